@@ -0,0 +1,86 @@
+"""
+ANN(IVF) 인덱스와 정확한 전체 검색 비교 벤치마크
+
+합성 특징 벡터(군집 구조)를 임시 특징 저장소에 넣고, 검색 작업과 같은 경로로
+정확한 검색(SimilarityIndex 전체 점수)과 ANN 후보 축소(approximate_candidates: 저장소 동기화,
+IVF 탐색, 후보 위치 찾기) + 정확한 재순위의 질의당 지연 시간과 상위 N개 재현율(recall)을 nprobe별로 출력합니다.
+
+    python debug/benchmark_ann_index.py [행 수] [차원]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import ann_index, feature_store
+from utils.similarity_search import SimilarityIndex
+
+TOP_N = 10
+NUM_QUERIES = 50
+
+
+def _make_vectors(num_rows, dim, seed=0):
+    """얼굴 특징과 비슷한 양수 범위의 군집 데이터"""
+    rng = np.random.default_rng(seed)
+    centers = rng.random((max(8, num_rows // 500), dim)) * 2
+    labels = rng.integers(0, len(centers), num_rows)
+    return (centers[labels] + rng.normal(0, 0.15, (num_rows, dim))).astype(np.float32)
+
+
+def main():
+    num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    dim = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    vectors = _make_vectors(num_rows, dim)
+    queries = vectors[np.random.default_rng(1).choice(num_rows, NUM_QUERIES, replace=False)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 이미지 파일 없이 저장소를 채우고, 서명은 매니페스트처럼 미리 알려 줌
+        names = [f"img_{i:06d}.png" for i in range(num_rows)]
+        paths = [os.path.join(tmp, name) for name in names]
+        signatures = np.tile([1.0, 100.0], (num_rows, 1))
+        store = feature_store.get_feature_store(paths[0], feature_store.KIND_FACE)
+        store.replace_all(names, signatures, vectors)
+        path_signatures = {path: (1.0, 100) for path in paths}
+
+        start = time.perf_counter()
+        matrix, found, _, sources = feature_store.load_features(
+            paths, feature_store.KIND_FACE, path_signatures, with_sources=True)
+        load_time = time.perf_counter() - start
+        exact = SimilarityIndex(found, face_vectors=matrix)
+
+        start = time.perf_counter()
+        ivf = ann_index.sync_store_index(store)
+        build_time = time.perf_counter() - start
+        print(f"행 {num_rows}, 차원 {dim}, 리스트 {len(ivf.centroids)}, "
+              f"특징 로드 {load_time:.2f}s, 인덱스 생성 {build_time:.2f}s")
+
+        # 정확한 검색 (기준 경로)
+        start = time.perf_counter()
+        truth = []
+        for query in queries:
+            results = exact.search(exact.face_scores([query])[0], top_n=TOP_N)
+            truth.append({key for _, key in results})
+        exact_ms = (time.perf_counter() - start) / NUM_QUERIES * 1000
+        print(f"{'방식':<16}{'지연(ms)':>10}{'재현율@' + str(TOP_N):>12}")
+        print(f"{'정확한 검색':<16}{exact_ms:>10.2f}{1.0:>12.3f}")
+
+        count = TOP_N * ann_index.CANDIDATE_OVERSAMPLE
+        for nprobe in (1, 2, 4, 8, 16, 32):
+            start = time.perf_counter()
+            recall = 0.0
+            for query, expected in zip(queries, truth):
+                positions = ann_index.approximate_candidates(sources, query, count, nprobe)
+                subset = exact.take(positions)
+                results = subset.search(subset.face_scores([query])[0], top_n=TOP_N)
+                recall += len(expected & {key for _, key in results}) / TOP_N
+            ann_ms = (time.perf_counter() - start) / NUM_QUERIES * 1000
+            print(f"{'IVF nprobe=' + str(nprobe):<16}{ann_ms:>10.2f}{recall / NUM_QUERIES:>12.3f}")
+
+
+if __name__ == '__main__':
+    main()
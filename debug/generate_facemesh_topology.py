@@ -0,0 +1,144 @@
+"""
+MediaPipe FaceMesh 토폴로지 상수 모듈 생성 스크립트
+
+utils/facemesh_topology.py를 생성합니다. 생성된 모듈은 MediaPipe 없이 로드됩니다.
+MediaPipe 버전을 올린 뒤 연결 정보가 바뀌었으면 이 스크립트를 다시 실행하세요.
+
+    python debug/generate_facemesh_topology.py
+"""
+import os
+import sys
+from collections import defaultdict
+
+import mediapipe as mp
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OUTPUT_PATH = os.path.join(ROOT_DIR, 'utils', 'facemesh_topology.py')
+
+# 생성할 연결 집합 (mp.solutions.face_mesh 속성명)
+CONNECTION_NAMES = [
+    'FACEMESH_LIPS',
+    'FACEMESH_LEFT_EYE',
+    'FACEMESH_LEFT_IRIS',
+    'FACEMESH_LEFT_EYEBROW',
+    'FACEMESH_RIGHT_EYE',
+    'FACEMESH_RIGHT_IRIS',
+    'FACEMESH_RIGHT_EYEBROW',
+    'FACEMESH_FACE_OVAL',
+    'FACEMESH_NOSE',
+    'FACEMESH_CONTOURS',
+    'FACEMESH_IRISES',
+    'FACEMESH_TESSELATION',
+]
+
+
+def _derive_triangles(edges):
+    """
+    테셀레이션 간선에서 삼각형 면을 복원합니다.
+    세 간선이 모두 있는 3-클리크를 찾고, 면이 아닌 클리크(세 간선이 모두 3개 삼각형에 공유됨)는 제외합니다.
+    """
+    undirected = {tuple(sorted(edge)) for edge in edges}
+    neighbors = defaultdict(set)
+    for a, b in undirected:
+        neighbors[a].add(b)
+        neighbors[b].add(a)
+
+    cliques = set()
+    for a, b in undirected:
+        for c in neighbors[a] & neighbors[b]:
+            cliques.add(tuple(sorted((a, b, c))))
+
+    edge_count = defaultdict(int)
+    for a, b, c in cliques:
+        for edge in ((a, b), (a, c), (b, c)):
+            edge_count[edge] += 1
+
+    triangles = [t for t in cliques
+                 if not all(edge_count[e] > 2 for e in ((t[0], t[1]), (t[0], t[2]), (t[1], t[2])))]
+    return sorted(triangles)
+
+
+def _format_int_rows(values, per_line=16, indent='    '):
+    """정수 리스트를 줄바꿈된 소스 문자열로 변환"""
+    lines = []
+    for i in range(0, len(values), per_line):
+        lines.append(indent + ', '.join(str(v) for v in values[i:i + per_line]) + ',')
+    return '\n'.join(lines)
+
+
+def generate():
+    mp_face_mesh = mp.solutions.face_mesh
+
+    out = []
+    out.append('"""')
+    out.append('MediaPipe FaceMesh 토폴로지 상수 (자동 생성 파일 - 직접 수정하지 마세요)')
+    out.append(f'생성: debug/generate_facemesh_topology.py (mediapipe {mp.__version__})')
+    out.append('')
+    out.append('MediaPipe 없이 로드되며, mp.solutions.face_mesh 대신 그대로 사용할 수 있습니다.')
+    out.append('- FACEMESH_*: 기존과 같은 frozenset[(a, b)] 연결 집합')
+    out.append('- *_EDGES: (E, 2) int32 간선 배열, *_INDICES: 정렬된 고유 정점 인덱스 배열')
+    out.append('- TESSELATION_TRIANGLES: (T, 3) int32 테셀레이션 삼각형')
+    out.append('"""')
+    out.append('import numpy as np')
+    out.append('')
+    out.append(f'FACEMESH_NUM_LANDMARKS = {mp_face_mesh.FACEMESH_NUM_LANDMARKS}')
+    out.append(f'FACEMESH_NUM_LANDMARKS_WITH_IRISES = {mp_face_mesh.FACEMESH_NUM_LANDMARKS_WITH_IRISES}')
+    out.append('')
+    out.append('')
+    out.append('def _edges(flat):')
+    out.append('    """평탄화된 간선 튜플을 (E, 2) 읽기 전용 배열로 변환"""')
+    out.append('    array = np.array(flat, dtype=np.int32).reshape(-1, 2)')
+    out.append('    array.flags.writeable = False')
+    out.append('    return array')
+    out.append('')
+    out.append('')
+    out.append('def _indices(edges):')
+    out.append('    """간선 배열의 고유 정점 인덱스 (정렬, 읽기 전용)"""')
+    out.append('    array = np.unique(edges).astype(np.int32)')
+    out.append('    array.flags.writeable = False')
+    out.append('    return array')
+    out.append('')
+    out.append('')
+    out.append('def _connections(edges):')
+    out.append('    """간선 배열을 mp.solutions.face_mesh와 같은 frozenset 형식으로 변환"""')
+    out.append('    return frozenset(tuple(edge) for edge in edges.tolist())')
+    out.append('')
+
+    for name in CONNECTION_NAMES:
+        base = name[len('FACEMESH_'):]
+        edges = sorted(getattr(mp_face_mesh, name))
+        flat = [v for edge in edges for v in edge]
+        out.append('')
+        out.append(f'{base}_EDGES = _edges((')
+        out.append(_format_int_rows(flat))
+        out.append('))')
+        out.append(f'{base}_INDICES = _indices({base}_EDGES)')
+        out.append(f'{name} = _connections({base}_EDGES)')
+
+    triangles = _derive_triangles(mp_face_mesh.FACEMESH_TESSELATION)
+    flat = [v for tri in triangles for v in tri]
+    out.append('')
+    out.append('# 테셀레이션 간선의 3-클리크에서 복원한 삼각형 면')
+    out.append('TESSELATION_TRIANGLES = np.array((')
+    out.append(_format_int_rows(flat, per_line=15))
+    out.append('), dtype=np.int32).reshape(-1, 3)')
+    out.append('TESSELATION_TRIANGLES.flags.writeable = False')
+    out.append('')
+    out.append('# 눈동자 중심 인덱스 (refine_landmarks=True일 때만 존재, 각각 LEFT_IRIS/RIGHT_IRIS 윤곽의 중심)')
+    out.append('LEFT_IRIS_CENTER_INDEX = 473')
+    out.append('RIGHT_IRIS_CENTER_INDEX = 468')
+    out.append('IRIS_CENTER_INDICES = np.array((RIGHT_IRIS_CENTER_INDEX, LEFT_IRIS_CENTER_INDEX), dtype=np.int32)')
+    out.append('IRIS_CENTER_INDICES.flags.writeable = False')
+    out.append('')
+    out.append('# 눈동자 전체 인덱스 (윤곽 8개 + 중심 2개, 468~477)')
+    out.append('IRIS_ALL_INDICES = np.union1d(IRISES_INDICES, IRIS_CENTER_INDICES).astype(np.int32)')
+    out.append('IRIS_ALL_INDICES.flags.writeable = False')
+    out.append('')
+
+    with open(OUTPUT_PATH, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('\n'.join(out))
+    print(f"생성 완료: {OUTPUT_PATH} (삼각형 {len(triangles)}개)")
+
+
+if __name__ == '__main__':
+    sys.exit(generate())
@@ -77,6 +77,8 @@ _face_file = ""  # 얼굴 파일 경로 (Kaodata.s7)
 _png_dir = ""  # PNG 파일 가져오기 디렉토리 경로 (얼굴 이미지 가져오기 패널용)
 _save_file_dir = ""  # 저장 파일 열기 대화상자 초기 디렉토리
 _face_extract_dir = ""  # 얼굴 추출 패널에서 이미지를 불러오고 저장할 디렉토리 경로
+_detection_max_size = 1280  # 얼굴 감지 작업 해상도 (긴 변 최대 픽셀, 0이면 원본 해상도로 감지)
+_morph_render_threads = 0  # 폴리곤 모핑 렌더링 스레드 수 (0이면 CPU 코어 수)
 _file_mtime = None  # 파일의 마지막 수정 시간 저장
 _is_saving = False  # 파일 저장 중 플래그
 _last_save_time = 0  # 마지막 저장 시간 (타임스탬프)
@@ -2,11 +2,13 @@
 PNG 파일을 읽어서 Kaodata.s7에 저장하는 패널
 """
 import os
+import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from PIL import Image, ImageTk
 
 import utils.kaodata_image as kaodata_image
+import utils.kaodata_index as kaodata_index
 from gui.frame import basic as _basic
 
 class FaceImportPanel(tk.Toplevel):
@@ -23,6 +25,11 @@ class FaceImportPanel(tk.Toplevel):
         self.tk_image = None
         self.image_created = None
         
+        # 비슷한 게임 얼굴 찾기 (백그라운드 스레드)
+        self._similar_slot_thread = None
+        self._similar_slot_cancelled = False
+        self._similar_slot_state = None
+        
         self.create_widgets()
         
         # 창 닫기 이벤트
@@ -103,6 +110,18 @@ class FaceImportPanel(tk.Toplevel):
         )
         face_detection_check.pack(side=tk.LEFT, padx=(20, 0))
         
+        # 비슷한 게임 얼굴 프레임 (선택하면 얼굴 번호로 입력)
+        similar_frame = tk.LabelFrame(main_frame, text="비슷한 게임 얼굴", padx=5, pady=5)
+        similar_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        btn_similar = tk.Button(similar_frame, text="비슷한 슬롯 찾기", command=self.find_similar_slots, width=14)
+        btn_similar.pack(side=tk.LEFT, anchor="n", padx=(0, 5))
+        
+        self.similar_slot_listbox = tk.Listbox(similar_frame, height=5, width=30, exportselection=False)
+        self.similar_slot_listbox.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.similar_slot_listbox.bind("<<ListboxSelect>>", self.on_similar_slot_select)
+        self.similar_slot_results = []
+        
         # 버튼 프레임
         button_frame = tk.Frame(main_frame)
         button_frame.pack(fill=tk.X)
@@ -306,8 +325,78 @@ class FaceImportPanel(tk.Toplevel):
             messagebox.showerror("에러", f"저장 실패:\n{e}")
             self.status_label.config(text=f"에러: {e}", fg="red")
     
+    def find_similar_slots(self, top_k=10):
+        """현재 이미지와 가장 비슷한 게임 얼굴 번호 찾기 (인덱스 갱신 후 검색)"""
+        if self.current_image is None:
+            messagebox.showwarning("경고", "먼저 PNG 파일을 선택하세요.")
+            return
+        if self._similar_slot_thread is not None:
+            return
+        
+        image = self.current_image.copy()
+        state = {'done': 0, 'total': 0, 'results': None, 'error': None}
+        self._similar_slot_state = state
+        self._similar_slot_cancelled = False
+        
+        def _progress(done, total):
+            state['done'], state['total'] = done, total
+        
+        def _run():
+            try:
+                index = kaodata_index.get_index()
+                index.update(is_cancelled=lambda: self._similar_slot_cancelled, on_progress=_progress)
+                state['results'] = index.query_image(image, top_k=top_k)
+            except Exception as e:
+                print(f"[얼굴이미지] 비슷한 게임 얼굴 찾기 실패: {e}")
+                state['error'] = e
+        
+        self.status_label.config(text="게임 얼굴 인덱스 확인 중...", fg="blue")
+        self._similar_slot_thread = threading.Thread(target=_run, daemon=True)
+        self._similar_slot_thread.start()
+        self.after(100, self._poll_similar_slots)
+    
+    def _poll_similar_slots(self):
+        """백그라운드 검색 진행 상황 확인"""
+        if self._similar_slot_thread is None or self._similar_slot_cancelled:
+            return
+        state = self._similar_slot_state
+        if self._similar_slot_thread.is_alive():
+            if state['total']:
+                self.status_label.config(
+                    text=f"게임 얼굴 인덱스 갱신 중... {state['done']}/{state['total']}", fg="blue"
+                )
+            self.after(100, self._poll_similar_slots)
+            return
+        
+        self._similar_slot_thread = None
+        if state['error'] is not None:
+            self.status_label.config(text=f"에러: {state['error']}", fg="red")
+            return
+        
+        results = state['results'] or []
+        self.similar_slot_results = results
+        self.similar_slot_listbox.delete(0, tk.END)
+        for score, faceno in results:
+            self.similar_slot_listbox.insert(tk.END, f"얼굴 번호 {faceno}  (유사도 {score:.3f})")
+        if results:
+            self.status_label.config(text=f"비슷한 게임 얼굴 {len(results)}개", fg="green")
+        else:
+            self.status_label.config(text="비슷한 게임 얼굴을 찾지 못했습니다 (얼굴 감지 실패)", fg="orange")
+    
+    def on_similar_slot_select(self, event=None):
+        """비슷한 게임 얼굴 선택 시 얼굴 번호 입력"""
+        selection = self.similar_slot_listbox.curselection()
+        if not selection or selection[0] >= len(self.similar_slot_results):
+            return
+        _, faceno = self.similar_slot_results[selection[0]]
+        self.face_entry.delete(0, tk.END)
+        self.face_entry.insert(0, str(faceno))
+        self.update_current_preview()
+    
     def on_close(self):
         """창 닫기"""
+        # 진행 중인 인덱스 갱신은 중간 저장 후 중단
+        self._similar_slot_cancelled = True
         self.destroy()
 
 def show_face_import_panel(parent=None):
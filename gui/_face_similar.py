@@ -3,7 +3,7 @@
 이미지와 비슷한 얼굴을 찾아서 목록으로 표시하는 기능
 """
 import os
-import glob
+from collections import OrderedDict
 import tkinter as tk
 from tkinter import messagebox, filedialog
 from PIL import Image, ImageTk
@@ -11,7 +11,21 @@ import platform
 
 import utils.kaodata_image as kaodata_image
 import utils.face_landmarks as face_landmarks
-from gui.face_extract.similar import SimilarFaceManagerMixin
+import utils.feature_store as feature_store
+import utils.dir_manifest as dir_manifest
+import utils.face_clustering as face_clustering
+import utils.thumbnail_cache as thumbnail_cache
+from gui.frame.virtual_list import VirtualList
+from gui.face_extract.similar import SimilarFaceManagerMixin, _list_image_files, _same_path, refresh_directory
+
+# 결과 목록 썸네일 크기와 행 높이
+_THUMBNAIL_SIZE = thumbnail_cache.THUMBNAIL_SIZE
+_RESULT_ROW_HEIGHT = _THUMBNAIL_SIZE[1] + 16
+
+# 결과가 바뀔 때 미리 준비할 앞쪽 썸네일 수, 화면용 PhotoImage 보관 수, 썸네일 폴링 간격
+_THUMBNAIL_PREFETCH = 64
+_PHOTO_CACHE_LIMIT = 256
+_THUMBNAIL_POLL_MS = 50
 
 # Windows에서 경고음 비활성화를 위한 함수
 def _silent_messagebox(title, message, icon='info', buttons='ok'):
@@ -224,36 +238,32 @@ class FaceSimilarPanel(SimilarFaceManagerMixin, tk.Toplevel):
         btn_find_similar_clothing = tk.Button(top_frame, text="비슷한 옷 찾기", command=self.on_find_similar_clothing, width=15, bg="#4CAF50", fg="white")
         btn_find_similar_clothing.pack(side=tk.LEFT, padx=(0, 10))
         
-        self.similar_faces_status_label = tk.Label(top_frame, text="", fg="gray", font=("", 8))
-        self.similar_faces_status_label.pack(side=tk.LEFT)
-        
-        # 스크롤 가능한 프레임
-        canvas_frame = tk.Frame(result_frame)
-        canvas_frame.pack(fill=tk.BOTH, expand=True)
+        btn_find_duplicates = tk.Button(top_frame, text="중복 그룹", command=self.on_find_duplicate_groups, width=9)
+        btn_find_duplicates.pack(side=tk.LEFT, padx=(0, 5))
         
-        # 캔버스와 스크롤바
-        self.similar_faces_canvas = tk.Canvas(canvas_frame, bg="white")
-        scrollbar = tk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self.similar_faces_canvas.yview)
-        self.similar_faces_scrollable_frame = tk.Frame(self.similar_faces_canvas)
+        btn_open_report = tk.Button(top_frame, text="그룹 보고서", command=self.on_open_cluster_report, width=9)
+        btn_open_report.pack(side=tk.LEFT, padx=(0, 10))
         
-        self.similar_faces_canvas.configure(yscrollcommand=scrollbar.set)
+        btn_cancel_search = tk.Button(top_frame, text="취소", command=self._cancel_search, width=6)
+        btn_cancel_search.pack(side=tk.LEFT, padx=(0, 10))
         
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.similar_faces_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        # 스크롤 가능한 프레임을 캔버스에 배치
-        self.similar_faces_canvas.create_window((0, 0), window=self.similar_faces_scrollable_frame, anchor=tk.NW)
+        self.similar_faces_status_label = tk.Label(top_frame, text="", fg="gray", font=("", 8))
+        self.similar_faces_status_label.pack(side=tk.LEFT)
         
-        # 스크롤 영역 업데이트
-        self.similar_faces_scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.similar_faces_canvas.configure(scrollregion=self.similar_faces_canvas.bbox("all"))
+        # 결과 목록 (보이는 행만 위젯을 만들고 스크롤 시 재사용, 썸네일은 디스크 캐시에서 로드)
+        self.similar_results_view = VirtualList(
+            result_frame, row_height=_RESULT_ROW_HEIGHT,
+            create_row=self._create_result_row, bind_row=self._bind_result_row
         )
+        self.similar_results_view.pack(fill=tk.BOTH, expand=True)
+        self._thumbnail_loader = None
+        self._thumbnail_photos = OrderedDict()
+        self._result_status_cache = {}
         
         # 마우스 휠 바인딩
         def _on_mousewheel(event):
-            self.similar_faces_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        self.similar_faces_canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            self.similar_results_view.yview_scroll(int(-1*(event.delta/120)), "units")
+        self.similar_results_view.canvas.bind_all("<MouseWheel>", _on_mousewheel)
         
         # 초기 상태: 비어있음
         self.similar_faces_list = []
@@ -274,18 +284,8 @@ class FaceSimilarPanel(SimilarFaceManagerMixin, tk.Toplevel):
             self.file_listbox.insert(0, f"디렉토리를 찾을 수 없습니다: {png_dir}")
             return
         
-        # 지원하는 이미지 파일 확장자
-        image_extensions = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.bmp', '*.tiff', '*.tif', '*.webp']
-        
-        # 모든 이미지 파일 목록 가져오기
-        image_files = []
-        for ext in image_extensions:
-            image_files.extend(glob.glob(os.path.join(png_dir, ext)))
-            image_files.extend(glob.glob(os.path.join(png_dir, ext.upper())))
-        
-        # 중복 제거
-        image_files = list(set(os.path.normpath(f) for f in image_files))
-        image_files.sort()
+        # 디렉토리 매니페스트 갱신 (한 번의 스캔으로 변경분 계산, 변경된 파일 캐시 정리)
+        image_files = refresh_directory(png_dir)
         
         if not image_files:
             self.file_listbox.insert(0, "이미지 파일이 없습니다")
@@ -468,34 +468,160 @@ class FaceSimilarPanel(SimilarFaceManagerMixin, tk.Toplevel):
             messagebox.showwarning("경고", "이미지를 먼저 선택하세요.")
             return
         
-        # 기존 목록 클리어
-        for widget in self.similar_faces_scrollable_frame.winfo_children():
-            widget.destroy()
+        # 진행 중인 검색 취소 후 기존 목록 클리어
+        self.cancel_similarity_search()
+        self.similar_results_view.clear()
         
         self.similar_faces_status_label.config(text="검색 중...", fg="blue")
-        self.update()
         
-        try:
-            # 비슷한 얼굴 찾기 (얼굴만 비교)
-            similar_faces = self.find_similar_faces(
-                reference_image_path=self.current_image_path, 
-                top_n=10,
-                include_clothing=False
-            )
-            
-            if not similar_faces:
-                self.similar_faces_status_label.config(text="비슷한 얼굴을 찾을 수 없습니다.", fg="gray")
+        # 랜드마크 캐시가 없는 이미지는 워커 프로세스에서 먼저 감지
+        def _on_landmarks_ready(cancelled):
+            if not cancelled:
+                self._run_similar_face_search()
+        self.start_landmark_indexing(self._get_search_image_files(rescan=True), on_complete=_on_landmarks_ready)
+    
+    def _cancel_search(self):
+        """취소 버튼: 랜드마크 감지, 유사도 검색, 중복 그룹 찾기를 모두 취소"""
+        self.cancel_landmark_indexing()
+        self.cancel_similarity_search()
+        if getattr(self, '_clustering_job', None) is not None:
+            self.cancel_duplicate_clustering()
+            self.similar_faces_status_label.config(text="중복 그룹 찾기 취소됨", fg="gray")
+    
+    def _get_search_dir(self):
+        """검색 대상 디렉토리 (얼굴 추출 패널 폴더가 있으면 사용, 없으면 png_dir)"""
+        if self.face_extract_dir and os.path.exists(self.face_extract_dir):
+            return self.face_extract_dir
+        return kaodata_image.get_png_dir()
+    
+    def _get_search_image_files(self, rescan=False):
+        """검색 대상 디렉토리의 이미지 파일 목록
+        
+        검색은 매니페스트의 (수정 시간, 크기)로 저장된 특징을 믿고 쓰므로, 검색을 시작할 때는 rescan=True로
+        디렉토리를 다시 스캔해 마지막 스캔 이후 바뀐 파일의 캐시를 정리합니다.
+        """
+        png_dir = self._get_search_dir()
+        if not os.path.exists(png_dir):
+            return []
+        if rescan:
+            return refresh_directory(png_dir)
+        return _list_image_files(png_dir)
+    
+    def on_find_duplicate_groups(self):
+        """중복 그룹 버튼: 디렉토리 전체를 비슷한 얼굴 그룹으로 묶어 보고서 저장 후 열기"""
+        image_files = self._get_search_image_files(rescan=True)
+        if len(image_files) < 2:
+            messagebox.showwarning("경고", "그룹을 찾을 이미지가 부족합니다.")
+            return
+        
+        self._cancel_search()
+        self.similar_faces_status_label.config(text="중복 그룹 찾는 중...", fg="blue")
+        
+        def _on_progress(stage, done, total):
+            if stage == face_clustering.STAGE_FEATURES:
+                text = f"특징 추출 중... {done}/{total}"
+            elif stage == face_clustering.STAGE_PAIRS:
+                text = f"유사도 계산 중... {done}/{total} 블록"
+            else:
                 return
-            
-            # 결과 표시
-            self.similar_faces_list = similar_faces
-            self._display_similar_faces(similar_faces)
-            
+            self.similar_faces_status_label.config(text=text, fg="blue")
+        
+        def _on_complete(job):
+            if job.cancelled:
+                self.similar_faces_status_label.config(text="중복 그룹 찾기 취소됨", fg="gray")
+            elif job.error is not None or job.groups is None:
+                self.similar_faces_status_label.config(text="중복 그룹 찾기 실패", fg="red")
+            else:
+                self.similar_faces_status_label.config(text=f"{len(job.groups)}개 그룹을 찾았습니다.", fg="green")
+                self._open_cluster_report(job.report_path)
+        
+        # 랜드마크 캐시가 없는 이미지는 워커 프로세스에서 먼저 감지
+        def _on_landmarks_ready(cancelled):
+            if not cancelled:
+                self.start_duplicate_clustering(image_files, on_progress=_on_progress, on_complete=_on_complete)
+        self.start_landmark_indexing(image_files, on_complete=_on_landmarks_ready)
+    
+    def on_open_cluster_report(self):
+        """그룹 보고서 버튼: 현재 디렉토리에 저장된 중복 그룹 보고서 열기"""
+        report_path = face_clustering.get_report_path(self._get_search_dir())
+        if not os.path.exists(report_path):
+            messagebox.showinfo("알림", "저장된 그룹 보고서가 없습니다.\n'중복 그룹' 버튼으로 먼저 그룹을 찾으세요.")
+            return
+        self._open_cluster_report(report_path)
+    
+    def _open_cluster_report(self, report_path):
+        """그룹 보고서 창 표시 (그룹을 선택하면 결과 목록에 그룹 이미지를 표시)"""
+        report = face_clustering.load_report(report_path)
+        if report is None:
+            messagebox.showerror("에러", f"그룹 보고서를 읽을 수 없습니다:\n{report_path}")
+            return
+        
+        window = getattr(self, '_cluster_report_window', None)
+        if window is not None and window.winfo_exists():
+            window.destroy()
+        window = tk.Toplevel(self)
+        window.title("중복 그룹 보고서")
+        window.geometry("360x420")
+        self._cluster_report_window = window
+        
+        groups = report['groups']
+        summary = (f"{report['created']}  |  이미지 {report['total']}개, 그룹 {len(groups)}개\n"
+                   f"임계값 {report['threshold'] * 100:.0f}%  ({report['mode']}, {report['linkage']})")
+        tk.Label(window, text=summary, justify=tk.LEFT, anchor="w").pack(fill=tk.X, padx=5, pady=5)
+        
+        list_frame = tk.Frame(window)
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=(0, 5))
+        scrollbar = tk.Scrollbar(list_frame, orient=tk.VERTICAL)
+        listbox = tk.Listbox(list_frame, yscrollcommand=scrollbar.set)
+        scrollbar.config(command=listbox.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        for number, group in enumerate(groups, 1):
+            listbox.insert(tk.END, f"그룹 {number} ({len(group)}개): {os.path.basename(group[0][1])}")
+        
+        def _on_select(event):
+            selection = listbox.curselection()
+            if not selection:
+                return
+            group = groups[selection[0]]
+            self._show_similar_faces(group)
             self.similar_faces_status_label.config(
-                text=f"{len(similar_faces)}개 얼굴을 찾았습니다.",
-                fg="green"
+                text=f"그룹 {selection[0] + 1}: {len(group)}개 (대표 이미지 대비 유사도)", fg="green"
+            )
+        listbox.bind("<<ListboxSelect>>", _on_select)
+    
+    def _run_similar_face_search(self):
+        """랜드마크 준비 후 비슷한 얼굴 검색 실행 (작업 스레드, 결과는 점진적으로 표시)"""
+        if not self.current_image_path:
+            return
+        
+        self.similar_faces_status_label.config(text="검색 중...", fg="blue")
+        
+        # 기준 이미지는 제외
+        image_files = [f for f in self._get_search_image_files() if not _same_path(f, self.current_image_path)]
+        
+        def _on_complete(job):
+            if job.cancelled:
+                self.similar_faces_status_label.config(text="검색 취소됨", fg="gray")
+            elif not job.reference_found:
+                self.similar_faces_status_label.config(text="기준 이미지에서 얼굴을 찾을 수 없습니다.", fg="gray")
+            elif not job.results:
+                self.similar_faces_status_label.config(text="비슷한 얼굴을 찾을 수 없습니다.", fg="gray")
+            else:
+                self.similar_faces_status_label.config(
+                    text=f"{len(job.results)}개 얼굴을 찾았습니다.",
+                    fg="green"
+                )
+        
+        try:
+            # 비슷한 얼굴 찾기 (얼굴만 비교, 임베딩 기저가 학습된 디렉토리는 전체 메시 임베딩 사용)
+            self.start_similarity_search(
+                self.current_image_path, image_files,
+                include_clothing=False, top_n=10,
+                on_results=self._show_similar_faces, on_complete=_on_complete,
+                mesh=True
             )
-            
         except Exception as e:
             messagebox.showerror("에러", f"비슷한 얼굴 검색 실패:\n{e}")
             self.similar_faces_status_label.config(text="검색 실패", fg="red")
@@ -506,256 +632,198 @@ class FaceSimilarPanel(SimilarFaceManagerMixin, tk.Toplevel):
             messagebox.showwarning("경고", "이미지를 먼저 선택하세요.")
             return
         
-        # 기존 목록 클리어
-        for widget in self.similar_faces_scrollable_frame.winfo_children():
-            widget.destroy()
+        # 진행 중인 검색 취소 후 기존 목록 클리어
+        self.cancel_similarity_search()
+        self.similar_results_view.clear()
         
         self.similar_faces_status_label.config(text="검색 중...", fg="blue")
-        self.update()
         
-        try:
-            # 기준 이미지의 옷 특징 추출
-            reference_clothing = self._extract_clothing_features_for_image(self.current_image_path)
-            if reference_clothing is None:
+        # 랜드마크와 옷 특징이 없는 이미지는 워커 프로세스에서 먼저 일괄 계산
+        def _on_landmarks_ready(cancelled):
+            if not cancelled:
+                self._run_similar_clothing_search()
+        self.start_landmark_indexing(self._get_search_image_files(rescan=True), on_complete=_on_landmarks_ready, clothing=True)
+    
+    def _run_similar_clothing_search(self):
+        """랜드마크 준비 후 비슷한 옷 검색 실행 (작업 스레드, 결과는 점진적으로 표시)"""
+        if not self.current_image_path:
+            return
+        
+        self.similar_faces_status_label.config(text="검색 중...", fg="blue")
+        
+        # 기준 이미지는 제외
+        image_files = [f for f in self._get_search_image_files() if not _same_path(f, self.current_image_path)]
+        
+        def _on_complete(job):
+            if job.cancelled:
+                self.similar_faces_status_label.config(text="검색 취소됨", fg="gray")
+            elif not job.reference_found:
                 messagebox.showwarning("경고", "옷 영역을 찾을 수 없습니다.")
                 self.similar_faces_status_label.config(text="옷 영역 없음", fg="gray")
-                return
-            
-            # 이미지 디렉토리 경로 가져오기
-            if self.face_extract_dir and os.path.exists(self.face_extract_dir):
-                png_dir = self.face_extract_dir
-            else:
-                png_dir = kaodata_image.get_png_dir()
-            
-            if not os.path.exists(png_dir):
-                return []
-            
-            # 모든 이미지 파일 찾기
-            import glob
-            image_extensions = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.bmp', '*.tiff', '*.tif', '*.webp']
-            image_files = []
-            for ext in image_extensions:
-                image_files.extend(glob.glob(os.path.join(png_dir, ext)))
-                image_files.extend(glob.glob(os.path.join(png_dir, ext.upper())))
-            
-            # 중복 제거
-            image_files = list(set(os.path.normpath(f) for f in image_files))
-            
-            # 기준 이미지는 제외
-            image_files = [f for f in image_files if f != self.current_image_path]
-            
-            # 모든 이미지의 옷 특징 추출 및 비교
-            similarities = []
-            total = len(image_files)
-            
-            for idx, image_path in enumerate(image_files):
-                try:
-                    clothing_features = self._extract_clothing_features_for_image(image_path)
-                    if clothing_features is not None:
-                        similarity = face_landmarks.calculate_clothing_similarity(reference_clothing, clothing_features)
-                        similarities.append((similarity, image_path))
-                    
-                    # 진행률 업데이트
-                    if hasattr(self, 'similar_faces_status_label'):
-                        progress = int((idx + 1) / total * 100)
-                        self.similar_faces_status_label.config(
-                            text=f"검색 중... {idx + 1}/{total} ({progress}%)"
-                        )
-                        self.update()
-                        
-                except Exception as e:
-                    print(f"[비슷한옷] 이미지 처리 실패 ({image_path}): {e}")
-                    continue
-            
-            # 유사도가 높은 순으로 정렬
-            similarities.sort(key=lambda x: x[0], reverse=True)
-            
-            # 90% 이상 유사도만 필터링
-            similar_faces = [(sim, path) for sim, path in similarities if sim >= 0.9]
-            
-            if not similar_faces:
+            elif not job.results:
                 self.similar_faces_status_label.config(text="비슷한 옷을 찾을 수 없습니다. (90% 이상)", fg="gray")
-                return
-            
-            # 결과 표시
-            self.similar_faces_list = similar_faces
-            self._display_similar_faces(similar_faces)
-            
-            self.similar_faces_status_label.config(
-                text=f"{len(similar_faces)}개 옷을 찾았습니다.",
-                fg="green"
+            else:
+                self.similar_faces_status_label.config(
+                    text=f"{len(job.results)}개 옷을 찾았습니다.",
+                    fg="green"
+                )
+        
+        try:
+            # 90% 이상 유사도만 유사도가 높은 순으로
+            self.start_similarity_search(
+                self.current_image_path, image_files,
+                clothing_only=True, top_n=None, min_score=0.9,
+                on_results=self._show_similar_faces, on_complete=_on_complete
             )
-            
         except Exception as e:
             messagebox.showerror("에러", f"옷만 검색 실패:\n{e}")
             self.similar_faces_status_label.config(text="검색 실패", fg="red")
     
     def _extract_clothing_features_for_image(self, image_path):
-        """이미지에서 옷 특징만 추출 (캐싱 포함)"""
-        # 캐시 확인 (features 폴더 내)
-        from gui.face_extract.similar import _get_features_dir, _get_features_cache_filename
-        features_dir = _get_features_dir(image_path)
-        cache_filename = _get_features_cache_filename(image_path, '_clothing_only')
-        cache_key = os.path.join(features_dir, cache_filename)
-        cached_features = self._load_features_cache_by_key(image_path, cache_key)
-        if cached_features is not None:
-            return cached_features
-        
-        try:
-            # 이미지 로드
-            image = Image.open(image_path)
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
-            
-            # 옷 특징 벡터 추출
-            features = face_landmarks.extract_clothing_features_vector(image)
-            
-            # 캐시 저장
-            if features is not None:
-                self._save_features_cache_by_key(image_path, cache_key, features)
-            
-            return features
-            
-        except Exception as e:
-            print(f"[비슷한옷] 옷 특징 추출 실패 ({image_path}): {e}")
-            return None
+        """이미지에서 옷 특징만 추출 (특징 저장소 캐싱 포함)"""
+        return self._extract_face_features_for_image(image_path, clothing_only=True)
+    
+    def _show_similar_faces(self, similar_faces):
+        """검색 중간/최종 결과로 목록을 다시 표시"""
+        self.similar_faces_list = similar_faces
+        self._display_similar_faces(similar_faces)
     
     def _display_similar_faces(self, similar_faces):
-        """비슷한 얼굴 목록 표시"""
-        thumbnail_size = (96, 120)  # 썸네일 크기
+        """비슷한 얼굴 목록 표시 (보이는 행만 채우고, 앞쪽 결과 썸네일은 미리 준비)"""
+        self._result_status_cache.clear()
+        self.similar_results_view.set_items(similar_faces)
+        self._request_thumbnails([path for _, path in similar_faces[:_THUMBNAIL_PREFETCH]])
+    
+    def _create_result_row(self, parent):
+        """결과 행 위젯 생성 (VirtualList가 재사용)"""
+        row = tk.Frame(parent, relief=tk.RAISED, borderwidth=1)
+        row.file_path = None
+        
+        # 썸네일 자리는 고정 크기 (썸네일이 준비되기 전에도 행 높이가 같도록)
+        thumbnail_frame = tk.Frame(row, width=_THUMBNAIL_SIZE[0], height=_THUMBNAIL_SIZE[1], bg="gray")
+        thumbnail_frame.pack_propagate(False)
+        thumbnail_frame.pack(side=tk.LEFT, padx=5, pady=5)
+        row.thumbnail_label = tk.Label(thumbnail_frame, bg="gray")
+        row.thumbnail_label.pack(fill=tk.BOTH, expand=True)
+        
+        # 정보 프레임
+        info_frame = tk.Frame(row)
+        info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
+        row.filename_label = tk.Label(info_frame, font=("", 9), anchor="w")
+        row.filename_label.pack(fill=tk.X)
+        row.similarity_label = tk.Label(info_frame, font=("", 8), fg="blue", anchor="w")
+        row.similarity_label.pack(fill=tk.X)
+        row.status_label = tk.Label(info_frame, anchor="w")
+        row.status_label.pack(fill=tk.X, pady=(2, 0))
+        
+        # 삭제 버튼 (현재 행에 채워진 파일 기준)
+        btn_delete = tk.Button(row, text="삭제", width=8,
+                               command=lambda: row.file_path and self._delete_result_image(row.file_path))
+        btn_delete.pack(side=tk.RIGHT, padx=5, pady=5)
+        
+        # 썸네일 클릭 / 더블클릭으로 이미지 선택
+        def _select(event):
+            if row.file_path:
+                self._load_similar_face_image(row.file_path)
+        row.thumbnail_label.bind("<Button-1>", _select)
+        for widget in (row, row.filename_label, row.similarity_label):
+            widget.bind("<Double-Button-1>", _select)
+        return row
+    
+    def _bind_result_row(self, row, item, index):
+        """결과 행에 항목 내용 채우기"""
+        similarity, file_path = item
+        row.file_path = file_path
+        row.filename_label.config(text=os.path.basename(file_path))
+        row.similarity_label.config(text=f"유사도: {similarity * 100:.1f}%")
+        
+        status_text, status_color = self._get_result_status(file_path)
+        row.status_label.config(text=status_text, fg=status_color, font=("", 9 if status_color == "green" else 7))
+        
+        photo = self._get_thumbnail_photo(file_path)
+        if photo is not None:
+            row.thumbnail_label.config(image=photo, text="")
+        else:
+            row.thumbnail_label.config(image="", text="...")
+            self._request_thumbnails([file_path])
+    
+    def _get_result_status(self, file_path):
+        """결과 항목의 피처/파라미터/추출 이미지 상태 (텍스트, 색상), 목록이 바뀔 때까지 캐시"""
+        cached = self._result_status_cache.get(file_path)
+        if cached is not None:
+            return cached
+        
+        # 피처 확인 (특징 저장소)
+        has_features = any(
+            file_path in feature_store.get_feature_store(file_path, kind)
+            for kind in feature_store.FEATURE_KINDS
+        )
         
-        for idx, (similarity, file_path) in enumerate(similar_faces):
-            # 각 항목을 위한 프레임
-            item_frame = tk.Frame(self.similar_faces_scrollable_frame, relief=tk.RAISED, borderwidth=1)
-            item_frame.pack(fill=tk.X, padx=2, pady=2)
-            
-            # 썸네일 이미지 로드 및 표시
-            try:
-                image = Image.open(file_path)
-                if image.mode != 'RGB':
-                    image = image.convert('RGB')
-                
-                # 썸네일 생성
-                image.thumbnail(thumbnail_size, Image.LANCZOS)
-                photo = ImageTk.PhotoImage(image)
-                
-                # 썸네일 라벨
-                thumbnail_label = tk.Label(item_frame, image=photo)
-                thumbnail_label.image = photo  # 참조 유지
-                thumbnail_label.pack(side=tk.LEFT, padx=5, pady=5)
-                
-                # 클릭 이벤트 바인딩
-                thumbnail_label.bind("<Button-1>", lambda e, path=file_path: self._load_similar_face_image(path))
-                
-            except Exception as e:
-                print(f"[비슷한얼굴] 썸네일 로드 실패 ({file_path}): {e}")
-                # 썸네일 로드 실패 시 빈 라벨
-                empty_label = tk.Label(item_frame, text="[이미지 없음]", width=12, height=15, bg="gray")
-                empty_label.pack(side=tk.LEFT, padx=5, pady=5)
-            
-            # 정보 프레임
-            info_frame = tk.Frame(item_frame)
-            info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
-            
-            # 파일명
-            filename = os.path.basename(file_path)
-            filename_label = tk.Label(info_frame, text=filename, font=("", 9), anchor="w")
-            filename_label.pack(fill=tk.X)
-            
-            # 유사도 점수
-            similarity_percent = similarity * 100
-            similarity_label = tk.Label(
-                info_frame, 
-                text=f"유사도: {similarity_percent:.1f}%", 
-                font=("", 8),
-                fg="blue",
-                anchor="w"
-            )
-            similarity_label.pack(fill=tk.X)
-            
-            # 파일 존재 여부 표시
-            status_frame = tk.Frame(info_frame)
-            status_frame.pack(fill=tk.X, pady=(2, 0))
-            
-            # 피처 파일 확인
-            from gui.face_extract.similar import _get_features_dir, _get_features_cache_filename
-            features_dir = _get_features_dir(file_path)
-            has_features = False
-            for suffix in ['', '_clothing', '_clothing_only']:
-                cache_filename = _get_features_cache_filename(file_path, suffix)
-                cache_path = os.path.join(features_dir, cache_filename)
-                if os.path.exists(cache_path):
-                    has_features = True
-                    break
-            
-            # 파라미터 파일 확인
-            import utils.config as config_util
-            parameters_dir = config_util._get_parameters_dir(file_path)
-            params_filename = config_util._get_parameters_filename(file_path)
-            params_path = os.path.join(parameters_dir, params_filename)
-            has_params = os.path.exists(params_path)
-            
-            # 추출 이미지 확인
-            import re
-            original_filename = os.path.basename(file_path)
-            base_name = os.path.splitext(original_filename)[0]
-            base_name = re.sub(r'^[A-Za-z]+_', '', base_name)
-            png_filename = f"{base_name}_s7.png"
-            image_dir = os.path.dirname(file_path)
-            faces_dir = os.path.join(image_dir, "faces")
-            png_file_path = os.path.join(faces_dir, png_filename)
-            has_extracted = os.path.exists(png_file_path)
-            
-            # 상태 표시
-            status_texts = []
-            if has_features:
-                status_texts.append("피처")
-            if has_params:
-                status_texts.append("파라미터")
-            if has_extracted:
-                status_texts.append("추출")
-            
-            if status_texts:
-                status_text = " | ".join(status_texts)
-                status_label = tk.Label(
-                    status_frame,
-                    text=status_text,
-                    fg="green",
-                    anchor="w"
-                )
-                status_label.pack(side=tk.LEFT)
-            else:
-                status_label = tk.Label(
-                    status_frame,
-                    text="없음",
-                    font=("", 7),
-                    fg="gray",
-                    anchor="w"
-                )
-                status_label.pack(side=tk.LEFT)
-            
-            # 삭제 버튼 (클로저 문제 방지를 위해 함수로 감싸기)
-            def make_delete_handler(img_path, frame):
-                def handler():
-                    self._delete_result_image(img_path, frame)
-                return handler
-            
-            btn_delete = tk.Button(
-                item_frame, 
-                text="삭제", 
-                command=make_delete_handler(file_path, item_frame),
-                width=8,
-            )
-            btn_delete.pack(side=tk.RIGHT, padx=5, pady=5)
-            
-            # 더블클릭으로 이미지 선택
-            item_frame.bind("<Double-Button-1>", lambda e, path=file_path: self._load_similar_face_image(path))
-            filename_label.bind("<Double-Button-1>", lambda e, path=file_path: self._load_similar_face_image(path))
-            similarity_label.bind("<Double-Button-1>", lambda e, path=file_path: self._load_similar_face_image(path))
-        
-        # 스크롤 영역 업데이트
-        self.similar_faces_canvas.update_idletasks()
-        self.similar_faces_canvas.configure(scrollregion=self.similar_faces_canvas.bbox("all"))
+        # 파라미터 파일 확인
+        import utils.config as config_util
+        parameters_dir = config_util._get_parameters_dir(file_path)
+        params_filename = config_util._get_parameters_filename(file_path)
+        has_params = os.path.exists(os.path.join(parameters_dir, params_filename))
+        
+        # 추출 이미지 확인
+        import re
+        base_name = os.path.splitext(os.path.basename(file_path))[0]
+        base_name = re.sub(r'^[A-Za-z]+_', '', base_name)
+        png_file_path = os.path.join(os.path.dirname(file_path), "faces", f"{base_name}_s7.png")
+        has_extracted = os.path.exists(png_file_path)
+        
+        status_texts = []
+        if has_features:
+            status_texts.append("피처")
+        if has_params:
+            status_texts.append("파라미터")
+        if has_extracted:
+            status_texts.append("추출")
+        status = (" | ".join(status_texts), "green") if status_texts else ("없음", "gray")
+        self._result_status_cache[file_path] = status
+        return status
+    
+    def _get_thumbnail_photo(self, file_path):
+        """메모리 캐시에 썸네일이 있으면 PhotoImage 반환 (없으면 None)"""
+        image = thumbnail_cache.get_thumbnail_cache().peek(file_path)
+        if image is None:
+            return None
+        cached = self._thumbnail_photos.get(file_path)
+        if cached is not None and cached[0] is image:
+            self._thumbnail_photos.move_to_end(file_path)
+            return cached[1]
+        photo = ImageTk.PhotoImage(image)
+        self._thumbnail_photos[file_path] = (image, photo)
+        while len(self._thumbnail_photos) > _PHOTO_CACHE_LIMIT:
+            self._thumbnail_photos.popitem(last=False)
+        return photo
+    
+    def _request_thumbnails(self, file_paths):
+        """메모리에 없는 썸네일을 작업 스레드에서 준비 요청"""
+        cache = thumbnail_cache.get_thumbnail_cache()
+        missing = [path for path in file_paths if cache.peek(path) is None]
+        if not missing:
+            return
+        if self._thumbnail_loader is None:
+            self._thumbnail_loader = thumbnail_cache.ThumbnailLoader(cache)
+        idle = self._thumbnail_loader.pending == 0
+        self._thumbnail_loader.request(missing)
+        if idle:
+            self.after(_THUMBNAIL_POLL_MS, self._poll_thumbnails)
+    
+    def _poll_thumbnails(self):
+        """준비된 썸네일을 보이는 행에 반영"""
+        loader = self._thumbnail_loader
+        if loader is None:
+            return
+        try:
+            loaded = {path for path, image in loader.poll() if image is not None}
+            if loaded:
+                self.similar_results_view.rebind(lambda item: item[1] in loaded)
+        except Exception as e:
+            print(f"[비슷한얼굴] 썸네일 표시 실패: {e}")
+        if loader.pending:
+            self.after(_THUMBNAIL_POLL_MS, self._poll_thumbnails)
     
     def _load_similar_face_image(self, file_path):
         """비슷한 얼굴 이미지 클릭 시 해당 이미지 선택"""
@@ -776,7 +844,7 @@ class FaceSimilarPanel(SimilarFaceManagerMixin, tk.Toplevel):
         self.current_image_path = file_path
         self._show_current_image_preview(file_path)
     
-    def _delete_result_image(self, file_path, item_frame):
+    def _delete_result_image(self, file_path):
         """검색 결과에서 이미지 삭제"""
         # 파일 경로 정규화
         file_path = os.path.normpath(file_path)
@@ -823,6 +891,7 @@ class FaceSimilarPanel(SimilarFaceManagerMixin, tk.Toplevel):
             try:
                 os.remove(file_path)
                 deleted_files.append("이미지 파일")
+                dir_manifest.get_manifest(os.path.dirname(file_path)).discard(os.path.basename(file_path))
             except Exception as e:
                 # 경고음 비활성화
                 original_bell = self.bell
@@ -860,9 +929,16 @@ class FaceSimilarPanel(SimilarFaceManagerMixin, tk.Toplevel):
                 except Exception as e:
                     print(f"[비슷한얼굴] 추출 이미지 삭제 실패 ({png_file_path}): {e}")
             
-            # features 캐시 파일 삭제
-            from gui.face_extract.similar import _get_features_dir, _get_features_cache_filename
-            features_dir = _get_features_dir(file_path)
+            # 특징 저장소 항목 삭제 표시
+            try:
+                if feature_store.remove_image_features(file_path):
+                    deleted_files.append("features 저장소 항목")
+            except Exception as e:
+                print(f"[비슷한얼굴] features 저장소 항목 삭제 실패 ({file_path}): {e}")
+            
+            # 이전 형식 features 캐시 파일 삭제
+            from gui.face_extract.similar import _get_features_cache_filename
+            features_dir = feature_store.get_features_dir(file_path)
             for suffix in ['', '_clothing', '_clothing_only']:
                 cache_filename = _get_features_cache_filename(file_path, suffix)
                 cache_path = os.path.join(features_dir, cache_filename)
@@ -872,7 +948,17 @@ class FaceSimilarPanel(SimilarFaceManagerMixin, tk.Toplevel):
                         deleted_files.append(f"features 캐시 ({suffix or '기본'})")
                     except Exception as e:
                         print(f"[비슷한얼굴] features 캐시 삭제 실패 ({cache_path}): {e}")
-            
+
+            # 랜드마크 캐시 파일 삭제
+            import utils.landmark_cache as landmark_cache
+            landmarks_path = landmark_cache.get_landmarks_cache_path(file_path)
+            if os.path.exists(landmarks_path):
+                try:
+                    os.remove(landmarks_path)
+                    deleted_files.append("랜드마크 캐시")
+                except Exception as e:
+                    print(f"[비슷한얼굴] 랜드마크 캐시 삭제 실패 ({landmarks_path}): {e}")
+
             # parameters 파일 삭제
             import utils.config as config_util
             parameters_dir = config_util._get_parameters_dir(file_path)
@@ -886,7 +972,8 @@ class FaceSimilarPanel(SimilarFaceManagerMixin, tk.Toplevel):
                     print(f"[비슷한얼굴] parameters 파일 삭제 실패 ({params_path}): {e}")
             
             # 결과 목록에서 항목 제거
-            item_frame.destroy()
+            self.similar_results_view.remove(lambda item: _same_path(item[1], file_path))
+            self.similar_faces_list = self.similar_results_view.items
             
             # 파일 목록에서도 제거 (정확한 경로로 매칭)
             filename = os.path.basename(file_path)
@@ -902,20 +989,17 @@ class FaceSimilarPanel(SimilarFaceManagerMixin, tk.Toplevel):
                 if listbox_filename == filename:
                     # 경로도 확인하여 정확히 일치하는 경우만 삭제
                     listbox_file_path = os.path.normpath(os.path.join(png_dir, listbox_filename))
-                    if listbox_file_path == file_path:
+                    if _same_path(listbox_file_path, file_path):
                         self.file_listbox.delete(i)
                         print(f"[비슷한얼굴] 파일 목록에서 제거: {listbox_filename}")
                         break
             
             # 현재 선택된 이미지가 삭제된 경우 초기화
-            if self.current_image_path == file_path:
+            if self.current_image_path and _same_path(self.current_image_path, file_path):
                 self.current_image_path = None
                 self.current_image_canvas.delete("all")
                 self.current_image_photo = None
-            
-            # 스크롤 영역 업데이트
-            self.similar_faces_canvas.update_idletasks()
-            self.similar_faces_canvas.configure(scrollregion=self.similar_faces_canvas.bbox("all"))
+
             
             # 경고음 없이 완료 메시지 표시
             _silent_messagebox("완료", f"파일이 삭제되었습니다.\n\n삭제된 항목:\n" + "\n".join(f"- {f}" for f in deleted_files), icon='info')
@@ -1114,6 +1198,10 @@ class FaceSimilarPanel(SimilarFaceManagerMixin, tk.Toplevel):
     
     def on_close(self):
         """창 닫기"""
+        self._cancel_search()
+        if self._thumbnail_loader is not None:
+            self._thumbnail_loader.shutdown()
+            self._thumbnail_loader = None
         self.destroy()
 
 
@@ -6,6 +6,8 @@
 import tkinter as tk
 from PIL import Image, ImageTk
 
+from utils.face_morphing.polygon_morphing import kernels as morph_kernels
+
 from .file import FileManagerMixin
 from .preview import PreviewManagerMixin
 from .polygon_renderer import PolygonRendererMixin
@@ -293,6 +295,9 @@ class FaceEditPanel(
         
         self.create_widgets()
         self._apply_guide_scaling_state(self.use_guide_line_scaling.get())
+        
+        # 정변환 누적 커널 미리 컴파일 (첫 드래그가 멈추지 않도록 백그라운드에서)
+        morph_kernels.warm_up(background=True)
         self._last_guide_scaling_state = None
 
         # 창 초기 크기 설정 (캔버스 초기 크기 * 2 + 여백)
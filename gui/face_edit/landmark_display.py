@@ -435,8 +435,7 @@ class LandmarkDisplayMixin:
             
             # MediaPipe 연결 정보 가져오기
             try:
-                import mediapipe as mp
-                mp_face_mesh = mp.solutions.face_mesh
+                from utils import facemesh_topology as mp_face_mesh
                 FACE_OVAL = mp_face_mesh.FACEMESH_FACE_OVAL
                 LEFT_EYE = mp_face_mesh.FACEMESH_LEFT_EYE
                 RIGHT_EYE = mp_face_mesh.FACEMESH_RIGHT_EYE
@@ -500,8 +499,7 @@ class LandmarkDisplayMixin:
                 connections_to_draw = list(LEFT_EYE) + list(RIGHT_EYE)
                 # 눈동자 연결 정보 추가
                 try:
-                    import mediapipe as mp
-                    mp_face_mesh = mp.solutions.face_mesh
+                    from utils import facemesh_topology as mp_face_mesh
                     try:
                         LEFT_IRIS = list(mp_face_mesh.FACEMESH_LEFT_IRIS)
                         RIGHT_IRIS = list(mp_face_mesh.FACEMESH_RIGHT_IRIS)
@@ -683,8 +681,7 @@ class LandmarkDisplayMixin:
     def _highlight_connected_lines(self, canvas_obj, landmark_index):
         """선택된 포인트에 연결된 선들을 빨간색으로 강조 (현재 탭의 폴리곤에 포함된 연결선만)"""
         try:
-            import mediapipe as mp
-            mp_face_mesh = mp.solutions.face_mesh
+            from utils import facemesh_topology as mp_face_mesh
             
             # 현재 탭에 해당하는 연결 정보 가져오기
             current_tab = getattr(self, 'current_morphing_tab', '눈')
@@ -828,8 +825,7 @@ class LandmarkDisplayMixin:
             return
         
         try:
-            import mediapipe as mp
-            mp_face_mesh = mp.solutions.face_mesh
+            from utils import facemesh_topology as mp_face_mesh
             
             # 현재 탭에 해당하는 연결 정보 가져오기
             current_tab = getattr(self, 'current_morphing_tab', '눈')
@@ -928,8 +928,7 @@ class LogicMixin(EditingStepsMixin):
             tesselation_graph = {}
             if expansion_level > 0:
                 try:
-                    import mediapipe as mp
-                    mp_face_mesh = mp.solutions.face_mesh
+                    from utils import facemesh_topology as mp_face_mesh
                     tesselation = list(mp_face_mesh.FACEMESH_TESSELATION)
                     
                     for idx1, idx2 in tesselation:
@@ -12,6 +12,7 @@ import utils.face_morphing as face_morphing
 import utils.style_transfer as style_transfer
 import utils.face_transform as face_transform
 from utils.face_morphing.region_extraction import _get_region_center
+from utils.landmarks import as_landmarks
 
 
 
@@ -23,8 +24,7 @@ class UtilsMixin:
         if not base_indices:
             return set()
         try:
-            import mediapipe as mp
-            mp_face_mesh = mp.solutions.face_mesh
+            from utils import facemesh_topology as mp_face_mesh
             tesselation = list(mp_face_mesh.FACEMESH_TESSELATION)
         except Exception:
             tesselation = []
@@ -114,21 +114,12 @@ class UtilsMixin:
         """부위별 중심을 기준으로 크기 조정"""
         if not landmarks or not region_groups or (abs(size_x - 1.0) < 0.01 and abs(size_y - 1.0) < 0.01):
             return landmarks
-        scaled = list(landmarks)
+        scaled = as_landmarks(landmarks)
         for region_name, indices in region_groups.items():
             center = center_map.get(region_name)
             if center is None:
                 continue
-            cx, cy = center
-            for idx in indices:
-                if 0 <= idx < len(scaled):
-                    x, y = scaled[idx]
-                    dx = x - cx
-                    dy = y - cy
-                    scaled[idx] = (
-                        cx + dx * size_x,
-                        cy + dy * size_y
-                    )
+            scaled = scaled.scale(size_x, size_y, center, indices=list(indices))
         return scaled
 
     @staticmethod
@@ -136,17 +127,12 @@ class UtilsMixin:
         """선택된 부위를 통째로 이동"""
         if not landmarks or (abs(delta_x) < 0.1 and abs(delta_y) < 0.1):
             return landmarks
-        translated = list(landmarks)
+        translated = as_landmarks(landmarks)
         if region_groups:
             for indices in region_groups.values():
-                for idx in indices:
-                    if 0 <= idx < len(translated):
-                        x, y = translated[idx]
-                        translated[idx] = (x + delta_x, y + delta_y)
+                translated = translated.translate(delta_x, delta_y, indices=list(indices))
         else:
-            for idx in range(len(translated)):
-                x, y = translated[idx]
-                translated[idx] = (x + delta_x, y + delta_y)
+            translated = translated.translate(delta_x, delta_y)
         return translated
     
     def update_labels_only(self):
@@ -597,8 +583,7 @@ class UtilsMixin:
     def _get_region_indices(self, region_name):
         """부위 이름에 해당하는 랜드마크 인덱스 목록 반환"""
         try:
-            import mediapipe as mp
-            mp_face_mesh = mp.solutions.face_mesh
+            from utils import facemesh_topology as mp_face_mesh
             
             indices = set()
             
@@ -1197,7 +1197,8 @@ class PolygonDragHandlerMixin:
                 else:
                     print_debug("apply_polygon_drag_final",f"morph_handler _force_use_indices 없음, 전체 변형 사용")
                 
-                result = face_morphing.morph_face_by_polygons(
+                morph_polygons = self._get_polygon_drag_morph_function()
+                result = morph_polygons(
                         self.current_image,  # 원본 이미지
                         original_landmarks_for_morph,  # 원본 랜드마크 (468개)
                         custom_landmarks_for_morph,  # 변형된 랜드마크 (468개, 중앙 포인트 제거됨)
@@ -1214,6 +1215,11 @@ class PolygonDragHandlerMixin:
                         skip_pixel_warp=False
                     )
                 
+                renderer = getattr(self, '_incremental_morph_renderer', None)
+                if renderer is not None and morph_polygons == renderer.render:
+                    region_text = "전체" if renderer.last_full else str(renderer.last_region)
+                    print_debug("apply_polygon_drag_final", f"부분 재렌더링 영역: {region_text}")
+                
                 # 디버그: 결과 확인
                 print_debug("얼굴편집", f"morph_face_by_polygons 결과: {type(result)}, 크기: {result.size if result else 'None'}")
             if result is None:
@@ -1317,6 +1323,16 @@ class PolygonDragHandlerMixin:
         if not hasattr(self, '_last_polygon_apply_signature'):
             self._last_polygon_apply_signature = None
 
+    def _get_polygon_drag_morph_function(self):
+        """드래그 최종 적용에 쓸 모핑 함수 (incremental_drag_render가 켜져 있으면 직전 결과 재사용)"""
+        if not getattr(self, 'incremental_drag_render', True):
+            return face_morphing.morph_face_by_polygons
+        renderer = getattr(self, '_incremental_morph_renderer', None)
+        if renderer is None:
+            renderer = face_morphing.IncrementalMorphRenderer()
+            self._incremental_morph_renderer = renderer
+        return renderer.render
+
     def _get_var_value_for_signature(self, attr_name, default=0.0):
         var = getattr(self, attr_name, None)
         if var is None:
@@ -1474,8 +1490,7 @@ class PolygonDragHandlerMixin:
         # 눈동자 중앙 포인트가 클릭 범위 내에 있으면 눈동자 포인트를 찾지 않음
         center_radius = 10  # 중앙 포인트 클릭 범위 (캔버스 좌표계 기준, 픽셀)
         try:
-            import mediapipe as mp
-            mp_face_mesh = mp.solutions.face_mesh
+            from utils import facemesh_topology as mp_face_mesh
             LEFT_IRIS = list(mp_face_mesh.FACEMESH_LEFT_IRIS)
             RIGHT_IRIS = list(mp_face_mesh.FACEMESH_RIGHT_IRIS)
             
@@ -1628,8 +1643,7 @@ class PolygonDragHandlerMixin:
         center_radius = 25  # 중앙 포인트 클릭 범위 (캔버스 좌표계 기준, 픽셀)
         
         try:
-            import mediapipe as mp
-            mp_face_mesh = mp.solutions.face_mesh
+            from utils import facemesh_topology as mp_face_mesh
             LEFT_IRIS = list(mp_face_mesh.FACEMESH_LEFT_IRIS)
             RIGHT_IRIS = list(mp_face_mesh.FACEMESH_RIGHT_IRIS)
             
@@ -455,8 +455,7 @@ class AllTabDrawerMixin:
 
         # 전체 탭: 선택된 부위가 있으면 선택된 부위만, 없으면 모든 부위의 폴리곤 그리기
         try:
-            import mediapipe as mp
-            mp_face_mesh = mp.solutions.face_mesh
+            from utils import facemesh_topology as mp_face_mesh
             LEFT_EYE = list(mp_face_mesh.FACEMESH_LEFT_EYE)
             RIGHT_EYE = list(mp_face_mesh.FACEMESH_RIGHT_EYE)
             LEFT_EYEBROW = list(mp_face_mesh.FACEMESH_LEFT_EYEBROW)
@@ -515,8 +514,7 @@ class AllTabDrawerMixin:
                 # 확장 레벨에 따라 주변 포인트 추가
                 if expansion_level > 0:
                     try:
-                        import mediapipe as mp
-                        mp_face_mesh = mp.solutions.face_mesh
+                        from utils import facemesh_topology as mp_face_mesh
                         tesselation = list(mp_face_mesh.FACEMESH_TESSELATION)
 
                         # TESSELATION 그래프 구성
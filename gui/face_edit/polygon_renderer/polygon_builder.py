@@ -137,8 +137,7 @@ class PolygonBuilderMixin:
         
         
         try:
-            import mediapipe as mp
-            mp_face_mesh = mp.solutions.face_mesh
+            from utils import facemesh_topology as mp_face_mesh
             LEFT_IRIS_CONNECTIONS = list(mp_face_mesh.FACEMESH_LEFT_IRIS)
             RIGHT_IRIS_CONNECTIONS = list(mp_face_mesh.FACEMESH_RIGHT_IRIS)
         except AttributeError:
@@ -184,8 +183,7 @@ class PolygonBuilderMixin:
             return iris_points_from_landmarks
         
         try:
-            import mediapipe as mp
-            mp_face_mesh = mp.solutions.face_mesh
+            from utils import facemesh_topology as mp_face_mesh
             tesselation = mp_face_mesh.FACEMESH_TESSELATION
         except ImportError:
             from utils.logger import print_warning
@@ -72,8 +72,7 @@ class TabDrawersMixin:
         """eye 탭 폴리곤 그리기"""
         # 눈 편집 시: MediaPipe 연결 정보를 사용해서 눈과 눈썹을 각각 별도 폴리곤으로 그리기
         try:
-            import mediapipe as mp
-            mp_face_mesh = mp.solutions.face_mesh
+            from utils import facemesh_topology as mp_face_mesh
             LEFT_EYE = list(mp_face_mesh.FACEMESH_LEFT_EYE)
             RIGHT_EYE = list(mp_face_mesh.FACEMESH_RIGHT_EYE)
             LEFT_EYEBROW = list(mp_face_mesh.FACEMESH_LEFT_EYEBROW)
@@ -161,8 +160,7 @@ class TabDrawersMixin:
             # 확장 레벨에 따라 주변 포인트 추가
             if expansion_level > 0:
                 try:
-                    import mediapipe as mp
-                    mp_face_mesh = mp.solutions.face_mesh
+                    from utils import facemesh_topology as mp_face_mesh
                     tesselation = list(mp_face_mesh.FACEMESH_TESSELATION)
                     tesselation_graph = {}
                     for idx1, idx2 in tesselation:
@@ -226,8 +224,7 @@ class TabDrawersMixin:
             # 확장 레벨에 따라 주변 포인트 추가
             if expansion_level > 0:
                 try:
-                    import mediapipe as mp
-                    mp_face_mesh = mp.solutions.face_mesh
+                    from utils import facemesh_topology as mp_face_mesh
                     tesselation = list(mp_face_mesh.FACEMESH_TESSELATION)
                     tesselation_graph = {}
                     for idx1, idx2 in tesselation:
@@ -335,8 +332,7 @@ class TabDrawersMixin:
         """nose 탭 폴리곤 그리기"""
         # 코 영역: MediaPipe 연결 정보 사용
         try:
-            import mediapipe as mp
-            mp_face_mesh = mp.solutions.face_mesh
+            from utils import facemesh_topology as mp_face_mesh
             NOSE = list(mp_face_mesh.FACEMESH_NOSE)
             # 코 탭의 랜드마크 인덱스 수집
             nose_indices_set = set()
@@ -347,8 +343,7 @@ class TabDrawersMixin:
             # 확장 레벨에 따라 주변 포인트 추가
             if expansion_level > 0:
                 try:
-                    import mediapipe as mp
-                    mp_face_mesh = mp.solutions.face_mesh
+                    from utils import facemesh_topology as mp_face_mesh
                     tesselation = list(mp_face_mesh.FACEMESH_TESSELATION)
                     tesselation_graph = {}
                     for idx1, idx2 in tesselation:
@@ -445,8 +440,7 @@ class TabDrawersMixin:
         """mouth 탭 폴리곤 그리기"""
         # 입 영역: MediaPipe 연결 정보 사용
         try:
-            import mediapipe as mp
-            mp_face_mesh = mp.solutions.face_mesh
+            from utils import facemesh_topology as mp_face_mesh
             LIPS = list(mp_face_mesh.FACEMESH_LIPS)
             # 입 탭의 랜드마크 인덱스 수집
             lips_indices_set = set()
@@ -457,8 +451,7 @@ class TabDrawersMixin:
             # 확장 레벨에 따라 주변 포인트 추가
             if expansion_level > 0:
                 try:
-                    import mediapipe as mp
-                    mp_face_mesh = mp.solutions.face_mesh
+                    from utils import facemesh_topology as mp_face_mesh
                     tesselation = list(mp_face_mesh.FACEMESH_TESSELATION)
                     tesselation_graph = {}
                     for idx1, idx2 in tesselation:
@@ -560,8 +553,7 @@ class TabDrawersMixin:
         """eyebrow 탭 폴리곤 그리기"""
         # 눈썹 영역: MediaPipe 연결 정보 사용
         try:
-            import mediapipe as mp
-            mp_face_mesh = mp.solutions.face_mesh
+            from utils import facemesh_topology as mp_face_mesh
             LEFT_EYEBROW = list(mp_face_mesh.FACEMESH_LEFT_EYEBROW)
             RIGHT_EYEBROW = list(mp_face_mesh.FACEMESH_RIGHT_EYEBROW)
 
@@ -574,8 +566,7 @@ class TabDrawersMixin:
             # 확장 레벨에 따라 주변 포인트 추가
             if expansion_level > 0:
                 try:
-                    import mediapipe as mp
-                    mp_face_mesh = mp.solutions.face_mesh
+                    from utils import facemesh_topology as mp_face_mesh
                     tesselation = list(mp_face_mesh.FACEMESH_TESSELATION)
                     tesselation_graph = {}
                     for idx1, idx2 in tesselation:
@@ -728,8 +719,7 @@ class TabDrawersMixin:
         """jaw 탭 폴리곤 그리기"""
         # 턱선 영역: FACE_OVAL에서 턱선 부분만 필터링
         try:
-            import mediapipe as mp
-            mp_face_mesh = mp.solutions.face_mesh
+            from utils import facemesh_topology as mp_face_mesh
             FACE_OVAL = list(mp_face_mesh.FACEMESH_FACE_OVAL)
 
             # 턱선 필터링: 눈 중심을 기준으로 아래쪽 부분만 사용 (귀까지 포함)
@@ -789,8 +779,7 @@ class TabDrawersMixin:
             # 확장 레벨에 따라 주변 포인트 추가
             if expansion_level > 0:
                 try:
-                    import mediapipe as mp
-                    mp_face_mesh = mp.solutions.face_mesh
+                    from utils import facemesh_topology as mp_face_mesh
                     tesselation = list(mp_face_mesh.FACEMESH_TESSELATION)
                     tesselation_graph = {}
                     for idx1, idx2 in tesselation:
@@ -894,8 +883,7 @@ class TabDrawersMixin:
             margin_ratio: 눈동자 이동 범위 제한 마진 비율 (0.0 ~ 1.0)
         """
         try:
-            import mediapipe as mp
-            mp_face_mesh = mp.solutions.face_mesh
+            from utils import facemesh_topology as mp_face_mesh
             
             # 눈동자 연결 정보 가져오기
             try:
@@ -1255,8 +1243,7 @@ class TabDrawersMixin:
         """contour 탭 폴리곤 그리기"""
         # 얼굴 외곽선: MediaPipe 연결 정보 사용
         try:
-            import mediapipe as mp
-            mp_face_mesh = mp.solutions.face_mesh
+            from utils import facemesh_topology as mp_face_mesh
             FACE_OVAL = list(mp_face_mesh.FACEMESH_FACE_OVAL)
             # 윤곽 탭의 랜드마크 인덱스 수집
             face_oval_indices_set = set()
@@ -1267,8 +1254,7 @@ class TabDrawersMixin:
             # 확장 레벨에 따라 주변 포인트 추가
             if expansion_level > 0:
                 try:
-                    import mediapipe as mp
-                    mp_face_mesh = mp.solutions.face_mesh
+                    from utils import facemesh_topology as mp_face_mesh
                     tesselation = list(mp_face_mesh.FACEMESH_TESSELATION)
                     tesselation_graph = {}
                     for idx1, idx2 in tesselation:
@@ -3,6 +3,8 @@
 """
 import numpy as np
 
+from utils.landmarks import as_point_array
+
 # scipy import 확인
 try:
     from scipy.spatial import Delaunay
@@ -30,24 +32,18 @@ class UtilsMixin:
             return
         
         try:
-            # numpy 배열로 변환
-            original_points_array = np.array(original_landmarks, dtype=np.float32)
-            transformed_points_array = np.array(transformed_landmarks, dtype=np.float32)
-            
             # 이미지 경계 포인트 추가
             margin = 10
-            boundary_points = [
+            boundary_points = np.array([
                 (-margin, -margin),
                 (img_width + margin, -margin),
                 (img_width + margin, img_height + margin),
                 (-margin, img_height + margin)
-            ]
-            
-            all_original_points = list(original_landmarks) + boundary_points
-            all_transformed_points = list(transformed_landmarks) + boundary_points
+            ], dtype=np.float32)
             
-            original_points_array = np.array(all_original_points, dtype=np.float32)
-            transformed_points_array = np.array(all_transformed_points, dtype=np.float32)
+            # numpy 배열로 변환 (Landmarks는 복사 없이 배열 사용)
+            original_points_array = np.vstack([as_point_array(original_landmarks), boundary_points])
+            transformed_points_array = np.vstack([as_point_array(transformed_landmarks), boundary_points])
             
             # Delaunay Triangulation 생성
             tri = Delaunay(original_points_array)
@@ -10,8 +10,7 @@ class TabRendererMixin:
     def _get_target_indices_for_tab(self, current_tab):
         """현재 탭에 해당하는 랜드마크 인덱스 목록 반환"""
         try:
-            import mediapipe as mp
-            mp_face_mesh = mp.solutions.face_mesh
+            from utils import facemesh_topology as mp_face_mesh
             
             if current_tab == '눈':
                 LEFT_EYE = list(mp_face_mesh.FACEMESH_LEFT_EYE)
@@ -100,8 +99,7 @@ class TabRendererMixin:
     def _get_selected_region_indices(self):
         """선택된 부위의 랜드마크 인덱스 목록 반환 (전체 탭용)"""
         try:
-            import mediapipe as mp
-            mp_face_mesh = mp.solutions.face_mesh
+            from utils import facemesh_topology as mp_face_mesh
             
             indices = set()
             
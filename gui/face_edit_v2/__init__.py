@@ -6,6 +6,8 @@ import os
 import tkinter as tk
 from PIL import Image, ImageTk
 
+from utils.face_morphing.polygon_morphing import kernels as morph_kernels
+
 # 핵심 Mixin들만 남기기
 from .file import FileManagerMixin
 from .preview import PreviewManagerMixin
@@ -300,6 +302,9 @@ class FaceEditPanel(
         self.create_widgets()
         self._apply_guide_scaling_state(self.use_guide_line_scaling.get())
         
+        # 정변환 누적 커널 미리 컴파일 (첫 드래그가 멈추지 않도록 백그라운드에서)
+        morph_kernels.warm_up(background=True)
+        
         # 창 초기 크기 및 위치 설정
         initial_window_width = (self.canvas_initial_width * 2) + 50
         initial_window_height = self.canvas_initial_height + 100
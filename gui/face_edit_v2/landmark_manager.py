@@ -4,6 +4,10 @@
 """
 from typing import List, Tuple, Optional, Dict, Any, Set
 
+import numpy as np
+
+from utils.landmarks import Landmarks, as_landmarks
+
 
 class LandmarkManager:
     """랜드마크 상태를 중앙에서 관리하는 클래스"""
@@ -109,10 +113,12 @@ class LandmarkManager:
                     iris_center_indices = {468, 473}
                     iris_indices = iris_contour_indices | iris_center_indices
                     
-                    # 얼굴 랜드마크 (468개)
-                    face_landmarks = [pt for i, pt in enumerate(landmarks) if i not in iris_indices]
-                    # 눈동자 랜드마크 (10개)
-                    iris_landmarks = [landmarks[i] for i in sorted(iris_indices) if i < len(landmarks)]
+                    # 인덱스 마스크로 얼굴(468개)과 눈동자(10개)를 한 번에 분리
+                    points = as_landmarks(landmarks)
+                    iris_mask = np.zeros(len(points), dtype=bool)
+                    iris_mask[sorted(i for i in iris_indices if i < len(points))] = True
+                    face_landmarks = points.take(np.flatnonzero(~iris_mask))
+                    iris_landmarks = points.take(np.flatnonzero(iris_mask))
                     
                     self._original_face_landmarks = face_landmarks
                     self._original_iris_landmarks = iris_landmarks if iris_landmarks else None
@@ -162,8 +168,8 @@ class LandmarkManager:
                     # 눈동자 랜드마크는 제외하되, 얼굴 랜드마크 전체를 사용
                     # 경계 포인트는 이미지 경계 밖에 있어서 포함하면 전체 이미지가 되므로 제외
                     # 패딩을 50%로 늘려서 얼굴 전체(턱, 이마 등)를 포함하도록 함
-                    landmarks_no_iris = [pt for i, pt in enumerate(landmarks) if i not in iris_indices]
-                    bbox = _calculate_landmark_bounding_box(landmarks_no_iris, img_width, img_height, padding_ratio=0.5)
+                    bbox = _calculate_landmark_bounding_box(landmarks, img_width, img_height, padding_ratio=0.5,
+                                                            exclude_indices=iris_indices)
                     if bbox is not None:
                         self._original_bbox = bbox
                         self._original_bbox_img_size = (img_width, img_height)
@@ -559,7 +565,7 @@ class LandmarkManager:
         """
         if self._original_face_landmarks is not None:
             if self._original_iris_landmarks is not None:
-                result = list(self._original_face_landmarks)  # 눈동자 추가를 위해 복사본 필요
+                result = Landmarks(self._original_face_landmarks)  # 눈동자 추가를 위해 복사본 필요
                 # 눈동자 랜드마크를 올바른 인덱스 위치에 삽입
                 try:
                     from utils.face_morphing.region_extraction import get_iris_indices
@@ -661,9 +667,8 @@ class LandmarkManager:
             # 중앙 포인트 추가 (morph_face_by_polygons 순서: MediaPipe LEFT_IRIS 먼저, MediaPipe RIGHT_IRIS 나중)
             if left_center is not None and right_center is not None:
                 # 중앙 포인트 추가를 위해 새 리스트 생성 (구조 변경 필요)
-                original = list(self._original_face_landmarks)  # 중앙 포인트 추가를 위해 복사본 필요
-                original.append(left_center)   # landmarks[468]
-                original.append(right_center)  # landmarks[469]
+                original = Landmarks(self._original_face_landmarks)  # 중앙 포인트 추가를 위해 복사본 필요
+                original.extend([left_center, right_center])  # landmarks[468], landmarks[469]
             else:
                 # 중앙 포인트가 없으면 직접 참조 반환 (복사본 없음)
                 original = self._original_face_landmarks
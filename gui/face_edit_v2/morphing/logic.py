@@ -14,6 +14,7 @@ import utils.style_transfer as style_transfer
 import utils.face_transform as face_transform
 
 from .editing_steps import EditingStepsMixin
+from utils.landmarks import Landmarks
 from utils.logger import print_info, print_debug, print_error, print_warning
 
 
@@ -22,7 +23,9 @@ class LogicMixin(EditingStepsMixin):
     """편집 적용 및 보정 로직 기능 Mixin"""
     
     def _convert_landmarks_to_tuples(self, landmarks, img_width, img_height):
-        """랜드마크를 tuple 리스트로 변환"""
+        """랜드마크를 tuple 리스트로 변환 (Landmarks는 이미 튜플 호환이므로 그대로 반환)"""
+        if isinstance(landmarks, Landmarks):
+            return landmarks
         result = []
         for landmark in landmarks:
             if isinstance(landmark, tuple):
@@ -929,8 +932,7 @@ class LogicMixin(EditingStepsMixin):
             tesselation_graph = {}
             if expansion_level > 0:
                 try:
-                    import mediapipe as mp
-                    mp_face_mesh = mp.solutions.face_mesh
+                    from utils import facemesh_topology as mp_face_mesh
                     tesselation = list(mp_face_mesh.FACEMESH_TESSELATION)
                     
                     for idx1, idx2 in tesselation:
@@ -1062,6 +1064,8 @@ class LogicMixin(EditingStepsMixin):
                 right_iris_center_orig=polygon_inputs['right_center_orig'],
                 cached_original_bbox=polygon_inputs['cached_bbox'],
                 blend_ratio=polygon_inputs['blend_ratio'],
+                # 드래그 중에는 원본 랜드마크/바운딩 박스가 그대로이므로 무게중심 필드를 재사용
+                render_backend="cached_remap",
             )
             
             # 가이드축이 있고 변형이 필요한 경우 추가 적용
@@ -10,6 +10,9 @@ import utils.face_morphing as face_morphing
 from utils.logger import print_info, print_debug, print_error, print_warning
 from PIL import Image, ImageDraw, ImageFilter
 
+# 드래그를 멈춘 뒤 원본 해상도로 다시 렌더링할 때까지 기다리는 시간 (ms)
+FULL_RENDER_IDLE_MS = 300
+
 
 def clamp_iris_position(center, eye_landmarks, margin_ratio=0.3):
     """눈동자 위치를 눈 랜드마크 내로 클램핑"""
@@ -358,8 +361,9 @@ class PolygonDragHandlerMixin:
             # 이미 위에서 on_iris_center_drag로 위임했으므로 여기서는 처리하지 않음
             pass
         
-        # 성능 최적화: 드래그 중에는 실시간 미리보기 비활성화
-        # 드래그 종료 시에만 최종 편집 적용
+        # 드래그 중에는 표시 해상도로 미리보기, 멈추거나 놓으면 원본 해상도로 렌더링
+        self.apply_polygon_drag_preview()
+        
         # 이벤트 전파 중단 (이미지 드래그 방지)
         return "break"
     
@@ -368,6 +372,9 @@ class PolygonDragHandlerMixin:
         if not self.dragging_polygon or self.dragged_polygon_index != landmark_index:
             return
         
+        # 예약된 미리보기/유휴 렌더링 대신 바로 원본 해상도로 렌더링
+        self._cancel_polygon_drag_renders()
+        
         # 드래그 종료 시 확대/축소 플래그 해제
         if hasattr(self, '_skip_morphing_change'):
             self._skip_morphing_change = False
@@ -623,6 +630,7 @@ class PolygonDragHandlerMixin:
         except Exception as e:
             print(f"[DEBUG] Error updating iris center position: {e}")
         
+        self.apply_polygon_drag_preview()
         return "break"
     
     def _update_iris_connections_during_drag(self, canvas_obj, iris_side, center_x, center_y):
@@ -656,6 +664,9 @@ class PolygonDragHandlerMixin:
         if not self.dragging_polygon or self.dragged_polygon_index != iris_side:
             return
         
+        # 예약된 미리보기/유휴 렌더링 대신 바로 원본 해상도로 렌더링
+        self._cancel_polygon_drag_renders()
+        
         # 드래그 종료 시 최종 좌표 확인
         final_left = self.landmark_manager.get_left_iris_center_coord()
         final_right = self.landmark_manager.get_right_iris_center_coord()
@@ -686,10 +697,48 @@ class PolygonDragHandlerMixin:
         return "break"
     
     def apply_polygon_drag_preview(self):
-        """폴리곤 드래그 중 실시간 미리보기 (현재 비활성화: 성능 최적화)"""
-        # 성능 최적화: 드래그 중에는 실시간 미리보기 비활성화
-        # 드래그 종료 시에만 최종 편집 적용
-        pass
+        """폴리곤 드래그 중 미리보기 예약
+        
+        모션 이벤트마다 렌더링하지 않고 이벤트 처리가 끝난 유휴 시점에 한 번만 표시 해상도로 렌더링하며,
+        드래그를 FULL_RENDER_IDLE_MS 동안 멈추면 원본 해상도로 다시 렌더링합니다.
+        예약할 때마다 렌더링 세대를 올리므로, 이전에 예약된 원본 해상도 렌더링은 새 미리보기를 덮어쓰지 않습니다.
+        """
+        self._polygon_render_generation = getattr(self, '_polygon_render_generation', 0) + 1
+        if getattr(self, '_polygon_preview_job', None) is None:
+            self._polygon_preview_job = self.after_idle(self._run_polygon_drag_preview)
+        full_render_job = getattr(self, '_polygon_full_render_job', None)
+        if full_render_job is not None:
+            self.after_cancel(full_render_job)
+        self._polygon_full_render_job = self.after(
+            FULL_RENDER_IDLE_MS, self._run_polygon_drag_full_render, self._polygon_render_generation)
+    
+    def _run_polygon_drag_preview(self):
+        """예약된 표시 해상도 미리보기 렌더링"""
+        self._polygon_preview_job = None
+        if not getattr(self, 'dragging_polygon', False):
+            return
+        self.apply_polygon_drag_final(desc="drag preview", quality="preview")
+    
+    def _run_polygon_drag_full_render(self, generation):
+        """드래그를 멈춘 뒤 원본 해상도 렌더링 (그 사이 새 미리보기가 요청되었으면 건너뜀)"""
+        if generation != getattr(self, '_polygon_render_generation', 0):
+            return
+        self._polygon_full_render_job = None
+        self.apply_polygon_drag_final(desc="drag idle", quality="full")
+    
+    def _cancel_polygon_drag_renders(self):
+        """예약된 드래그 미리보기/원본 해상도 렌더링 취소"""
+        for attr in ('_polygon_preview_job', '_polygon_full_render_job'):
+            job = getattr(self, attr, None)
+            if job is not None:
+                self.after_cancel(job)
+                setattr(self, attr, None)
+        self._polygon_render_generation = getattr(self, '_polygon_render_generation', 0) + 1
+    
+    def _get_polygon_preview_size(self):
+        """미리보기 렌더링 크기 (편집 캔버스 표시 크기, 없으면 None)"""
+        canvas = getattr(self, 'canvas_edited', None)
+        return getattr(canvas, 'display_size', None) if canvas is not None else None
     
     def _move_iris_only(self, image, left_center_orig, right_center_orig, left_center_new, right_center_new):
         """눈동자 영역만 이동 (머리 변형 없이)
@@ -781,18 +830,21 @@ class PolygonDragHandlerMixin:
         result_image = Image.fromarray(result.astype(np.uint8))
         return result_image
     
-    def apply_polygon_drag_final(self, desc="", force_slider_mode=False):
+    def apply_polygon_drag_final(self, desc="", force_slider_mode=False, quality="full"):
         """폴리곤 드래그 종료 시 최종 편집 적용
         
         Args:
             force_slider_mode: (사용 안 함, 하위 호환성 유지용)
+            quality: "full"이면 원본 해상도, "preview"면 편집 캔버스 표시 해상도로 렌더링 (드래그 중)
         """
         
         self._ensure_polygon_apply_guard_state()
         polygon_signature = self._build_polygon_apply_signature(force_slider_mode)
+        preview = quality == "preview"
         
         print_debug("apply_polygon_drag_final",f"{desc} called..\npolygon_signature={polygon_signature}")
-        if polygon_signature == getattr(self, '_last_polygon_apply_signature', None):
+        signature_attr = '_last_polygon_preview_signature' if preview else '_last_polygon_apply_signature'
+        if polygon_signature == getattr(self, signature_attr, None):
             return
 
         # custom_landmarks 확인 (LandmarkManager 사용)
@@ -1197,7 +1249,14 @@ class PolygonDragHandlerMixin:
                 else:
                     print_debug("apply_polygon_drag_final",f"morph_handler _force_use_indices 없음, 전체 변형 사용")
                 
-                result = face_morphing.morph_face_by_polygons(
+                if preview:
+                    # 미리보기는 축소 렌더링이므로 부분 재렌더링 상태를 건드리지 않음
+                    morph_polygons = face_morphing.morph_face_by_polygons
+                    preview_kwargs = {'render_backend': "remap", 'preview_size': self._get_polygon_preview_size()}
+                else:
+                    morph_polygons = self._get_polygon_drag_morph_function()
+                    preview_kwargs = {}
+                result = morph_polygons(
                         self.current_image,  # 원본 이미지
                         original_landmarks_for_morph,  # 원본 랜드마크 (468개)
                         custom_landmarks_for_morph,  # 변형된 랜드마크 (468개, 중앙 포인트 제거됨)
@@ -1211,9 +1270,15 @@ class PolygonDragHandlerMixin:
                         clamping_enabled=clamping_enabled_val,  # 눈동자 이동 범위 제한 활성화 여부
                         margin_ratio=margin_ratio_val,  # 눈동자 이동 범위 제한 마진 비율
                         iris_mapping_method=iris_mapping_method_val,  # 눈동자 맵핑 방법 (iris_outline/eye_landmarks)
-                        skip_pixel_warp=False
+                        skip_pixel_warp=False,
+                        **preview_kwargs
                     )
                 
+                renderer = getattr(self, '_incremental_morph_renderer', None)
+                if renderer is not None and morph_polygons == renderer.render:
+                    region_text = "전체" if renderer.last_full else str(renderer.last_region)
+                    print_debug("apply_polygon_drag_final", f"부분 재렌더링 영역: {region_text}")
+                
                 # 디버그: 결과 확인
                 print_debug("얼굴편집", f"morph_face_by_polygons 결과: {type(result)}, 크기: {result.size if result else 'None'}")
             if result is None:
@@ -1305,7 +1370,13 @@ class PolygonDragHandlerMixin:
                         self.update_face_features_display()
                 self._last_edited_image_hash = None
             
-            self._last_polygon_apply_signature = polygon_signature
+            if preview:
+                # 화면은 미리보기이므로 같은 포인트라도 원본 해상도 렌더링은 다시 수행
+                self._last_polygon_preview_signature = polygon_signature
+                self._last_polygon_apply_signature = None
+            else:
+                self._last_polygon_apply_signature = polygon_signature
+                self._last_polygon_preview_signature = polygon_signature
 
         except Exception as e:
             print_error("얼굴편집", f"랜드마크 드래그 최종 적용 실패: {e}", e)
@@ -1316,6 +1387,20 @@ class PolygonDragHandlerMixin:
     def _ensure_polygon_apply_guard_state(self):
         if not hasattr(self, '_last_polygon_apply_signature'):
             self._last_polygon_apply_signature = None
+        if not hasattr(self, '_last_polygon_preview_signature'):
+            self._last_polygon_preview_signature = None
+        if not hasattr(self, '_polygon_render_generation'):
+            self._polygon_render_generation = 0
+
+    def _get_polygon_drag_morph_function(self):
+        """드래그 최종 적용에 쓸 모핑 함수 (incremental_drag_render가 켜져 있으면 직전 결과 재사용)"""
+        if not getattr(self, 'incremental_drag_render', True):
+            return face_morphing.morph_face_by_polygons
+        renderer = getattr(self, '_incremental_morph_renderer', None)
+        if renderer is None:
+            renderer = face_morphing.IncrementalMorphRenderer()
+            self._incremental_morph_renderer = renderer
+        return renderer.render
 
     def _get_var_value_for_signature(self, attr_name, default=0.0):
         var = getattr(self, attr_name, None)
@@ -1474,8 +1559,7 @@ class PolygonDragHandlerMixin:
         # 눈동자 중앙 포인트가 클릭 범위 내에 있으면 눈동자 포인트를 찾지 않음
         center_radius = 10  # 중앙 포인트 클릭 범위 (캔버스 좌표계 기준, 픽셀)
         try:
-            import mediapipe as mp
-            mp_face_mesh = mp.solutions.face_mesh
+            from utils import facemesh_topology as mp_face_mesh
             LEFT_IRIS = list(mp_face_mesh.FACEMESH_LEFT_IRIS)
             RIGHT_IRIS = list(mp_face_mesh.FACEMESH_RIGHT_IRIS)
             
@@ -1628,8 +1712,7 @@ class PolygonDragHandlerMixin:
         center_radius = 25  # 중앙 포인트 클릭 범위 (캔버스 좌표계 기준, 픽셀)
         
         try:
-            import mediapipe as mp
-            mp_face_mesh = mp.solutions.face_mesh
+            from utils import facemesh_topology as mp_face_mesh
             LEFT_IRIS = list(mp_face_mesh.FACEMESH_LEFT_IRIS)
             RIGHT_IRIS = list(mp_face_mesh.FACEMESH_RIGHT_IRIS)
             
@@ -453,8 +453,7 @@ class DrawingMixin(AllTabDrawerMixin):
             
             # MediaPipe 연결 정보 가져오기
             try:
-                import mediapipe as mp
-                mp_face_mesh = mp.solutions.face_mesh
+                from utils import facemesh_topology as mp_face_mesh
                 FACE_OVAL = mp_face_mesh.FACEMESH_FACE_OVAL
                 LEFT_EYE = mp_face_mesh.FACEMESH_LEFT_EYE
                 RIGHT_EYE = mp_face_mesh.FACEMESH_RIGHT_EYE
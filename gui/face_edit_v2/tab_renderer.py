@@ -20,8 +20,7 @@ class TabRendererMixin:
     def _get_selected_region_indices(self):
         """선택된 부위의 랜드마크 인덱스 목록 반환 (전체 탭용)"""
         try:
-            import mediapipe as mp
-            mp_face_mesh = mp.solutions.face_mesh
+            from utils import facemesh_topology as mp_face_mesh
             
             indices = set()
             
@@ -3,7 +3,6 @@
 파일 선택, 로드 관련 기능을 담당
 """
 import os
-import glob
 import tkinter as tk
 from tkinter import filedialog
 
@@ -27,19 +26,9 @@ class FileManagerMixin:
             self.file_listbox.insert(0, f"디렉토리를 찾을 수 없습니다: {png_dir}")
             return
         
-        # 지원하는 이미지 파일 확장자
-        image_extensions = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.bmp', '*.tiff', '*.tif', '*.webp']
-        
-        # 모든 이미지 파일 목록 가져오기
-        image_files = []
-        for ext in image_extensions:
-            image_files.extend(glob.glob(os.path.join(png_dir, ext)))
-            image_files.extend(glob.glob(os.path.join(png_dir, ext.upper())))
-        
-        # 중복 제거 (Windows에서 대소문자 구분 안 함으로 인한 중복 방지)
-        # 정규화된 경로를 사용하여 중복 제거
-        image_files = list(set(os.path.normpath(f) for f in image_files))
-        image_files.sort()
+        # 디렉토리 매니페스트 갱신 (한 번의 스캔으로 변경분 계산, 변경된 파일 캐시 정리)
+        from gui.face_extract.similar import refresh_directory
+        image_files = refresh_directory(png_dir)
         
         if not image_files:
             self.file_listbox.insert(0, "이미지 파일이 없습니다")
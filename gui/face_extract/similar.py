@@ -3,31 +3,23 @@
 비슷한 얼굴을 찾아서 목록으로 표시하는 기능을 담당
 """
 import os
-import json
-import hashlib
 import tkinter as tk
 from tkinter import messagebox
 from PIL import Image
 
 import utils.face_landmarks as face_landmarks
-import utils.kaodata_image as kaodata_image
-
-
-def _get_features_dir(image_path):
-    """이미지 파일이 있는 디렉토리의 features 폴더 경로 반환"""
-    image_dir = os.path.dirname(image_path)
-    features_dir = os.path.join(image_dir, 'features')
-    # features 폴더가 없으면 생성
-    if not os.path.exists(features_dir):
-        try:
-            os.makedirs(features_dir, exist_ok=True)
-        except Exception as e:
-            print(f"[비슷한얼굴] features 폴더 생성 실패: {e}")
-    return features_dir
+import utils.landmark_cache as landmark_cache
+import utils.feature_store as feature_store
+import utils.ann_index as ann_index
+import utils.face_embedding as face_embedding
+import utils.face_clustering as face_clustering
+from utils.batch_landmarks import BatchLandmarkDetector
+import utils.similarity_indexer as similarity_indexer
+import utils.dir_manifest as dir_manifest
 
 
 def _get_features_cache_filename(image_path, suffix=''):
-    """이미지 파일명을 기반으로 캐시 파일명 생성"""
+    """이전 형식(이미지별 JSON) 특징 캐시 파일명 (정리용)"""
     # 이미지 파일명 (확장자 포함)
     image_filename = os.path.basename(image_path)
     # 캐시 파일명: {이미지파일명}.s7ed.features{suffix}
@@ -35,220 +27,292 @@ def _get_features_cache_filename(image_path, suffix=''):
     return cache_filename
 
 
+def _list_image_files(png_dir, rescan=False):
+    """디렉토리의 이미지 파일 목록 반환 (정규화 경로, 디렉토리 매니페스트 사용)"""
+    return dir_manifest.list_image_files(png_dir, rescan=rescan)
+
+
+def _same_path(path_a, path_b):
+    """두 경로가 같은 파일을 가리키는지 (정규화 후 비교)"""
+    return os.path.normcase(os.path.abspath(path_a)) == os.path.normcase(os.path.abspath(path_b))
+
+
+def apply_directory_changes(directory, diff):
+    """
+    디렉토리 매니페스트 변경분을 캐시에 반영합니다.
+    삭제/변경된 파일의 특징과 랜드마크 캐시만 지우고, 추가된 파일은 검색할 때 추출합니다.
+    """
+    stale = list(diff.removed) + list(diff.changed)
+    if not stale:
+        return
+    for name in stale:
+        image_path = os.path.join(directory, name)
+        feature_store.remove_image_features(image_path, flush=False)
+        landmark_cache.remove_landmarks(image_path)
+    feature_store.flush_all()
+    print(f"[비슷한얼굴] 변경된 파일 캐시 정리: 삭제 {len(diff.removed)}개, 변경 {len(diff.changed)}개")
+
+
+def refresh_directory(png_dir):
+    """디렉토리를 다시 스캔하고 변경분을 캐시에 반영한 뒤 이미지 경로 목록 반환"""
+    manifest = dir_manifest.get_manifest(png_dir)
+    diff = manifest.scan()
+    if diff:
+        apply_directory_changes(manifest.directory, diff)
+    return manifest.paths()
+
+
+def _search_mode(include_clothing=False, clothing_only=False, mesh=False):
+    """특징 추출 옵션을 검색 방식으로 변환"""
+    if clothing_only:
+        return similarity_indexer.MODE_CLOTHING
+    if include_clothing:
+        return similarity_indexer.MODE_COMBINED
+    if mesh:
+        return similarity_indexer.MODE_MESH
+    return similarity_indexer.MODE_FACE
+
+
 class SimilarFaceManagerMixin:
     """비슷한 얼굴 검색 기능 Mixin"""
     
-    def _get_features_cache_path(self, image_path):
-        """특징 벡터 캐시 파일 경로 반환 (features 폴더 내)"""
-        features_dir = _get_features_dir(image_path)
-        cache_filename = _get_features_cache_filename(image_path)
-        return os.path.join(features_dir, cache_filename)
-    
-    def _load_features_cache(self, image_path):
-        """특징 벡터 캐시 로드 (기존 함수, 호환성 유지)"""
-        cache_path = self._get_features_cache_path(image_path)
-        return self._load_features_cache_by_key(image_path, cache_path)
-    
-    def _save_features_cache(self, image_path, features):
-        """특징 벡터 캐시 저장 (기존 함수, 호환성 유지)"""
-        cache_path = self._get_features_cache_path(image_path)
-        self._save_features_cache_by_key(image_path, cache_path, features)
-    
-    def _extract_face_features_for_image(self, image_path, include_clothing=False, clothing_only=False):
-        """이미지에서 얼굴 특징 벡터 추출 (캐싱 포함)"""
-        # 캐시 확인 (옷 포함 여부에 따라 다른 캐시 키 사용)
-        features_dir = _get_features_dir(image_path)
+    def _extract_face_features_for_image(self, image_path, include_clothing=False, clothing_only=False, mesh=False):
+        """
+        이미지에서 얼굴 특징 벡터 추출 (특징 저장소 캐싱 포함)
+        mesh=True면 전체 메시 임베딩 (디렉토리 임베딩 기저가 학습되어 있어야 함)
+        """
+        # 필요한 특징 종류 (옷 포함 특징은 얼굴/옷 저장소를 함께 사용)
         if clothing_only:
-            cache_filename = _get_features_cache_filename(image_path, '_clothing_only')
+            kinds = [feature_store.KIND_CLOTHING]
+        elif mesh:
+            kinds = [feature_store.KIND_EMBEDDING]
         elif include_clothing:
-            cache_filename = _get_features_cache_filename(image_path, '_clothing')
+            kinds = [feature_store.KIND_FACE, feature_store.KIND_CLOTHING]
         else:
-            cache_filename = _get_features_cache_filename(image_path)
-        cache_key = os.path.join(features_dir, cache_filename)
-        
-        cached_features = self._load_features_cache_by_key(image_path, cache_key)
-        if cached_features is not None:
-            return cached_features
-        
-        try:
-            # 이미지 로드
-            image = Image.open(image_path)
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
-            
-            # 특징 벡터 추출
-            if clothing_only:
-                features = face_landmarks.extract_clothing_features_vector(image)
-            elif include_clothing:
-                features = face_landmarks.extract_combined_features_vector(image, include_clothing=True)
+            kinds = [feature_store.KIND_FACE]
+        
+        vectors = {}
+        missing = []
+        for kind in kinds:
+            vector, cached = feature_store.get_feature_store(image_path, kind).get(image_path)
+            if cached:
+                vectors[kind] = vector
             else:
-                features = face_landmarks.extract_face_features_vector(image)
-            
-            # 캐시 저장
-            if features is not None:
-                self._save_features_cache_by_key(image_path, cache_key, features)
-            
-            return features
-            
-        except Exception as e:
-            print(f"[비슷한얼굴] 특징 추출 실패 ({image_path}): {e}")
-            return None
-    
-    def _load_features_cache_by_key(self, image_path, cache_key):
-        """특징 벡터 캐시 로드 (캐시 키 지정)"""
-        if not os.path.exists(cache_key):
-            return None
+                missing.append(kind)
         
-        try:
-            # 이미지 파일의 수정 시간 확인
-            image_mtime = os.path.getmtime(image_path)
-            
-            with open(cache_key, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            
-            # 캐시의 이미지 수정 시간과 비교
-            if cache_data.get('image_mtime') == image_mtime:
-                import numpy as np
-                # 튜플인 경우와 단일 벡터인 경우 처리
-                features_data = cache_data['features']
-                if isinstance(features_data, list) and len(features_data) == 2:
-                    # 결합 특징 벡터 (얼굴, 옷)
-                    face_features = np.array(features_data[0], dtype=np.float32)
-                    clothing_features = np.array(features_data[1], dtype=np.float32) if features_data[1] else None
-                    return (face_features, clothing_features)
-                else:
-                    # 단일 특징 벡터
-                    features = np.array(features_data, dtype=np.float32)
-                    return features
-            
-            # 수정 시간이 다르면 캐시 무효화
-            return None
-            
-        except Exception as e:
-            print(f"[비슷한얼굴] 캐시 로드 실패: {e}")
-            return None
+        if missing:
+            try:
+                # 이미지 로드
+                image = Image.open(image_path)
+                if image.mode != 'RGB':
+                    image = image.convert('RGB')
+                
+                # 랜드마크는 캐시 우선 (배치 감지 결과 재사용)
+                landmarks = self._get_landmarks_for_image(image_path, image)
+                if landmarks is None:
+                    return None
+                
+                # 특징 벡터 추출 후 저장 (특징이 없는 경우도 기록해 재추출을 피함)
+                for kind in missing:
+                    if kind == feature_store.KIND_EMBEDDING:
+                        # 메시/임베딩 저장은 face_embedding이 담당 (기저가 없으면 기록하지 않음)
+                        vectors[kind] = face_embedding.compute_embedding(image_path, landmarks)
+                        continue
+                    if kind == feature_store.KIND_CLOTHING:
+                        vector = face_landmarks.extract_clothing_features_vector(image, landmarks)
+                    else:
+                        vector = face_landmarks.extract_face_features_vector(image, landmarks)
+                        # 랜드마크가 있을 때 메시도 기록해 두어 임베딩 기저 학습에 사용
+                        face_embedding.store_mesh(image_path, landmarks)
+                    feature_store.get_feature_store(image_path, kind).put(image_path, vector)
+                    vectors[kind] = vector
+                
+            except Exception as e:
+                print(f"[비슷한얼굴] 특징 추출 실패 ({image_path}): {e}")
+                return None
+        
+        if clothing_only:
+            return vectors[feature_store.KIND_CLOTHING]
+        if mesh:
+            return vectors[feature_store.KIND_EMBEDDING]
+        face_features = vectors[feature_store.KIND_FACE]
+        if include_clothing:
+            # 결합 특징 벡터 (얼굴, 옷)
+            if face_features is None:
+                return None
+            return (face_features, vectors[feature_store.KIND_CLOTHING])
+        return face_features
     
-    def _save_features_cache_by_key(self, image_path, cache_key, features):
-        """특징 벡터 캐시 저장 (캐시 키 지정)"""
-        if features is None:
-            return
+    def _get_landmarks_for_image(self, image_path, image):
+        """랜드마크 캐시를 확인하고, 없으면 감지 후 캐시에 저장"""
+        landmarks, cached = landmark_cache.load_landmarks(image_path)
+        if cached:
+            return landmarks
         
-        try:
-            image_mtime = os.path.getmtime(image_path)
-            
-            # 튜플인 경우와 단일 벡터인 경우 처리
-            if isinstance(features, tuple):
-                # 결합 특징 벡터 (얼굴, 옷)
-                features_data = [
-                    features[0].tolist(),
-                    features[1].tolist() if features[1] is not None else None
-                ]
-            else:
-                # 단일 특징 벡터
-                features_data = features.tolist()
-            
-            cache_data = {
-                'image_mtime': image_mtime,
-                'features': features_data
-            }
-            
-            with open(cache_key, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f)
-                
-        except Exception as e:
-            print(f"[비슷한얼굴] 캐시 저장 실패: {e}")
+        if not face_landmarks.is_available():
+            return None
+
+        landmarks, detected = face_landmarks.detect_face_landmarks(image)
+        if not detected:
+            landmarks = None
+        landmark_cache.save_landmarks(image_path, landmarks)
+        return landmarks
     
-    def find_similar_faces(self, reference_image_path=None, top_n=10, include_clothing=False):
+    def start_landmark_indexing(self, image_files, on_complete=None, clothing=False):
         """
-        현재 이미지와 비슷한 얼굴들을 찾습니다.
+        랜드마크 캐시가 없는 이미지들을 워커 프로세스에서 배치 감지합니다.
+        진행률은 similar_faces_status_label에 after() 콜백으로 표시됩니다.
         
         Args:
-            reference_image_path: 기준 이미지 경로 (None이면 현재 이미지 사용)
-            top_n: 반환할 상위 N개
-            include_clothing: 옷 특징 포함 여부
-        
-        Returns:
-            similar_faces: 유사도 점수와 함께 정렬된 리스트 [(similarity, file_path), ...]
+            image_files: 이미지 파일 경로 리스트
+            on_complete: on_complete(cancelled) 콜백 (감지할 이미지가 없으면 즉시 호출)
+            clothing: 옷 특징도 같은 워커에서 계산해 특징 저장소에 기록 (옷 검색 전에 사용)
         """
-        if reference_image_path is None:
-            reference_image_path = self.current_image_path
+        self.cancel_landmark_indexing()
         
-        if not reference_image_path or not os.path.exists(reference_image_path):
-            return []
+        detector = BatchLandmarkDetector(clothing=clothing)
+        queued = detector.start(image_files)
+        if queued == 0:
+            if on_complete is not None:
+                on_complete(False)
+            return
         
-        # 기준 이미지의 특징 벡터 추출
-        reference_features = self._extract_face_features_for_image(reference_image_path, include_clothing=include_clothing)
-        if reference_features is None:
-            return []
+        self._landmark_detector = detector
         
-        # 이미지 디렉토리 경로 가져오기
-        if self.face_extract_dir and os.path.exists(self.face_extract_dir):
-            png_dir = self.face_extract_dir
-        else:
-            png_dir = kaodata_image.get_png_dir()
+        def _on_progress(done, total, results):
+            if hasattr(self, 'similar_faces_status_label'):
+                progress = int(done / total * 100) if total else 100
+                self.similar_faces_status_label.config(
+                    text=f"랜드마크 감지 중... {done}/{total} ({progress}%)", fg="blue"
+                )
         
-        if not os.path.exists(png_dir):
-            return []
+        def _on_complete(cancelled):
+            if getattr(self, '_landmark_detector', None) is detector:
+                self._landmark_detector = None
+            if cancelled and hasattr(self, 'similar_faces_status_label'):
+                self.similar_faces_status_label.config(text="랜드마크 감지 취소됨", fg="gray")
+            if on_complete is not None:
+                on_complete(cancelled)
         
-        # 모든 이미지 파일 찾기
-        import glob
-        image_extensions = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.bmp', '*.tiff', '*.tif', '*.webp']
-        image_files = []
-        for ext in image_extensions:
-            image_files.extend(glob.glob(os.path.join(png_dir, ext)))
-            image_files.extend(glob.glob(os.path.join(png_dir, ext.upper())))
+        if hasattr(self, 'similar_faces_status_label'):
+            self.similar_faces_status_label.config(
+                text=f"랜드마크 감지 중... 0/{queued} (워커 {detector.num_workers}개)", fg="blue"
+            )
+        detector.attach(self, on_progress=_on_progress, on_complete=_on_complete)
+    
+    def cancel_landmark_indexing(self):
+        """진행 중인 배치 랜드마크 감지 취소"""
+        detector = getattr(self, '_landmark_detector', None)
+        if detector is not None:
+            detector.cancel()
+    
+    def start_similarity_search(self, reference_image_path, image_files, include_clothing=False, clothing_only=False,
+                                top_n=10, min_score=None, on_results=None, on_complete=None, mesh=False):
+        """
+        비슷한 얼굴/옷 검색을 작업 스레드에서 실행합니다.
+        저장소에 있는 후보는 바로 점수를 매기고, 나머지는 추출하면서 상위 결과를 점진적으로 갱신합니다.
         
-        # 중복 제거
-        image_files = list(set(os.path.normpath(f) for f in image_files))
+        Args:
+            reference_image_path: 기준 이미지 경로
+            image_files: 후보 이미지 경로 리스트 (기준 이미지 제외)
+            top_n: 결과 수 (None이면 min_score 이상 전체)
+            min_score: 이 점수 미만 결과 제외
+            on_results: on_results(results) 콜백 (상위 결과가 바뀔 때마다, [(similarity, file_path), ...])
+            on_complete: on_complete(job) 콜백 (job.cancelled, job.reference_found, job.results)
+            mesh: 얼굴 검색에 전체 메시 임베딩 사용 (기저가 아직 없으면 비율 특징으로 검색하고 기저를 학습)
+        """
+        self.cancel_similarity_search()
         
-        # 기준 이미지는 제외
-        image_files = [f for f in image_files if f != reference_image_path]
+        # 임베딩 기저는 검색 대상 디렉토리 기준 (기준 이미지와 후보가 같은 공간에 투영되어야 함)
+        basis_path = image_files[0] if image_files else reference_image_path
+        mesh = mesh and not clothing_only and not include_clothing and face_embedding.is_ready(basis_path)
+        mode = _search_mode(include_clothing, clothing_only, mesh)
+        maintenance = None
+        if not clothing_only:
+            # 메시가 없는 이미지를 캐시된 랜드마크로 채우고 임베딩 기저를 증분 학습
+            maintenance = face_embedding.update_library
+        job = similarity_indexer.SimilaritySearchJob(
+            lambda path: self._extract_face_features_for_image(
+                path, include_clothing=include_clothing, clothing_only=clothing_only, mesh=mesh
+            ),
+            mode=mode, top_n=top_n, min_score=min_score,
+            # 후보가 아주 많은 디렉토리에서만 ANN 인덱스로 후보를 줄임
+            ann_nprobe=ann_index.DEFAULT_NPROBE,
+            maintenance=maintenance
+        )
+        self._similarity_job = job
         
-        # 모든 이미지의 특징 벡터 추출
-        face_features_list = []
-        total = len(image_files)
+        def _on_progress(done, total, results, changed):
+            if getattr(self, '_similarity_job', None) is not job:
+                return
+            if changed and on_results is not None:
+                on_results(results)
+            if hasattr(self, 'similar_faces_status_label') and not job.is_finished():
+                progress = int(done / total * 100) if total else 100
+                self.similar_faces_status_label.config(
+                    text=f"검색 중... {done}/{total} ({progress}%)", fg="blue"
+                )
         
-        for idx, image_path in enumerate(image_files):
-            try:
-                features = self._extract_face_features_for_image(image_path, include_clothing=include_clothing, clothing_only=False)
-                if features is not None:
-                    face_features_list.append((features, image_path))
-                
-                # 진행률 업데이트 (UI가 있는 경우)
-                if hasattr(self, 'similar_faces_status_label'):
-                    progress = int((idx + 1) / total * 100)
-                    self.similar_faces_status_label.config(
-                        text=f"검색 중... {idx + 1}/{total} ({progress}%)"
-                    )
-                    self.update()  # UI 업데이트
-                    
-            except Exception as e:
-                print(f"[비슷한얼굴] 이미지 처리 실패 ({image_path}): {e}")
-                continue
+        def _on_complete(cancelled):
+            current = getattr(self, '_similarity_job', None)
+            if current is job:
+                self._similarity_job = None
+            elif current is not None:
+                # 이미 새 검색이 시작됨
+                return
+            if on_complete is not None:
+                on_complete(job)
         
-        # 비슷한 얼굴 찾기
-        if include_clothing:
-            # 옷 포함 비교
-            similarities = []
-            for features, metadata in face_features_list:
-                if features is not None:
-                    similarity = face_landmarks.calculate_combined_similarity(
-                        reference_features, 
-                        features,
-                        face_weight=0.7,
-                        clothing_weight=0.3
-                    )
-                    similarities.append((similarity, metadata))
-            
-            # 유사도가 높은 순으로 정렬
-            similarities.sort(key=lambda x: x[0], reverse=True)
-            similar_faces = similarities[:top_n]
-        else:
-            # 얼굴만 비교
-            similar_faces = face_landmarks.find_similar_faces(
-                reference_features, 
-                face_features_list, 
-                top_n=top_n
-            )
+        job.start(reference_image_path, image_files)
+        job.attach(self, on_progress=_on_progress, on_complete=_on_complete)
+        return job
+    
+    def cancel_similarity_search(self):
+        """진행 중인 유사도 검색 취소"""
+        job = getattr(self, '_similarity_job', None)
+        if job is not None:
+            self._similarity_job = None
+            job.cancel()
+    
+    def start_duplicate_clustering(self, image_files, threshold=face_clustering.DEFAULT_THRESHOLD,
+                                   linkage=face_clustering.LINKAGE_SINGLE, on_progress=None, on_complete=None):
+        """
+        디렉토리 이미지 전체를 비슷한 얼굴 그룹으로 묶어 보고서로 저장합니다 (작업 스레드).
+        임베딩 기저가 학습된 디렉토리는 전체 메시 임베딩, 아니면 비율 특징을 사용합니다.
         
-        return similar_faces
+        Args:
+            image_files: 대상 이미지 경로 리스트 (같은 디렉토리)
+            threshold: 같은 그룹으로 볼 최소 유사도
+            linkage: face_clustering.LINKAGE_SINGLE 또는 LINKAGE_COMPLETE
+            on_progress: on_progress(stage, done, total) 콜백
+            on_complete: on_complete(job) 콜백 (job.groups, job.report_path, job.cancelled, job.error)
+        """
+        self.cancel_duplicate_clustering()
+        if not image_files:
+            return None
+        
+        mesh = face_embedding.is_ready(image_files[0])
+        job = face_clustering.ClusteringJob(
+            lambda path: self._extract_face_features_for_image(path, mesh=mesh),
+            mode=_search_mode(mesh=mesh), threshold=threshold, linkage=linkage
+        )
+        self._clustering_job = job
+        
+        def _on_complete(finished_job):
+            if getattr(self, '_clustering_job', None) is not finished_job:
+                return
+            self._clustering_job = None
+            if on_complete is not None:
+                on_complete(finished_job)
+        
+        report_path = face_clustering.get_report_path(os.path.dirname(os.path.abspath(image_files[0])))
+        job.start(image_files, report_path)
+        job.attach(self, on_progress=on_progress, on_complete=_on_complete)
+        return job
+    
+    def cancel_duplicate_clustering(self):
+        """진행 중인 중복 그룹 찾기 취소"""
+        job = getattr(self, '_clustering_job', None)
+        if job is not None:
+            self._clustering_job = None
+            job.cancel()
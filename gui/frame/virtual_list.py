@@ -0,0 +1,125 @@
+"""
+가상화 스크롤 목록
+보이는 행 수만큼만 행 위젯을 만들고, 스크롤할 때 위젯을 다시 쓰면서 내용만 바꿉니다.
+항목이 수백 개여도 위젯 수는 화면 높이 / 행 높이 + 1개로 일정합니다.
+"""
+import math
+import tkinter as tk
+
+
+class VirtualList(tk.Frame):
+    """
+    고정 높이 행의 가상화 세로 목록
+
+    Args:
+        parent: 부모 위젯
+        row_height: 행 높이 (픽셀)
+        create_row: create_row(parent) -> 행 위젯 (캔버스 안에 배치됨)
+        bind_row: bind_row(row, item, index) 행 위젯에 항목 내용을 채움
+        bg: 배경색
+    """
+
+    def __init__(self, parent, row_height, create_row, bind_row, bg="white", **kwargs):
+        super().__init__(parent, **kwargs)
+        self.row_height = row_height
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.items = []
+
+        self.canvas = tk.Canvas(self, bg=bg, highlightthickness=0,
+                                yscrollincrement=max(1, row_height // 4))
+        self.scrollbar = tk.Scrollbar(self, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_view_changed)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.canvas.bind("<Configure>", lambda e: self._refresh(force=True))
+
+        # 재사용 행: [(row, window_id)], 각 행에 마지막으로 채운 (index, item) 또는 None(숨김)
+        self._rows = []
+        self._bound = []
+
+    def set_items(self, items, keep_position=True):
+        """항목 전체 교체 (keep_position=False면 맨 위로 스크롤)"""
+        self.items = list(items)
+        self._update_scrollregion()
+        if not keep_position:
+            self.canvas.yview_moveto(0)
+        self._refresh(force=True)
+
+    def clear(self):
+        """모든 항목 제거"""
+        self.set_items([], keep_position=False)
+
+    def remove(self, predicate):
+        """조건에 맞는 항목 제거"""
+        self.set_items([item for item in self.items if not predicate(item)])
+
+    def rebind(self, predicate=None):
+        """보이는 행 중 조건에 맞는 항목(None이면 전체)을 다시 채움 (썸네일 도착 등)"""
+        for slot, (row, _) in enumerate(self._rows):
+            bound = self._bound[slot]
+            if bound is None:
+                continue
+            index, item = bound
+            if predicate is None or predicate(item):
+                self.bind_row(row, item, index)
+
+    def visible_range(self):
+        """현재 보이는 항목 범위 (start, stop)"""
+        height = max(self.canvas.winfo_height(), 1)
+        start = max(0, int(self.canvas.canvasy(0) // self.row_height))
+        stop = min(len(self.items), start + int(math.ceil(height / self.row_height)) + 1)
+        return start, stop
+
+    def yview_scroll(self, number, what):
+        """마우스 휠 등에서 스크롤"""
+        self.canvas.yview_scroll(number, what)
+
+    def _update_scrollregion(self):
+        width = max(self.canvas.winfo_width(), 1)
+        self.canvas.configure(scrollregion=(0, 0, width, len(self.items) * self.row_height))
+
+    def _on_view_changed(self, first, last):
+        """캔버스 보기 영역이 바뀔 때 (스크롤, 크기 변경) 스크롤바 갱신 후 행 재배치"""
+        self.scrollbar.set(first, last)
+        self._refresh()
+
+    def _ensure_rows(self, count):
+        """필요한 만큼 행 위젯 생성 (남는 행은 숨겨 두고 재사용)"""
+        while len(self._rows) < count:
+            row = self.create_row(self.canvas)
+            window = self.canvas.create_window(0, 0, window=row, anchor=tk.NW, height=self.row_height,
+                                               state='hidden')
+            self._rows.append((row, window))
+            self._bound.append(None)
+
+    def _refresh(self, force=False):
+        """
+        보이는 항목에 행 위젯을 배치하고 내용이 바뀐 행만 다시 채움
+        항목 i는 항상 행 i % 행 수에 배치되므로, 스크롤하면 새로 드러난 행만 다시 채웁니다.
+        """
+        start, stop = self.visible_range()
+        if stop - start > len(self._rows):
+            self._ensure_rows(stop - start)
+            force = True
+        if force:
+            self._update_scrollregion()
+        width = max(self.canvas.winfo_width(), 1)
+        count = len(self._rows)
+
+        used = set()
+        for index in range(start, stop):
+            slot = index % count
+            used.add(slot)
+            row, window = self._rows[slot]
+            item = self.items[index]
+            if force or self._bound[slot] != (index, item):
+                self.canvas.coords(window, 0, index * self.row_height)
+                self.canvas.itemconfigure(window, width=width, state='normal')
+                self.bind_row(row, item, index)
+                self._bound[slot] = (index, item)
+
+        for slot, (_, window) in enumerate(self._rows):
+            if slot not in used and self._bound[slot] is not None:
+                self.canvas.itemconfigure(window, state='hidden')
+                self._bound[slot] = None
@@ -0,0 +1,157 @@
+"""
+ANN(IVF) 인덱스 테스트
+"""
+import os
+import sys
+import tempfile
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import ann_index, feature_store
+from utils.ann_index import IVFIndex
+
+
+def _vectors(count, dim=10, seed=0):
+    return (np.random.default_rng(seed).random((count, dim)) * 2).astype(np.float32)
+
+
+def _cosine_order(vectors, query):
+    """코사인 유사도 내림차순 행 번호 (정확한 검색 기준)"""
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.argsort(-(unit @ (query / np.linalg.norm(query))), kind='stable')
+
+
+def test_full_probe_matches_exact_and_incremental_add():
+    """모든 리스트를 탐색하면 정확한 최근접과 같고, 추가한 벡터도 바로 검색되는지 확인"""
+    vectors = _vectors(2000)
+    keys = [f"k{i}" for i in range(2000)]
+    index = IVFIndex()
+    index.add(keys, vectors)
+    assert index.is_trained and len(index.centroids) == 45
+
+    query = vectors[17] + 0.01
+    exact = _cosine_order(vectors, query)[:10]
+    results = index.search(query, 10, nprobe=len(index.centroids))
+    assert [key for _, key in results] == [keys[i] for i in exact]
+
+    index.add(['new'], [query])
+    assert index.search(query, 1)[0][1] == 'new'
+    index.remove(['new', 'k17'])
+    assert 'new' not in index and len(index) == 1999
+    print("[OK] 전체 탐색 일치 및 증분 추가")
+
+
+def test_lists_ignore_vector_length():
+    """리스트 배정과 탐색이 벡터 길이와 무관하게 방향(코사인)으로만 정해지는지 확인"""
+    vectors = _vectors(2000, seed=5)
+    scales = np.random.default_rng(6).uniform(0.1, 20.0, (2000, 1)).astype(np.float32)
+    keys = [f"k{i}" for i in range(2000)]
+    plain = IVFIndex()
+    plain.add(keys, vectors)
+    scaled = IVFIndex()
+    scaled.add(keys, vectors * scales)
+    assert np.allclose(plain.centroids, scaled.centroids, atol=1e-5)
+    assert np.array_equal(plain.assign, scaled.assign)
+
+    query = vectors[3]
+    assert np.array_equal(plain.candidates(query, 2), scaled.candidates(query * 7.0, 2))
+    # 길이만 다른 벡터는 거리 0으로 가장 가까움
+    scaled.add(['long'], [query * 50.0])
+    assert scaled.search(query, 1, nprobe=len(scaled.centroids))[0][1] in ('long', 'k3')
+    print("[OK] 벡터 길이와 무관한 리스트")
+
+
+def test_store_sync_and_persistence():
+    """저장소 변경분만 반영하고, 저장된 인덱스를 다시 로드하는지 확인"""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(30):
+            path = os.path.join(tmp, f"img_{i:02d}.png")
+            Image.new('RGB', (4, 4), (i, 0, 0)).save(path)
+            paths.append(path)
+        vectors = _vectors(30, seed=1)
+        store = feature_store.FeatureStore(feature_store.get_features_dir(paths[0]), feature_store.KIND_FACE)
+        for path, vector in zip(paths, vectors):
+            store.put(path, vector)
+
+        index = ann_index.sync_store_index(store)
+        assert len(index) == 30
+        assert os.path.exists(os.path.join(store.features_dir, 's7ed.features.face.ivf.npz'))
+
+        store.remove(paths[0])
+        store.put(paths[1], vectors[5])
+        index = ann_index.sync_store_index(store)
+        assert len(index) == 29 and 'img_00.png' not in index
+        assert np.array_equal(index.vectors[index._positions['img_01.png']], vectors[5])
+
+        reloaded = IVFIndex.load(os.path.join(store.features_dir, 's7ed.features.face.ivf.npz'))
+        assert sorted(reloaded.keys) == sorted(index.keys)
+        assert np.array_equal(reloaded.centroids, index.centroids)
+        print("[OK] 저장소 동기화 및 저장")
+
+
+def test_sync_reads_only_changed_entries():
+    """저장소 변경 세대가 그대로면 다시 읽지 않고, 바뀐 항목만 읽어 반영하는지 확인"""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(20):
+            path = os.path.join(tmp, f"img_{i:02d}.png")
+            Image.new('RGB', (4, 4), (i, 0, 0)).save(path)
+            paths.append(path)
+        vectors = _vectors(20, seed=2)
+        store = feature_store.FeatureStore(feature_store.get_features_dir(paths[0]), feature_store.KIND_FACE)
+        for path, vector in zip(paths, vectors):
+            store.put(path, vector)
+        index = ann_index.sync_store_index(store)
+
+        def _no_full_read():
+            raise AssertionError("전체 항목을 다시 읽음")
+
+        store.live_entries = _no_full_read
+        assert ann_index.sync_store_index(store) is index
+
+        read = []
+        entries = store.entries
+        store.entries = lambda names: read.append(sorted(names)) or entries(names)
+        store.put(paths[3], vectors[0])
+        store.remove(paths[4])
+        index = ann_index.sync_store_index(store)
+        assert read == [['img_03.png', 'img_04.png']]
+        assert len(index) == 19 and 'img_04.png' not in index
+        assert np.array_equal(index.vectors[index._positions['img_03.png']], vectors[0])
+        print("[OK] 변경분만 동기화")
+
+
+def test_candidates_map_to_loaded_positions():
+    """ANN 후보가 load_features 결과 순서의 위치로 돌아오고, 압축 후에도 같은 후보를 찾는지 확인"""
+    with tempfile.TemporaryDirectory() as tmp:
+        names = [f"img_{i:03d}.png" for i in range(300)]
+        paths = [os.path.join(tmp, name) for name in names]
+        vectors = _vectors(300, seed=3)
+        store = feature_store.get_feature_store(paths[0], feature_store.KIND_FACE)
+        store.replace_all(names, np.tile([1.0, 10.0], (300, 1)), vectors)
+        signatures = {path: (1.0, 10) for path in paths}
+
+        # 입력 순서와 저장소 행 순서가 다르도록 섞어서 읽음
+        order = np.random.default_rng(4).permutation(300)
+        _, found, _, sources = feature_store.load_features(
+            [paths[i] for i in order], feature_store.KIND_FACE, signatures, with_sources=True)
+        query = vectors[42]
+        positions = ann_index.approximate_candidates(sources, query, 5, nprobe=1000)
+        exact = {names[i] for i in _cosine_order(vectors, query)[:6]}
+        assert {os.path.basename(found[i]) for i in positions} == exact
+
+        store.compact()
+        assert np.array_equal(ann_index.approximate_candidates(sources, query, 5, nprobe=1000), positions)
+        print("[OK] 후보 위치 매핑")
+
+
+if __name__ == '__main__':
+    test_full_probe_matches_exact_and_incremental_add()
+    test_lists_ignore_vector_length()
+    test_store_sync_and_persistence()
+    test_sync_reads_only_changed_entries()
+    test_candidates_map_to_loaded_positions()
@@ -0,0 +1,61 @@
+"""
+무게중심 좌표 필드 캐시 테스트
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scipy.spatial import Delaunay
+
+from utils.face_morphing.polygon_morphing import barycentric_field
+
+
+def _grid_points():
+    xs, ys = np.meshgrid(np.linspace(0, 119, 10), np.linspace(0, 99, 10))
+    return np.column_stack([xs.ravel(), ys.ravel()])
+
+
+def test_field_cached_by_original_points():
+    """같은 원본 포인트/바운딩 박스는 캐시된 필드를 쓰고, 바뀌면 다시 계산하는지 확인"""
+    barycentric_field.clear_cache()
+    points = _grid_points()
+    tri = Delaunay(points)
+    field = barycentric_field.get_barycentric_field(tri, points, (0, 0, 120, 100))
+    assert field.simplex_ids.dtype == np.int32 and field.weights.dtype == np.float16
+    inside = field.simplex_ids >= 0
+    assert inside.all()
+    assert np.allclose(field.weights[inside].astype(np.float32).sum(axis=1), 1.0, atol=2e-3)
+    assert barycentric_field.get_barycentric_field(tri, points.copy(), (0, 0, 120, 100)) is field
+
+    moved = points.copy()
+    moved[45] += 1.0
+    assert barycentric_field.get_barycentric_field(Delaunay(moved), moved, (0, 0, 120, 100)) is not field
+    assert barycentric_field.get_barycentric_field(tri, points, (0, 0, 100, 100)) is not field
+    print("[OK] 무게중심 필드 캐시")
+
+
+def test_remap_coordinates_invert_displacement():
+    """안쪽 포인트를 평행 이동하면 역매핑 좌표가 목적지 - 이동량이 되는지 확인"""
+    barycentric_field.clear_cache()
+    points = _grid_points()
+    transformed = points.copy()
+    inner = (points[:, 0] > 30) & (points[:, 0] < 90) & (points[:, 1] > 30) & (points[:, 1] < 70)
+    transformed[inner] += (4.0, -2.0)
+
+    field = barycentric_field.get_barycentric_field(Delaunay(points), points, (10, 5, 120, 100))
+    map_x, map_y = field.remap_coordinates(points, transformed)
+    assert map_x.shape == (95, 110)
+    # 이동한 포인트로 둘러싸인 안쪽 (작업 이미지 좌표 x=50~69, y=45~54)
+    assert np.allclose(map_x[40:50, 40:60], np.arange(50, 70)[None, :] - 4.0, atol=0.05)
+    assert np.allclose(map_y[40:50, 40:60], np.arange(45, 55)[:, None] + 2.0, atol=0.05)
+    # 고정 포인트 바깥은 항등
+    assert np.allclose(map_x[:, :5], np.arange(10, 15)[None, :], atol=1e-3)
+    print("[OK] 역매핑 좌표")
+
+
+if __name__ == '__main__':
+    test_field_cached_by_original_points()
+    test_remap_coordinates_invert_displacement()
@@ -0,0 +1,162 @@
+"""
+배치 랜드마크 감지 서비스 테스트
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils.landmark_cache as landmark_cache
+import utils.feature_store as feature_store
+import utils.face_landmarks as face_landmarks
+from utils.batch_landmarks import BatchLandmarkDetector
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+TEST_IMAGES = ['face_000_from_kaodata.png', 'face_001_from_kaodata.png', 'face_007_from_kaodata.png']
+
+
+def _copy_test_images(tmp_dir):
+    paths = []
+    for name in TEST_IMAGES:
+        dst = os.path.join(tmp_dir, name)
+        shutil.copy(os.path.join(TEST_DIR, name), dst)
+        paths.append(dst)
+    return paths
+
+
+def _wait_until_finished(detector, timeout=120):
+    results = []
+    deadline = time.time() + timeout
+    while not detector.is_finished():
+        assert time.time() < deadline, "배치 감지 시간 초과"
+        results.extend(detector.poll())
+        time.sleep(0.05)
+    return results
+
+
+def test_landmark_cache_roundtrip():
+    """랜드마크 캐시 저장/로드 및 수정 시간 무효화"""
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        image_path = _copy_test_images(tmp_dir)[0]
+        assert landmark_cache.load_landmarks(image_path) == (None, False)
+
+        landmark_cache.save_landmarks(image_path, [(1, 2), (3, 4)])
+        landmarks, cached = landmark_cache.load_landmarks(image_path)
+        assert cached and landmarks.tolist() == [(1.0, 2.0), (3.0, 4.0)]
+
+        # 얼굴 없음도 캐시됨
+        landmark_cache.save_landmarks(image_path, None)
+        assert landmark_cache.load_landmarks(image_path) == (None, True)
+
+        # 이미지가 바뀌면 캐시 무효
+        os.utime(image_path, (time.time() + 10, time.time() + 10))
+        assert landmark_cache.load_landmarks(image_path) == (None, False)
+        print("[OK] 랜드마크 캐시 저장/로드")
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_batch_detection_writes_cache():
+    """워커 프로세스에서 감지한 결과가 스트리밍되고 캐시에 기록되는지 확인"""
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        image_paths = _copy_test_images(tmp_dir)
+        detector = BatchLandmarkDetector(num_workers=2)
+        assert detector.start(image_paths) == len(image_paths)
+
+        results = _wait_until_finished(detector)
+        assert sorted(r.image_path for r in results) == sorted(image_paths)
+        assert detector.done == len(image_paths)
+        for path in image_paths:
+            assert landmark_cache.is_cached(path)
+
+        # 캐시된 이미지는 다시 감지하지 않음
+        assert detector.start(image_paths) == 0
+        print("[OK] 배치 감지 및 캐시 기록")
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_batch_detection_cancel():
+    """취소하면 남은 작업이 제출되지 않고 종료되는지 확인"""
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        image_paths = _copy_test_images(tmp_dir) * 20
+        detector = BatchLandmarkDetector(num_workers=1)
+        detector.start(image_paths, skip_cached=False)
+        detector.cancel()
+
+        results = _wait_until_finished(detector)
+        assert detector.cancelled
+        assert len(results) < len(image_paths)
+        print("[OK] 배치 감지 취소")
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_batch_clothing_features():
+    """옷 특징도 워커에서 계산되어 저장소에 기록되고, 프로세스 안 추출과 같은 값인지 확인"""
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        image_paths = _copy_test_images(tmp_dir)
+        # 랜드마크가 이미 캐시된 이미지도 옷 특징이 없으면 다시 처리
+        detector = BatchLandmarkDetector(num_workers=1)
+        detector.start(image_paths[:1])
+        _wait_until_finished(detector)
+        detector = BatchLandmarkDetector(num_workers=2, clothing=True)
+        assert detector.start(image_paths) == len(image_paths)
+        _wait_until_finished(detector)
+
+        store = feature_store.get_feature_store(image_paths[0], feature_store.KIND_CLOTHING)
+        for path in image_paths:
+            vector, cached = store.get(path)
+            assert cached
+            landmarks, _ = landmark_cache.load_landmarks(path)
+            expected = None
+            if landmarks is not None:
+                with Image.open(path) as image:
+                    expected = face_landmarks.extract_clothing_features_vector(image.convert('RGB'), landmarks)
+            assert (vector is None) == (expected is None)
+            if vector is not None:
+                assert np.allclose(vector, expected, atol=1e-3)
+
+        assert BatchLandmarkDetector(clothing=True).start(image_paths) == 0
+        print("[OK] 배치 옷 특징 계산")
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_clothing_histogram_matches_calchist():
+    """bincount 히스토그램이 cv2.calcHist(32구간)와 같은지 확인"""
+    rng = np.random.default_rng(0)
+    pixels = rng.integers(0, 256, (64, 48, 3), dtype=np.uint8)
+    features = face_landmarks.clothing_features_from_pixels(pixels)
+    assert features.shape == (3 * face_landmarks.CLOTHING_HIST_BINS + 6,)
+    assert np.allclose(features[-6:-3], pixels.reshape(-1, 3).mean(axis=0), atol=1e-3)
+    try:
+        import cv2
+    except ImportError:
+        print("[SKIP] OpenCV 없음")
+        return
+    bgr = cv2.cvtColor(pixels, cv2.COLOR_RGB2BGR)
+    expected = []
+    for channel in range(3):
+        hist = cv2.calcHist([bgr], [channel], None, [face_landmarks.CLOTHING_HIST_BINS], [0, 256]).ravel()
+        expected.extend(hist / hist.sum())
+    assert np.allclose(features[:-6], expected, atol=1e-6)
+    print("[OK] 옷 히스토그램")
+
+
+if __name__ == '__main__':
+    test_landmark_cache_roundtrip()
+    test_batch_detection_writes_cache()
+    test_batch_detection_cancel()
+    test_batch_clothing_features()
+    test_clothing_histogram_matches_calchist()
@@ -0,0 +1,106 @@
+"""
+모핑 작업 배열 재사용 풀 테스트
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image
+from scipy.spatial import Delaunay
+
+from utils.face_morphing.polygon_morphing import core
+from utils.face_morphing.polygon_morphing.buffer_pool import BufferPool, get_buffer_pool, peak_rss_mb
+
+
+def test_acquire_reuses_released_buffers():
+    """돌려준 배열을 같은 shape/dtype 요청에 다시 빌려주고, 상한을 넘으면 버리는지 확인"""
+    pool = BufferPool(max_per_key=1, max_bytes=10000)
+    first = pool.acquire((10, 20), np.float32, fill=1.0)
+    assert np.all(first == 1.0)
+    pool.release(first)
+    pool.release(first)
+    assert pool.held_bytes == first.nbytes
+
+    again = pool.acquire((10, 20), np.float32, fill=0.0)
+    assert again is first and np.all(again == 0.0)
+    assert pool.acquire((10, 20), np.float64) is not first
+    assert (pool.hits, pool.misses) == (1, 2)
+
+    # 뷰는 보관하지 않고, 크기 상한을 넘으면 오래된 크기부터 버림
+    pool.release(again[:5])
+    assert pool.held_bytes == 0
+    pool.release(again, np.empty((50, 50), np.float32))
+    assert pool.held_bytes <= 10000
+    print("[OK] 버퍼 재사용")
+
+
+def test_forward_render_borrows_from_pool():
+    """정변환 렌더링을 반복하면 누적 버퍼를 새로 할당하지 않고 재사용하는지 확인"""
+    rng = np.random.default_rng(5)
+    image = rng.integers(0, 256, (90, 110, 3), dtype=np.uint8)
+    points = np.vstack([rng.uniform(10, 100, (25, 2)) * (1.0, 0.8), [(0, 0), (109, 0), (109, 89), (0, 89)]])
+    transformed = points.copy()
+    transformed[:25] += rng.normal(0, 1.5, (25, 2))
+    ctx = core.DelaunayContext(
+        img_array=image, working_img=image, working_width=110, working_height=90,
+        min_x=0, min_y=0, max_x=110, max_y=90,
+        tri=Delaunay(points), original_points_array=points, transformed_points_array=transformed,
+    )
+    render_ctx = core._build_pixel_coordinate_map(ctx)
+    assert np.array_equal(render_ctx.pixel_coords_orig_global[111], [1, 1])
+
+    pool = get_buffer_pool()
+    pool.clear()
+    outputs = []
+    for _ in range(2):
+        result, result_count, mask, _, _ = core._apply_forward_transforms(
+            delaunay_ctx=ctx, render_ctx=render_ctx, blend_ratio=1.0)
+        outputs.append(np.asarray(core._compose_result_image(
+            delaunay_ctx=ctx, result=result, result_count=result_count,
+            transformed_mask=mask, blend_ratio=1.0)))
+        pool.release(result, result_count, mask)
+    misses = pool.misses
+    result, result_count, mask, _, _ = core._apply_forward_transforms(
+        delaunay_ctx=ctx, render_ctx=render_ctx, blend_ratio=1.0)
+    assert pool.misses == misses
+    assert np.all(result_count >= 1.0)
+    assert np.array_equal(outputs[0], outputs[1])
+    print("[OK] 정변환 버퍼 재사용")
+
+
+def test_remap_backends_borrow_from_pool():
+    """remap/cached_remap 렌더링을 반복해도 새로 할당하지 않고, 반환된 RGBA 이미지가 재사용에 덮이지 않는지 확인"""
+    rng = np.random.default_rng(7)
+    image = Image.fromarray(rng.integers(0, 256, (90, 110, 4), dtype=np.uint8), 'RGBA')
+    points = [tuple(p) for p in rng.uniform(15, 75, (30, 2)) * (1.2, 1.0)]
+    transformed = [(x + dx, y + dy) for (x, y), (dx, dy) in zip(points, rng.normal(0, 1.5, (30, 2)))]
+
+    pool = get_buffer_pool()
+    for backend in ("remap", "cached_remap"):
+        pool.clear()
+        first = core.morph_face_by_polygons(image, points, transformed, render_backend=backend)
+        expected = np.asarray(first).copy()
+        core.morph_face_by_polygons(image, points, transformed, render_backend=backend)
+        hits, misses = pool.hits, pool.misses
+        second = core.morph_face_by_polygons(image, points, transformed, render_backend=backend)
+        assert pool.misses == misses and pool.hits > hits, backend
+        assert np.array_equal(np.asarray(first), expected), backend
+        assert np.array_equal(np.asarray(second), expected), backend
+    print("[OK] remap 버퍼 재사용")
+
+
+def test_peak_rss_reported():
+    """최대 상주 메모리를 MB 단위로 구하는지 확인 (지원하지 않는 플랫폼은 None)"""
+    peak = peak_rss_mb()
+    assert peak is None or peak > 1.0
+    print("[OK] 최대 RSS")
+
+
+if __name__ == '__main__':
+    test_acquire_reuses_released_buffers()
+    test_forward_render_borrows_from_pool()
+    test_remap_backends_borrow_from_pool()
+    test_peak_rss_reported()
@@ -0,0 +1,90 @@
+"""
+디렉토리 매니페스트 테스트
+"""
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.dir_manifest import DirectoryManifest, get_signatures, get_manifest
+
+
+def _write(path, data, mtime=None):
+    with open(path, 'wb') as f:
+        f.write(data)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+def test_scan_diff():
+    """추가/삭제/변경 변경분과 대소문자 확장자를 확인"""
+    with tempfile.TemporaryDirectory() as tmp:
+        _write(os.path.join(tmp, 'a.png'), b'aaa', 1000)
+        _write(os.path.join(tmp, 'B.PNG'), b'bbb', 1000)
+        _write(os.path.join(tmp, 'notes.txt'), b'ignored')
+        manifest = DirectoryManifest(tmp)
+
+        diff = manifest.scan()
+        assert diff.added == ['B.PNG', 'a.png'] and not diff.removed and not diff.changed
+        assert not manifest.scan()
+
+        os.remove(os.path.join(tmp, 'a.png'))
+        _write(os.path.join(tmp, 'B.PNG'), b'bbbb', 2000)
+        _write(os.path.join(tmp, 'c.jpg'), b'ccc')
+        diff = manifest.scan()
+        assert (diff.added, diff.removed, diff.changed) == (['c.jpg'], ['a.png'], ['B.PNG'])
+        assert [os.path.basename(p) for p in manifest.paths()] == ['B.PNG', 'c.jpg']
+        print("[OK] 스캔 변경분")
+
+
+def test_touch_without_content_change_and_persistence():
+    """내용이 같은 파일의 수정 시간 변경은 변경으로 보지 않고, 매니페스트가 저장되는지 확인"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'face.png')
+        _write(path, b'same', 1000)
+        manifest = DirectoryManifest(tmp)
+        manifest.scan()
+        assert manifest.content_hash('face.png') is not None
+
+        os.utime(path, (3000, 3000))
+        reopened = DirectoryManifest(tmp)
+        assert reopened.get('face.png').mtime == 1000
+        assert not reopened.scan()
+        assert reopened.get('face.png').mtime == 3000
+
+        _write(path, b'diff', 4000)
+        assert DirectoryManifest(tmp).scan().changed == ['face.png']
+        print("[OK] 내용 해시 비교 및 저장")
+
+
+def test_signatures_for_scanned_directory():
+    """스캔한 디렉토리 파일의 (수정 시간, 크기) 조회"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'x.png')
+        _write(path, b'12345', 1500)
+        assert get_signatures([path]) == {}
+        get_manifest(tmp).scan()
+        assert get_signatures([path, os.path.join(tmp, 'missing.png')]) == {path: (1500, 5)}
+        print("[OK] 서명 조회")
+
+
+def test_signatures_reflect_last_scan():
+    """서명은 마지막 스캔 시점 값이며, 파일이 바뀌면 다시 스캔해야 갱신되는지 확인"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'x.png')
+        _write(path, b'12345', 1500)
+        manifest = get_manifest(tmp)
+        manifest.scan()
+        _write(path, b'1234567', 2500)
+        assert get_signatures([path]) == {path: (1500, 5)}
+        assert manifest.scan().changed == ['x.png']
+        assert get_signatures([path]) == {path: (2500, 7)}
+        print("[OK] 스캔 후 서명 갱신")
+
+
+if __name__ == '__main__':
+    test_scan_diff()
+    test_touch_without_content_change_and_persistence()
+    test_signatures_for_scanned_directory()
+    test_signatures_reflect_last_scan()
@@ -0,0 +1,96 @@
+"""
+드래그 미리보기 품질 단계 테스트 (표시 해상도 미리보기 -> 유휴/놓을 때 원본 해상도)
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image
+
+from gui.face_edit_v2.polygon_drag_handler import PolygonDragHandlerMixin
+from utils.face_landmarks import detect_face_landmarks
+from utils.face_morphing.polygon_morphing import core
+
+_TEST_IMAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_face.png')
+
+
+class _FakePanel(PolygonDragHandlerMixin):
+    """Tk 예약 함수만 흉내 낸 패널 (렌더링 대신 요청한 품질을 기록)"""
+
+    def __init__(self):
+        self.jobs = {}
+        self.next_job = 0
+        self.renders = []
+        self.dragging_polygon = True
+
+    def after(self, ms, func, *args):
+        self.next_job += 1
+        self.jobs[self.next_job] = (func, args)
+        return self.next_job
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after_cancel(self, job):
+        self.jobs.pop(job, None)
+
+    def apply_polygon_drag_final(self, desc="", force_slider_mode=False, quality="full"):
+        self.renders.append(quality)
+
+    def run(self, job):
+        func, args = self.jobs.pop(job)
+        func(*args)
+
+
+def test_preview_then_full_render_with_stale_guard():
+    """모션 이벤트는 미리보기 한 번으로 모이고, 오래된 원본 해상도 예약은 새 미리보기를 덮어쓰지 않는지 확인"""
+    panel = _FakePanel()
+    panel.apply_polygon_drag_preview()
+    stale_full_render = panel._polygon_full_render_job
+    stale_func, stale_args = panel.jobs[stale_full_render]
+    panel.apply_polygon_drag_preview()
+    # 미리보기 예약 1개 + 가장 최근 원본 해상도 예약 1개
+    assert len(panel.jobs) == 2 and stale_full_render not in panel.jobs
+
+    stale_func(*stale_args)
+    assert panel.renders == []
+
+    panel.run(panel._polygon_preview_job)
+    panel.run(panel._polygon_full_render_job)
+    assert panel.renders == ["preview", "full"]
+
+    # 놓으면 예약을 모두 취소 (드래그 종료 처리가 바로 원본 해상도로 렌더링)
+    panel.apply_polygon_drag_preview()
+    panel._cancel_polygon_drag_renders()
+    assert panel.jobs == {}
+    print("[OK] 미리보기 품질 단계")
+
+
+def test_preview_size_lowers_working_resolution():
+    """preview_size를 주면 작업 해상도를 표시 크기로 낮추고 결과는 원본 크기로 돌려주는지 확인"""
+    assert core._preview_scale(400, 500, None) == 1.0
+    assert core._preview_scale(400, 500, (200, 200)) == 0.4
+    assert core._preview_scale(400, 500, (800, 1000)) == 1.0
+
+    image = Image.open(_TEST_IMAGE).convert('RGB')
+    image = image.resize((image.width * 4, image.height * 4), Image.BICUBIC)
+    landmarks, detected = detect_face_landmarks(image)
+    assert detected
+    original = [tuple(point) for point in np.asarray(landmarks, dtype=np.float64)[:468]]
+    transformed = list(original)
+    transformed[1] = (original[1][0] + 4.0, original[1][1])
+
+    preview_size = (image.width // 2, image.height // 2)
+    result, contexts = core.morph_face_by_polygons(image, original, transformed, render_backend="remap",
+                                                   preview_size=preview_size, return_contexts=True)
+    assert result.size == image.size
+    assert abs(contexts["delaunay"].scale_factor - 0.5) < 1e-9
+    print("[OK] 미리보기 작업 해상도")
+
+
+if __name__ == '__main__':
+    test_preview_then_full_render_with_stale_guard()
+    test_preview_size_lowers_working_resolution()
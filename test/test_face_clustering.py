@@ -0,0 +1,104 @@
+"""
+중복 그룹 찾기(군집) 테스트
+"""
+import os
+import sys
+import time
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import face_clustering, feature_store, similarity_indexer
+from utils.similarity_search import SimilarityIndex
+
+
+def _clustered_vectors(seed=0):
+    """3개 묶음(각 5개) + 외톨이 7개"""
+    rng = np.random.default_rng(seed)
+    centers = rng.random((3, 10)) * 2 + 0.5
+    groups = [center + rng.normal(0, 0.005, (5, 10)) for center in centers]
+    singles = rng.random((7, 10)) * 2 + 0.5
+    return np.vstack(groups + [singles]).astype(np.float32)
+
+
+def test_blocked_pairs_match_full_matrix():
+    """작은 블록 + 병렬 타일 결과가 전체 점수 행렬과 같은지, 연결 요소가 맞는지 확인"""
+    vectors = _clustered_vectors()
+    keys = [f"img_{i:02d}.png" for i in range(len(vectors))]
+    index = SimilarityIndex(keys, face_vectors=vectors)
+    threshold = 0.99
+
+    full = index.face_scores(vectors)
+    expected = {(i, j) for i, j in zip(*np.nonzero(full >= threshold)) if i < j}
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        rows, cols, scores = face_clustering.threshold_pairs(index, threshold, similarity_indexer.MODE_FACE,
+                                                             block_size=4, executor=executor)
+    assert set(zip(rows.tolist(), cols.tolist())) == expected
+    assert np.allclose(scores, full[rows, cols])
+
+    groups = face_clustering.cluster_index(index, threshold, block_size=4)
+    members = sorted(sorted(position for position, _ in group) for group in groups)
+    assert members == [list(range(0, 5)), list(range(5, 10)), list(range(10, 15))]
+    assert all(group[0][1] == 1.0 for group in groups)
+    print("[OK] 블록 단위 쌍 찾기 및 연결 요소")
+
+
+def test_complete_linkage_splits_chain():
+    """A-B, B-C만 가까운 사슬은 단일 연결이면 한 그룹, 완전 연결이면 나뉘는지 확인"""
+    scores = np.array([
+        [1.0, 0.96, 0.90],
+        [0.96, 1.0, 0.97],
+        [0.90, 0.97, 1.0],
+    ])
+    assert face_clustering.complete_linkage(scores, 0.95) == [[1, 2]]
+
+    union_find = face_clustering.UnionFind(4)
+    union_find.union(0, 1)
+    union_find.union(1, 2)
+    assert [g.tolist() for g in union_find.groups()] == [[0, 1, 2]]
+    print("[OK] 완전 연결 응집 군집")
+
+
+def test_clustering_job_writes_report():
+    """저장소 특징으로 작업을 실행하고 보고서를 다시 읽는지 확인"""
+    with tempfile.TemporaryDirectory() as tmp:
+        vectors = _clustered_vectors(seed=2)
+        paths = []
+        for i in range(len(vectors)):
+            path = os.path.join(tmp, f"img_{i:02d}.png")
+            with open(path, 'wb') as f:
+                f.write(b'x' * (i + 1))
+            paths.append(path)
+        store = feature_store.get_feature_store(paths[0], feature_store.KIND_FACE)
+        for path, vector in zip(paths[1:], vectors[1:]):
+            store.put(path, vector)
+
+        # 저장소에 없는 이미지만 추출 함수로 계산
+        extracted = []
+        def extract(path):
+            extracted.append(path)
+            store.put(path, vectors[paths.index(path)])
+
+        report_path = face_clustering.get_report_path(tmp)
+        job = face_clustering.ClusteringJob(extract, threshold=0.99, num_workers=2, block_size=8)
+        job.start(paths, report_path)
+        deadline = time.time() + 10
+        while not job.is_finished() and time.time() < deadline:
+            time.sleep(0.01)
+        assert job.is_finished() and job.error is None and extracted == [paths[0]]
+        assert len(job.groups) == 3
+
+        report = face_clustering.load_report(report_path)
+        assert report['total'] == len(paths) and len(report['groups']) == 3
+        first = report['groups'][0]
+        assert first[0][0] == 1.0 and all(os.path.exists(path) for _, path in first)
+        print("[OK] 군집 작업 및 보고서")
+
+
+if __name__ == '__main__':
+    test_blocked_pairs_match_full_matrix()
+    test_complete_linkage_splits_chain()
+    test_clustering_job_writes_report()
@@ -0,0 +1,152 @@
+"""
+얼굴 감지 (작업 해상도 축소/정밀화) 테스트
+"""
+import os
+import sys
+import threading
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils.face_detectors as face_detectors
+import utils.face_landmarks as face_landmarks
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _make_large_photo(scale=10, canvas_size=(2600, 2000), offset=(1500, 600)):
+    """테스트 얼굴을 확대해 큰 배경에 붙인 고해상도 사진 생성"""
+    face = Image.open(os.path.join(TEST_DIR, 'face_000_from_kaodata.png')).convert('RGB')
+    photo = Image.new('RGB', canvas_size, (120, 130, 140))
+    photo.paste(face.resize((face.width * scale, face.height * scale), Image.BICUBIC), offset)
+    return face, photo
+
+
+def test_downscale_for_detection():
+    """긴 변 기준 축소 배율 확인 (작은 이미지는 그대로)"""
+    array = np.zeros((2000, 1000, 3), dtype=np.uint8)
+    small, scale = face_landmarks.downscale_for_detection(array, 500)
+    assert small.shape[:2] == (500, 250) and scale == 0.25
+
+    same, scale = face_landmarks.downscale_for_detection(array, 0)
+    assert same is array and scale == 1.0
+    print("[OK] 작업 해상도 축소")
+
+
+def test_pyramid_returns_original_coordinates():
+    """축소본에서 감지해도 랜드마크가 원본 좌표계로 반환되는지 확인"""
+    if not face_landmarks.is_available():
+        print("[SKIP] MediaPipe 없음")
+        return
+
+    scale, offset = 10, (1500, 600)
+    face, photo = _make_large_photo(scale=scale, offset=offset)
+    reference, detected = face_landmarks.detect_face_landmarks(face)
+    assert detected
+
+    landmarks, detected = face_landmarks.detect_face_landmarks(photo, max_size=640)
+    assert detected
+    mapped = (landmarks.array - np.array(offset, dtype=np.float32)) / scale
+    assert np.abs(mapped - reference.array).mean() < 1.5
+    print("[OK] 피라미드 감지 좌표 환산")
+
+
+def test_detector_registry_is_thread_local():
+    """같은 스레드에서는 같은 인스턴스, 다른 스레드에서는 별도 인스턴스인지 확인"""
+    if not face_landmarks.is_available():
+        print("[SKIP] MediaPipe 없음")
+        return
+
+    main_mesh = face_detectors.get_face_mesh()
+    assert face_detectors.get_face_mesh() is main_mesh
+
+    other = []
+    def _worker():
+        other.append(face_detectors.get_face_mesh())
+        face_detectors.release_thread_detectors()
+    thread = threading.Thread(target=_worker)
+    thread.start()
+    thread.join()
+    assert other[0] is not None and other[0] is not main_mesh
+    print("[OK] 스레드별 감지기 캐시")
+
+
+def test_detect_face_region():
+    """감지 결과가 원본 좌표 영역이고, 얼굴이 없으면 None을 반환하는지 확인"""
+    if not face_landmarks.is_available():
+        print("[SKIP] MediaPipe 없음")
+        return
+
+    face, photo = _make_large_photo()
+    blank = np.full((200, 200, 3), 128, dtype=np.uint8)
+    regions = [face_detectors.detect_face_region(image, use_mediapipe=True) for image in (photo, face, blank)]
+
+    x, y, w, h = regions[0]
+    assert 1500 <= x < 1500 + face.width * 10 and 600 <= y < 600 + face.height * 10
+    assert regions[1] is not None
+    assert regions[2] is None
+    print("[OK] 얼굴 영역 감지")
+
+
+def test_detect_faces_batch():
+    """일괄 감지가 감지기를 한 번만 가져와 이미지 순서대로 한 장씩 감지한 것과 같은 결과를 내는지 확인"""
+    if not face_landmarks.is_available():
+        print("[SKIP] MediaPipe 없음")
+        return
+
+    face, photo = _make_large_photo()
+    blank = np.full((200, 200, 3), 128, dtype=np.uint8)
+    images = [photo, face, blank]
+
+    lookups = []
+    get_face_mesh = face_detectors.get_face_mesh
+
+    def _counting_get_face_mesh():
+        lookups.append(1)
+        return get_face_mesh()
+
+    face_detectors.get_face_mesh = _counting_get_face_mesh
+    try:
+        regions = face_detectors.detect_faces(iter(images), use_mediapipe=True)
+    finally:
+        face_detectors.get_face_mesh = get_face_mesh
+
+    assert len(lookups) == 1
+    assert regions == [face_detectors.detect_face_region(image, use_mediapipe=True) for image in images]
+    assert regions[0] is not None and regions[2] is None
+    print("[OK] 얼굴 영역 일괄 감지")
+
+
+def test_extract_uses_precomputed_region():
+    """미리 감지한 영역을 주면 다시 감지하지 않고 같은 크롭을 만드는지 확인"""
+    if not face_landmarks.is_available():
+        print("[SKIP] MediaPipe 없음")
+        return
+    from utils import kaodata_image
+
+    face, _ = _make_large_photo()
+    image = face.resize((face.width * 4, face.height * 4), Image.BICUBIC)
+    detected, region = kaodata_image.extract_face_region(image, return_face_region=True, use_mediapipe=True)
+
+    detect_faces = face_detectors.detect_faces
+    face_detectors.detect_faces = None
+    try:
+        reused, reused_region = kaodata_image.extract_face_region(image, return_face_region=True, use_mediapipe=True,
+                                                                    face_region=region)
+    finally:
+        face_detectors.detect_faces = detect_faces
+
+    assert reused_region == region
+    assert np.array_equal(np.asarray(reused), np.asarray(detected))
+    print("[OK] 미리 감지한 영역으로 크롭")
+
+
+if __name__ == '__main__':
+    test_downscale_for_detection()
+    test_pyramid_returns_original_coordinates()
+    test_detector_registry_is_thread_local()
+    test_detect_face_region()
+    test_detect_faces_batch()
+    test_extract_uses_precomputed_region()
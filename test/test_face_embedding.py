@@ -0,0 +1,124 @@
+"""
+전체 메시 얼굴 임베딩 테스트
+"""
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import face_embedding, feature_store
+from utils.similarity_search import SimilarityIndex
+
+
+def _faces(count, seed=0):
+    """기본 얼굴 + 변형 모드 몇 개로 만든 합성 478점 랜드마크 (픽셀 좌표)"""
+    rng = np.random.default_rng(seed)
+    base = rng.normal(0, 40, (478, 2)) + 100
+    base[468] = (80, 90)     # 오른쪽 눈동자
+    base[473] = (120, 90)    # 왼쪽 눈동자
+    modes = rng.normal(0, 3, (4, 478, 2))
+    weights = rng.normal(0, 1, (count, 4))
+    return base + np.einsum('nk,kpd->npd', weights, modes)
+
+
+def _transform(points, angle, scale, offset):
+    cos, sin = np.cos(angle), np.sin(angle)
+    return (points @ np.array([[cos, -sin], [sin, cos]]).T) * scale + offset
+
+
+def test_mesh_vector_similarity_invariant():
+    """이동/크기/회전이 달라도 같은 메시 벡터가 나오는지 확인"""
+    face = _faces(1)[0]
+    moved = _transform(face, 0.3, 2.5, (40, -10))
+    a, b = face_embedding.mesh_vector(face), face_embedding.mesh_vector(moved)
+    assert a.shape == (face_embedding.MESH_DIM,) and a.dtype == np.float32
+    assert np.allclose(a, b, atol=1e-5)
+    assert face_embedding.mesh_vector(face[:468]) is None
+
+    rotated = _transform(a.reshape(-1, 2), 0.2, 1.0, 0).ravel()
+    aligned = face_embedding.procrustes_align([rotated], a)[0]
+    assert np.allclose(aligned, a, atol=1e-6)
+    print("[OK] 메시 정규화/정렬")
+
+
+def test_incremental_basis_and_store():
+    """기저 학습, 증분 재학습 시 임베딩 재투영, 가장 가까운 얼굴 검색 확인"""
+    with tempfile.TemporaryDirectory() as tmp:
+        faces = _faces(40, seed=1)
+        paths = []
+        for i, face in enumerate(faces):
+            path = os.path.join(tmp, f"face_{i:02d}.png")
+            with open(path, 'wb') as f:
+                f.write(b'x' * (i + 1))
+            paths.append(path)
+
+        for path, face in zip(paths[:16], faces[:16]):
+            face_embedding.store_mesh(path, face)
+        basis = face_embedding.sync_basis(paths[0])
+        # 변형 모드가 4개뿐이므로 분산이 없는 방향은 제외됨
+        assert basis.is_fitted and basis.version == 1 and 4 <= basis.dims <= 15
+        embedding_store = feature_store.get_feature_store(paths[0], feature_store.KIND_EMBEDDING)
+        assert embedding_store.matrix_path.endswith('.f16')
+        assert len(embedding_store.live_entries()[0]) == 16
+
+        # 새 이미지는 현재 기저로 바로 투영, 표본이 2배가 되면 기저를 다시 계산하고 전체 재투영
+        embedding = face_embedding.compute_embedding(paths[16], faces[16])
+        assert embedding.dtype == np.float32 and embedding.shape == (basis.dims,)
+        for path, face in zip(paths[17:], faces[17:]):
+            face_embedding.store_mesh(path, face)
+        basis = face_embedding.sync_basis(paths[0])
+        assert basis.version == 2 and basis.count == 40
+        names, _, vectors = embedding_store.live_entries()
+        assert len(names) == 40 and vectors.shape[1] == basis.dims
+
+        query = face_embedding.mesh_vector(_transform(faces[7], -0.1, 0.8, (5, 5)))
+        index = SimilarityIndex(names, face_vectors=vectors)
+        results = index.search(index.face_scores(basis.transform([query]).astype(np.float32))[0], top_n=1)
+        assert results[0][1] == 'face_07.png'
+
+        reloaded = face_embedding.EmbeddingBasis.load(os.path.join(tmp, 'features', face_embedding.BASIS_FILENAME))
+        assert reloaded.version == 2 and reloaded.seen == basis.seen
+        assert np.array_equal(reloaded.transform([query]), basis.transform([query]))
+        print("[OK] 증분 기저 학습 및 임베딩 검색")
+
+
+def test_changed_image_is_added_again():
+    """같은 파일명이라도 이미지가 바뀌면 (수정 시간/크기가 다르면) 메시를 다시 통계에 넣는지 확인"""
+    with tempfile.TemporaryDirectory() as tmp:
+        faces = _faces(17, seed=2)
+        paths = []
+        for i, face in enumerate(faces[:16]):
+            path = os.path.join(tmp, f"face_{i:02d}.png")
+            with open(path, 'wb') as f:
+                f.write(b'x' * (i + 1))
+            face_embedding.store_mesh(path, face)
+            paths.append(path)
+        basis = face_embedding.sync_basis(paths[0])
+        assert basis.count == 16
+        assert face_embedding.sync_basis(paths[0]).count == 16
+
+        # 같은 이름으로 다른 얼굴 이미지를 덮어씀
+        with open(paths[3], 'wb') as f:
+            f.write(b'y' * 100)
+        face_embedding.store_mesh(paths[3], faces[16])
+        basis = face_embedding.sync_basis(paths[0])
+        assert basis.count == 17 and len(basis.seen) == 16
+        assert basis.seen['face_03.png'][1] == 100
+
+        embedding_store = feature_store.get_feature_store(paths[0], feature_store.KIND_EMBEDDING)
+        stored = embedding_store.get_many([paths[3]])[0]
+        mesh = feature_store.get_feature_store(paths[0], feature_store.KIND_MESH).get_many([paths[3]])[0]
+        assert np.array_equal(stored, basis.transform(mesh).astype(np.float32))
+
+        reloaded = face_embedding.EmbeddingBasis.load(os.path.join(tmp, 'features', face_embedding.BASIS_FILENAME))
+        assert reloaded.seen == basis.seen
+        print("[OK] 바뀐 이미지 메시 다시 학습")
+
+
+if __name__ == '__main__':
+    test_mesh_vector_similarity_invariant()
+    test_incremental_basis_and_store()
+    test_changed_image_is_added_again()
@@ -0,0 +1,65 @@
+"""
+FaceMesh 토폴로지 상수 모듈 테스트
+"""
+import os
+import sys
+import subprocess
+
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from utils import facemesh_topology
+
+
+def test_loads_without_mediapipe():
+    """토폴로지 모듈 로드 시 MediaPipe를 import하지 않는지 확인"""
+    code = "import sys; import utils.facemesh_topology; print('mediapipe' in sys.modules)"
+    output = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT_DIR, text=True)
+    assert output.strip() == 'False'
+    print("[OK] MediaPipe 없이 로드")
+
+
+def test_matches_mediapipe_connections():
+    """생성된 연결 집합이 MediaPipe 정의와 같은지 확인"""
+    try:
+        import mediapipe as mp
+    except ImportError:
+        print("[SKIP] MediaPipe 없음")
+        return
+
+    mp_face_mesh = mp.solutions.face_mesh
+    for name in ('FACEMESH_LIPS', 'FACEMESH_LEFT_EYE', 'FACEMESH_RIGHT_IRIS', 'FACEMESH_FACE_OVAL',
+                 'FACEMESH_CONTOURS', 'FACEMESH_TESSELATION'):
+        assert getattr(facemesh_topology, name) == getattr(mp_face_mesh, name), name
+    print("[OK] MediaPipe 연결 정보 일치")
+
+
+def test_arrays_and_triangles():
+    """인덱스 배열과 테셀레이션 삼각형 형태 확인"""
+    assert facemesh_topology.LEFT_IRIS_INDICES.tolist() == [474, 475, 476, 477]
+    assert facemesh_topology.IRIS_ALL_INDICES.tolist() == list(range(468, 478))
+    assert not facemesh_topology.TESSELATION_EDGES.flags.writeable
+
+    triangles = facemesh_topology.TESSELATION_TRIANGLES
+    assert triangles.shape[1] == 3 and triangles.max() < facemesh_topology.FACEMESH_NUM_LANDMARKS
+
+    # 모든 삼각형 변은 테셀레이션 간선이어야 함
+    edges = {tuple(sorted(edge)) for edge in facemesh_topology.TESSELATION_EDGES.tolist()}
+    for a, b, c in triangles.tolist():
+        assert (a, b) in edges and (a, c) in edges and (b, c) in edges
+
+    # 각 간선은 삼각형 1개(경계) 또는 2개(내부)에만 속함
+    counts = {}
+    for tri in np.sort(triangles, axis=1).tolist():
+        for edge in ((tri[0], tri[1]), (tri[0], tri[2]), (tri[1], tri[2])):
+            counts[edge] = counts.get(edge, 0) + 1
+    assert set(counts.values()) <= {1, 2}
+    print("[OK] 인덱스 배열 및 삼각형")
+
+
+if __name__ == '__main__':
+    test_loads_without_mediapipe()
+    test_matches_mediapipe_connections()
+    test_arrays_and_triangles()
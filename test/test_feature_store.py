@@ -0,0 +1,119 @@
+"""
+특징 벡터 저장소 테스트
+"""
+import os
+import sys
+import json
+import tempfile
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import feature_store
+from utils.feature_store import FeatureStore
+
+
+def _make_images(directory, count):
+    """저장소 키로 쓸 작은 이미지 파일 생성"""
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"img_{i:03d}.png")
+        Image.new('RGB', (4, 4), (i, i, i)).save(path)
+        paths.append(path)
+    return paths
+
+
+def test_put_get_and_reload():
+    """저장 후 다른 인스턴스에서 같은 벡터를 읽는지, 특징 없음도 기록되는지 확인"""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _make_images(tmp, 3)
+        features_dir = feature_store.get_features_dir(paths[0])
+        store = FeatureStore(features_dir, feature_store.KIND_FACE)
+        vectors = np.random.default_rng(0).random((2, 8)).astype(np.float32)
+        store.put(paths[0], vectors[0])
+        store.put(paths[1], vectors[1])
+        store.put(paths[2], None)
+        store.flush()
+
+        reopened = FeatureStore(features_dir, feature_store.KIND_FACE)
+        vector, cached = reopened.get(paths[1])
+        assert cached and np.array_equal(vector, vectors[1])
+        assert reopened.get(paths[2]) == (None, True)
+
+        matrix, found, missing = reopened.get_many(paths)
+        assert found == paths[:2] and missing == []
+        assert np.array_equal(matrix, vectors)
+        print("[OK] 저장/재로드")
+
+
+def test_invalidated_when_image_changes():
+    """이미지 파일이 바뀌면 캐시 항목을 무시하는지 확인"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _make_images(tmp, 1)[0]
+        store = FeatureStore(feature_store.get_features_dir(path), feature_store.KIND_CLOTHING)
+        store.put(path, np.ones(4, dtype=np.float32))
+
+        Image.new('RGB', (6, 6)).save(path)
+        os.utime(path, (0, 12345))
+        assert store.get(path) == (None, False)
+        print("[OK] 이미지 변경 시 무효화")
+
+
+def test_tombstones_and_compaction():
+    """삭제/갱신 행이 압축 후 제거되고 남은 벡터가 유지되는지 확인"""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _make_images(tmp, 80)
+        features_dir = feature_store.get_features_dir(paths[0])
+        store = FeatureStore(features_dir, feature_store.KIND_FACE)
+        vectors = np.arange(80 * 4, dtype=np.float32).reshape(80, 4)
+        for path, vector in zip(paths, vectors):
+            store.put(path, vector)
+        for path in paths[:40]:
+            assert store.remove(path)
+        assert store.needs_compaction()
+        store.flush()
+
+        assert store.matrix().shape == (40, 4)
+        assert os.path.getsize(store.matrix_path) == 40 * 4 * 4
+        reopened = FeatureStore(features_dir, feature_store.KIND_FACE)
+        matrix, found, missing = reopened.get_many(paths)
+        assert found == paths[40:] and missing == paths[:40]
+        assert np.array_equal(matrix, vectors[40:])
+        print("[OK] 삭제 표시 및 압축")
+
+
+def test_stale_feature_version_is_recomputed():
+    """특징 계산 버전이 예전인 옷 저장소는 버리고, 버전이 없는 얼굴 저장소는 그대로 읽는지 확인"""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _make_images(tmp, 2)
+        features_dir = feature_store.get_features_dir(paths[0])
+        vector = np.arange(8, dtype=np.float32)
+        for kind in (feature_store.KIND_CLOTHING, feature_store.KIND_FACE):
+            store = FeatureStore(features_dir, kind)
+            store.put(paths[0], vector)
+            store.flush()
+            # 버전 필드가 생기기 전에 기록된 저장소처럼 만듦
+            with open(store.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            index.pop('feature_version')
+            with open(store.index_path, 'w', encoding='utf-8') as f:
+                json.dump(index, f)
+
+        clothing = FeatureStore(features_dir, feature_store.KIND_CLOTHING)
+        assert clothing.get(paths[0]) == (None, False)
+        clothing.put(paths[1], vector)
+        clothing.flush()
+        assert FeatureStore(features_dir, feature_store.KIND_CLOTHING).get(paths[1])[1]
+
+        face_vector, cached = FeatureStore(features_dir, feature_store.KIND_FACE).get(paths[0])
+        assert cached and np.array_equal(face_vector, vector)
+        print("[OK] 특징 계산 버전")
+
+
+if __name__ == '__main__':
+    test_put_get_and_reload()
+    test_invalidated_when_image_changes()
+    test_tombstones_and_compaction()
+    test_stale_feature_version_is_recomputed()
@@ -0,0 +1,105 @@
+"""
+점 드래그 부분 재렌더링 테스트
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image
+
+from utils.face_landmarks import detect_face_landmarks
+from utils.face_morphing.polygon_morphing import core
+from utils.face_morphing.polygon_morphing.incremental import IncrementalMorphRenderer
+
+_TEST_IMAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_face.png')
+
+
+def _load_face():
+    """테스트 얼굴 이미지(5배 확대)와 468개 랜드마크"""
+    image = Image.open(_TEST_IMAGE).convert('RGB')
+    image = image.resize((image.width * 5, image.height * 5), Image.BICUBIC)
+    landmarks, detected = detect_face_landmarks(image)
+    assert detected
+    return image, [tuple(point) for point in np.asarray(landmarks, dtype=np.float64)[:468]]
+
+
+def _moved(landmarks, offset, index=None):
+    """랜드마크 하나(index) 또는 전체를 offset만큼 옮긴 목록"""
+    points = np.array(landmarks)
+    if index is None:
+        points += offset
+    else:
+        points[index] += offset
+    return [tuple(point) for point in points]
+
+
+def test_point_drag_renders_only_dirty_region():
+    """점 하나를 옮기면 그 주변만 다시 그리고, 결과가 전체 remap 렌더링과 같은지 확인"""
+    image, landmarks = _load_face()
+    renderer = IncrementalMorphRenderer()
+    nose = _moved(landmarks, (3.0, 2.0), index=1)
+    renderer.render(image, landmarks, nose, blend_ratio=1.0)
+    assert renderer.last_full
+
+    dragged = _moved(nose, (2.0, -1.0), index=1)
+    result = renderer.render(image, landmarks, dragged, blend_ratio=1.0)
+    assert not renderer.last_full
+    x0, y0, x1, y1 = renderer.last_region
+    assert x0 <= dragged[1][0] < x1 and y0 <= dragged[1][1] < y1
+    assert (x1 - x0) * (y1 - y0) < image.width * image.height * 0.1
+
+    expected = core.morph_face_by_polygons(image, landmarks, dragged, blend_ratio=1.0, render_backend="remap")
+    assert np.array_equal(np.asarray(result), np.asarray(expected))
+
+    # 움직인 점이 없으면 직전 결과 그대로
+    again = renderer.render(image, landmarks, dragged, blend_ratio=1.0)
+    assert renderer.last_region == (0, 0, 0, 0)
+    assert np.array_equal(np.asarray(again), np.asarray(expected))
+    print("[OK] 부분 재렌더링")
+
+
+def test_drag_on_perturbed_mesh_matches_full_render():
+    """이미 편집된(모든 점을 조금씩 옮긴) 메시에서 점 하나를 끌어도 전체 remap 렌더링과 같은지 확인"""
+    image, landmarks = _load_face()
+    points = np.array(landmarks)
+    for trial in range(6):
+        rng = np.random.default_rng(trial)
+        edited = points + rng.normal(0.0, 2.5, points.shape)
+        renderer = IncrementalMorphRenderer()
+        renderer.render(image, landmarks, [tuple(p) for p in edited], blend_ratio=1.0)
+
+        dragged = edited.copy()
+        dragged[rng.integers(0, len(points))] += rng.normal(0.0, 3.0, 2)
+        dragged = [tuple(p) for p in dragged]
+        result = renderer.render(image, landmarks, dragged, blend_ratio=1.0)
+        assert not renderer.last_full
+        expected = core.morph_face_by_polygons(image, landmarks, dragged, blend_ratio=1.0,
+                                               render_backend="remap")
+        assert np.array_equal(np.asarray(result), np.asarray(expected)), trial
+    print("[OK] 편집된 메시에서 부분 재렌더링")
+
+
+def test_large_change_falls_back_to_full_render():
+    """바뀐 영역이 넓거나 옵션이 바뀌면 전체를 다시 렌더링하는지 확인"""
+    image, landmarks = _load_face()
+    renderer = IncrementalMorphRenderer()
+    renderer.render(image, landmarks, list(landmarks), blend_ratio=1.0)
+
+    shifted = _moved(landmarks, (2.0, 0.0))
+    result = renderer.render(image, landmarks, shifted, blend_ratio=1.0)
+    assert renderer.last_full
+    expected = core.morph_face_by_polygons(image, landmarks, shifted, blend_ratio=1.0, render_backend="remap")
+    assert np.array_equal(np.asarray(result), np.asarray(expected))
+
+    renderer.render(image, landmarks, shifted, blend_ratio=0.5)
+    assert renderer.last_full
+    print("[OK] 전체 렌더링 대체")
+
+
+if __name__ == '__main__':
+    test_point_drag_renders_only_dirty_region()
+    test_drag_on_perturbed_mesh_matches_full_render()
+    test_large_change_falls_back_to_full_render()
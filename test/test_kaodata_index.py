@@ -0,0 +1,89 @@
+"""
+게임 얼굴(Kaodata.s7) 유사도 인덱스 테스트
+"""
+import os
+import sys
+import tempfile
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import globals as gl
+from utils import kaodata_image, kaodata_index
+
+
+def _write_kaodata(path, seed=0):
+    """슬롯마다 다른 단색 값을 가진 합성 Kaodata 파일"""
+    rng = np.random.default_rng(seed)
+    slots = np.repeat(rng.integers(1, 256, kaodata_index.FACE_COUNT, dtype=np.uint8)[:, None],
+                      kaodata_image.FACE_SIZE, axis=1)
+    with open(path, 'wb') as f:
+        f.write(b'\0' * kaodata_image.HEADER_SIZE)
+        f.write(slots.tobytes())
+
+
+class _CountingExtractor:
+    """이미지 평균 밝기로 만든 가짜 (랜드마크, 특징)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, image):
+        self.calls += 1
+        mean = np.asarray(image.convert('L'), dtype=np.float32).mean() / 255.0
+        return None, np.array([1.0, mean * 4 + 0.1, 2.0 - mean], dtype=np.float32)
+
+
+def test_incremental_update_and_query():
+    """처음에는 전체 슬롯, 이후에는 바뀐 슬롯만 다시 계산하고 검색하는지 확인"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'Kaodata.s7')
+        _write_kaodata(path)
+        extractor = _CountingExtractor()
+        index = kaodata_index.KaodataIndex(path, extract=extractor)
+        assert len(index.update()) == kaodata_index.FACE_COUNT
+        assert index.update() == [] and extractor.calls == kaodata_index.FACE_COUNT
+        assert os.path.exists(kaodata_index.get_index_path(path))
+
+        # 다른 프로세스에서 다시 열어도 저장된 인덱스를 그대로 사용
+        reopened = kaodata_index.KaodataIndex(path, extract=extractor)
+        assert reopened.update() == [] and extractor.calls == kaodata_index.FACE_COUNT
+
+        # 검색: 슬롯 이미지 그대로 넣으면 자기 자신(또는 같은 특징의 슬롯)이 1위
+        query = kaodata_index.slot_image(kaodata_index.read_slots(path)[123])
+        results = reopened.query_image(query, top_k=3)
+        assert len(results) == 3 and results[0][0] > 0.999
+        assert np.allclose(reopened.vectors[results[0][1]], reopened.vectors[123])
+        print("[OK] 증분 갱신 및 검색")
+
+
+def test_save_face_image_invalidates_slot():
+    """save_face_image로 슬롯을 쓰면 그 슬롯만 다시 계산하는지 확인"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'Kaodata.s7')
+        _write_kaodata(path, seed=1)
+        previous = gl._face_file
+        gl._face_file = path
+        try:
+            extractor = _CountingExtractor()
+            index = kaodata_index.get_index(path)
+            index.extract = extractor
+            index.update()
+            extractor.calls = 0
+
+            kaodata_image.save_face_image(7, Image.new('RGB', (96, 120), (200, 180, 160)))
+            assert 7 in index._dirty
+            assert index.update() == [7] and extractor.calls == 1
+            assert index.update() == []
+        finally:
+            kaodata_image.close_kaodata_file()
+            gl._face_file = previous
+            kaodata_index._indexes.clear()
+        print("[OK] 저장 시 슬롯 무효화")
+
+
+if __name__ == '__main__':
+    test_incremental_update_and_query()
+    test_save_face_image_invalidates_slot()
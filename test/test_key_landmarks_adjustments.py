@@ -0,0 +1,51 @@
+"""
+주요 랜드마크(눈/입/얼굴 중심) 기반 조정 함수 회귀 테스트
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image
+
+from utils.face_landmarks import detect_face_landmarks, get_key_landmarks
+from utils.face_morphing.adjustments import adjust_jaw, adjust_upper_lip_size
+
+_TEST_IMAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_faces', 'face000.png')
+
+
+def _load_face():
+    """실제 얼굴 이미지와 감지한 랜드마크"""
+    image = Image.open(_TEST_IMAGE).convert('RGB')
+    landmarks, detected = detect_face_landmarks(image)
+    assert detected
+    return image, landmarks
+
+
+def test_key_landmark_centers_are_integer_pixels():
+    """조정 함수가 슬라이스 경계로 쓰는 중심 좌표가 정수인지 확인"""
+    _, landmarks = _load_face()
+    key_landmarks = get_key_landmarks(landmarks)
+    for name in ('left_eye', 'right_eye', 'nose', 'mouth', 'face_center'):
+        assert all(isinstance(value, int) for value in key_landmarks[name]), name
+    print("[OK] 주요 랜드마크 정수 좌표")
+
+
+def test_mouth_and_face_adjustments_change_image():
+    """입술/턱 조정이 예외로 원본을 그대로 돌려주지 않고 실제로 이미지를 바꾸는지 확인"""
+    image, landmarks = _load_face()
+    original = np.asarray(image)
+
+    lip = adjust_upper_lip_size(image, upper_lip_size_ratio=2.0, landmarks=landmarks)
+    assert not np.array_equal(np.asarray(lip.convert('RGB')), original)
+
+    jaw = adjust_jaw(image, jaw_adjustment=30.0, landmarks=landmarks)
+    assert not np.array_equal(np.asarray(jaw.convert('RGB')), original)
+    print("[OK] 입술/턱 조정 적용")
+
+
+if __name__ == '__main__':
+    test_key_landmark_centers_are_integer_pixels()
+    test_mouth_and_face_adjustments_change_image()
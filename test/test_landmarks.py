@@ -0,0 +1,93 @@
+"""
+Landmarks 배열 타입 테스트
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.landmarks import Landmarks, as_landmarks, as_point_array
+from utils.face_morphing.polygon_morphing.movement import move_points
+
+
+def test_tuple_list_compatibility():
+    """인덱싱/반복/수정이 튜플 리스트처럼 동작하는지 확인"""
+    points = Landmarks([(1, 2), (3.5, 4.25)])
+    assert len(points) == 2
+    assert points[1] == (3.5, 4.25)
+    assert list(points) == [(1.0, 2.0), (3.5, 4.25)]
+    assert points == [(1, 2), (3.5, 4.25)]
+
+    x, y = points[0]
+    assert (x, y) == (1.0, 2.0)
+
+    points[0] = (10, 20)
+    points.append((5, 6))
+    points.extend([(7, 8)])
+    assert points.tolist() == [(10.0, 20.0), (3.5, 4.25), (5.0, 6.0), (7.0, 8.0)]
+    assert points.to_int_tuples()[1] == (4, 4)
+    print("[OK] 튜플 리스트 호환")
+
+
+def test_zero_copy_views():
+    """배열 변환은 복사 없이 같은 메모리를 공유하고, 슬라이스는 리스트처럼 독립적인지 확인"""
+    array = np.arange(20, dtype=np.float32).reshape(10, 2)
+    points = as_landmarks(array)
+    assert as_point_array(points) is points.array
+    assert np.shares_memory(points.array, array)
+
+    head = points[:3]
+    assert isinstance(head, Landmarks)
+    assert not np.shares_memory(head.array, points.array)
+    head[0] = (-1, -1)
+    assert points[0] == (0.0, 1.0)
+    assert head[0] == (-1.0, -1.0)
+    print("[OK] 복사 없는 배열 / 독립 슬라이스")
+
+
+def test_concatenation_with_lists():
+    """Landmarks와 튜플 리스트를 양쪽 순서로 이어 붙일 수 있는지 확인"""
+    points = Landmarks([(1, 2), (3, 4)])
+    boundary = [(-10, -10), (10, 10)]
+
+    tail = points + boundary
+    head = boundary + points
+    assert isinstance(tail, Landmarks) and isinstance(head, Landmarks)
+    assert head.tolist() == [(-10.0, -10.0), (10.0, 10.0), (1.0, 2.0), (3.0, 4.0)]
+    assert tail.tolist() == [(1.0, 2.0), (3.0, 4.0), (-10.0, -10.0), (10.0, 10.0)]
+    assert len(points) == 2
+    print("[OK] 리스트와 이어 붙이기")
+
+
+def test_vector_ops():
+    """translate/scale/centroid가 서브픽셀 좌표를 유지하고 원본을 바꾸지 않는지 확인"""
+    points = Landmarks([(0, 0), (2, 0), (2, 2), (0, 2)])
+    moved = points.translate(0.5, -0.25, indices=[1, 2])
+    assert moved.tolist() == [(0.0, 0.0), (2.5, -0.25), (2.5, 1.75), (0.0, 2.0)]
+    assert points[1] == (2.0, 0.0)
+
+    scaled = points.scale(1.5, 0.5, center=points.centroid())
+    assert scaled.bbox() == (-0.5, 0.5, 2.5, 1.5)
+    assert points.centroid([0, 1]) == (1.0, 0.0)
+    print("[OK] 벡터 연산")
+
+
+def test_move_points_returns_landmarks():
+    """포인트 이동 결과가 Landmarks이고 영향 반경 밖 포인트는 그대로인지 확인"""
+    points = Landmarks([(0, 0), (10, 0), (100, 100)])
+    result = move_points(points, [0], [(4, 0)], influence_radius=20.0)
+    assert isinstance(result, Landmarks)
+    assert result[0] == (4.0, 0.0)
+    assert 0.0 < result[1][0] - 10.0 < 4.0
+    assert result[2] == (100.0, 100.0)
+    print("[OK] 포인트 이동")
+
+
+if __name__ == '__main__':
+    test_tuple_list_compatibility()
+    test_zero_copy_views()
+    test_concatenation_with_lists()
+    test_vector_ops()
+    test_move_points_returns_landmarks()
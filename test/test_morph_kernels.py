@@ -0,0 +1,75 @@
+"""
+정변환 스플랫 누적 커널 테스트
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.face_morphing.polygon_morphing import kernels
+
+
+def _entries(count, size, seed):
+    rng = np.random.default_rng(seed)
+    dest_idx = rng.integers(0, size, count)
+    weights = rng.uniform(0, 1, count).astype(np.float32)
+    values = rng.uniform(0, 255, (count, 3)).astype(np.float32)
+    return dest_idx, weights, values
+
+
+def _reference(dest_idx, weights, values, size):
+    result = np.zeros((size, 3), dtype=np.float64)
+    count = np.zeros(size, dtype=np.float64)
+    np.add.at(result, dest_idx, values.astype(np.float64) * weights[:, None])
+    np.add.at(count, dest_idx, weights.astype(np.float64))
+    return result, count
+
+
+def test_accumulate_matches_add_at():
+    """누적 결과가 np.add.at과 같고, mask는 값을 받은 픽셀만 표시하는지 확인"""
+    size = 500
+    dest_idx, weights, values = _entries(20000, size - 50, 0)
+    expected_result, expected_count = _reference(dest_idx, weights, values, size)
+
+    for accumulate in (kernels.accumulate, kernels._accumulate_bincount):
+        result = np.zeros((size, 3), dtype=np.float32)
+        count = np.zeros(size, dtype=np.float32)
+        mask = np.zeros(size, dtype=np.bool_)
+        accumulate(dest_idx, weights, values, result, count, mask)
+        assert np.allclose(result, expected_result, rtol=1e-4)
+        assert np.allclose(count, expected_count, rtol=1e-4)
+        assert np.array_equal(mask, np.isin(np.arange(size), dest_idx))
+    print("[OK] 누적 커널")
+
+
+def test_accumulate_without_mask_adds_to_existing():
+    """mask 없이 기존 버퍼 값에 더하는지 확인 (범위 밖 픽셀 누적 경로)"""
+    size = 64
+    dest_idx, weights, values = _entries(300, size, 1)
+    result = np.full((size, 3), 10.0, dtype=np.float32)
+    count = np.ones(size, dtype=np.float32)
+    kernels.accumulate(dest_idx, weights, values, result, count)
+    expected_result, expected_count = _reference(dest_idx, weights, values, size)
+    assert np.allclose(result, expected_result + 10.0, rtol=1e-4)
+    assert np.allclose(count, expected_count + 1.0, rtol=1e-4)
+    kernels.accumulate(np.array([], dtype=np.int64), np.array([], dtype=np.float32),
+                       np.zeros((0, 3), dtype=np.float32), result, count)
+    print("[OK] 기존 버퍼 누적")
+
+
+def test_warm_up():
+    """numba가 없으면 미리 컴파일이 아무것도 하지 않고, 있으면 컴파일을 마치는지 확인"""
+    thread = kernels.warm_up(background=True)
+    if not kernels.is_numba_available():
+        assert thread is None
+    elif thread is not None:
+        thread.join()
+    print("[OK] 커널 미리 컴파일")
+
+
+if __name__ == '__main__':
+    test_accumulate_matches_add_at()
+    test_accumulate_without_mask_adds_to_existing()
+    test_warm_up()
@@ -0,0 +1,77 @@
+"""
+모핑 애니메이션 프레임 렌더링 테스트
+"""
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image
+
+from utils.face_landmarks import detect_face_landmarks
+from utils.face_morphing.polygon_morphing import core
+from utils.face_morphing.polygon_morphing import sequence
+
+_TEST_IMAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_face.png')
+
+
+def _load_face():
+    """테스트 얼굴 이미지(4배 확대), 원본 랜드마크, 코끝을 옮긴 랜드마크"""
+    image = Image.open(_TEST_IMAGE).convert('RGB')
+    image = image.resize((image.width * 4, image.height * 4), Image.BICUBIC)
+    landmarks, detected = detect_face_landmarks(image)
+    assert detected
+    original = [tuple(point) for point in np.asarray(landmarks, dtype=np.float64)[:468]]
+    transformed = list(original)
+    transformed[1] = (original[1][0] + 3.0, original[1][1] + 2.0)
+    return image, original, transformed
+
+
+def test_sequence_prepares_once_and_ends_at_full_morph():
+    """준비 단계는 한 번만 하고, 첫 프레임은 원본/마지막 프레임은 전체 모핑 결과와 같은지 확인"""
+    image, original, transformed = _load_face()
+    calls = []
+    morph = core.morph_face_by_polygons
+
+    def _counting_morph(*args, **kwargs):
+        calls.append(kwargs.get('skip_pixel_warp'))
+        return morph(*args, **kwargs)
+
+    core.morph_face_by_polygons = _counting_morph
+    try:
+        frames = list(sequence.render_morph_sequence(image, original, transformed, 5, blend_ratio=1.0))
+    finally:
+        core.morph_face_by_polygons = morph
+
+    assert calls == [True]
+    assert len(frames) == 5 and all(frame.size == image.size for frame in frames)
+    assert np.array_equal(np.asarray(frames[0]), np.asarray(image))
+    expected = core.morph_face_by_polygons(image, original, transformed, blend_ratio=1.0,
+                                           render_backend="cached_remap")
+    assert np.array_equal(np.asarray(frames[-1]), np.asarray(expected))
+    assert not np.array_equal(np.asarray(frames[2]), np.asarray(frames[-1]))
+    print("[OK] 모핑 애니메이션 프레임")
+
+
+def test_cross_fade_and_writer_thread():
+    """두 이미지 교차 페이드가 두 번째 이미지로 끝나고, 쓰기 스레드가 프레임을 순서대로 저장하는지 확인"""
+    image, original, transformed = _load_face()
+    target = Image.fromarray(255 - np.asarray(image))
+    frames = sequence.render_morph_sequence(image, original, transformed, 4, target_image=target)
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        paths = sequence.write_morph_sequence(frames, output_dir, prefix="clip")
+        assert [os.path.basename(path) for path in paths] == [f"clip_{i:04d}.png" for i in range(4)]
+        last = np.asarray(Image.open(paths[-1]).convert('RGB')).astype(np.int16)
+        first = np.asarray(Image.open(paths[0]).convert('RGB')).astype(np.int16)
+    assert np.abs(first - np.asarray(image)).max() <= 1
+    assert np.abs(last - np.asarray(target)).max() <= 1
+    print("[OK] 교차 페이드 / 쓰기 스레드")
+
+
+if __name__ == '__main__':
+    test_sequence_prepares_once_and_ends_at_full_morph()
+    test_cross_fade_and_writer_thread()
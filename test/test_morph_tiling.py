@@ -0,0 +1,105 @@
+"""
+행 타일 병렬 모핑 렌더링 테스트
+"""
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scipy.spatial import Delaunay
+
+from utils.face_morphing.polygon_morphing import barycentric_field
+from utils.face_morphing.polygon_morphing import core
+from utils.face_morphing.polygon_morphing import tiling
+
+
+def _noise_context():
+    """무작위 포인트를 흔든 DelaunayContext (무작위 잡음 이미지, 바운딩 박스는 이미지 안쪽)"""
+    rng = np.random.default_rng(7)
+    image = rng.integers(0, 256, (260, 300, 3), dtype=np.uint8)
+    points = np.vstack([rng.uniform(30, 270, (80, 2)) * (1.0, 0.9),
+                        [(10, 10), (290, 10), (290, 250), (10, 250)]])
+    transformed = points.copy()
+    transformed[:80] += rng.normal(0, 3.0, (80, 2))
+    return core.DelaunayContext(
+        img_array=image, working_img=image, working_width=300, working_height=260,
+        min_x=15, min_y=12, max_x=285, max_y=247,
+        tri=Delaunay(points), original_points_array=points, transformed_points_array=transformed,
+    )
+
+
+def test_split_rows():
+    """띠가 행 범위를 빈틈없이 순서대로 나누고, 최소 행 수를 지키는지 확인"""
+    tiles = tiling.split_rows(12, 247, 4)
+    assert len(tiles) == 4 and tiles[0][0] == 12 and tiles[-1][1] == 247
+    assert all(a[1] == b[0] for a, b in zip(tiles, tiles[1:]))
+    assert len(tiling.split_rows(0, tiling.MIN_TILE_ROWS * 2, 16)) == 2
+    assert tiling.split_rows(0, 10, 8) == [(0, 10)]
+    assert tiling.split_rows(5, 5, 4) == []
+    print("[OK] 행 띠 나누기")
+
+
+def test_tiled_remap_matches_single_thread():
+    """remap 렌더링을 여러 띠로 나눠도 한 스레드 결과와 비트 단위로 같은지 확인"""
+    ctx = _noise_context()
+    expected = core._apply_inverse_remap(delaunay_ctx=ctx, tile_count=1)
+    assert not np.array_equal(expected, ctx.working_img)
+    for tile_count in (2, 3, 7):
+        assert np.array_equal(core._apply_inverse_remap(delaunay_ctx=ctx, tile_count=tile_count), expected)
+    region = (40, 30, 200, 180)
+    assert np.array_equal(core._apply_inverse_remap(delaunay_ctx=ctx, region=region, tile_count=3),
+                          core._apply_inverse_remap(delaunay_ctx=ctx, region=region, tile_count=1))
+    print("[OK] 타일 remap 렌더링")
+
+
+def test_tiled_cached_remap_matches_single_thread():
+    """캐시 필드 remap 렌더링을 여러 띠로 나눠도 한 스레드 결과와 비트 단위로 같은지 확인"""
+    barycentric_field.clear_cache()
+    ctx = _noise_context()
+    expected = core._apply_cached_remap(delaunay_ctx=ctx, tile_count=1)
+    for tile_count in (2, 5):
+        assert np.array_equal(core._apply_cached_remap(delaunay_ctx=ctx, tile_count=tile_count), expected)
+    print("[OK] 타일 캐시 remap 렌더링")
+
+
+def test_shared_pool_survives_concurrent_callers():
+    """여러 스레드가 띠 수를 바꿔 가며 동시에 렌더링해도 공용 풀이 교체/종료되지 않는지 확인"""
+    errors = []
+    executor = tiling._get_executor()
+    # 더 많은 띠를 요청해도 다른 호출이 쥐고 있는 풀에 계속 제출할 수 있어야 함
+    tiling.render_row_tiles(0, 4000, lambda row_start, row_stop: None,
+                            tile_count=tiling.RENDER_POOL_WORKERS + 4)
+    executor.submit(int).result()
+
+    def _caller(offset):
+        rows = np.zeros(400, dtype=np.int64)
+
+        def _render_tile(row_start, row_stop):
+            time.sleep(0.001)
+            rows[row_start:row_stop] += 1
+
+        try:
+            for i in range(20):
+                tiling.render_row_tiles(0, 400, _render_tile, tile_count=2 + (i + offset) % 6)
+            assert np.all(rows == 20)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=_caller, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == [] and tiling._get_executor() is executor
+    print("[OK] 공용 렌더링 풀 동시 사용")
+
+
+if __name__ == '__main__':
+    test_split_rows()
+    test_tiled_remap_matches_single_thread()
+    test_tiled_cached_remap_matches_single_thread()
+    test_shared_pool_survives_concurrent_callers()
@@ -0,0 +1,115 @@
+"""
+모핑 삼각형 토폴로지 테스트 (FaceMesh 고정 삼각형, 래스터화 점 위치 찾기)
+"""
+import os
+import sys
+from collections import Counter
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scipy.spatial import Delaunay
+
+from utils.face_morphing.polygon_morphing import topology
+from utils.face_morphing.polygon_morphing import core
+
+
+def test_face_mesh_triangles_form_closed_disk():
+    """테셀레이션 + 눈/입 채움 + 윤곽 띠가 경계 사각형만 열린 하나의 원판인지 확인"""
+    for num_landmarks, iris_center_order in ((470, (468, 469)), (468, None)):
+        triangles = topology.face_mesh_triangles(num_landmarks, iris_center_order)
+        assert len({tuple(sorted(t)) for t in triangles.tolist()}) == len(triangles)
+        edges = Counter()
+        for a, b, c in triangles.tolist():
+            for edge in ((a, b), (b, c), (a, c)):
+                edges[tuple(sorted(edge))] += 1
+        assert max(edges.values()) == 2
+        # 감는 방향이 맞춰져 있으면 안쪽 변은 양방향으로 한 번씩 지나감
+        directed = Counter((a, b) for t in triangles.tolist() for a, b in zip(t, t[1:] + t[:1]))
+        assert max(directed.values()) == 1
+        corners = set(range(num_landmarks, num_landmarks + topology.BOUNDARY_POINT_COUNT))
+        open_edges = [edge for edge, count in edges.items() if count == 1]
+        assert len(open_edges) == 4 and all(set(edge) <= corners for edge in open_edges)
+        # 오일러 특성 (원판): V - E + F = 1
+        vertices = num_landmarks + topology.BOUNDARY_POINT_COUNT
+        assert vertices - len(edges) + len(triangles) == 1
+    print("[OK] FaceMesh 고정 삼각형")
+
+
+def test_raster_locator_matches_delaunay():
+    """래스터화 맵 조회가 정수 좌표에서 scipy find_simplex와 같은지 확인 (변에 걸친 픽셀은 이웃 삼각형 허용)"""
+    rng = np.random.default_rng(3)
+    points = np.vstack([rng.uniform(5, 115, (60, 2)), [(-10, -10), (130, -10), (130, 110), (-10, 110)]])
+    delaunay = Delaunay(points)
+    raster = topology.RasterTopology(points, delaunay.simplices.astype(np.int32))
+    ys, xs = np.mgrid[0:100, 0:120]
+    coords = np.column_stack([xs.ravel(), ys.ravel()]).astype(np.float64)
+    expected = delaunay.find_simplex(coords)
+    located = raster.find_simplex(coords)
+    # 변에 걸친 픽셀은 어느 쪽 삼각형이든 가능: 고른 삼각형의 각 변에서 1픽셀 안쪽이면 됨
+    assert np.all(located >= 0)
+    mismatched = np.flatnonzero(located != expected)
+    corners = points[raster.simplices[located[mismatched]]]
+    pixels = coords[mismatched]
+    for k in range(3):
+        start, end = corners[:, k], corners[:, (k + 1) % 3]
+        opposite = corners[:, (k + 2) % 3]
+        edge = end - start
+        length = np.hypot(edge[:, 0], edge[:, 1])
+        side = np.sign(edge[:, 0] * (opposite - start)[:, 1] - edge[:, 1] * (opposite - start)[:, 0])
+        distance = side * (edge[:, 0] * (pixels - start)[:, 1] - edge[:, 1] * (pixels - start)[:, 0]) / length
+        assert np.all(distance >= -1.0)
+    assert np.allclose(raster.transform, delaunay.transform)
+    assert raster.find_simplex(np.array([[500.0, 500.0]]))[0] == -1
+    print("[OK] 래스터화 점 위치 찾기")
+
+
+def test_folded_face_mesh_is_used():
+    """옆을 향한 초상화처럼 접힌 FaceMesh도 뒤집힌 삼각형만 빼고 빈틈 없이 래스터화해 쓰는지 확인"""
+    from PIL import Image
+    from utils.face_landmarks import detect_face_landmarks
+
+    image_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_face.png')
+    image = Image.open(image_path).convert('RGB')
+    image = image.resize((image.width * 4, image.height * 4), Image.BICUBIC)
+    landmarks, detected = detect_face_landmarks(image)
+    assert detected
+    landmarks = np.asarray(landmarks, dtype=np.float64)
+    width, height = image.size
+    points = np.vstack([landmarks[:468], landmarks[473:478].mean(axis=0), landmarks[468:473].mean(axis=0),
+                        [(-10, -10), (width + 10, -10), (width + 10, height + 10), (-10, height + 10)]])
+
+    tri = topology.build_topology(points)
+    assert np.array_equal(tri.simplices, topology.face_mesh_simplices(points))
+    assert tri.covers(points[-topology.BOUNDARY_POINT_COUNT:])
+    areas = topology._signed_areas(points, tri.simplices)
+    assert tri.folded.any() and np.array_equal(tri.folded, areas * np.sign(areas.sum()) <= 0)
+    ys, xs = np.mgrid[0:height, 0:width]
+    located = tri.find_simplex(np.column_stack([xs.ravel(), ys.ravel()]).astype(np.float64))
+    assert np.all(located >= 0) and not np.any(tri.folded[located])
+
+    # 뒤집힘 검사는 같은 포인트의 Delaunay 삼각형으로 함
+    assert np.array_equal(tri.delaunay.simplices, Delaunay(points).simplices)
+    assert tri.relocated(points + 0.5).covers(points[-topology.BOUNDARY_POINT_COUNT:] + 0.5)
+    print(f"[OK] 접힌 FaceMesh 사용 (접힌 삼각형 {int(tri.folded.sum())}개 제외)")
+
+
+def test_topology_cache_and_fallback():
+    """FaceMesh 구성이 아니면 Delaunay 삼각형을 쓰고, 같은 포인트는 캐시된 토폴로지를 재사용하는지 확인"""
+    rng = np.random.default_rng(4)
+    points = np.vstack([rng.uniform(5, 95, (30, 2)), [(-10, -10), (110, -10), (110, 110), (-10, 110)]])
+    tri = core._create_delaunay_triangulation(points)
+    assert isinstance(tri, topology.RasterTopology)
+    assert np.array_equal(np.sort(np.sort(tri.simplices, axis=1), axis=0),
+                          np.sort(np.sort(Delaunay(points).simplices, axis=1), axis=0))
+    assert core._create_delaunay_triangulation(points.copy()) is tri
+    assert core._create_delaunay_triangulation(points + 0.5) is not tri
+    print("[OK] 토폴로지 캐시")
+
+
+if __name__ == '__main__':
+    test_face_mesh_triangles_form_closed_disk()
+    test_raster_locator_matches_delaunay()
+    test_folded_face_mesh_is_used()
+    test_topology_cache_and_fallback()
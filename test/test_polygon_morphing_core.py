@@ -0,0 +1,93 @@
+"""
+폴리곤 모핑 정변환 준비 단계 테스트 (삼각형별 픽셀 묶기, 일괄 아핀 계산)
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2
+from scipy.spatial import Delaunay
+
+from utils.face_morphing.polygon_morphing import core
+
+
+def test_group_pixels_by_simplex():
+    """CSR 슬라이스가 삼각형별 마스크 결과(순서 포함)와 같은지 확인"""
+    rng = np.random.default_rng(0)
+    simplex_indices = rng.integers(-1, 20, 5000).astype(np.int32)
+    pixel_order, offsets = core._group_pixels_by_simplex(simplex_indices, 25)
+    assert len(offsets) == 26 and offsets[-1] == np.count_nonzero(simplex_indices >= 0)
+    for simplex_idx in range(25):
+        expected = np.where(simplex_indices == simplex_idx)[0]
+        assert np.array_equal(pixel_order[offsets[simplex_idx]:offsets[simplex_idx + 1]], expected)
+    print("[OK] 삼각형별 픽셀 묶기")
+
+
+def test_batched_affines_match_opencv():
+    """일괄 계산한 아핀 행렬이 cv2.getAffineTransform과 같고, 뒤집힌 삼각형은 항등 변환인지 확인"""
+    rng = np.random.default_rng(1)
+    original = rng.uniform(0, 200, (40, 2))
+    transformed = original + rng.normal(0, 2.0, original.shape)
+    simplices = Delaunay(original).simplices
+
+    affines = core._compute_triangle_affines(original, transformed, simplices)
+    assert affines.shape == (len(simplices), 2, 3)
+    for simplex, affine in zip(simplices, affines):
+        src = original[simplex].astype(np.float32)
+        dst = transformed[simplex].astype(np.float32)
+        v1, v2 = dst[1] - dst[0], dst[2] - dst[0]
+        w1, w2 = src[1] - src[0], src[2] - src[0]
+        if (v1[0] * v2[1] - v1[1] * v2[0]) * (w1[0] * w2[1] - w1[1] * w2[0]) < 0:
+            continue
+        if min(np.linalg.norm(dst[1] - dst[0]), np.linalg.norm(dst[2] - dst[0]),
+               np.linalg.norm(dst[2] - dst[1])) < 0.5:
+            continue
+        assert np.allclose(affine, cv2.getAffineTransform(src, dst), atol=1e-6) or \
+            np.allclose(affine, np.eye(2, 3))
+
+    # 한 점을 반대편으로 보내 삼각형을 뒤집으면 항등 변환
+    flipped = original.copy()
+    simplex = simplices[0]
+    flipped[simplex[0]] = flipped[simplex[1]] + flipped[simplex[2]] - flipped[simplex[0]]
+    affine = core._compute_triangle_affines(original, flipped, simplices[:1])[0]
+    assert np.allclose(affine, np.eye(2, 3))
+    print("[OK] 일괄 아핀 계산")
+
+
+def _grid_context(transformed_shift):
+    """10x10 격자 포인트의 가운데 영역만 이동한 DelaunayContext (가로 그라디언트 이미지)"""
+    gradient = np.tile(np.arange(120, dtype=np.uint8)[None, :, None], (100, 1, 3))
+    xs, ys = np.meshgrid(np.linspace(0, 119, 10), np.linspace(0, 99, 10))
+    original = np.column_stack([xs.ravel(), ys.ravel()])
+    transformed = original.copy()
+    inner = (original[:, 0] > 30) & (original[:, 0] < 90) & (original[:, 1] > 30) & (original[:, 1] < 70)
+    transformed[inner] += transformed_shift
+    return core.DelaunayContext(
+        img_array=gradient, working_img=gradient, working_width=120, working_height=100,
+        min_x=0, min_y=0, max_x=120, max_y=100,
+        tri=Delaunay(original), original_points_array=original, transformed_points_array=transformed,
+    )
+
+
+def test_inverse_remap_renderer():
+    """remap 렌더링: 변형이 없으면 그대로, 이동한 영역은 원본에서 되짚어 샘플링하는지 확인"""
+    ctx = _grid_context((0.0, 0.0))
+    assert np.array_equal(core._apply_inverse_remap(delaunay_ctx=ctx), ctx.working_img)
+
+    ctx = _grid_context((4.0, 0.0))
+    result = core._apply_inverse_remap(delaunay_ctx=ctx)
+    assert result.shape == ctx.working_img.shape
+    # 이동한 포인트로 둘러싸인 안쪽: 목적지 x는 원본 x - 4에서 가져옴
+    assert np.array_equal(result[45:55, 50:70, 0], ctx.working_img[45:55, 46:66, 0])
+    # 고정 포인트 바깥은 그대로
+    assert np.array_equal(result[:, :10], ctx.working_img[:, :10])
+    print("[OK] remap 역매핑 렌더링")
+
+
+if __name__ == '__main__':
+    test_group_pixels_by_simplex()
+    test_batched_affines_match_opencv()
+    test_inverse_remap_renderer()
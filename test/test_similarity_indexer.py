@@ -0,0 +1,124 @@
+"""
+백그라운드 유사도 검색 작업 테스트
+"""
+import os
+import sys
+import time
+import tempfile
+import threading
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import feature_store
+from utils import similarity_indexer
+from utils.similarity_search import SimilarityIndex
+
+
+def _run_until_finished(job, timeout=30.0):
+    """UI 없이 poll()을 반복해 작업 완료까지 대기, 중간 결과 기록"""
+    snapshots = []
+    deadline = time.time() + timeout
+    while not job.is_finished():
+        if job.poll():
+            snapshots.append(list(job.results))
+        assert time.time() < deadline, "검색 작업이 끝나지 않았습니다"
+        time.sleep(0.01)
+    job.poll()
+    return snapshots
+
+
+def _setup(directory, count, cached):
+    """이미지 파일 생성, 앞쪽 cached개는 저장소에 미리 특징 기록"""
+    rng = np.random.default_rng(3)
+    vectors = {}
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"img_{i:03d}.png")
+        Image.new('RGB', (4, 4), (i, 0, 0)).save(path)
+        paths.append(path)
+        vectors[path] = (rng.random(10) * 2).astype(np.float32)
+    store = feature_store.get_feature_store(paths[0], feature_store.KIND_FACE)
+    for path in paths[:cached]:
+        store.put(path, vectors[path])
+    store.flush()
+    return paths, vectors
+
+
+def test_streaming_search_matches_full_search():
+    """저장소 특징 + 스레드 추출 결과를 합친 최종 상위 N개가 전체 검색과 같은지 확인"""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths, vectors = _setup(tmp, 40, cached=25)
+        extracted = []
+
+        def _extract(path):
+            extracted.append(path)
+            time.sleep(0.005)
+            feature_store.get_feature_store(path, feature_store.KIND_FACE).put(path, vectors[path])
+            return vectors[path]
+
+        job = similarity_indexer.SimilaritySearchJob(_extract, top_n=5, num_workers=3)
+        job.start(paths[0], paths[1:])
+        snapshots = _run_until_finished(job)
+
+        assert job.reference_found and not job.cancelled
+        assert job.done == 39 and len(snapshots) >= 1
+        assert sorted(extracted) == sorted([paths[0]] + paths[25:])
+
+        index = SimilarityIndex(paths[1:], face_vectors=np.stack([vectors[p] for p in paths[1:]]))
+        expected = index.search(index.face_scores([vectors[paths[0]]])[0], top_n=5)
+        assert [key for _, key in job.results] == [key for _, key in expected]
+        assert np.allclose([s for s, _ in job.results], [s for s, _ in expected], atol=1e-6)
+
+        # 두 번째 검색은 모두 저장소에서 로드 (기준 이미지 포함)
+        extracted.clear()
+        job = similarity_indexer.SimilaritySearchJob(_extract, top_n=5)
+        job.start(paths[0], paths[1:])
+        _run_until_finished(job)
+        assert extracted == [paths[0]] and [k for _, k in job.results] == [k for _, k in expected]
+
+        # ANN 후보 축소 경로 (모든 리스트를 탐색하면 정확한 검색과 같음)
+        min_rows = similarity_indexer.ann_index.MIN_ROWS_FOR_ANN
+        similarity_indexer.ann_index.MIN_ROWS_FOR_ANN = 1
+        try:
+            job = similarity_indexer.SimilaritySearchJob(_extract, top_n=5, ann_nprobe=1000)
+            job.start(paths[0], paths[1:])
+            _run_until_finished(job)
+        finally:
+            similarity_indexer.ann_index.MIN_ROWS_FOR_ANN = min_rows
+        assert [k for _, k in job.results] == [k for _, k in expected]
+        print("[OK] 점진적 검색 결과")
+
+
+def test_cancel_and_missing_reference():
+    """취소 시 남은 추출을 건너뛰고, 기준 특징이 없으면 결과 없이 끝나는지 확인"""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths, vectors = _setup(tmp, 30, cached=0)
+        release = threading.Event()
+        calls = []
+
+        def _slow_extract(path):
+            calls.append(path)
+            release.wait(5)
+            return vectors[path]
+
+        job = similarity_indexer.SimilaritySearchJob(_slow_extract, num_workers=2)
+        job.start(paths[0], paths[1:])
+        time.sleep(0.05)
+        job.cancel()
+        release.set()
+        _run_until_finished(job)
+        assert job.cancelled and len(calls) < len(paths)
+
+        job = similarity_indexer.SimilaritySearchJob(lambda path: None)
+        job.start(paths[0], paths[1:])
+        _run_until_finished(job)
+        assert job.reference_found is False and job.results == []
+        print("[OK] 취소 및 기준 특징 없음")
+
+
+if __name__ == '__main__':
+    test_streaming_search_matches_full_search()
+    test_cancel_and_missing_reference()
@@ -0,0 +1,70 @@
+"""
+벡터화된 유사도 검색 엔진 테스트
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils.face_landmarks as face_landmarks
+from utils.similarity_search import SimilarityIndex, top_k
+
+
+def _random_features(count, seed=0):
+    """얼굴 특징 (10차원)과 옷 특징 (히스토그램 96 + 통계 6) 생성"""
+    rng = np.random.default_rng(seed)
+    faces = (rng.random((count, 10)) * 2).astype(np.float32)
+    clothing = np.concatenate([rng.random((count, 96)) / 32, rng.random((count, 6)) * 200], axis=1).astype(np.float32)
+    return faces, clothing
+
+
+def test_scores_match_pairwise_functions():
+    """행렬 점수가 기존 쌍별 유사도 함수와 같은지 확인"""
+    faces, clothing = _random_features(200)
+    faces[3] = 0.0
+    features_list = [((faces[i], clothing[i] if i % 3 else None), f"img_{i}") for i in range(200)]
+    index = SimilarityIndex.from_features(features_list)
+
+    query = (faces[7] * 1.01, clothing[7])
+    combined = index.combined_scores([query[0]], [query[1]])[0]
+    expected = [face_landmarks.calculate_combined_similarity(query, f) for f, _ in features_list]
+    assert np.allclose(combined, expected, atol=1e-5)
+
+    face = index.face_scores([faces[11]])[0]
+    expected = [face_landmarks.calculate_face_similarity(faces[11], faces[i]) for i in range(200)]
+    assert np.allclose(face, expected, atol=1e-5)
+
+    cloth = index.clothing_scores([clothing[5]])[0]
+    for i in range(200):
+        if i % 3:
+            assert abs(cloth[i] - face_landmarks.calculate_clothing_similarity(clothing[5], clothing[i])) < 1e-5
+        else:
+            assert np.isnan(cloth[i])
+    print("[OK] 쌍별 함수와 점수 일치")
+
+
+def test_top_k_and_search():
+    """상위 N개 선택이 전체 정렬과 같고, 여러 기준을 한 번에 처리하는지 확인"""
+    scores = np.random.default_rng(1).random((3, 500)).astype(np.float32)
+    indices = top_k(scores, 7)
+    assert indices.shape == (3, 7)
+    for row, row_indices in zip(scores, indices):
+        assert row_indices.tolist() == np.argsort(-row, kind='stable')[:7].tolist()
+
+    faces, _ = _random_features(50, seed=2)
+    index = SimilarityIndex([f"img_{i}" for i in range(50)], face_vectors=faces)
+    results = index.search(index.face_scores(faces[:4]), top_n=3, exclude={'img_0'})
+    assert len(results) == 4
+    assert results[1][0][1] == 'img_1' and all(key != 'img_0' for _, key in results[0])
+
+    legacy = face_landmarks.find_similar_faces(faces[2], [(faces[i], i) for i in range(50)], top_n=5)
+    assert legacy[0][1] == 2 and legacy == sorted(legacy, key=lambda x: x[0], reverse=True)
+    assert index.search(index.face_scores([faces[2]])[0], min_score=2.0) == []
+    print("[OK] 상위 N개 선택")
+
+
+if __name__ == '__main__':
+    test_scores_match_pairwise_functions()
+    test_top_k_and_search()
@@ -0,0 +1,148 @@
+"""
+썸네일 캐시 / 가상화 결과 목록 테스트
+"""
+import os
+import sys
+import time
+import tempfile
+
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import dir_manifest, thumbnail_cache
+
+
+def _write_image(path, color, size=(400, 500)):
+    Image.new('RGB', size, color).save(path)
+
+
+def _close(color_a, color_b, tolerance=8):
+    """손실 압축(WebP) 오차를 허용한 색 비교"""
+    return all(abs(a - b) <= tolerance for a, b in zip(color_a, color_b))
+
+
+def test_disk_cache_keyed_by_content():
+    """디스크 썸네일이 내용 해시로 재사용되고, 내용이 바뀌면 새로 만드는지 확인"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'face.png')
+        _write_image(path, (200, 100, 50))
+
+        image = thumbnail_cache.ThumbnailCache().get(path)
+        assert image.size == (96, 120) and image.mode == 'RGB'
+        thumbnails_dir = thumbnail_cache.get_thumbnails_dir(path)
+        files = os.listdir(thumbnails_dir)
+        assert len(files) == 1
+
+        # 새 캐시(메모리 비어 있음)는 디스크 썸네일을 그대로 읽음
+        cache = thumbnail_cache.ThumbnailCache()
+        assert cache.peek(path) is None
+        disk_mtime = os.path.getmtime(os.path.join(thumbnails_dir, files[0]))
+        assert _close(cache.get(path).getpixel((10, 10)), image.getpixel((10, 10)))
+        assert cache.peek(path) is not None
+        assert os.path.getmtime(os.path.join(thumbnails_dir, files[0])) == disk_mtime
+
+        # 같은 내용의 다른 파일은 같은 디스크 썸네일 사용
+        copy_path = os.path.join(tmp, 'copy.png')
+        with open(path, 'rb') as src, open(copy_path, 'wb') as dst:
+            dst.write(src.read())
+        cache.get(copy_path)
+        assert len(os.listdir(thumbnails_dir)) == 1
+
+        # 내용이 바뀌면 메모리/디스크 모두 새 썸네일
+        time.sleep(0.01)
+        _write_image(path, (10, 20, 30))
+        assert cache.peek(path) is None
+        assert not _close(cache.get(path).getpixel((10, 10)), image.getpixel((10, 10)))
+        assert len(os.listdir(thumbnails_dir)) == 2
+        assert cache.get(os.path.join(tmp, 'missing.png')) is None
+        print("[OK] 내용 해시 디스크 캐시")
+
+
+def test_loader_streams_results():
+    """로더가 작업 스레드에서 썸네일을 만들어 poll()로 전달하는지 확인"""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(5):
+            path = os.path.join(tmp, f'img_{i}.png')
+            _write_image(path, (i * 40, 0, 0))
+            paths.append(path)
+
+        loader = thumbnail_cache.ThumbnailLoader(thumbnail_cache.ThumbnailCache(), num_workers=2)
+        loader.request(paths + paths[:2])
+        loaded = {}
+        deadline = time.time() + 10
+        while loader.pending and time.time() < deadline:
+            loaded.update(loader.poll())
+            time.sleep(0.01)
+        loaded.update(loader.poll())
+        loader.shutdown()
+        assert sorted(loaded) == sorted(paths)
+        assert all(image is not None for image in loaded.values())
+        print("[OK] 썸네일 로더")
+
+
+def test_content_hash_recorded_in_manifest():
+    """스캔한 디렉토리의 내용 해시는 매니페스트에 기록되어 다음 조회에서 다시 계산하지 않는지 확인"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'face.png')
+        _write_image(path, (120, 60, 30))
+        manifest = dir_manifest.get_manifest(tmp)
+        manifest.scan()
+
+        computed = []
+        compute = dir_manifest.compute_content_hash
+        dir_manifest.compute_content_hash = lambda p: computed.append(p) or compute(p)
+        try:
+            loader = thumbnail_cache.ThumbnailLoader(thumbnail_cache.ThumbnailCache(), num_workers=1)
+            loader.request([path])
+            deadline = time.time() + 10
+            while loader.pending and time.time() < deadline:
+                loader.poll()
+                time.sleep(0.01)
+            loader.shutdown()
+            thumbnail_cache.ThumbnailCache().get(path)
+        finally:
+            dir_manifest.compute_content_hash = compute
+        assert len(computed) == 1
+
+        # 로더가 끝나면 디스크 매니페스트에도 저장됨
+        reloaded = dir_manifest.DirectoryManifest(tmp)
+        assert reloaded.get('face.png').content_hash == manifest.get('face.png').content_hash
+        print("[OK] 내용 해시 매니페스트 기록")
+
+
+def test_virtual_list_recycles_rows():
+    """보이는 행만 만들고 스크롤 시 재사용하는지 확인 (디스플레이가 없으면 건너뜀)"""
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        print("[SKIP] 디스플레이 없음")
+        return
+    from gui.frame.virtual_list import VirtualList
+    try:
+        created, bound = [], []
+        view = VirtualList(root, row_height=20,
+                           create_row=lambda parent: created.append(tk.Label(parent)) or created[-1],
+                           bind_row=lambda row, item, index: bound.append(index))
+        view.canvas.configure(height=100)
+        view.pack()
+        root.update()
+        view.set_items(list(range(500)))
+        root.update()
+        assert len(created) <= 7
+        bound.clear()
+        view.canvas.yview_moveto(0.5)
+        root.update()
+        assert view.visible_range()[0] >= 240 and len(created) <= 7
+        print("[OK] 가상화 목록")
+    finally:
+        root.destroy()
+
+
+if __name__ == '__main__':
+    test_disk_cache_keyed_by_content()
+    test_loader_streams_results()
+    test_content_hash_recorded_in_manifest()
+    test_virtual_list_recycles_rows()
@@ -0,0 +1,415 @@
+"""
+근사 최근접 이웃(ANN) 인덱스
+특징 저장소 위에 NumPy로 구현한 IVF(Inverted File) 인덱스를 둡니다.
+벡터를 k-means 중심(리스트)별로 나누어 두고, 기준 벡터와 가까운 nprobe개 리스트의 후보만 거리 계산합니다.
+반환된 후보는 similarity_search의 정확한 점수로 다시 순위를 매기는 용도이며, 정확한 전체 검색이 기준 경로입니다.
+
+최종 점수는 코사인 비중이 크므로(similarity_search.FACE_COSINE_WEIGHT) 클러스터링, 리스트 배정, 탐색, 후보 순위는
+모두 단위 길이로 정규화한 벡터로 계산합니다 (구면 k-means, 코사인 순위). 저장하는 벡터는 원래 값 그대로입니다.
+nprobe가 클수록 재현율(recall)이 높고 느려지며, nprobe >= 리스트 수이면 정확한 코사인 검색과 같습니다.
+인덱스는 특징 저장소 옆 s7ed.features.{kind}.ivf.npz에 저장되고, 저장소 변경분만 증분 반영합니다.
+"""
+import os
+import threading
+
+import numpy as np
+
+import utils.feature_store as feature_store
+
+# 로거 (지연 로딩)
+_logger = None
+
+def _get_logger():
+    """로거 가져오기 (지연 로딩)"""
+    global _logger
+    if _logger is None:
+        from utils.logger import get_logger
+        _logger = get_logger('ANN인덱스')
+    return _logger
+
+
+# 인덱스 파일 형식 버전 (2: 정규화한 벡터로 학습한 중심)
+ANN_VERSION = 2
+
+# 이 행 수 미만이면 정확한 전체 검색이 충분히 빠르므로 ANN을 쓰지 않음
+MIN_ROWS_FOR_ANN = 20000
+
+# 기본 탐색 리스트 수 (재현율/속도 조절값)
+DEFAULT_NPROBE = 8
+
+# ANN 후보 수 = 요청 결과 수 x 배수 (정확한 점수로 다시 순위를 매기기 위한 여유분)
+CANDIDATE_OVERSAMPLE = 8
+
+# 학습 이후 행 수가 이 배수 이상 늘면 중심을 다시 학습
+_RETRAIN_GROWTH = 4.0
+
+# k-means 설정
+_KMEANS_ITERATIONS = 10
+_KMEANS_SAMPLES_PER_LIST = 64
+_DISTANCE_BLOCK_ROWS = 16384
+
+
+def _default_num_lists(num_rows):
+    """행 수에 맞는 리스트 수 (약 sqrt(N))"""
+    return int(np.clip(round(np.sqrt(max(num_rows, 1))), 1, 4096))
+
+
+def _unit_rows(vectors):
+    """행마다 단위 길이로 정규화한 float32 벡터 (노름이 0인 행은 그대로 0)"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms > 0, norms, 1.0)
+
+
+def _nearest_centroids(vectors, centroids, count=1):
+    """각 벡터에서 가장 가까운 중심 count개 (블록 단위로 거리 계산)"""
+    centroid_sq = (centroids.astype(np.float64) ** 2).sum(axis=1)
+    count = min(count, len(centroids))
+    result = np.empty((len(vectors), count), dtype=np.int64)
+    for start in range(0, len(vectors), _DISTANCE_BLOCK_ROWS):
+        block = vectors[start:start + _DISTANCE_BLOCK_ROWS].astype(np.float64)
+        # |v - c|^2에서 행마다 같은 |v|^2는 순위에 영향이 없으므로 생략
+        distance = centroid_sq[np.newaxis, :] - 2.0 * (block @ centroids.T.astype(np.float64))
+        if count == 1:
+            result[start:start + len(block), 0] = distance.argmin(axis=1)
+        else:
+            part = np.argpartition(distance, count - 1, axis=1)[:, :count]
+            order = np.argsort(np.take_along_axis(distance, part, axis=1), axis=1)
+            result[start:start + len(block)] = np.take_along_axis(part, order, axis=1)
+    return result
+
+
+def _train_centroids(vectors, num_lists, seed=0):
+    """표본에서 구면 k-means로 리스트 중심 학습 (vectors는 정규화된 벡터, 중심도 단위 길이로 유지)"""
+    rng = np.random.default_rng(seed)
+    num_lists = min(num_lists, len(vectors))
+    sample_size = min(len(vectors), num_lists * _KMEANS_SAMPLES_PER_LIST)
+    sample = vectors[rng.choice(len(vectors), sample_size, replace=False)].astype(np.float64)
+    centroids = sample[rng.choice(sample_size, num_lists, replace=False)].copy()
+
+    for _ in range(_KMEANS_ITERATIONS):
+        assign = _nearest_centroids(sample, centroids)[:, 0]
+        counts = np.bincount(assign, minlength=num_lists)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, sample)
+        filled = counts > 0
+        centroids[filled] = _unit_rows(sums[filled]).astype(np.float64)
+        # 빈 리스트는 임의 표본으로 다시 시작
+        empty = np.flatnonzero(~filled)
+        if len(empty):
+            centroids[empty] = sample[rng.choice(sample_size, len(empty), replace=False)]
+    return centroids.astype(np.float32)
+
+
+class IVFIndex:
+    """
+    NumPy IVF 인덱스 (키: 문자열, 벡터: float32)
+
+    Args:
+        num_lists: 리스트(중심) 수 (None이면 첫 학습 시 sqrt(N))
+        nprobe: 기본 탐색 리스트 수
+    """
+
+    def __init__(self, num_lists=None, nprobe=DEFAULT_NPROBE):
+        self.num_lists = num_lists
+        self.nprobe = nprobe
+        self.centroids = None
+        self.trained_rows = 0
+        self.keys = []
+        self.vectors = np.empty((0, 0), dtype=np.float32)
+        self.assign = np.empty(0, dtype=np.int64)
+        self.signatures = np.empty((0, 2), dtype=np.float64)
+        self._positions = {}
+        self._order = None
+        self._offsets = None
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self._positions
+
+    @property
+    def is_trained(self):
+        return self.centroids is not None
+
+    def _invalidate_layout(self):
+        self._positions = {key: i for i, key in enumerate(self.keys)}
+        self._order = None
+        self._offsets = None
+
+    def _layout(self):
+        """리스트별로 정렬한 행 순서와 리스트 시작 위치 (변경 후 처음 검색할 때 계산)"""
+        if self._order is None:
+            self._order = np.argsort(self.assign, kind='stable')
+            counts = np.bincount(self.assign, minlength=len(self.centroids))
+            self._offsets = np.concatenate([[0], np.cumsum(counts)])
+        return self._order, self._offsets
+
+    def train(self, vectors=None, seed=0):
+        """중심을 학습하고 모든 행을 다시 배정 (vectors가 None이면 현재 행으로 학습)"""
+        vectors = self.vectors if vectors is None else np.asarray(vectors, dtype=np.float32)
+        if len(vectors) == 0:
+            return
+        num_lists = self.num_lists or _default_num_lists(len(vectors))
+        self.centroids = _train_centroids(_unit_rows(vectors), num_lists, seed=seed)
+        self.trained_rows = len(vectors)
+        if len(self.vectors):
+            self.assign = _nearest_centroids(_unit_rows(self.vectors), self.centroids)[:, 0]
+        self._invalidate_layout()
+
+    def add(self, keys, vectors, signatures=None):
+        """
+        벡터를 추가합니다 (같은 키가 있으면 교체). 학습 전이면 추가 후 학습합니다.
+
+        Args:
+            keys: 키 리스트
+            vectors: (n, D) 벡터
+            signatures: (n, 2) 변경 감지용 값 (수정 시간, 크기)
+        """
+        keys = list(keys)
+        if not keys:
+            return
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32).reshape(len(keys), -1)
+        if signatures is None:
+            signatures = np.zeros((len(keys), 2), dtype=np.float64)
+        signatures = np.asarray(signatures, dtype=np.float64).reshape(len(keys), 2)
+
+        self.remove([key for key in keys if key in self._positions])
+        if len(self.vectors) == 0:
+            self.vectors = np.empty((0, vectors.shape[1]), dtype=np.float32)
+        elif self.vectors.shape[1] != vectors.shape[1]:
+            raise ValueError(f"벡터 차원이 다릅니다: {self.vectors.shape[1]} != {vectors.shape[1]}")
+
+        self.keys.extend(keys)
+        self.vectors = np.concatenate([self.vectors, vectors])
+        self.signatures = np.concatenate([self.signatures, signatures])
+        if self.is_trained:
+            self.assign = np.concatenate([self.assign, _nearest_centroids(_unit_rows(vectors), self.centroids)[:, 0]])
+            self._invalidate_layout()
+        else:
+            self.assign = np.zeros(len(self.keys), dtype=np.int64)
+            self.train()
+
+    def remove(self, keys):
+        """키에 해당하는 행 제거"""
+        rows = [self._positions[key] for key in keys if key in self._positions]
+        if not rows:
+            return
+        keep = np.ones(len(self.keys), dtype=bool)
+        keep[rows] = False
+        self.keys = [key for key, kept in zip(self.keys, keep) if kept]
+        self.vectors = self.vectors[keep]
+        self.assign = self.assign[keep]
+        self.signatures = self.signatures[keep]
+        self._invalidate_layout()
+
+    def needs_retrain(self):
+        """학습 이후 행 수가 크게 늘었는지 여부"""
+        return self.is_trained and len(self) > self.trained_rows * _RETRAIN_GROWTH
+
+    def candidates(self, query, nprobe=None):
+        """기준 벡터와 가까운 nprobe개 리스트에 속한 행 번호"""
+        if not self.is_trained or len(self) == 0:
+            return np.empty(0, dtype=np.int64)
+        nprobe = nprobe or self.nprobe
+        query = _unit_rows(np.asarray(query, dtype=np.float32).reshape(1, -1))
+        lists = _nearest_centroids(query, self.centroids, count=nprobe)[0]
+        order, offsets = self._layout()
+        return np.concatenate([order[offsets[i]:offsets[i + 1]] for i in lists])
+
+    def search(self, query, k, nprobe=None):
+        """
+        기준 벡터의 근사 코사인 최근접 k개
+
+        Returns:
+            [(distance, key), ...] 정규화한 벡터 사이 거리 오름차순 (코사인 유사도 내림차순과 같음)
+        """
+        rows = self.candidates(query, nprobe)
+        if len(rows) == 0:
+            return []
+        query = _unit_rows(np.asarray(query, dtype=np.float32).ravel())
+        distance = np.linalg.norm(_unit_rows(self.vectors[rows]) - query, axis=1)
+        k = min(k, len(rows))
+        best = np.argpartition(distance, k - 1)[:k] if k < len(rows) else np.arange(len(rows))
+        best = best[np.argsort(distance[best], kind='stable')]
+        return [(float(distance[i]), self.keys[rows[i]]) for i in best.tolist()]
+
+    def save(self, path):
+        """인덱스를 .npz로 저장 (임시 파일에 쓴 뒤 교체)"""
+        temp_path = path + '.tmp.npz'
+        np.savez(
+            temp_path,
+            version=np.array(ANN_VERSION),
+            nprobe=np.array(self.nprobe),
+            num_lists=np.array(self.num_lists or 0),
+            trained_rows=np.array(self.trained_rows),
+            centroids=self.centroids if self.centroids is not None else np.empty((0, 0), dtype=np.float32),
+            keys=np.array(self.keys, dtype=str),
+            vectors=self.vectors,
+            assign=self.assign,
+            signatures=self.signatures,
+        )
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """저장된 인덱스 로드 (형식이 다르면 None)"""
+        with np.load(path, allow_pickle=False) as data:
+            if int(data['version']) != ANN_VERSION:
+                return None
+            index = cls(num_lists=int(data['num_lists']) or None, nprobe=int(data['nprobe']))
+            centroids = data['centroids']
+            index.centroids = centroids if centroids.size else None
+            index.trained_rows = int(data['trained_rows'])
+            index.keys = data['keys'].tolist()
+            index.vectors = data['vectors']
+            index.assign = data['assign']
+            index.signatures = data['signatures']
+        index._invalidate_layout()
+        return index
+
+
+def _ann_path(store):
+    return os.path.join(store.features_dir, f"s7ed.features.{store.kind}.ivf.npz")
+
+
+# 저장소별 메모리 캐시 (FeatureStore -> (IVFIndex, 반영한 저장소 변경 세대))
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def _load_index(store):
+    """저장된 인덱스 로드 (없거나 읽을 수 없으면 빈 인덱스)"""
+    path = _ann_path(store)
+    if os.path.exists(path):
+        try:
+            index = IVFIndex.load(path)
+            if index is not None:
+                return index
+        except Exception as e:
+            _get_logger().warning(f"ANN 인덱스 로드 실패, 다시 만듭니다 ({path}): {e}")
+    return IVFIndex()
+
+
+def _full_sync(store, index):
+    """
+    저장소 전체와 비교해 달라진 항목을 찾음 (프로세스에서 저장소를 처음 쓰거나 저장소가 초기화된 경우)
+
+    Returns:
+        (index, removed, names, signatures, vectors): 반영할 제거/추가 항목
+    """
+    names, signatures, vectors = store.live_entries()
+    if len(index) and len(vectors) and index.vectors.shape[1] != vectors.shape[1]:
+        # 특징 정의가 바뀜
+        index = IVFIndex(nprobe=index.nprobe)
+
+    live = set(names)
+    removed = [key for key in index.keys if key not in live]
+    positions = np.array([index._positions.get(name, -1) for name in names], dtype=np.int64)
+    known = positions >= 0
+    unchanged = np.zeros(len(names), dtype=bool)
+    if known.any():
+        # 저장된 인덱스 파일이 다른 프로세스의 변경을 놓쳤을 수 있으므로 벡터도 비교
+        unchanged[known] = (
+            (index.signatures[positions[known]] == signatures[known]).all(axis=1)
+            & (index.vectors[positions[known]] == vectors[known]).all(axis=1)
+        )
+    changed = np.flatnonzero(~unchanged)
+    return index, removed, [names[i] for i in changed], signatures[changed], vectors[changed]
+
+
+def _apply_changes(store, index, removed, names, signatures, vectors):
+    """제거/추가 항목을 인덱스에 반영하고 저장"""
+    # 이미 학습된 인덱스에서 대부분의 벡터가 바뀐 경우 (임베딩 기저 재학습 등) 기존 중심은 의미가 없음
+    mostly_changed = index.is_trained and len(names) > len(index) // 2
+    index.remove(removed)
+    index.add(names, vectors, signatures)
+    if index.needs_retrain() or mostly_changed:
+        index.num_lists = _default_num_lists(len(index))
+        index.train()
+    path = _ann_path(store)
+    try:
+        index.save(path)
+    except OSError as e:
+        _get_logger().error(f"ANN 인덱스 저장 실패 ({path}): {e}")
+    _get_logger().debug(
+        f"ANN 인덱스 갱신 ({store.kind}): 추가/변경 {len(names)}, 제거 {len(removed)}, 전체 {len(index)}"
+    )
+
+
+def sync_store_index(store, nprobe=None):
+    """
+    특징 저장소의 ANN 인덱스를 로드하고, 저장소와 달라진 항목만 증분 반영합니다.
+    저장소 변경 세대가 그대로면 아무것도 읽지 않고, 바뀌었으면 바뀐 항목만 읽습니다.
+    저장소 전체 비교는 프로세스에서 처음 쓸 때와 저장소가 초기화되었을 때만 합니다.
+
+    Args:
+        store: FeatureStore
+        nprobe: 탐색 리스트 수 (None이면 저장된 값)
+
+    Returns:
+        IVFIndex (저장소가 비어 있으면 빈 인덱스)
+    """
+    with _indexes_lock:
+        index, synced = _indexes.get(store, (None, None))
+        changed_names = None
+        if index is not None:
+            generation, changed_names = store.changes_since(synced)
+        if changed_names is None:
+            generation = store.generation
+            index, removed, names, signatures, vectors = _full_sync(store, index or _load_index(store))
+        elif changed_names:
+            names, signatures, vectors = store.entries(changed_names)
+            present = set(names)
+            removed = [name for name in changed_names if name not in present]
+        else:
+            names, removed = [], []
+        if nprobe:
+            index.nprobe = nprobe
+
+        if removed or names:
+            _apply_changes(store, index, removed, names, signatures, vectors)
+
+        _indexes[store] = (index, generation)
+        return index
+
+
+def _source_positions(source, index, query, count, nprobe):
+    """출처(디렉토리 하나) 안에서 ANN 후보의 위치"""
+    hits = [name for _, name in index.search(query, count, nprobe)]
+    if not hits:
+        return np.empty(0, dtype=np.int64)
+    rows, layout = source.store.rows_for(hits)
+    if layout == source.layout:
+        # 특징을 읽은 뒤 행 배치가 그대로면 행 번호로 바로 찾음
+        return np.flatnonzero(np.isin(source.rows, rows))
+    # 그 사이 압축/초기화됨: 파일명으로 찾음
+    hits = set(hits)
+    return np.asarray([i for i, path in enumerate(source.paths) if os.path.basename(path) in hits],
+                      dtype=np.int64)
+
+
+def approximate_candidates(sources, query, count, nprobe=None):
+    """
+    특징 행렬의 후보 중 기준 벡터와 가까운 행을 ANN 인덱스로 고릅니다.
+
+    Args:
+        sources: feature_store.load_features(with_sources=True)가 반환한 디렉토리별 출처
+        query: 기준 특징 벡터
+        count: 디렉토리별 최대 후보 수
+        nprobe: 탐색 리스트 수 (재현율/속도 조절)
+
+    Returns:
+        np.ndarray: 출처들을 이어 붙인 순서(load_features의 found_paths 순서)의 위치 (오름차순)
+    """
+    positions = []
+    offset = 0
+    for source in sources:
+        index = sync_store_index(source.store, nprobe)
+        # 후보 목록에 없는 이미지(기준 이미지 등)를 고려해 조금 더 가져옴
+        positions.append(_source_positions(source, index, query, count + 1, nprobe) + offset)
+        offset += len(source.rows)
+    if not positions:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate(positions)
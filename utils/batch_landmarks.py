@@ -0,0 +1,249 @@
+"""
+배치 랜드마크 감지 서비스
+여러 워커 프로세스에서 FaceMesh를 미리 로드해 두고 디렉토리 단위로 랜드마크를 감지합니다.
+결과는 큐로 스트리밍되고 랜드마크 캐시에 기록되며, UI에는 after() 콜백으로 진행률을 전달합니다.
+clothing=True면 같은 워커가 이미 읽은 이미지로 옷 특징도 계산하고, 특징 저장소 기록은 UI 프로세스에서 합니다.
+"""
+import os
+import queue
+import threading
+import multiprocessing
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import utils.face_detectors as face_detectors
+import utils.face_landmarks as face_landmarks
+import utils.landmark_cache as landmark_cache
+import utils.feature_store as feature_store
+
+# 로거 (지연 로딩)
+_logger = None
+
+def _get_logger():
+    """로거 가져오기 (지연 로딩)"""
+    global _logger
+    if _logger is None:
+        from utils.logger import get_logger
+        _logger = get_logger('배치랜드마크')
+    return _logger
+
+
+# 워커 결과: landmarks가 None이면 얼굴 없음 또는 에러 (error에 메시지)
+# clothing은 옷 특징 벡터 (옷 특징을 요청하지 않았거나 옷 영역이 없으면 None)
+BatchLandmarkResult = namedtuple("BatchLandmarkResult", ["image_path", "landmarks", "error", "clothing"],
+                                 defaults=(None,))
+
+# 워커 프로세스별 감지 작업 해상도
+_worker_max_size = None
+
+
+def _init_worker(max_size=None):
+    """워커 프로세스 초기화: 감지기 레지스트리에 FaceMesh 모델을 미리 로드"""
+    global _worker_max_size
+    _worker_max_size = max_size
+    face_detectors.get_face_mesh()
+
+
+def _detect_worker(image_path, clothing=False):
+    """
+    워커 프로세스에서 이미지 한 장의 랜드마크를 감지하고 캐시에 기록
+    clothing=True면 캐시된 랜드마크가 있어도 이미지를 읽어 옷 특징을 계산합니다.
+    """
+    import numpy as np
+    from PIL import Image
+
+    try:
+        landmarks, cached = landmark_cache.load_landmarks(image_path) if clothing else (None, False)
+        face_mesh = None
+        if not cached:
+            face_mesh = face_detectors.get_face_mesh()
+            if face_mesh is None:
+                return BatchLandmarkResult(image_path, None, "MediaPipe를 사용할 수 없습니다")
+
+        if cached and landmarks is None:
+            # 얼굴이 없다고 기록된 이미지는 옷 특징도 없음
+            return BatchLandmarkResult(image_path, None, None)
+
+        with Image.open(image_path) as image:
+            rgb = image.convert('RGB')
+        if not cached:
+            landmarks = face_landmarks._detect_with_pyramid(face_mesh, np.array(rgb), _worker_max_size)
+            landmark_cache.save_landmarks(image_path, landmarks)
+
+        features = None
+        if clothing and landmarks is not None:
+            features = face_landmarks.extract_clothing_features_vector(rgb, landmarks)
+        return BatchLandmarkResult(image_path, landmarks, None, features)
+    except Exception as e:
+        return BatchLandmarkResult(image_path, None, str(e))
+
+
+def get_default_worker_count():
+    """기본 워커 수 (UI 스레드용으로 코어 하나를 남김)"""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+class BatchLandmarkDetector:
+    """
+    프로세스 풀 기반 배치 랜드마크 감지기
+
+    사용 예:
+        detector = BatchLandmarkDetector()
+        detector.start(image_paths)
+        detector.attach(widget, on_progress, on_complete)
+        ...
+        detector.cancel()
+    """
+
+    def __init__(self, num_workers=None, clothing=False):
+        self.num_workers = num_workers or get_default_worker_count()
+        self.clothing = clothing
+        self._executor = None
+        self._results = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.total = 0
+        self.done = 0
+        self.failed = 0
+        self.cancelled = False
+
+    @property
+    def running(self):
+        """감지 작업이 진행 중인지 여부"""
+        with self._lock:
+            return self._executor is not None and self._pending > 0
+
+    def start(self, image_paths, skip_cached=True):
+        """
+        배치 감지를 시작합니다.
+
+        Args:
+            image_paths: 이미지 파일 경로 리스트
+            skip_cached: 유효한 캐시가 있는 이미지는 건너뜀 (clothing이면 옷 특징도 저장소에 있어야 건너뜀)
+
+        Returns:
+            int: 실제로 감지를 요청한 이미지 수
+        """
+        if self._executor is not None:
+            raise RuntimeError("이미 실행 중인 배치 감지가 있습니다")
+
+        if skip_cached:
+            pending = [p for p in image_paths if not landmark_cache.is_cached(p)]
+            if self.clothing:
+                _, _, missing = feature_store.load_features(image_paths, feature_store.KIND_CLOTHING)
+                pending = set(pending).union(missing)
+                image_paths = [p for p in image_paths if p in pending]
+            else:
+                image_paths = pending
+
+        self.total = len(image_paths)
+        self.done = 0
+        self.failed = 0
+        self.cancelled = False
+        if not image_paths:
+            return 0
+
+        # Tk 프로세스를 fork하지 않도록 spawn 컨텍스트 사용
+        ctx = multiprocessing.get_context('spawn')
+        workers = min(self.num_workers, len(image_paths))
+        self._executor = ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                                             initializer=_init_worker,
+                                             initargs=(face_landmarks.get_detection_max_size(),))
+        self._pending = len(image_paths)
+        _get_logger().info(f"배치 랜드마크 감지 시작: {len(image_paths)}개, 워커 {workers}개")
+
+        for image_path in image_paths:
+            future = self._executor.submit(_detect_worker, image_path, self.clothing)
+            future.add_done_callback(self._on_future_done)
+        return len(image_paths)
+
+    def _on_future_done(self, future):
+        """워커 결과를 큐로 전달 (풀 관리 스레드에서 호출됨)"""
+        with self._lock:
+            self._pending -= 1
+        if future.cancelled():
+            return
+        try:
+            self._results.put(future.result())
+        except Exception as e:
+            # 워커 프로세스가 비정상 종료된 경우 등
+            _get_logger().error(f"배치 랜드마크 워커 실패: {e}")
+            self._results.put(BatchLandmarkResult(None, None, str(e)))
+
+    def poll(self):
+        """
+        지금까지 도착한 결과를 모두 꺼냅니다 (논블로킹).
+
+        Returns:
+            list[BatchLandmarkResult]
+        """
+        results = []
+        while True:
+            try:
+                result = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self.done += 1
+            if result.error:
+                self.failed += 1
+                _get_logger().warning(f"랜드마크 감지 실패 ({result.image_path}): {result.error}")
+            elif self.clothing:
+                # 옷 특징은 UI 프로세스에서 저장소에 기록 (얼굴/옷 영역이 없으면 특징 없음으로 기록)
+                feature_store.get_feature_store(result.image_path, feature_store.KIND_CLOTHING).put(
+                    result.image_path, result.clothing
+                )
+            results.append(result)
+
+        if self._executor is not None and not self.running:
+            self._shutdown(wait=False)
+        return results
+
+    def is_finished(self):
+        """모든 결과가 소비되었는지 여부"""
+        return self._executor is None and self._results.empty()
+
+    def cancel(self):
+        """남은 작업을 취소합니다 (진행 중인 이미지는 완료까지 기다리지 않음)"""
+        if self._executor is None:
+            return
+        self.cancelled = True
+        _get_logger().info(f"배치 랜드마크 감지 취소: {self.done}/{self.total}")
+        self._shutdown(wait=False, cancel_futures=True)
+
+    def _shutdown(self, wait=False, cancel_futures=False):
+        """프로세스 풀 종료 (옷 특징을 기록했으면 저장소 색인 저장)"""
+        executor = self._executor
+        self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+            if self.clothing:
+                feature_store.flush_all()
+
+    def attach(self, widget, on_progress=None, on_complete=None, interval_ms=100):
+        """
+        Tk 위젯의 after() 루프로 결과를 주기적으로 수거합니다.
+
+        Args:
+            widget: after()를 제공하는 Tk 위젯
+            on_progress: on_progress(done, total, results) 콜백
+            on_complete: on_complete(cancelled) 콜백
+            interval_ms: 폴링 간격 (밀리초)
+        """
+        def _tick():
+            try:
+                results = self.poll()
+                if results and on_progress is not None:
+                    on_progress(self.done, self.total, results)
+            except Exception as e:
+                _get_logger().error(f"배치 랜드마크 진행률 처리 실패: {e}", exc_info=True)
+
+            if self.is_finished():
+                _get_logger().info(
+                    f"배치 랜드마크 감지 종료: {self.done}/{self.total} (실패 {self.failed}, 취소 {self.cancelled})"
+                )
+                if on_complete is not None:
+                    on_complete(self.cancelled)
+                return
+            widget.after(interval_ms, _tick)
+
+        widget.after(interval_ms, _tick)
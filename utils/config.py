@@ -63,6 +63,11 @@ def load_config():
             gl._save_file_dir = config['save_file_dir']
         if 'face_extract_dir' in config:
             gl._face_extract_dir = config['face_extract_dir']
+        if 'detection_max_size' in config:
+            gl._detection_max_size = int(config['detection_max_size'])
+            _get_logger().info(f"얼굴 감지 작업 해상도: {gl._detection_max_size}px")
+        if 'morph_render_threads' in config:
+            gl._morph_render_threads = int(config['morph_render_threads'])
         
         # 새로운 설정 항목 (기존 호환성 유지)
         if 'window' in config:
@@ -104,6 +109,10 @@ def save_config():
             config['save_file_dir'] = gl._save_file_dir
         if hasattr(gl, '_face_extract_dir'):
             config['face_extract_dir'] = gl._face_extract_dir
+        if hasattr(gl, '_detection_max_size'):
+            config['detection_max_size'] = gl._detection_max_size
+        if hasattr(gl, '_morph_render_threads'):
+            config['morph_render_threads'] = gl._morph_render_threads
         
         # 새로운 설정 항목 저장
         if hasattr(gl, '_window_config') and gl._window_config:
@@ -0,0 +1,291 @@
+"""
+디렉토리 이미지 목록(매니페스트)
+os.scandir 한 번으로 디렉토리의 이미지 파일 (이름, 크기, 수정 시간, 내용 해시)을 수집하고,
+이전 스캔과 비교한 변경분(추가/삭제/변경)을 돌려줍니다.
+파일 목록, 특징 저장소, 랜드마크 캐시는 디렉토리를 다시 훑지 않고 이 변경분을 사용합니다.
+
+매니페스트는 features 폴더의 s7ed.manifest.json에 저장되어 프로그램을 다시 켜도 변경분을 계산할 수 있습니다.
+내용 해시는 필요할 때만 계산하며, 수정 시간만 바뀌고 내용이 같은 파일은 변경으로 보지 않습니다.
+"""
+import os
+import json
+import hashlib
+import threading
+from collections import namedtuple
+
+# 로거 (지연 로딩)
+_logger = None
+
+def _get_logger():
+    """로거 가져오기 (지연 로딩)"""
+    global _logger
+    if _logger is None:
+        from utils.logger import get_logger
+        _logger = get_logger('디렉토리목록')
+    return _logger
+
+
+# 지원하는 이미지 확장자 (소문자)
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.tif', '.webp')
+
+MANIFEST_VERSION = 1
+
+# content_hash(defer_save=True)로 새로 계산한 해시를 디스크에 쓰기 전까지 모아 둘 최대 수
+_FLUSH_INTERVAL = 64
+MANIFEST_FILENAME = 's7ed.manifest.json'
+
+# 매니페스트 항목: content_hash는 아직 계산하지 않았으면 None
+ManifestEntry = namedtuple("ManifestEntry", ["name", "size", "mtime", "content_hash"])
+
+
+class ManifestDiff(namedtuple("ManifestDiff", ["added", "removed", "changed"])):
+    """스캔 변경분 (각각 파일명 리스트)"""
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+
+def is_image_file(name):
+    """지원하는 이미지 확장자인지 (대소문자 무시)"""
+    return os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS
+
+
+def compute_content_hash(path):
+    """파일 내용 해시 (blake2b 128비트, 16진수)"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DirectoryManifest:
+    """디렉토리 하나의 이미지 매니페스트 (스레드 안전)"""
+
+    def __init__(self, directory):
+        self.directory = os.path.normpath(os.path.abspath(directory))
+        self.manifest_path = os.path.join(self.directory, 'features', MANIFEST_FILENAME)
+        self._lock = threading.RLock()
+        self._entries = None
+        self._dirty = 0
+        self.scanned = False
+
+    def _ensure_loaded(self):
+        """저장된 매니페스트 로드 (이전 세션과 비교하기 위해)"""
+        if self._entries is not None:
+            return
+        self._entries = {}
+        if not os.path.exists(self.manifest_path):
+            return
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == MANIFEST_VERSION:
+                self._entries = {
+                    name: ManifestEntry(name, size, mtime, content_hash)
+                    for name, size, mtime, content_hash in data.get('entries', [])
+                }
+        except Exception as e:
+            _get_logger().error(f"매니페스트 로드 실패 ({self.manifest_path}): {e}")
+            self._entries = {}
+
+    def _save(self):
+        """매니페스트를 임시 파일에 쓴 뒤 교체"""
+        try:
+            os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+            temp_path = self.manifest_path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': MANIFEST_VERSION, 'entries': [list(e) for e in self._entries.values()]}, f)
+            os.replace(temp_path, self.manifest_path)
+            self._dirty = 0
+        except OSError as e:
+            _get_logger().error(f"매니페스트 저장 실패 ({self.manifest_path}): {e}")
+
+    def scan(self):
+        """
+        디렉토리를 os.scandir 한 번으로 훑고 이전 상태와 비교합니다.
+
+        Returns:
+            ManifestDiff: 추가/삭제/변경된 파일명 (첫 스캔에서 저장된 매니페스트가 없으면 전부 추가)
+        """
+        with self._lock:
+            self._ensure_loaded()
+            current = {}
+            try:
+                with os.scandir(self.directory) as it:
+                    for entry in it:
+                        if not is_image_file(entry.name):
+                            continue
+                        try:
+                            if not entry.is_file():
+                                continue
+                            stat = entry.stat()
+                        except OSError as e:
+                            _get_logger().warning(f"파일 정보 확인 실패 ({entry.path}): {e}")
+                            continue
+                        current[entry.name] = (stat.st_size, stat.st_mtime)
+            except OSError as e:
+                _get_logger().error(f"디렉토리 스캔 실패 ({self.directory}): {e}")
+                return ManifestDiff([], [], [])
+
+            added, changed, entries = [], [], {}
+            for name, (size, mtime) in current.items():
+                previous = self._entries.get(name)
+                if previous is None:
+                    added.append(name)
+                    entries[name] = ManifestEntry(name, size, mtime, None)
+                elif previous.size == size and previous.mtime == mtime:
+                    entries[name] = previous
+                else:
+                    entries[name] = self._compare_content(previous, size, mtime, changed)
+            removed = [name for name in self._entries if name not in current]
+
+            diff = ManifestDiff(sorted(added), sorted(removed), sorted(changed))
+            content_changed = bool(diff) or any(entries[n] != self._entries.get(n) for n in entries)
+            self._entries = entries
+            self.scanned = True
+            if content_changed or not os.path.exists(self.manifest_path):
+                self._save()
+            if diff:
+                _get_logger().debug(
+                    f"디렉토리 변경 ({self.directory}): 추가 {len(diff.added)}, 삭제 {len(diff.removed)}, 변경 {len(diff.changed)}"
+                )
+            return diff
+
+    def _compare_content(self, previous, size, mtime, changed):
+        """크기/수정 시간이 바뀐 파일: 이전 해시가 있으면 내용을 비교해 실제 변경만 기록"""
+        name = previous.name
+        if previous.content_hash is not None and previous.size == size:
+            try:
+                content_hash = compute_content_hash(os.path.join(self.directory, name))
+                if content_hash == previous.content_hash:
+                    # 내용은 같고 수정 시간만 바뀜
+                    return ManifestEntry(name, size, mtime, content_hash)
+            except OSError as e:
+                _get_logger().warning(f"내용 해시 계산 실패 ({name}): {e}")
+        changed.append(name)
+        return ManifestEntry(name, size, mtime, None)
+
+    def ensure_scanned(self):
+        """이번 세션에서 아직 스캔하지 않았으면 스캔 (이미 스캔했으면 변경분 없음)"""
+        with self._lock:
+            if self.scanned:
+                return ManifestDiff([], [], [])
+            return self.scan()
+
+    def entries(self):
+        """현재 항목 리스트 (파일명 순)"""
+        with self._lock:
+            self._ensure_loaded()
+            return [self._entries[name] for name in sorted(self._entries)]
+
+    def paths(self):
+        """현재 이미지 경로 리스트 (파일명 순, 정규화된 경로)"""
+        return [os.path.join(self.directory, entry.name) for entry in self.entries()]
+
+    def get(self, name):
+        """파일명으로 항목 조회 (없으면 None)"""
+        with self._lock:
+            self._ensure_loaded()
+            return self._entries.get(name)
+
+    def discard(self, name):
+        """프로그램에서 삭제한 파일을 다시 스캔하지 않고 매니페스트에서 제거"""
+        with self._lock:
+            self._ensure_loaded()
+            if self._entries.pop(name, None) is not None:
+                self._save()
+
+    def content_hash(self, name, defer_save=False):
+        """
+        파일 내용 해시 (처음 요청할 때 계산해 매니페스트에 기록)
+
+        Args:
+            name: 파일명
+            defer_save: True면 새 해시를 바로 저장하지 않고 모아서 저장 (flush()로 마무리)
+        """
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(name)
+            if entry is None:
+                return None
+            if entry.content_hash is None:
+                try:
+                    entry = entry._replace(content_hash=compute_content_hash(os.path.join(self.directory, name)))
+                except OSError as e:
+                    _get_logger().warning(f"내용 해시 계산 실패 ({name}): {e}")
+                    return None
+                self._entries[name] = entry
+                self._dirty += 1
+                if not defer_save or self._dirty >= _FLUSH_INTERVAL:
+                    self._save()
+            return entry.content_hash
+
+    def flush(self):
+        """모아 둔 내용 해시를 저장"""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+
+# 열린 매니페스트 (정규화된 디렉토리 경로 -> DirectoryManifest)
+_manifests = {}
+_manifests_lock = threading.Lock()
+
+
+def get_manifest(directory):
+    """디렉토리의 매니페스트 반환 (프로세스 내에서 공유)"""
+    key = os.path.normcase(os.path.normpath(os.path.abspath(directory)))
+    with _manifests_lock:
+        manifest = _manifests.get(key)
+        if manifest is None:
+            manifest = _manifests[key] = DirectoryManifest(directory)
+        return manifest
+
+
+def flush_all():
+    """열린 모든 매니페스트의 모아 둔 변경 사항을 저장"""
+    with _manifests_lock:
+        manifests = list(_manifests.values())
+    for manifest in manifests:
+        manifest.flush()
+
+
+def list_image_files(directory, rescan=False):
+    """
+    디렉토리의 이미지 파일 경로 리스트 (파일명 순)
+
+    Args:
+        directory: 이미지 디렉토리
+        rescan: True면 항상 다시 스캔, False면 이번 세션에서 스캔한 결과 재사용
+    """
+    manifest = get_manifest(directory)
+    if rescan:
+        manifest.scan()
+    else:
+        manifest.ensure_scanned()
+    return manifest.paths()
+
+
+def get_signatures(image_paths):
+    """
+    매니페스트에 기록된 {경로: (수정 시간, 크기)} (이번 세션에 스캔한 디렉토리의 파일만)
+    특징 저장소 조회 시 파일마다 stat하지 않도록 사용합니다.
+
+    파일을 다시 stat하지 않으므로 값은 마지막 scan() 시점의 상태입니다.
+    그 뒤에 바뀐 파일은 이전 서명으로 조회되므로, 호출하는 쪽은 검색처럼 캐시를 믿고 쓰는 작업 전에
+    디렉토리를 scan()해야 합니다 (UI에서는 refresh_directory로 변경분을 캐시에 반영).
+    """
+    signatures = {}
+    manifests = {}
+    for image_path in image_paths:
+        directory = os.path.dirname(os.path.abspath(image_path))
+        manifest = manifests.get(directory)
+        if manifest is None:
+            manifest = manifests[directory] = get_manifest(directory)
+        if not manifest.scanned:
+            continue
+        entry = manifest.get(os.path.basename(image_path))
+        if entry is not None:
+            signatures[image_path] = (entry.mtime, entry.size)
+    return signatures
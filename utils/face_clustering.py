@@ -0,0 +1,485 @@
+"""
+초상화 라이브러리 중복/유사 그룹 찾기
+모든 이미지 쌍의 유사도를 블록(타일) 단위로 계산해 메모리를 일정하게 유지하고, 임계값 이상인 쌍만 모아
+연결 요소(단일 연결) 또는 완전 연결 응집 군집으로 그룹을 만듭니다.
+
+- 특징은 특징 저장소에서 읽고 (similarity_indexer.load_cached_index), 없는 이미지만 추출합니다.
+- 유사도 행렬은 위쪽 삼각형 타일만 계산하며, 타일은 스레드 풀에서 병렬로 처리합니다 (행렬곱은 GIL을 놓음).
+- 결과는 features 폴더의 s7ed.clusters.json 보고서로 저장되어 비슷한 얼굴 패널 결과 목록에서 열 수 있습니다.
+"""
+import os
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import numpy as np
+
+import utils.feature_store as feature_store
+import utils.similarity_indexer as similarity_indexer
+from utils.similarity_search import DEFAULT_FACE_WEIGHT, DEFAULT_CLOTHING_WEIGHT
+
+# 로거 (지연 로딩)
+_logger = None
+
+def _get_logger():
+    """로거 가져오기 (지연 로딩)"""
+    global _logger
+    if _logger is None:
+        from utils.logger import get_logger
+        _logger = get_logger('얼굴군집')
+    return _logger
+
+
+# 그룹 방식
+LINKAGE_SINGLE = 'single'        # 임계값 이상인 쌍으로 이어진 연결 요소
+LINKAGE_COMPLETE = 'complete'    # 그룹 안 모든 쌍이 임계값 이상 (연결 요소 안에서 응집 군집)
+
+DEFAULT_THRESHOLD = 0.95
+
+# 타일 한 변 (타일 하나의 점수 행렬은 BLOCK_SIZE^2 float32)
+BLOCK_SIZE = 1024
+
+# 이 크기를 넘는 그룹은 대표 이미지를 고르지 않고 첫 이미지를 대표로 사용
+_MAX_MEDOID_GROUP = 2048
+
+REPORT_VERSION = 1
+REPORT_FILENAME = 's7ed.clusters.json'
+
+# 작업 단계
+STAGE_FEATURES = 'features'
+STAGE_PAIRS = 'pairs'
+STAGE_DONE = 'done'
+
+
+def get_report_path(directory):
+    """디렉토리의 군집 보고서 경로"""
+    return os.path.join(directory, 'features', REPORT_FILENAME)
+
+
+class UnionFind:
+    """정수 원소 0..n-1의 서로소 집합 (경로 절반 압축 + 크기 기준 합치기)"""
+
+    def __init__(self, size):
+        self.parent = np.arange(size, dtype=np.int64)
+        self.size = np.ones(size, dtype=np.int64)
+
+    def find(self, item):
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a, b):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+
+    def groups(self, min_size=2):
+        """크기가 min_size 이상인 집합들 (원소 배열 리스트, 큰 집합부터)"""
+        roots = np.array([self.find(i) for i in range(len(self.parent))], dtype=np.int64)
+        order = np.argsort(roots, kind='stable')
+        boundaries = np.flatnonzero(np.diff(roots[order])) + 1
+        groups = [g for g in np.split(order, boundaries) if len(g) >= min_size]
+        groups.sort(key=lambda g: (-len(g), int(g[0])))
+        return groups
+
+
+def _split_blocks(count, block_size):
+    return [(start, min(start + block_size, count)) for start in range(0, count, block_size)]
+
+
+def _clothing_queries(index):
+    """인덱스 각 행의 옷 특징 (없으면 None) 리스트"""
+    queries = [None] * len(index)
+    if index.clothing is not None:
+        for row, position in enumerate(index.clothing_rows.tolist()):
+            queries[position] = index.clothing.vectors[row]
+    return queries
+
+
+def tile_scores(row_index, col_index, mode, face_weight=DEFAULT_FACE_WEIGHT, clothing_weight=DEFAULT_CLOTHING_WEIGHT):
+    """
+    두 후보 묶음 사이의 유사도 타일 (score_index와 같은 정의)
+
+    Args:
+        row_index, col_index: SimilarityIndex
+        mode: similarity_indexer 검색 방식
+
+    Returns:
+        (len(row_index), len(col_index)) float32 점수 (옷 특징이 없는 쌍은 NaN)
+    """
+    if len(row_index) == 0 or len(col_index) == 0:
+        return np.empty((len(row_index), len(col_index)), dtype=np.float32)
+    if mode == similarity_indexer.MODE_CLOTHING:
+        scores = np.full((len(row_index), len(col_index)), np.nan, dtype=np.float32)
+        if row_index.clothing is not None:
+            scores[row_index.clothing_rows] = col_index.clothing_scores(row_index.clothing.vectors)
+        return scores
+    if mode == similarity_indexer.MODE_COMBINED:
+        return col_index.combined_scores(row_index.face.vectors, _clothing_queries(row_index),
+                                         face_weight=face_weight, clothing_weight=clothing_weight)
+    return col_index.face_scores(row_index.face.vectors)
+
+
+def threshold_pairs(index, threshold, mode, face_weight=DEFAULT_FACE_WEIGHT, clothing_weight=DEFAULT_CLOTHING_WEIGHT,
+                    block_size=BLOCK_SIZE, executor=None, is_cancelled=None, on_tile=None):
+    """
+    유사도가 임계값 이상인 모든 쌍 (i < j)을 위쪽 삼각형 타일 단위로 찾습니다.
+
+    Args:
+        index: SimilarityIndex
+        threshold: 최소 유사도
+        executor: 타일을 병렬로 계산할 Executor (None이면 현재 스레드)
+        is_cancelled: 취소 여부 확인 함수
+        on_tile: on_tile(done, total) 진행률 콜백
+
+    Returns:
+        (rows, cols, scores): int64, int64, float32 배열 (취소되면 None)
+    """
+    blocks = _split_blocks(len(index), block_size)
+    sub_indexes = [index.take(np.arange(start, stop)) for start, stop in blocks]
+    tiles = [(r, c) for r in range(len(blocks)) for c in range(r, len(blocks))]
+
+    def _compute(tile):
+        r, c = tile
+        if is_cancelled is not None and is_cancelled():
+            return None
+        row_index, col_index = sub_indexes[r], sub_indexes[c]
+        if mode in (similarity_indexer.MODE_FACE, similarity_indexer.MODE_MESH):
+            # 얼굴 점수는 코사인 상한으로 걸러 낸 쌍만 계산
+            rows, cols, scores = col_index.face.scores_at_least(row_index.face, threshold)
+        else:
+            tile_matrix = tile_scores(row_index, col_index, mode, face_weight, clothing_weight)
+            with np.errstate(invalid='ignore'):
+                rows, cols = np.nonzero(tile_matrix >= threshold)
+            scores = tile_matrix[rows, cols]
+        if r == c:
+            # 대각 타일은 자기 자신과 중복 쌍 제외
+            upper = rows < cols
+            rows, cols, scores = rows[upper], cols[upper], scores[upper]
+        return rows + blocks[r][0], cols + blocks[c][0], scores
+
+    results = []
+    if executor is None:
+        for done, tile in enumerate(tiles, 1):
+            result = _compute(tile)
+            if result is None:
+                return None
+            results.append(result)
+            if on_tile is not None:
+                on_tile(done, len(tiles))
+    else:
+        pending = {executor.submit(_compute, tile) for tile in tiles}
+        done = 0
+        while pending:
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                result = future.result()
+                if result is None:
+                    for other in pending:
+                        other.cancel()
+                    return None
+                results.append(result)
+                done += 1
+            if on_tile is not None:
+                on_tile(done, len(tiles))
+
+    if not results:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+    rows, cols, scores = (np.concatenate(parts) for parts in zip(*results))
+    return rows.astype(np.int64), cols.astype(np.int64), scores.astype(np.float32)
+
+
+def complete_linkage(scores, threshold):
+    """
+    완전 연결 응집 군집: 두 군집 사이의 가장 낮은 유사도가 임계값 이상인 동안 가장 가까운 쌍을 합칩니다.
+
+    Args:
+        scores: (n, n) 대칭 유사도 행렬
+        threshold: 합치는 최소 유사도
+
+    Returns:
+        원소 인덱스 리스트들 (크기 2 이상만)
+    """
+    n = len(scores)
+    linkage = np.array(scores, dtype=np.float64)
+    linkage[np.isnan(linkage)] = -np.inf
+    np.fill_diagonal(linkage, -np.inf)
+    members = [[i] for i in range(n)]
+    while True:
+        flat = int(np.argmax(linkage))
+        a, b = divmod(flat, n)
+        if linkage[a, b] < threshold:
+            break
+        # 완전 연결: 합친 군집과의 유사도는 두 군집 중 낮은 쪽
+        merged = np.minimum(linkage[a], linkage[b])
+        merged[a] = -np.inf
+        linkage[a, :] = merged
+        linkage[:, a] = merged
+        linkage[b, :] = -np.inf
+        linkage[:, b] = -np.inf
+        members[a].extend(members[b])
+        members[b] = []
+    return [sorted(m) for m in members if len(m) >= 2]
+
+
+def _describe_group(index, positions, mode, face_weight, clothing_weight, scores=None):
+    """그룹 대표(다른 이미지와 평균 유사도가 가장 높은 이미지)와 각 이미지의 대표 대비 유사도"""
+    positions = np.asarray(positions, dtype=np.int64)
+    if scores is None and len(positions) <= _MAX_MEDOID_GROUP:
+        group = index.take(positions)
+        scores = tile_scores(group, group, mode, face_weight, clothing_weight)
+    if scores is None:
+        group = index.take(positions)
+        first = tile_scores(group.take([0]), group, mode, face_weight, clothing_weight)[0]
+        representative, member_scores = 0, first
+    else:
+        filled = np.where(np.isnan(scores), 0.0, scores)
+        representative = int(np.argmax(filled.sum(axis=1)))
+        member_scores = scores[representative]
+    member_scores = np.where(np.isnan(member_scores), 0.0, member_scores)
+    member_scores[representative] = 1.0
+    order = np.argsort(-member_scores, kind='stable')
+    return [(int(positions[i]), float(member_scores[i])) for i in order]
+
+
+def cluster_index(index, threshold=DEFAULT_THRESHOLD, mode=similarity_indexer.MODE_FACE, linkage=LINKAGE_SINGLE,
+                  face_weight=DEFAULT_FACE_WEIGHT, clothing_weight=DEFAULT_CLOTHING_WEIGHT,
+                  block_size=BLOCK_SIZE, executor=None, is_cancelled=None, on_tile=None):
+    """
+    검색 인덱스 전체를 그룹으로 묶습니다.
+
+    Returns:
+        그룹 리스트 (큰 그룹부터), 각 그룹은 대표 이미지부터 [(후보 인덱스, 대표 대비 유사도), ...]
+        (취소되면 None)
+    """
+    pairs = threshold_pairs(index, threshold, mode, face_weight, clothing_weight,
+                            block_size=block_size, executor=executor, is_cancelled=is_cancelled, on_tile=on_tile)
+    if pairs is None:
+        return None
+    rows, cols, _ = pairs
+
+    union_find = UnionFind(len(index))
+    for a, b in zip(rows.tolist(), cols.tolist()):
+        union_find.union(a, b)
+    components = union_find.groups()
+
+    groups = []
+    for component in components:
+        if is_cancelled is not None and is_cancelled():
+            return None
+        if linkage == LINKAGE_COMPLETE and len(component) <= _MAX_MEDOID_GROUP:
+            sub = index.take(component)
+            scores = tile_scores(sub, sub, mode, face_weight, clothing_weight)
+            symmetric = np.fmin(scores, scores.T)
+            for members in complete_linkage(symmetric, threshold):
+                groups.append(_describe_group(index, component[members], mode, face_weight, clothing_weight,
+                                              scores=symmetric[np.ix_(members, members)]))
+        else:
+            groups.append(_describe_group(index, component, mode, face_weight, clothing_weight))
+    groups.sort(key=lambda g: -len(g))
+    return groups
+
+
+def write_report(path, keys, groups, mode, threshold, linkage, total):
+    """
+    군집 결과 보고서 저장 (임시 파일에 쓴 뒤 교체)
+
+    Args:
+        keys: 후보 인덱스 -> 이미지 경로
+        groups: cluster_index 결과
+        total: 검사한 이미지 수
+    """
+    report = {
+        'version': REPORT_VERSION,
+        'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'mode': mode,
+        'threshold': threshold,
+        'linkage': linkage,
+        'total': total,
+        'groups': [
+            [{'name': os.path.basename(keys[position]), 'score': round(score, 4)} for position, score in group]
+            for group in groups
+        ],
+    }
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+    os.replace(temp_path, path)
+
+
+def load_report(path):
+    """
+    군집 보고서 로드
+
+    Returns:
+        보고서 dict ('groups'는 이미지 경로로 바꾼 [(score, path), ...] 리스트들) 또는 None
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+    except (OSError, ValueError) as e:
+        _get_logger().error(f"군집 보고서 로드 실패 ({path}): {e}")
+        return None
+    if report.get('version') != REPORT_VERSION:
+        _get_logger().warning(f"군집 보고서 형식이 다릅니다: {path}")
+        return None
+    directory = os.path.dirname(os.path.dirname(os.path.abspath(path)))
+    report['groups'] = [
+        [(member['score'], os.path.join(directory, member['name'])) for member in group]
+        for group in report['groups']
+    ]
+    return report
+
+
+class ClusteringJob:
+    """
+    백그라운드 중복 그룹 찾기 작업 (조정 스레드 1개 + 스레드 풀)
+
+    사용 예:
+        job = ClusteringJob(extract_features, mode=MODE_FACE, threshold=0.95)
+        job.start(image_paths, report_path)
+        job.attach(widget, on_progress, on_complete)
+
+    Args:
+        extract_features: extract_features(image_path) -> 특징 (저장소 기록까지 담당, 스레드 안전해야 함)
+        mode: similarity_indexer 검색 방식
+        threshold: 같은 그룹으로 볼 최소 유사도
+        linkage: LINKAGE_SINGLE 또는 LINKAGE_COMPLETE
+    """
+
+    def __init__(self, extract_features, mode=similarity_indexer.MODE_FACE, threshold=DEFAULT_THRESHOLD,
+                 linkage=LINKAGE_SINGLE, num_workers=None, block_size=BLOCK_SIZE,
+                 face_weight=DEFAULT_FACE_WEIGHT, clothing_weight=DEFAULT_CLOTHING_WEIGHT):
+        self.extract_features = extract_features
+        self.mode = mode
+        self.threshold = threshold
+        self.linkage = linkage
+        self.num_workers = num_workers or similarity_indexer.get_default_worker_count()
+        self.block_size = block_size
+        self.face_weight = face_weight
+        self.clothing_weight = clothing_weight
+
+        self._cancel_event = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+        self.stage = None
+        self.done = 0
+        self.total = 0
+        self.cancelled = False
+        self.error = None
+        self.groups = None
+        self.keys = []
+        self.report_path = None
+
+    def start(self, image_paths, report_path=None):
+        """작업 시작 (report_path가 있으면 끝난 뒤 보고서 저장)"""
+        if self._thread is not None:
+            raise RuntimeError("이미 실행 중인 군집 작업이 있습니다")
+        self.report_path = report_path
+        self._thread = threading.Thread(target=self._run, args=(list(image_paths),),
+                                        name='clustering', daemon=True)
+        self._thread.start()
+
+    def _set_progress(self, stage, done, total):
+        with self._lock:
+            self.stage, self.done, self.total = stage, done, total
+
+    def progress(self):
+        """(단계, 완료 수, 전체 수)"""
+        with self._lock:
+            return self.stage, self.done, self.total
+
+    def _run(self, image_paths):
+        try:
+            with ThreadPoolExecutor(max_workers=self.num_workers, thread_name_prefix='clustering') as executor:
+                index = self._load_index(image_paths, executor)
+                if index is None:
+                    return
+                start = time.perf_counter()
+                groups = cluster_index(
+                    index, self.threshold, self.mode, self.linkage, self.face_weight, self.clothing_weight,
+                    block_size=self.block_size, executor=executor, is_cancelled=self._cancel_event.is_set,
+                    on_tile=lambda done, total: self._set_progress(STAGE_PAIRS, done, total)
+                )
+            if groups is None:
+                return
+            _get_logger().info(
+                f"중복 그룹 찾기 완료: 이미지 {len(index)}개, 그룹 {len(groups)}개 ({time.perf_counter() - start:.2f}s)"
+            )
+            if self.report_path:
+                write_report(self.report_path, index.keys, groups, self.mode, self.threshold, self.linkage, len(index))
+            self.keys = index.keys
+            self.groups = groups
+        except Exception as e:
+            self.error = e
+            _get_logger().error(f"중복 그룹 찾기 실패: {e}", exc_info=True)
+        finally:
+            self._set_progress(STAGE_DONE, self.done, self.total)
+
+    def _load_index(self, image_paths, executor):
+        """저장소에 없는 이미지만 병렬 추출한 뒤 전체 인덱스 로드 (취소되면 None)"""
+        _, missing = similarity_indexer.load_cached_index(image_paths, self.mode)
+        self._set_progress(STAGE_FEATURES, 0, len(missing))
+        if missing:
+            futures = [executor.submit(self._extract, path) for path in missing]
+            for done, future in enumerate(futures, 1):
+                future.result()
+                self._set_progress(STAGE_FEATURES, done, len(missing))
+                if self._cancel_event.is_set():
+                    for other in futures:
+                        other.cancel()
+                    return None
+            feature_store.flush_all()
+        index, _ = similarity_indexer.load_cached_index(image_paths, self.mode)
+        return index
+
+    def _extract(self, image_path):
+        if self._cancel_event.is_set():
+            return
+        try:
+            self.extract_features(image_path)
+        except Exception as e:
+            _get_logger().warning(f"특징 추출 실패 ({image_path}): {e}")
+
+    def is_finished(self):
+        """작업이 끝났는지 여부 (취소 포함)"""
+        return self._thread is not None and not self._thread.is_alive()
+
+    def cancel(self):
+        """작업 취소 (진행 중인 타일은 끝날 때까지 기다리지 않음)"""
+        if self._thread is None or self.is_finished():
+            return
+        self.cancelled = True
+        self._cancel_event.set()
+        _get_logger().info("중복 그룹 찾기 취소")
+
+    def attach(self, widget, on_progress=None, on_complete=None, interval_ms=200):
+        """
+        Tk 위젯의 after() 루프로 진행률을 전달합니다.
+
+        Args:
+            on_progress: on_progress(stage, done, total) 콜백
+            on_complete: on_complete(job) 콜백 (job.groups, job.cancelled, job.error)
+        """
+        def _tick():
+            if self.is_finished():
+                if on_complete is not None:
+                    on_complete(self)
+                return
+            if on_progress is not None:
+                try:
+                    on_progress(*self.progress())
+                except Exception as e:
+                    _get_logger().error(f"군집 진행률 처리 실패: {e}", exc_info=True)
+            widget.after(interval_ms, _tick)
+
+        widget.after(interval_ms, _tick)
@@ -0,0 +1,273 @@
+"""
+얼굴 감지기 레지스트리
+OpenCV Haar 분류기와 MediaPipe FaceMesh를 호출할 때마다 새로 만들지 않고 한 번만 로드해 재사용합니다.
+두 감지기 모두 동시 호출에 안전하지 않으므로 스레드별 인스턴스를 유지합니다.
+
+추출 패널과 일괄 가져오기가 함께 쓰는 detect_faces(일괄) / detect_face_region(한 장) API를 제공합니다.
+"""
+import os
+import threading
+from collections import namedtuple
+
+import numpy as np
+from PIL import Image
+
+import utils.face_landmarks as face_landmarks
+from utils import facemesh_topology
+
+try:
+    import cv2
+    _cv2_available = True
+except ImportError:
+    _cv2_available = False
+
+# 로거 (지연 로딩)
+_logger = None
+
+def _get_logger():
+    """로거 가져오기 (지연 로딩)"""
+    global _logger
+    if _logger is None:
+        from utils.logger import get_logger
+        _logger = get_logger('얼굴감지기')
+    return _logger
+
+
+# Haar 분류기 파일명
+HAAR_FRONTAL_FACE = 'haarcascade_frontalface_default.xml'
+HAAR_EYE = 'haarcascade_eye.xml'
+
+# 스레드별 감지기 인스턴스 (cascades: {파일명: CascadeClassifier 또는 None}, face_mesh)
+_thread_local = threading.local()
+
+# 한 번의 감지 호출이 쓰는 감지기 묶음 (없는 감지기는 None)
+_Detectors = namedtuple('_Detectors', ['face_mesh', 'face_cascade', 'eye_cascade'])
+
+# 프로세스 단위로 확인한 분류기 경로 (존재하지 않는 파일은 None으로 기록해 경고를 한 번만 출력)
+_cascade_paths = {}
+_cascade_paths_lock = threading.Lock()
+
+
+def _resolve_cascade_path(filename):
+    """분류기 XML 경로를 확인 (프로세스당 한 번)"""
+    with _cascade_paths_lock:
+        if filename not in _cascade_paths:
+            path = os.path.join(cv2.data.haarcascades, filename)
+            if not os.path.exists(path):
+                _get_logger().warning(f"Haar 분류기 파일을 찾을 수 없습니다: {path}")
+                path = None
+            _cascade_paths[filename] = path
+        return _cascade_paths[filename]
+
+
+def get_cascade(filename):
+    """
+    현재 스레드의 Haar 분류기를 반환합니다 (스레드당 한 번만 로드).
+
+    Args:
+        filename: 분류기 파일명 (HAAR_FRONTAL_FACE, HAAR_EYE 등)
+
+    Returns:
+        cv2.CascadeClassifier 또는 None (OpenCV가 없거나 로드 실패)
+    """
+    if not _cv2_available:
+        return None
+
+    cascades = getattr(_thread_local, 'cascades', None)
+    if cascades is None:
+        cascades = _thread_local.cascades = {}
+
+    if filename not in cascades:
+        cascade = None
+        path = _resolve_cascade_path(filename)
+        if path is not None:
+            cascade = cv2.CascadeClassifier(path)
+            if cascade.empty():
+                _get_logger().warning(f"Haar 분류기 로드 실패: {path}")
+                cascade = None
+            else:
+                _get_logger().debug(f"Haar 분류기 로드: {filename} (스레드 {threading.current_thread().name})")
+        cascades[filename] = cascade
+    return cascades[filename]
+
+
+def get_face_mesh():
+    """
+    현재 스레드의 FaceMesh 인스턴스를 반환합니다 (스레드당 한 번만 로드).
+
+    Returns:
+        mp.solutions.face_mesh.FaceMesh 또는 None (MediaPipe 없음)
+    """
+    if not face_landmarks.is_available():
+        return None
+
+    face_mesh = getattr(_thread_local, 'face_mesh', None)
+    if face_mesh is None:
+        face_mesh = face_landmarks.mp.solutions.face_mesh.FaceMesh(
+            static_image_mode=True,
+            max_num_faces=1,
+            refine_landmarks=True,
+            min_detection_confidence=0.5
+        )
+        _thread_local.face_mesh = face_mesh
+        _get_logger().debug(f"FaceMesh 로드 (스레드 {threading.current_thread().name})")
+    return face_mesh
+
+
+def release_thread_detectors():
+    """현재 스레드의 감지기 인스턴스를 해제합니다 (작업 스레드 종료 시 호출)."""
+    face_mesh = getattr(_thread_local, 'face_mesh', None)
+    if face_mesh is not None:
+        try:
+            face_mesh.close()
+        except Exception as e:
+            _get_logger().warning(f"FaceMesh 해제 실패: {e}")
+    _thread_local.face_mesh = None
+    _thread_local.cascades = {}
+
+
+def _to_rgb_array(image):
+    """PIL.Image 또는 numpy 배열을 RGB uint8 배열로 변환"""
+    if isinstance(image, Image.Image):
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        return np.asarray(image)
+    array = np.asarray(image)
+    if array.ndim == 2:
+        return np.stack([array] * 3, axis=-1)
+    if array.shape[2] == 4:
+        return array[:, :, :3]
+    return array
+
+
+def _face_region_from_landmarks(landmarks, img_width, img_height):
+    """랜드마크의 얼굴 윤곽선(FACE_OVAL) 범위로 얼굴 영역 (x, y, w, h) 계산"""
+    points = landmarks.array
+    oval_indices = facemesh_topology.FACE_OVAL_INDICES
+    oval_indices = oval_indices[oval_indices < len(points)]
+    if len(oval_indices) > 0:
+        points = points[oval_indices]
+
+    min_x, min_y = points.min(axis=0)
+    max_x, max_y = points.max(axis=0)
+    x = max(0, int(min_x))
+    y = max(0, int(min_y))
+    w = min(img_width - x, int(max_x - min_x))
+    h = min(img_height - y, int(max_y - min_y))
+    if w <= 0 or h <= 0:
+        return None
+    return (x, y, w, h)
+
+
+def _current_detectors(use_mediapipe):
+    """현재 스레드의 감지기 묶음 (일괄 감지 동안 한 번만 조회해 모든 이미지에 재사용)"""
+    face_mesh = get_face_mesh() if use_mediapipe and face_landmarks.is_available() else None
+    return _Detectors(face_mesh, get_cascade(HAAR_FRONTAL_FACE), get_cascade(HAAR_EYE))
+
+
+def _detect_region_mediapipe(img_rgb, max_size, face_mesh):
+    """MediaPipe 랜드마크로 얼굴 영역 감지"""
+    landmarks = face_landmarks._detect_with_pyramid(face_mesh, img_rgb, max_size)
+    if landmarks is None:
+        return None
+    img_height, img_width = img_rgb.shape[:2]
+    return _face_region_from_landmarks(landmarks, img_width, img_height)
+
+
+def _detect_region_haar(img_rgb, max_size, face_cascade, eye_cascade):
+    """Haar 분류기로 얼굴 영역 감지 (얼굴을 못 찾으면 두 눈 위치로 추정)"""
+    if not _cv2_available:
+        return None
+    img_height, img_width = img_rgb.shape[:2]
+
+    # 그레이스케일로 변환 (얼굴 인식용), 고해상도 이미지는 작업 해상도로 축소해서 감지
+    gray, scale = face_landmarks.downscale_for_detection(cv2.cvtColor(img_rgb, cv2.COLOR_RGB2GRAY), max_size)
+    if scale != 1.0:
+        _get_logger().debug(f"감지 작업 해상도: {img_width}x{img_height} -> {gray.shape[1]}x{gray.shape[0]}")
+
+    if face_cascade is not None:
+        faces = face_cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=3, minSize=(20, 20))
+        if len(faces) > 0:
+            # 가장 큰 얼굴 선택 후 원본 좌표로 환산
+            largest_face = max(faces, key=lambda f: f[2] * f[3])
+            return tuple(int(round(v / scale)) for v in largest_face)
+
+    # 얼굴을 못 찾은 경우 - 전체 이미지에서 눈 감지 시도 (fallback)
+    if eye_cascade is None:
+        return None
+    eyes = eye_cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=3, minSize=(10, 10))
+    if len(eyes) < 2:
+        return None
+
+    eye_centers = []
+    for eye in eyes:
+        ex, ey, ew, eh = (int(round(v / scale)) for v in eye)
+        eye_centers.append((ex + ew // 2, ey + eh // 2))
+
+    # 위쪽 눈 높이와 두 눈 X 평균을 기준으로 얼굴 크기 추정 (눈 간격의 2.5배가 얼굴 너비)
+    eye_center_y = min(ec[1] for ec in eye_centers)
+    face_center_x = sum(ec[0] for ec in eye_centers) // len(eye_centers)
+    eye_distance = abs(eye_centers[0][0] - eye_centers[1][0])
+    estimated_face_width = int(eye_distance * 2.5)
+    estimated_face_height = int(estimated_face_width * 1.25)
+
+    # 눈은 얼굴 상단 1/3 지점
+    x = max(0, face_center_x - estimated_face_width // 2)
+    y = max(0, eye_center_y - estimated_face_height // 3)
+    w = min(img_width - x, estimated_face_width)
+    h = min(img_height - y, estimated_face_height)
+    return (x, y, w, h)
+
+
+def detect_face_region(image, use_mediapipe=False, max_size=None):
+    """
+    이미지에서 가장 큰 얼굴 영역을 감지합니다.
+
+    Args:
+        image: PIL.Image 또는 RGB numpy 배열
+        use_mediapipe: True면 MediaPipe 랜드마크를 먼저 시도하고, 실패하면 Haar 분류기로 폴백
+        max_size: 감지 작업 해상도 (None이면 설정값)
+
+    Returns:
+        (x, y, w, h) 원본 좌표의 얼굴 영역 또는 None (얼굴과 눈을 모두 찾지 못함)
+    """
+    return _detect_region(_to_rgb_array(image), _current_detectors(use_mediapipe), max_size)
+
+
+def _detect_region(img_rgb, detectors, max_size):
+    """감지기 묶음으로 한 이미지의 얼굴 영역 감지 (MediaPipe 실패 시 Haar 분류기로 폴백)"""
+    if detectors.face_mesh is not None:
+        try:
+            region = _detect_region_mediapipe(img_rgb, max_size, detectors.face_mesh)
+            if region is not None:
+                return region
+            _get_logger().info("MediaPipe로 얼굴을 찾지 못했습니다. OpenCV 방식으로 폴백합니다.")
+        except Exception as e:
+            _get_logger().warning(f"MediaPipe 얼굴 감지 실패: {e}, OpenCV 방식으로 폴백합니다.")
+
+    return _detect_region_haar(img_rgb, max_size, detectors.face_cascade, detectors.eye_cascade)
+
+
+def detect_faces(images, use_mediapipe=False, max_size=None):
+    """
+    여러 이미지의 얼굴 영역을 같은 감지기 인스턴스로 감지합니다.
+    감지기(FaceMesh, Haar 분류기)는 호출 시작 때 현재 스레드 레지스트리에서 한 번만 가져와 모든 이미지에 씁니다.
+
+    Args:
+        images: PIL.Image 또는 RGB numpy 배열의 iterable (생성기도 가능, 차례로 하나씩 읽음)
+        use_mediapipe: MediaPipe 우선 사용 여부
+        max_size: 감지 작업 해상도 (None이면 설정값)
+
+    Returns:
+        list: 이미지 순서대로 (x, y, w, h) 또는 None (감지 실패/에러)
+    """
+    detectors = _current_detectors(use_mediapipe)
+    regions = []
+    for index, image in enumerate(images):
+        try:
+            regions.append(_detect_region(_to_rgb_array(image), detectors, max_size))
+        except Exception as e:
+            _get_logger().error(f"얼굴 감지 실패 (이미지 {index}): {e}")
+            regions.append(None)
+    return regions
+
@@ -0,0 +1,399 @@
+"""
+전체 메시 얼굴 임베딩
+FaceMesh 랜드마크 478개 전체를 정규화/정렬한 뒤, 디렉토리(라이브러리)별로 학습한 PCA 기저로 투영해
+작은 float16 벡터(기본 48차원)로 만듭니다. 손으로 고른 비율 10개(extract_face_features_vector)보다
+얼굴형 전체를 반영하면서도, 검색은 여전히 작은 행렬곱 한 번입니다.
+
+- 메시: 중심을 원점으로, 크기를 1로 맞추고 두 눈동자를 잇는 선이 수평이 되도록 회전 (KIND_MESH에 저장)
+- 기저: 기준 메시(canonical)에 프로크루스테스 정렬한 메시의 평균/공분산 누적 통계로 학습하고,
+  새 메시는 통계에만 더해 두었다가 표본 수가 REFIT_GROWTH배가 되면 기저를 다시 계산합니다 (증분 학습).
+  통계에 넣은 메시는 특징 저장소처럼 (파일명, 수정 시간, 크기)로 기록하므로, 같은 이름으로 바뀐 이미지도 다시 더합니다.
+  기저가 바뀌면 저장된 메시로 임베딩 전체를 다시 투영합니다.
+- 임베딩: 주성분 좌표를 고유값의 제곱근으로 나눈 백색화 좌표 (KIND_EMBEDDING에 저장)
+
+기저는 features 폴더의 s7ed.embedding.basis.npz에 저장됩니다.
+"""
+import os
+import threading
+
+import numpy as np
+
+import utils.feature_store as feature_store
+import utils.landmark_cache as landmark_cache
+from utils.landmarks import as_point_array
+from utils.facemesh_topology import (
+    FACEMESH_NUM_LANDMARKS_WITH_IRISES, LEFT_IRIS_CENTER_INDEX, RIGHT_IRIS_CENTER_INDEX,
+)
+
+# 로거 (지연 로딩)
+_logger = None
+
+def _get_logger():
+    """로거 가져오기 (지연 로딩)"""
+    global _logger
+    if _logger is None:
+        from utils.logger import get_logger
+        _logger = get_logger('얼굴임베딩')
+    return _logger
+
+
+# 기저 파일 형식 버전 (2: 통계에 넣은 메시를 파일명과 (수정 시간, 크기)로 기록)
+BASIS_VERSION = 2
+BASIS_FILENAME = 's7ed.embedding.basis.npz'
+
+# 메시 벡터 차원 (x, y 좌표 478쌍)
+MESH_DIM = FACEMESH_NUM_LANDMARKS_WITH_IRISES * 2
+
+# 임베딩 차원 (표본이 적으면 표본 수 - 1로 줄어듦)
+EMBEDDING_DIMS = 48
+
+# 처음 기저를 학습하는 최소 표본 수
+MIN_TRAIN_SAMPLES = 16
+
+# 마지막 학습 이후 표본 수가 이 배수가 되면 기저를 다시 계산
+REFIT_GROWTH = 2.0
+
+# 0에 가까운 고유값으로 나누지 않도록 하는 하한과, 주성분으로 쓸 최소 상대 분산
+_MIN_VARIANCE = 1e-10
+_MIN_RELATIVE_VARIANCE = 1e-6
+
+
+def mesh_vector(landmarks):
+    """
+    랜드마크를 정규화된 메시 벡터로 변환합니다.
+
+    Args:
+        landmarks: 478개 랜드마크 (Landmarks, (N, 2) 배열 또는 튜플 리스트)
+
+    Returns:
+        (MESH_DIM,) float32 벡터 또는 None (눈동자 포함 478개가 아닌 경우)
+    """
+    if landmarks is None:
+        return None
+    points = as_point_array(landmarks)
+    if len(points) != FACEMESH_NUM_LANDMARKS_WITH_IRISES:
+        return None
+    points = points.astype(np.float64)
+    points = points - points.mean(axis=0)
+    scale = np.sqrt((points ** 2).sum())
+    if scale <= 0:
+        return None
+    points /= scale
+
+    # 오른쪽 눈동자 -> 왼쪽 눈동자 방향이 +x가 되도록 회전
+    dx, dy = points[LEFT_IRIS_CENTER_INDEX] - points[RIGHT_IRIS_CENTER_INDEX]
+    angle = np.arctan2(dy, dx)
+    cos, sin = np.cos(-angle), np.sin(-angle)
+    rotation = np.array([[cos, -sin], [sin, cos]])
+    return (points @ rotation.T).astype(np.float32).ravel()
+
+
+def procrustes_align(meshes, reference):
+    """
+    메시들을 기준 메시에 회전 정렬합니다 (정규화된 메시이므로 이동/크기는 이미 맞춰져 있음).
+
+    2차원에서 최적 회전각은 atan2(sum(x*y' - y*x'), sum(x*x' + y*y'))로 닫힌 형태라
+    SVD 없이 한 번에 계산합니다.
+
+    Args:
+        meshes: (n, MESH_DIM) 메시 벡터
+        reference: (MESH_DIM,) 기준 메시
+
+    Returns:
+        (n, MESH_DIM) float64 정렬된 메시
+    """
+    points = np.asarray(meshes, dtype=np.float64).reshape(len(meshes), -1, 2)
+    ref = np.asarray(reference, dtype=np.float64).reshape(-1, 2)
+    dot = points[:, :, 0] @ ref[:, 0] + points[:, :, 1] @ ref[:, 1]
+    cross = points[:, :, 0] @ ref[:, 1] - points[:, :, 1] @ ref[:, 0]
+    angle = np.arctan2(cross, dot)
+    cos, sin = np.cos(angle)[:, np.newaxis], np.sin(angle)[:, np.newaxis]
+    aligned = np.empty_like(points)
+    aligned[:, :, 0] = cos * points[:, :, 0] - sin * points[:, :, 1]
+    aligned[:, :, 1] = sin * points[:, :, 0] + cos * points[:, :, 1]
+    return aligned.reshape(len(meshes), -1)
+
+
+class EmbeddingBasis:
+    """
+    디렉토리 하나의 증분 PCA 기저
+
+    평균/공분산은 누적 합과 외적 합으로 보관하므로, 새 메시는 partial_fit으로 통계에 더하기만 하고
+    refit에서 고유값 분해를 다시 합니다. 기준 메시(canonical)는 처음 partial_fit한 표본의 평균으로 고정합니다.
+    """
+
+    def __init__(self):
+        self.canonical = None
+        self.count = 0
+        self.total = np.zeros(MESH_DIM, dtype=np.float64)
+        self.scatter = np.zeros((MESH_DIM, MESH_DIM), dtype=np.float64)
+        # 통계에 넣은 메시 {파일명: (수정 시간, 크기)}
+        self.seen = {}
+        # 학습 결과
+        self.mean = None
+        self.components = None
+        self.scales = None
+        self.fitted_count = 0
+        self.version = 0
+
+    @property
+    def is_fitted(self):
+        """기저가 학습되었는지 여부"""
+        return self.components is not None
+
+    @property
+    def dims(self):
+        """임베딩 차원 (학습 전이면 0)"""
+        return 0 if self.components is None else len(self.components)
+
+    def partial_fit(self, meshes, names=None, signatures=None):
+        """
+        메시를 누적 통계에 더합니다 (기저는 refit 때 갱신).
+
+        Args:
+            meshes: (n, MESH_DIM) 정규화된 메시
+            names: 메시의 이미지 파일명 (같은 이미지를 두 번 더하지 않도록 기록)
+            signatures: (n, 2) 메시를 계산한 이미지의 (수정 시간, 크기) (None이면 이름만 기록)
+        """
+        meshes = np.asarray(meshes, dtype=np.float64).reshape(-1, MESH_DIM)
+        if len(meshes) == 0:
+            return
+        if self.canonical is None:
+            canonical = meshes.mean(axis=0)
+            # 한 번 정렬 후 다시 평균을 내어 기준 메시를 다듬음
+            canonical = procrustes_align(meshes, canonical).mean(axis=0)
+            self.canonical = canonical / np.linalg.norm(canonical)
+        aligned = procrustes_align(meshes, self.canonical)
+        self.count += len(aligned)
+        self.total += aligned.sum(axis=0)
+        self.scatter += aligned.T @ aligned
+        if names is not None:
+            if signatures is None:
+                signatures = [None] * len(names)
+            for name, signature in zip(names, signatures):
+                self.seen[name] = None if signature is None else (float(signature[0]), float(signature[1]))
+
+    def is_seen(self, name, signature):
+        """이 파일명과 (수정 시간, 크기)의 메시를 이미 통계에 넣었는지 여부"""
+        seen = self.seen.get(name, False)
+        return seen is not False and seen == (float(signature[0]), float(signature[1]))
+
+    def needs_refit(self):
+        """기저를 (다시) 계산할 때인지 여부"""
+        if self.count < MIN_TRAIN_SAMPLES:
+            return False
+        return self.fitted_count == 0 or self.count >= self.fitted_count * REFIT_GROWTH
+
+    def refit(self):
+        """누적 통계로 평균과 주성분을 다시 계산"""
+        if self.count < 2:
+            return False
+        mean = self.total / self.count
+        covariance = self.scatter / self.count - np.outer(mean, mean)
+        eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+        # 분산이 사실상 0인 방향은 백색화하면 잡음만 커지므로 제외
+        significant = int((eigenvalues > eigenvalues.max() * _MIN_RELATIVE_VARIANCE).sum())
+        dims = max(1, min(EMBEDDING_DIMS, self.count - 1, significant))
+        order = np.argsort(eigenvalues)[::-1][:dims]
+        self.mean = mean
+        self.components = np.ascontiguousarray(eigenvectors[:, order].T)
+        self.scales = np.sqrt(np.maximum(eigenvalues[order], _MIN_VARIANCE))
+        self.fitted_count = self.count
+        self.version += 1
+        _get_logger().info(f"임베딩 기저 학습: 표본 {self.count}개, {dims}차원 (버전 {self.version})")
+        return True
+
+    def transform(self, meshes):
+        """
+        메시를 임베딩으로 투영합니다.
+
+        Returns:
+            (n, dims) float16 백색화 주성분 좌표
+        """
+        if not self.is_fitted:
+            raise RuntimeError("임베딩 기저가 아직 학습되지 않았습니다")
+        meshes = np.asarray(meshes, dtype=np.float64).reshape(-1, MESH_DIM)
+        aligned = procrustes_align(meshes, self.canonical)
+        projected = (aligned - self.mean) @ self.components.T
+        return (projected / self.scales).astype(np.float16)
+
+    def save(self, path):
+        """npz 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = path + '.tmp.npz'
+        fitted = self.is_fitted
+        np.savez(
+            temp_path,
+            version=BASIS_VERSION,
+            canonical=self.canonical if self.canonical is not None else np.empty(0),
+            count=self.count,
+            total=self.total,
+            scatter=self.scatter,
+            seen=np.array(sorted(self.seen), dtype=str),
+            seen_signatures=np.array([self.seen[name] or (np.nan, np.nan) for name in sorted(self.seen)],
+                                     dtype=np.float64).reshape(-1, 2),
+            mean=self.mean if fitted else np.empty(0),
+            components=self.components if fitted else np.empty((0, MESH_DIM)),
+            scales=self.scales if fitted else np.empty(0),
+            fitted_count=self.fitted_count,
+            basis_version=self.version,
+        )
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """저장된 기저 로드 (형식이 다르면 ValueError)"""
+        with np.load(path) as data:
+            if int(data['version']) != BASIS_VERSION or data['total'].shape != (MESH_DIM,):
+                raise ValueError(f"임베딩 기저 형식이 다릅니다: {path}")
+            basis = cls()
+            basis.canonical = data['canonical'] if data['canonical'].size else None
+            basis.count = int(data['count'])
+            basis.total = data['total']
+            basis.scatter = data['scatter']
+            basis.seen = {
+                name: None if np.isnan(mtime) else (float(mtime), float(size))
+                for name, (mtime, size) in zip(data['seen'].tolist(), data['seen_signatures'].tolist())
+            }
+            if data['components'].size:
+                basis.mean = data['mean']
+                basis.components = data['components']
+                basis.scales = data['scales']
+            basis.fitted_count = int(data['fitted_count'])
+            basis.version = int(data['basis_version'])
+        return basis
+
+
+# 열린 기저 (features 폴더 경로 -> (EmbeddingBasis, 잠금))
+_bases = {}
+_bases_lock = threading.Lock()
+
+
+def _basis_path(features_dir):
+    return os.path.join(features_dir, BASIS_FILENAME)
+
+
+def _get_basis_entry(image_path):
+    """이미지 디렉토리의 기저와 잠금 (처음이면 파일에서 로드)"""
+    features_dir = os.path.normcase(os.path.normpath(feature_store.get_features_dir(image_path)))
+    with _bases_lock:
+        entry = _bases.get(features_dir)
+        if entry is None:
+            basis = None
+            path = _basis_path(features_dir)
+            if os.path.exists(path):
+                try:
+                    basis = EmbeddingBasis.load(path)
+                except Exception as e:
+                    _get_logger().warning(f"임베딩 기저 로드 실패, 다시 학습합니다 ({path}): {e}")
+            entry = _bases[features_dir] = (basis or EmbeddingBasis(), threading.RLock())
+        return entry
+
+
+def get_basis(image_path):
+    """이미지가 속한 디렉토리의 임베딩 기저"""
+    return _get_basis_entry(image_path)[0]
+
+
+def is_ready(image_path):
+    """디렉토리의 임베딩 기저가 학습되어 임베딩 검색을 쓸 수 있는지 여부"""
+    return get_basis(image_path).is_fitted
+
+
+def store_mesh(image_path, landmarks):
+    """메시 벡터를 계산해 메시 저장소에 기록 (478개가 아니면 '메시 없음'으로 기록)"""
+    mesh = mesh_vector(landmarks)
+    feature_store.get_feature_store(image_path, feature_store.KIND_MESH).put(image_path, mesh)
+    return mesh
+
+
+def compute_embedding(image_path, landmarks):
+    """
+    메시와 임베딩을 계산해 저장소에 기록합니다.
+
+    Returns:
+        (dims,) float32 임베딩 또는 None (메시가 없거나 기저가 아직 없음; 기저가 없으면 임베딩은 기록하지 않음)
+    """
+    mesh = store_mesh(image_path, landmarks)
+    basis, lock = _get_basis_entry(image_path)
+    embedding_store = feature_store.get_feature_store(image_path, feature_store.KIND_EMBEDDING)
+    # 기저를 다시 학습하는 동안 이전 기저로 계산한 임베딩이 섞이지 않도록 잠금 안에서 기록
+    with lock:
+        if not basis.is_fitted:
+            return None
+        if mesh is None:
+            embedding_store.put(image_path, None)
+            return None
+        embedding = basis.transform([mesh])[0]
+        embedding_store.put(image_path, embedding)
+    return embedding.astype(np.float32)
+
+
+def _reproject(image_path, basis):
+    """기저가 바뀌었으므로 저장된 메시 전체로 임베딩 저장소를 다시 만듦"""
+    names, signatures, meshes = feature_store.get_feature_store(image_path, feature_store.KIND_MESH).live_entries()
+    embeddings = basis.transform(meshes) if len(meshes) else np.empty((0, basis.dims), dtype=np.float16)
+    feature_store.get_feature_store(image_path, feature_store.KIND_EMBEDDING).replace_all(names, signatures, embeddings)
+    _get_logger().info(f"임베딩 다시 투영: {len(names)}개")
+
+
+def sync_basis(image_path):
+    """
+    디렉토리 메시 저장소에서 아직 통계에 넣지 않은 메시(바뀐 이미지의 메시 포함)를 더하고, 필요하면 기저를 다시 계산합니다.
+    기저가 그대로면 새 메시만 투영해 임베딩 저장소에 추가합니다.
+
+    Args:
+        image_path: 디렉토리 안의 아무 이미지 경로
+
+    Returns:
+        EmbeddingBasis
+    """
+    basis, lock = _get_basis_entry(image_path)
+    names, signatures, meshes = feature_store.get_feature_store(image_path, feature_store.KIND_MESH).live_entries()
+    with lock:
+        # 이름이 같아도 이미지가 바뀌었으면 (수정 시간/크기가 다르면) 새 메시로 취급
+        new = [i for i, name in enumerate(names) if not basis.is_seen(name, signatures[i])]
+        if not new and not basis.needs_refit():
+            return basis
+        basis.partial_fit(meshes[new], [names[i] for i in new], signatures[new])
+        if basis.needs_refit() and basis.refit():
+            _reproject(image_path, basis)
+        elif basis.is_fitted and new:
+            directory = os.path.dirname(os.path.abspath(image_path))
+            embedding_store = feature_store.get_feature_store(image_path, feature_store.KIND_EMBEDDING)
+            for i, embedding in zip(new, basis.transform(meshes[new])):
+                embedding_store.put(os.path.join(directory, names[i]), embedding)
+        path = _basis_path(feature_store.get_features_dir(image_path))
+        try:
+            basis.save(path)
+        except OSError as e:
+            _get_logger().error(f"임베딩 기저 저장 실패 ({path}): {e}")
+    return basis
+
+
+def update_library(image_paths, is_cancelled=None):
+    """
+    메시가 없는 이미지를 캐시된 랜드마크로 채우고 디렉토리별 기저를 갱신합니다.
+    랜드마크를 새로 감지하지는 않으므로 검색 작업의 남는 시간에 실행하는 유지보수 작업입니다.
+
+    Args:
+        image_paths: 이미지 경로 리스트
+        is_cancelled: 취소 여부 확인 함수 (None이면 취소 없음)
+    """
+    directories = {}
+    for image_path in image_paths:
+        directories.setdefault(os.path.dirname(os.path.abspath(image_path)), []).append(image_path)
+
+    for paths in directories.values():
+        mesh_store = feature_store.get_feature_store(paths[0], feature_store.KIND_MESH)
+        _, _, missing = mesh_store.get_many(paths)
+        for image_path in missing:
+            if is_cancelled is not None and is_cancelled():
+                return
+            landmarks, cached = landmark_cache.load_landmarks(image_path)
+            if cached:
+                store_mesh(image_path, landmarks)
+        if missing:
+            mesh_store.flush()
+        sync_basis(paths[0])
+        feature_store.get_feature_store(paths[0], feature_store.KIND_EMBEDDING).flush()
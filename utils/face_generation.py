@@ -356,7 +356,7 @@ def extract_face_part(image, part_key, landmarks=None):
         # 마스크 생성 (원형)
         if _cv2_available:
             mask_array = np.zeros((img_height, img_width), dtype=np.uint8)
-            cv2.circle(mask_array, center, radius, 255, -1)
+            cv2.circle(mask_array, (int(round(center[0])), int(round(center[1]))), radius, 255, -1)
             # 가우시안 블러로 부드럽게
             mask_array = cv2.GaussianBlur(mask_array, (15, 15), 0)
             mask = Image.fromarray(mask_array, mode='L')
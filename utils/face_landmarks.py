@@ -6,6 +6,9 @@ import math
 import numpy as np
 from PIL import Image
 
+from utils.landmarks import Landmarks, as_point_array
+from utils import facemesh_topology
+
 # 로거 (지연 로딩)
 _logger = None
 
@@ -69,15 +72,126 @@ def is_available():
     return _mediapipe_available
 
 
-def detect_face_landmarks(image):
+# 감지 작업 해상도 기본값 (긴 변 최대 픽셀, globals._detection_max_size로 변경 가능)
+DEFAULT_DETECTION_MAX_SIZE = 1280
+
+# 정밀화 ROI 여백 (1차 감지된 얼굴 크기 대비 비율)
+_REFINE_ROI_MARGIN = 0.35
+
+
+def get_detection_max_size():
+    """
+    감지 작업 해상도(긴 변 최대 픽셀)를 반환합니다.
+    설정(config.json의 detection_max_size)이 없으면 기본값을 사용하며, 0 이하면 축소하지 않습니다.
+    """
+    try:
+        import globals as gl
+        return int(getattr(gl, '_detection_max_size', DEFAULT_DETECTION_MAX_SIZE))
+    except Exception as e:
+        _get_logger().warning(f"감지 해상도 설정 읽기 실패, 기본값 사용: {e}")
+        return DEFAULT_DETECTION_MAX_SIZE
+
+
+def downscale_for_detection(img_array, max_size=None):
+    """
+    긴 변이 max_size를 넘으면 감지용으로 축소한 배열을 반환합니다.
+    
+    Args:
+        img_array: numpy 배열 (H, W) 또는 (H, W, C)
+        max_size: 긴 변 최대 픽셀 (None이면 설정값, 0 이하면 축소 안 함)
+    
+    Returns:
+        (array, scale): 축소된 배열과 배율 (원본 좌표 = 축소 좌표 / scale)
+    """
+    if max_size is None:
+        max_size = get_detection_max_size()
+    img_height, img_width = img_array.shape[:2]
+    long_side = max(img_height, img_width)
+    if max_size <= 0 or long_side <= max_size:
+        return img_array, 1.0
+    
+    scale = max_size / long_side
+    new_size = (max(1, int(round(img_width * scale))), max(1, int(round(img_height * scale))))
+    if _cv2_available:
+        small = cv2.resize(img_array, new_size, interpolation=cv2.INTER_AREA)
+    else:
+        small = np.array(Image.fromarray(img_array).resize(new_size, Image.LANCZOS))
+    return small, scale
+
+
+def _detect_with_pyramid(face_mesh, img_array, max_size=None):
+    """
+    고해상도 이미지용 2단계 감지: 축소본에서 얼굴을 찾은 뒤,
+    원본 해상도에서 얼굴 주변 ROI를 잘라 다시 감지하여 랜드마크를 정밀화합니다.
+    
+    Args:
+        face_mesh: mp.solutions.face_mesh.FaceMesh 인스턴스
+        img_array: RGB numpy 배열 (H, W, 3)
+        max_size: 감지 작업 해상도 (None이면 설정값)
+    
+    Returns:
+        landmarks: 원본 좌표계의 Landmarks 또는 None
+    """
+    if max_size is None:
+        max_size = get_detection_max_size()
+    img_height, img_width = img_array.shape[:2]
+    
+    small, scale = downscale_for_detection(img_array, max_size)
+    if scale == 1.0:
+        return _detect_with_face_mesh(face_mesh, img_array)
+    
+    coarse = _detect_with_face_mesh(face_mesh, small)
+    if coarse is None:
+        _get_logger().debug(f"축소 감지 실패: {img_width}x{img_height} -> {small.shape[1]}x{small.shape[0]}")
+        return None
+    
+    # 1차 결과를 원본 좌표로 환산하고 여백을 둔 ROI 계산
+    coarse = Landmarks(coarse.array / np.float32(scale), copy=False)
+    min_x, min_y, max_x, max_y = coarse.bbox()
+    margin_x = (max_x - min_x) * _REFINE_ROI_MARGIN
+    margin_y = (max_y - min_y) * _REFINE_ROI_MARGIN
+    x0 = max(0, int(min_x - margin_x))
+    y0 = max(0, int(min_y - margin_y))
+    x1 = min(img_width, int(np.ceil(max_x + margin_x)))
+    y1 = min(img_height, int(np.ceil(max_y + margin_y)))
+    
+    # ROI를 작업 해상도로 맞췄을 때 해상도 이득이 없으면 (얼굴이 이미지 대부분을 차지) 1차 결과 사용
+    roi_long_side = max(x1 - x0, y1 - y0)
+    roi_scale = min(1.0, max_size / roi_long_side) if roi_long_side > 0 else scale
+    if roi_scale < scale * 1.25:
+        _get_logger().debug(
+            f"피라미드 감지: 원본 {img_width}x{img_height}, 작업 {small.shape[1]}x{small.shape[0]}, "
+            f"ROI 해상도 이득 없음 (정밀화 생략)"
+        )
+        return coarse
+    
+    roi, roi_scale = downscale_for_detection(np.ascontiguousarray(img_array[y0:y1, x0:x1]), max_size)
+    refined = _detect_with_face_mesh(face_mesh, roi)
+    
+    _get_logger().debug(
+        f"피라미드 감지: 원본 {img_width}x{img_height}, 작업 {small.shape[1]}x{small.shape[0]}, "
+        f"ROI ({x0}, {y0}, {x1 - x0}x{y1 - y0}) -> {roi.shape[1]}x{roi.shape[0]}, "
+        f"정밀화 {'성공' if refined is not None else '실패 (축소 결과 사용)'}"
+    )
+    if refined is None:
+        return coarse
+    
+    refined_array = refined.array / np.float32(roi_scale)
+    refined_array += np.array([x0, y0], dtype=np.float32)
+    return Landmarks(refined_array, copy=False)
+
+
+def detect_face_landmarks(image, max_size=None):
     """
     이미지에서 얼굴 랜드마크를 감지합니다.
     
     Args:
         image: PIL.Image 객체 (RGB 모드)
+        max_size: 감지 작업 해상도 (긴 변 최대 픽셀, None이면 설정값)
+                  이보다 큰 이미지는 축소본에서 감지 후 원본 ROI에서 정밀화합니다.
     
     Returns:
-        landmarks: 랜드마크 포인트 리스트 [(x, y), ...] 또는 None (얼굴을 찾지 못한 경우)
+        landmarks: Landmarks (float32 원본 픽셀 좌표, [(x, y), ...]처럼 사용 가능) 또는 None (얼굴을 찾지 못한 경우)
         face_detected: 얼굴 감지 여부 (bool)
     
     Note:
@@ -92,42 +206,43 @@ def detect_face_landmarks(image):
             image = image.convert('RGB')
         
         img_array = np.array(image)
-        img_height, img_width = img_array.shape[:2]
-        
-        # MediaPipe Face Mesh 초기화
-        mp_face_mesh = mp.solutions.face_mesh
-        face_mesh = mp_face_mesh.FaceMesh(
-            static_image_mode=True,
-            max_num_faces=1,
-            refine_landmarks=True,
-            min_detection_confidence=0.5
-        )
         
-        # RGB로 변환 (MediaPipe는 RGB를 기대)
-        results = face_mesh.process(img_array)
+        # 스레드별로 캐시된 FaceMesh 재사용 (호출마다 모델을 다시 로드하지 않음)
+        from utils.face_detectors import get_face_mesh
+        landmarks = _detect_with_pyramid(get_face_mesh(), img_array, max_size)
         
-        if results.multi_face_landmarks:
-            # 첫 번째 얼굴의 랜드마크 가져오기
-            face_landmarks = results.multi_face_landmarks[0]
-            
-            # 랜드마크 포인트를 (x, y) 좌표로 변환
-            landmarks = []
-            for landmark in face_landmarks.landmark:
-                x = int(landmark.x * img_width)
-                y = int(landmark.y * img_height)
-                landmarks.append((x, y))
-            
-            face_mesh.close()
+        if landmarks is not None:
             return landmarks, True
-        else:
-            face_mesh.close()
-            return None, False
+        return None, False
             
     except Exception as e:
         _get_logger().error(f"랜드마크 감지 실패: {e}", exc_info=True)
         return None, False
 
 
+def _detect_with_face_mesh(face_mesh, img_array):
+    """
+    이미 초기화된 FaceMesh로 랜드마크를 감지합니다.
+    (배치 감지 워커처럼 모델을 재사용하는 호출자용)
+    
+    Args:
+        face_mesh: mp.solutions.face_mesh.FaceMesh 인스턴스
+        img_array: RGB numpy 배열 (H, W, 3)
+    
+    Returns:
+        landmarks: Landmarks (float32 픽셀 좌표) 또는 None (얼굴을 찾지 못한 경우)
+    """
+    img_height, img_width = img_array.shape[:2]
+    
+    # RGB로 변환 (MediaPipe는 RGB를 기대)
+    results = face_mesh.process(img_array)
+    if not results.multi_face_landmarks:
+        return None
+    
+    # 첫 번째 얼굴의 랜드마크를 픽셀 좌표로 변환 (서브픽셀 정밀도 유지)
+    return Landmarks.from_normalized(results.multi_face_landmarks[0].landmark, img_width, img_height)
+
+
 # MediaPipe Face Mesh의 주요 랜드마크 인덱스
 # 참고: https://github.com/google/mediapipe/blob/master/mediapipe/python/solutions/face_mesh.py
 LEFT_EYE_INDICES = [33, 7, 163, 144, 145, 153, 154, 155, 133, 173, 157, 158, 159, 160, 161, 246]
@@ -154,46 +269,32 @@ def get_key_landmarks(landmarks):
     if landmarks is None or len(landmarks) < 468:
         return None
     
-    # 눈 중심 계산
-    left_eye_points = [landmarks[i] for i in LEFT_EYE_INDICES if i < len(landmarks)]
-    right_eye_points = [landmarks[i] for i in RIGHT_EYE_INDICES if i < len(landmarks)]
+    points = as_point_array(landmarks)
     
-    if left_eye_points and right_eye_points:
-        left_eye_center = (
-            sum(p[0] for p in left_eye_points) // len(left_eye_points),
-            sum(p[1] for p in left_eye_points) // len(left_eye_points)
-        )
-        right_eye_center = (
-            sum(p[0] for p in right_eye_points) // len(right_eye_points),
-            sum(p[1] for p in right_eye_points) // len(right_eye_points)
-        )
-    else:
-        return None
+    # 주요 포인트는 조정 함수들이 영역 슬라이스 경계로 바로 쓰므로 정수 픽셀 좌표로 반환
+    def _int_point(x, y):
+        return (int(round(float(x))), int(round(float(y))))
+    
+    def _mean_point(indices):
+        """인덱스 포인트들의 평균 좌표 (반올림한 정수 픽셀)"""
+        cx, cy = points[indices].mean(axis=0, dtype=np.float64)
+        return _int_point(cx, cy)
+    
+    # 눈 중심 계산
+    left_eye_center = _mean_point(LEFT_EYE_INDICES)
+    right_eye_center = _mean_point(RIGHT_EYE_INDICES)
     
     # 코 끝
-    nose_tip = landmarks[NOSE_TIP_INDEX] if NOSE_TIP_INDEX < len(landmarks) else None
+    nose_tip = _int_point(points[NOSE_TIP_INDEX, 0], points[NOSE_TIP_INDEX, 1])
     
     # 입 중심 계산
-    mouth_points = [landmarks[i] for i in MOUTH_INDICES if i < len(landmarks)]
-    if mouth_points:
-        mouth_center = (
-            sum(p[0] for p in mouth_points) // len(mouth_points),
-            sum(p[1] for p in mouth_points) // len(mouth_points)
-        )
-    else:
-        mouth_center = None
+    mouth_center = _mean_point(MOUTH_INDICES)
     
-    # 얼굴 중심 (두 눈의 중점과 입의 중점)
-    if nose_tip and mouth_center:
-        face_center = (
-            (left_eye_center[0] + right_eye_center[0] + nose_tip[0] + mouth_center[0]) // 4,
-            (left_eye_center[1] + right_eye_center[1] + nose_tip[1] + mouth_center[1]) // 4
-        )
-    else:
-        face_center = (
-            (left_eye_center[0] + right_eye_center[0]) // 2,
-            (left_eye_center[1] + right_eye_center[1]) // 2
-        )
+    # 얼굴 중심 (두 눈의 중점과 코 끝, 입의 중점)
+    face_center = _int_point(
+        (left_eye_center[0] + right_eye_center[0] + nose_tip[0] + mouth_center[0]) / 4,
+        (left_eye_center[1] + right_eye_center[1] + nose_tip[1] + mouth_center[1]) / 4
+    )
     
     return {
         'left_eye': left_eye_center,
@@ -294,28 +395,19 @@ def draw_landmarks(image, landmarks, key_landmarks=None, show_all_points=False):
             _cv2_available = False
         
         if _cv2_available:
-            # OpenCV로 그리기
+            # OpenCV로 그리기 (OpenCV는 정수 좌표가 필요하므로 반올림)
             img_copy = img_array.copy()
-            
-            # MediaPipe 공식 상수 사용
-            if _mediapipe_available:
-                mp_face_mesh = mp.solutions.face_mesh
-                FACE_OVAL = mp_face_mesh.FACEMESH_FACE_OVAL
-                LEFT_EYEBROW = mp_face_mesh.FACEMESH_LEFT_EYEBROW
-                RIGHT_EYEBROW = mp_face_mesh.FACEMESH_RIGHT_EYEBROW
-                LEFT_EYE = mp_face_mesh.FACEMESH_LEFT_EYE
-                RIGHT_EYE = mp_face_mesh.FACEMESH_RIGHT_EYE
-                NOSE = mp_face_mesh.FACEMESH_NOSE
-                LIPS = mp_face_mesh.FACEMESH_LIPS
-            else:
-                # MediaPipe가 없으면 빈 리스트 (그리지 않음)
-                FACE_OVAL = []
-                LEFT_EYEBROW = []
-                RIGHT_EYEBROW = []
-                LEFT_EYE = []
-                RIGHT_EYE = []
-                NOSE = []
-                LIPS = []
+            landmarks = Landmarks(landmarks, copy=False).to_int_tuples()
+            
+            # MediaPipe 공식 연결 상수 (토폴로지 모듈, MediaPipe 없이도 사용 가능)
+            mp_face_mesh = facemesh_topology
+            FACE_OVAL = mp_face_mesh.FACEMESH_FACE_OVAL
+            LEFT_EYEBROW = mp_face_mesh.FACEMESH_LEFT_EYEBROW
+            RIGHT_EYEBROW = mp_face_mesh.FACEMESH_RIGHT_EYEBROW
+            LEFT_EYE = mp_face_mesh.FACEMESH_LEFT_EYE
+            RIGHT_EYE = mp_face_mesh.FACEMESH_RIGHT_EYE
+            NOSE = mp_face_mesh.FACEMESH_NOSE
+            LIPS = mp_face_mesh.FACEMESH_LIPS
             
             if show_all_points:
                 # 모든 포인트를 작은 점으로 표시
@@ -392,25 +484,15 @@ def draw_landmarks(image, landmarks, key_landmarks=None, show_all_points=False):
             img_copy = image.copy()
             draw = ImageDraw.Draw(img_copy)
             
-            # MediaPipe 공식 상수 사용
-            if _mediapipe_available:
-                mp_face_mesh = mp.solutions.face_mesh
-                FACE_OVAL = mp_face_mesh.FACEMESH_FACE_OVAL
-                LEFT_EYEBROW = mp_face_mesh.FACEMESH_LEFT_EYEBROW
-                RIGHT_EYEBROW = mp_face_mesh.FACEMESH_RIGHT_EYEBROW
-                LEFT_EYE = mp_face_mesh.FACEMESH_LEFT_EYE
-                RIGHT_EYE = mp_face_mesh.FACEMESH_RIGHT_EYE
-                NOSE = mp_face_mesh.FACEMESH_NOSE
-                LIPS = mp_face_mesh.FACEMESH_LIPS
-            else:
-                # MediaPipe가 없으면 빈 리스트 (그리지 않음)
-                FACE_OVAL = []
-                LEFT_EYEBROW = []
-                RIGHT_EYEBROW = []
-                LEFT_EYE = []
-                RIGHT_EYE = []
-                NOSE = []
-                LIPS = []
+            # MediaPipe 공식 연결 상수 (토폴로지 모듈, MediaPipe 없이도 사용 가능)
+            mp_face_mesh = facemesh_topology
+            FACE_OVAL = mp_face_mesh.FACEMESH_FACE_OVAL
+            LEFT_EYEBROW = mp_face_mesh.FACEMESH_LEFT_EYEBROW
+            RIGHT_EYEBROW = mp_face_mesh.FACEMESH_RIGHT_EYEBROW
+            LEFT_EYE = mp_face_mesh.FACEMESH_LEFT_EYE
+            RIGHT_EYE = mp_face_mesh.FACEMESH_RIGHT_EYE
+            NOSE = mp_face_mesh.FACEMESH_NOSE
+            LIPS = mp_face_mesh.FACEMESH_LIPS
             
             # 중심점은 표시하지 않음 (윤곽선만 표시)
             
@@ -655,17 +737,76 @@ def find_similar_faces(reference_features, face_features_list, top_n=10):
     if reference_features is None:
         return []
     
-    similarities = []
-    for features, metadata in face_features_list:
-        if features is not None:
-            similarity = calculate_face_similarity(reference_features, features)
-            similarities.append((similarity, metadata))
+    # 모든 후보를 한 행렬로 모아 한 번에 계산 (점수 정의는 calculate_face_similarity와 같음)
+    from utils.similarity_search import SimilarityIndex
+    index = SimilarityIndex.from_features(
+        (features, metadata) for features, metadata in face_features_list if features is not None
+    )
+    if len(index) == 0:
+        return []
+    return index.search(index.face_scores([reference_features])[0], top_n=top_n)
+
+
+# 옷 특징 작업 해상도 (옷 영역을 이 크기로 줄인 뒤 계산)
+CLOTHING_WORK_SIZE = (128, 128)
+
+# 옷 색상 히스토그램 구간 수 (채널별, 256을 나누어떨어지게)
+CLOTHING_HIST_BINS = 32
+
+
+def clothing_region_box(landmarks, image_size):
+    """
+    랜드마크로 옷 영역 (left, top, right, bottom)을 추정합니다.
+    입 아래부터 이미지 하단까지, 얼굴 중심 기준 얼굴 너비만큼입니다.
+    
+    Args:
+        landmarks: 랜드마크 포인트 리스트
+        image_size: (width, height)
+    
+    Returns:
+        (left, top, right, bottom) 또는 None (옷 영역이 너무 작은 경우)
+    """
+    key_landmarks = get_key_landmarks(landmarks)
+    if key_landmarks is None:
+        return None
     
-    # 유사도가 높은 순으로 정렬
-    similarities.sort(key=lambda x: x[0], reverse=True)
+    img_width, img_height = image_size
     
-    # 상위 N개 반환
-    return similarities[:top_n]
+    # 입 위치 확인
+    if 'mouth' in key_landmarks and key_landmarks['mouth']:
+        mouth_y = key_landmarks['mouth'][1]
+    elif 'nose' in key_landmarks and key_landmarks['nose']:
+        # 입이 없으면 코 위치 기준으로 추정
+        nose_y = key_landmarks['nose'][1]
+        mouth_y = nose_y + (nose_y - (key_landmarks['left_eye'][1] + key_landmarks['right_eye'][1]) // 2) * 0.5
+    else:
+        return None
+    
+    # 얼굴 너비 추정 (두 눈 사이 거리 기준)
+    left_eye = key_landmarks['left_eye']
+    right_eye = key_landmarks['right_eye']
+    eye_distance = math.sqrt((right_eye[0] - left_eye[0])**2 + (right_eye[1] - left_eye[1])**2)
+    face_width = int(eye_distance * 2.0)  # 얼굴 너비는 눈 사이 거리의 약 2배
+    
+    # 얼굴 중심 X 좌표
+    face_center_x = (left_eye[0] + right_eye[0]) // 2
+    
+    # 옷 영역 추정
+    # 입 아래부터 이미지 하단까지
+    clothing_top = int(mouth_y + eye_distance * 0.3)  # 입 아래 약간 여유 공간
+    clothing_bottom = img_height
+    
+    # 옷 영역이 너무 작으면 (이미지 하단이 얼굴에 가까우면) None 반환
+    if clothing_bottom - clothing_top < eye_distance * 0.5:
+        return None
+    
+    # 얼굴 중심 기준으로 좌우 경계 설정
+    clothing_left = max(0, face_center_x - face_width // 2)
+    clothing_right = min(img_width, face_center_x + face_width // 2)
+    if clothing_right <= clothing_left:
+        return None
+    
+    return (clothing_left, clothing_top, clothing_right, clothing_bottom)
 
 
 def extract_clothing_region(image, landmarks=None):
@@ -679,7 +820,7 @@ def extract_clothing_region(image, landmarks=None):
     Returns:
         clothing_region: 옷 영역 이미지 (PIL.Image) 또는 None
     """
-    if not _mediapipe_available:
+    if landmarks is None and not _mediapipe_available:
         return None
     
     try:
@@ -689,59 +830,47 @@ def extract_clothing_region(image, landmarks=None):
             if not detected or landmarks is None:
                 return None
         
-        # 주요 랜드마크 추출
-        key_landmarks = get_key_landmarks(landmarks)
-        if key_landmarks is None:
-            return None
-        
-        # 이미지 크기
-        img_width, img_height = image.size
-        
-        # 입 위치 확인
-        if 'mouth' in key_landmarks and key_landmarks['mouth']:
-            mouth_y = key_landmarks['mouth'][1]
-        elif 'nose' in key_landmarks and key_landmarks['nose']:
-            # 입이 없으면 코 위치 기준으로 추정
-            nose_y = key_landmarks['nose'][1]
-            mouth_y = nose_y + (nose_y - (key_landmarks['left_eye'][1] + key_landmarks['right_eye'][1]) // 2) * 0.5
-        else:
-            return None
-        
-        # 얼굴 너비 추정 (두 눈 사이 거리 기준)
-        left_eye = key_landmarks['left_eye']
-        right_eye = key_landmarks['right_eye']
-        eye_distance = math.sqrt((right_eye[0] - left_eye[0])**2 + (right_eye[1] - left_eye[1])**2)
-        face_width = int(eye_distance * 2.0)  # 얼굴 너비는 눈 사이 거리의 약 2배
-        
-        # 얼굴 중심 X 좌표
-        face_center_x = (left_eye[0] + right_eye[0]) // 2
-        
-        # 옷 영역 추정
-        # 입 아래부터 이미지 하단까지
-        clothing_top = int(mouth_y + eye_distance * 0.3)  # 입 아래 약간 여유 공간
-        clothing_bottom = img_height
-        
-        # 옷 영역이 너무 작으면 (이미지 하단이 얼굴에 가까우면) None 반환
-        if clothing_bottom - clothing_top < eye_distance * 0.5:
+        box = clothing_region_box(landmarks, image.size)
+        if box is None:
             return None
         
-        # 얼굴 중심 기준으로 좌우 경계 설정
-        clothing_left = max(0, face_center_x - face_width // 2)
-        clothing_right = min(img_width, face_center_x + face_width // 2)
-        
         # 옷 영역 크롭
-        clothing_region = image.crop((clothing_left, clothing_top, clothing_right, clothing_bottom))
-        
-        return clothing_region
+        return image.crop(box)
         
     except Exception as e:
         _get_logger().error(f"옷 영역 추출 실패: {e}", exc_info=True)
         return None
 
 
+def clothing_features_from_pixels(pixels):
+    """
+    작업 해상도로 줄인 옷 영역 픽셀에서 특징 벡터를 계산합니다.
+    채널별 CLOTHING_HIST_BINS 구간 히스토그램(B, G, R 순서, 각각 합 1)은 양자화한 값을
+    bincount 한 번으로 셉니다 (cv2.calcHist [0, 256] 균등 구간과 같은 값).
+    
+    Args:
+        pixels: (H, W, 3) uint8 RGB 배열
+    
+    Returns:
+        features: [히스토그램 B, G, R..., 평균 R, G, B, 표준편차 R, G, B] float32 벡터
+    """
+    bins = CLOTHING_HIST_BINS
+    flat = np.ascontiguousarray(pixels, dtype=np.uint8).reshape(-1, 3)
+    # 구간 번호 (value * bins // 256) + 채널 오프셋 (B, G, R 순서)
+    quantized = (flat[:, ::-1] >> (8 - int(math.log2(bins)))).astype(np.intp)
+    quantized += np.arange(3, dtype=np.intp) * bins
+    counts = np.bincount(quantized.ravel(), minlength=3 * bins).reshape(3, bins).astype(np.float64)
+    hist = counts / (counts.sum(axis=1, keepdims=True) + 1e-10)
+    
+    values = flat.astype(np.float64)
+    return np.concatenate([hist.ravel(), values.mean(axis=0), values.std(axis=0)]).astype(np.float32)
+
+
 def extract_clothing_features_vector(image, landmarks=None):
     """
     옷 영역에서 특징 벡터를 추출합니다.
+    원본 해상도와 관계없이 옷 영역을 CLOTHING_WORK_SIZE로 줄인 뒤(BOX 필터) 계산합니다.
+    계산 방식을 바꿔 같은 이미지의 값이 달라지면 feature_store의 옷 특징 버전도 올려야 합니다.
     
     Args:
         image: PIL.Image 객체
@@ -750,61 +879,28 @@ def extract_clothing_features_vector(image, landmarks=None):
     Returns:
         features: 옷 특징 벡터 (numpy array) 또는 None
     """
+    if landmarks is None and not _mediapipe_available:
+        return None
+    
     try:
-        # 옷 영역 추출
-        clothing_region = extract_clothing_region(image, landmarks)
-        if clothing_region is None:
-            return None
-        
-        # RGB 모드로 변환
-        if clothing_region.mode != 'RGB':
-            clothing_region = clothing_region.convert('RGB')
-        
-        # 옷 영역을 일정한 크기로 리사이즈 (정규화)
-        normalized_size = (128, 128)  # 옷 영역 정규화 크기
-        clothing_resized = clothing_region.resize(normalized_size, Image.LANCZOS)
-        
-        # numpy 배열로 변환
-        img_array = np.array(clothing_resized)
+        # 랜드마크가 없으면 자동 감지
+        if landmarks is None:
+            landmarks, detected = detect_face_landmarks(image)
+            if not detected or landmarks is None:
+                return None
         
-        # 특징 벡터 구성
-        features = []
+        box = clothing_region_box(landmarks, image.size)
+        if box is None:
+            return None
         
-        if _cv2_available:
-            # OpenCV를 사용한 히스토그램 계산
-            # BGR로 변환
-            img_bgr = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
-            
-            # RGB 각 채널별 히스토그램 (32 bins로 축소하여 차원 감소)
-            hist_bins = 32
-            for i in range(3):  # B, G, R
-                hist = cv2.calcHist([img_bgr], [i], None, [hist_bins], [0, 256])
-                # 정규화
-                hist = hist / (hist.sum() + 1e-10)  # 0으로 나누기 방지
-                features.extend(hist.flatten().tolist())
-            
-            # 평균 색상 (R, G, B)
-            mean_color = img_array.mean(axis=(0, 1))
-            features.extend(mean_color.tolist())
-            
-            # 색상 표준편차 (R, G, B)
-            std_color = img_array.std(axis=(0, 1))
-            features.extend(std_color.tolist())
-        else:
-            # OpenCV가 없으면 간단한 통계값만 사용
-            # 평균 색상
-            mean_color = img_array.mean(axis=(0, 1))
-            features.extend(mean_color.tolist())
-            
-            # 색상 표준편차
-            std_color = img_array.std(axis=(0, 1))
-            features.extend(std_color.tolist())
-            
-            # 중앙값 색상
-            median_color = np.median(img_array.reshape(-1, 3), axis=0)
-            features.extend(median_color.tolist())
+        # 크롭과 축소를 한 번에 (팔레트 등 보간할 수 없는 모드는 먼저 RGB로 변환)
+        if image.mode not in ('RGB', 'RGBA', 'L'):
+            image = image.convert('RGB')
+        region = image.resize(CLOTHING_WORK_SIZE, Image.BOX, box=box, reducing_gap=2.0)
+        if region.mode != 'RGB':
+            region = region.convert('RGB')
         
-        return np.array(features, dtype=np.float32)
+        return clothing_features_from_pixels(np.asarray(region))
         
     except Exception as e:
         _get_logger().error(f"옷 특징 벡터 추출 실패: {e}", exc_info=True)
@@ -69,7 +69,10 @@ from .polygon_morphing import (
     transform_points_for_lip_vertical_move,
     move_point_group,
     move_points,
-    morph_face_by_polygons
+    morph_face_by_polygons,
+    IncrementalMorphRenderer,
+    render_morph_sequence,
+    write_morph_sequence
 )
 
 from .integration import (
@@ -120,6 +123,9 @@ __all__ = [
     'move_point_group',
     'move_points',
     'morph_face_by_polygons',
+    'IncrementalMorphRenderer',
+    'render_morph_sequence',
+    'write_morph_sequence',
     # 통합
     'apply_all_adjustments',
 ]
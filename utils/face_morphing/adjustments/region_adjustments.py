@@ -9,7 +9,9 @@ from PIL import Image
 from ..constants import _cv2_available, _landmarks_available
 from ..utils import _create_blend_mask
 from utils.logger import print_debug
-from ..region_extraction import _get_eye_region, _get_mouth_region, _get_nose_region, _get_region_center, _get_region_bbox
+from ..region_extraction import _get_eye_region, _get_mouth_region, _get_nose_region, _get_region_center, _get_region_bbox, get_region_indices
+from utils import facemesh_topology
+from utils.landmarks import as_point_array
 
 # 외부 모듈 import
 try:
@@ -438,87 +440,17 @@ def adjust_region_position(image, region_name, position_x=0.0, position_y=0.0,
             x1, y1, x2, y2 = nose_region
             region_size = max(x2 - x1, y2 - y1) / 2
         else:
-            # 다른 부위는 중심점 기준으로 영역 계산 (adjust_region_size와 동일)
-            import mediapipe as mp
-            mp_face_mesh = mp.solutions.face_mesh
-            
-            indices = []
-            if region_name == 'face_oval':
-                FACE_OVAL = list(mp_face_mesh.FACEMESH_FACE_OVAL)
-                for conn in FACE_OVAL:
-                    indices.append(conn[0])
-                    indices.append(conn[1])
-            elif region_name == 'left_eyebrow':
-                LEFT_EYEBROW = list(mp_face_mesh.FACEMESH_LEFT_EYEBROW)
-                for conn in LEFT_EYEBROW:
-                    indices.append(conn[0])
-                    indices.append(conn[1])
-            elif region_name == 'right_eyebrow':
-                RIGHT_EYEBROW = list(mp_face_mesh.FACEMESH_RIGHT_EYEBROW)
-                for conn in RIGHT_EYEBROW:
-                    indices.append(conn[0])
-                    indices.append(conn[1])
-            elif region_name == 'lips':
-                # Lips 전체 인덱스 (FACEMESH_LIPS 사용)
-                LIPS = list(mp_face_mesh.FACEMESH_LIPS)
-                for conn in LIPS:
-                    indices.append(conn[0])
-                    indices.append(conn[1])
-            elif region_name == 'upper_lips':
-                # 하위 호환성 유지
-                UPPER_LIP_INDICES = [61, 185, 40, 39, 37, 0, 267, 269, 270, 409, 291, 375, 321, 405, 314, 17, 84]
-                indices = UPPER_LIP_INDICES
-            elif region_name == 'lower_lips':
-                # 하위 호환성 유지
-                LOWER_LIP_INDICES = [181, 91, 146, 78, 95, 88, 178, 87, 14, 317, 402, 318, 324]
-                indices = LOWER_LIP_INDICES
-            elif region_name == 'left_iris':
-                try:
-                    LEFT_IRIS = list(mp_face_mesh.FACEMESH_LEFT_IRIS)
-                    for conn in LEFT_IRIS:
-                        indices.append(conn[0])
-                        indices.append(conn[1])
-                except AttributeError:
-                    # MediaPipe 정의 사용
-                    try:
-                        from utils.face_morphing.region_extraction import get_iris_indices
-                        left_iris_indices, _ = get_iris_indices()
-                        indices = left_iris_indices
-                    except ImportError:
-                        # 폴백: 하드코딩된 인덱스 사용 (실제 MediaPipe 정의: LEFT_IRIS=[474,475,476,477])
-                        indices = [474, 475, 476, 477]
-            elif region_name == 'right_iris':
-                try:
-                    RIGHT_IRIS = list(mp_face_mesh.FACEMESH_RIGHT_IRIS)
-                    for conn in RIGHT_IRIS:
-                        indices.append(conn[0])
-                        indices.append(conn[1])
-                except AttributeError:
-                    # MediaPipe 정의 사용
-                    try:
-                        from utils.face_morphing.region_extraction import get_iris_indices
-                        _, right_iris_indices = get_iris_indices()
-                        indices = right_iris_indices
-                    except ImportError:
-                        # 폴백: 하드코딩된 인덱스 사용 (실제 MediaPipe 정의: RIGHT_IRIS=[469,470,471,472])
-                        indices = [469, 470, 471, 472]
-            elif region_name == 'contours':
-                CONTOURS = list(mp_face_mesh.FACEMESH_CONTOURS)
-                for conn in CONTOURS:
-                    indices.append(conn[0])
-                    indices.append(conn[1])
-            elif region_name == 'tesselation':
-                TESSELATION = list(mp_face_mesh.FACEMESH_TESSELATION)
-                for conn in TESSELATION:
-                    indices.append(conn[0])
-                    indices.append(conn[1])
+            # 다른 부위는 중심점 기준으로 영역 계산 (adjust_region_size와 동일, 테셀레이션은 눈동자 제외)
+            if region_name == 'tesselation':
+                indices = facemesh_topology.TESSELATION_INDICES
+            else:
+                indices = get_region_indices(region_name)
             
-            valid_indices = [i for i in set(indices) if i < len(landmarks)]
-            if valid_indices:
-                x_coords = [landmarks[i][0] for i in valid_indices]
-                y_coords = [landmarks[i][1] for i in valid_indices]
-                if x_coords and y_coords:
-                    region_size = max(max(x_coords) - min(x_coords), max(y_coords) - min(y_coords)) / 2
+            if indices is not None:
+                points = as_point_array(landmarks)
+                indices = indices[indices < len(points)]
+                if len(indices) > 0:
+                    region_size = float(np.ptp(points[indices], axis=0).max()) / 2
         
         # 영역 추출 (중심점 기준)
         half_size = int(region_size)
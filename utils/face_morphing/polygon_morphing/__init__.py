@@ -9,6 +9,13 @@ from .utils import (
 from .core import (
     morph_face_by_polygons
 )
+from .incremental import (
+    IncrementalMorphRenderer
+)
+from .sequence import (
+    render_morph_sequence,
+    write_morph_sequence
+)
 from .transformations import (
     transform_points_for_eye_size,
     transform_points_for_eye_size_centered,
@@ -30,6 +37,9 @@ __all__ = [
     '_get_neighbor_points',
     '_check_triangles_flipped',
     'morph_face_by_polygons',
+    'IncrementalMorphRenderer',
+    'render_morph_sequence',
+    'write_morph_sequence',
     'transform_points_for_eye_size',
     'transform_points_for_eye_size_centered',
     'transform_points_for_nose_size',
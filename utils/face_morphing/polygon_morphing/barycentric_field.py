@@ -0,0 +1,164 @@
+"""
+바운딩 박스 픽셀의 무게중심 좌표 필드 캐시
+
+슬라이더를 드래그하는 동안에는 원본 폴리곤 포인트, Delaunay 삼각형, 바운딩 박스가 그대로이고
+변형된 포인트만 바뀝니다. 픽셀마다 원본 삼각형 인덱스(int32)와 무게중심 가중치(float16)를
+한 번만 계산해 두면, 매 프레임은 꼭짓점 이동량을 모으고 가중합하는 것만으로
+변위 필드를 만들 수 있습니다 (np.mgrid, find_simplex 재계산 없음).
+
+변위 필드 d는 원본 좌표 기준(정방향)이므로, remap에 필요한 역매핑은
+p = q - d(p) 고정점 반복으로 구합니다 (삼각형이 뒤집히지 않으면 수렴).
+
+캐시 키: 작업 해상도 원본 포인트 + 바운딩 박스 (이미지 크기/배율이 바뀌면 포인트 좌표도 바뀜)
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .buffer_pool import get_buffer_pool
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+# 보관할 필드 수 (필드 하나: 바운딩 박스 픽셀당 10바이트)
+FIELD_CACHE_SIZE = 2
+
+# 역매핑 고정점 반복 횟수 (첫 근사 이후)
+INVERSE_ITERATIONS = 2
+
+_CHUNK_SIZE = 100000
+
+
+class BarycentricField:
+    """
+    바운딩 박스 픽셀별 원본 삼각형 인덱스와 무게중심 가중치
+
+    Attributes:
+        bbox: (min_x, min_y, max_x, max_y)
+        simplices: 삼각형 꼭짓점 인덱스 (S, 3)
+        simplex_ids: 픽셀별 삼각형 인덱스 (H*W,) int32, 삼각형 밖은 -1
+        weights: 픽셀별 무게중심 가중치 (H*W, 3) float16
+    """
+
+    def __init__(self, tri, bbox):
+        self.bbox = tuple(int(v) for v in bbox)
+        self.simplices = tri.simplices
+        min_x, min_y, max_x, max_y = self.bbox
+        self.shape = (max_y - min_y, max_x - min_x)
+
+        y_coords, x_coords = np.mgrid[min_y:max_y, min_x:max_x]
+        coords = np.column_stack([x_coords.ravel(), y_coords.ravel()]).astype(np.float64)
+        total = len(coords)
+        self.simplex_ids = np.full(total, -1, dtype=np.int32)
+        self.weights = np.zeros((total, 3), dtype=np.float16)
+        for start in range(0, total, _CHUNK_SIZE):
+            chunk = coords[start:start + _CHUNK_SIZE]
+            ids = tri.find_simplex(chunk)
+            inside = ids >= 0
+            transform = tri.transform[ids[inside]]
+            bary = np.einsum('nij,nj->ni', transform[:, :2], chunk[inside] - transform[:, 2])
+            weights = np.empty((len(bary), 3), dtype=np.float64)
+            weights[:, :2] = bary
+            weights[:, 2] = 1.0 - bary.sum(axis=1)
+            self.simplex_ids[start:start + len(chunk)] = ids
+            self.weights[start:start + len(chunk)][inside] = weights
+
+        self._inside = np.flatnonzero(self.simplex_ids >= 0)
+        self._inside_ids = self.simplex_ids[self._inside]
+        self._inside_weights = self.weights[self._inside].astype(np.float32)
+
+    def displacement(self, original_points, transformed_points):
+        """
+        원본 좌표 기준 변위 필드 (H, W, 2) float32
+        꼭짓점 이동량을 삼각형별로 모은 뒤 픽셀별 가중합 한 번으로 계산합니다.
+        반환 배열은 버퍼 풀에서 빌린 것이므로 다 쓰면 풀에 돌려줄 수 있습니다.
+        """
+        vertex_offsets = (np.asarray(transformed_points, dtype=np.float32)
+                          - np.asarray(original_points, dtype=np.float32))
+        triangle_offsets = vertex_offsets[self.simplices]
+        field = get_buffer_pool().acquire((self.shape[0], self.shape[1], 2), np.float32, fill=0.0)
+        field.reshape(-1, 2)[self._inside] = np.einsum('nk,nkc->nc', self._inside_weights,
+                                                       triangle_offsets[self._inside_ids])
+        return field
+
+    def remap_coordinates(self, original_points, transformed_points, iterations=INVERSE_ITERATIONS):
+        """
+        cv2.remap용 역매핑 좌표 (map_x, map_y), 각 (H, W) float32 (작업 이미지 좌표)
+        목적지 q마다 q = p + d(p)를 만족하는 원본 p를 p = q - d(p) 반복으로 찾습니다.
+        """
+        displacement = self.displacement(original_points, transformed_points)
+        maps = self.inverse_map(displacement, 0, self.shape[0], iterations)
+        get_buffer_pool().release(displacement)
+        return maps
+
+    def inverse_map(self, displacement, row_start, row_stop, iterations=INVERSE_ITERATIONS):
+        """
+        변위 필드의 행 범위 [row_start, row_stop) (바운딩 박스 기준)에 대한 역매핑 좌표
+        반복마다 변위 필드 전체에서 샘플링하므로 행 범위를 나눠 계산해도 결과가 같습니다.
+        격자/샘플링 배열은 버퍼 풀에서 빌려 쓰며, 반환하는 (map_x, map_y)도 빌린 배열입니다.
+        """
+        min_x, min_y, _, _ = self.bbox
+        pool = get_buffer_pool()
+        tile_shape = (row_stop - row_start, self.shape[1])
+        grid_x = pool.acquire(tile_shape, np.float32)
+        grid_y = pool.acquire(tile_shape, np.float32)
+        grid_x[:] = np.arange(tile_shape[1], dtype=np.float32)
+        grid_y[:] = np.arange(row_start, row_stop, dtype=np.float32)[:, np.newaxis]
+
+        tile_displacement = displacement[row_start:row_stop]
+        map_x = np.subtract(grid_x, tile_displacement[:, :, 0], out=pool.acquire(tile_shape, np.float32))
+        map_y = np.subtract(grid_y, tile_displacement[:, :, 1], out=pool.acquire(tile_shape, np.float32))
+        sampled = pool.acquire(tile_shape + (2,), np.float32) if iterations > 0 else None
+        for _ in range(iterations):
+            cv2.remap(displacement, map_x, map_y, dst=sampled, interpolation=cv2.INTER_LINEAR,
+                      borderMode=cv2.BORDER_REPLICATE)
+            np.subtract(grid_x, sampled[:, :, 0], out=map_x)
+            np.subtract(grid_y, sampled[:, :, 1], out=map_y)
+        map_x += min_x
+        map_y += min_y
+        pool.release(grid_x, grid_y, sampled)
+        return map_x, map_y
+
+
+_fields = OrderedDict()
+_fields_lock = threading.Lock()
+
+
+def _field_key(original_points, bbox):
+    points = np.ascontiguousarray(original_points, dtype=np.float64)
+    digest = hashlib.blake2b(points.tobytes(), digest_size=16).hexdigest()
+    return digest, tuple(int(v) for v in bbox)
+
+
+def get_barycentric_field(tri, original_points, bbox):
+    """
+    원본 포인트/바운딩 박스에 대한 무게중심 필드 (캐시에 없을 때만 계산)
+
+    Args:
+        tri: 원본 포인트의 Delaunay 삼각분할
+        original_points: 작업 해상도 원본 포인트 (N, 2)
+        bbox: (min_x, min_y, max_x, max_y) 작업 해상도 바운딩 박스
+    """
+    key = _field_key(original_points, bbox)
+    with _fields_lock:
+        field = _fields.get(key)
+        if field is not None:
+            _fields.move_to_end(key)
+            return field
+
+    field = BarycentricField(tri, bbox)
+    with _fields_lock:
+        _fields[key] = field
+        while len(_fields) > FIELD_CACHE_SIZE:
+            _fields.popitem(last=False)
+    return field
+
+
+def clear_cache():
+    """필드 캐시 비우기"""
+    with _fields_lock:
+        _fields.clear()
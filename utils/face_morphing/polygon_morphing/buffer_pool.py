@@ -0,0 +1,162 @@
+"""
+모핑 작업 배열 재사용 풀
+
+드래그/슬라이더 중에는 같은 크기 이미지로 모핑을 계속 반복하므로, 호출마다 이미지 크기의
+float32 누적 버퍼/가중치/마스크를 새로 할당하고 버리면 초당 수백 MB가 할당기를 오갑니다.
+(shape, dtype)별로 다 쓴 배열을 보관해 두었다가 다음 호출에 빌려주면 할당 없이 재사용할 수 있습니다.
+정변환 누적 버퍼뿐 아니라 remap/cached_remap 백엔드의 결과 배열, 타일별 역매핑 좌표(map_x/map_y),
+변위 필드도 같은 풀에서 빌려 씁니다.
+
+빌린 배열은 내용이 남아 있을 수 있으므로 acquire(fill=...)로 초기화하거나 전부 덮어써서 사용하고,
+함수 밖으로 나가는 배열(PIL 이미지, 컨텍스트)은 풀에 돌려주면 안 됩니다.
+"""
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# (shape, dtype)마다 보관할 배열 수
+MAX_BUFFERS_PER_KEY = 4
+
+# 풀에 보관할 전체 크기 상한 (바이트)
+MAX_POOL_BYTES = 256 * 1024 * 1024
+
+
+class BufferPool:
+    """
+    (shape, dtype)별 작업 배열 풀
+
+    사용 예:
+        buffer = pool.acquire((h, w, 3), np.float32, fill=0.0)
+        ...
+        pool.release(buffer)
+    """
+
+    def __init__(self, max_per_key=MAX_BUFFERS_PER_KEY, max_bytes=MAX_POOL_BYTES):
+        self.max_per_key = max_per_key
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._buffers = OrderedDict()
+        self._held_bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(shape, dtype):
+        return tuple(int(v) for v in shape), np.dtype(dtype).str
+
+    def acquire(self, shape, dtype, fill=None):
+        """
+        보관된 배열을 빌리거나 새로 할당합니다.
+
+        Args:
+            shape: 배열 모양
+            dtype: 배열 자료형
+            fill: 주면 이 값으로 채워서 반환 (None이면 이전 내용이 남아 있을 수 있음)
+        """
+        key = self._key(shape, dtype)
+        buffer = None
+        with self._lock:
+            stack = self._buffers.get(key)
+            if stack:
+                buffer = stack.pop()
+                self._held_bytes -= buffer.nbytes
+                self._buffers.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if buffer is None:
+            buffer = np.empty(key[0], dtype=dtype)
+        if fill is not None:
+            buffer.fill(fill)
+        return buffer
+
+    def release(self, *buffers):
+        """다 쓴 배열을 풀에 돌려줍니다 (None은 무시, 상한을 넘으면 오래된 크기부터 버림)."""
+        with self._lock:
+            for buffer in buffers:
+                if buffer is None or not buffer.flags.owndata or not buffer.flags.c_contiguous:
+                    continue
+                key = self._key(buffer.shape, buffer.dtype)
+                stack = self._buffers.setdefault(key, [])
+                if len(stack) >= self.max_per_key or any(held is buffer for held in stack):
+                    continue
+                stack.append(buffer)
+                self._buffers.move_to_end(key)
+                self._held_bytes += buffer.nbytes
+            while self._held_bytes > self.max_bytes and self._buffers:
+                _, stack = self._buffers.popitem(last=False)
+                self._held_bytes -= sum(held.nbytes for held in stack)
+
+    def clear(self):
+        """보관한 배열 모두 버리기"""
+        with self._lock:
+            self._buffers.clear()
+            self._held_bytes = 0
+
+    @property
+    def held_bytes(self):
+        """풀에 보관 중인 배열 전체 크기 (바이트)"""
+        return self._held_bytes
+
+    def describe(self):
+        """로그용 요약 문자열"""
+        return f"보관 {self._held_bytes / (1024 * 1024):.1f}MB, 재사용 {self.hits}회, 할당 {self.misses}회"
+
+
+_pool = BufferPool()
+
+
+def get_buffer_pool():
+    """모핑 파이프라인 공용 버퍼 풀"""
+    return _pool
+
+
+def _windows_peak_rss():
+    import ctypes
+    from ctypes import wintypes
+
+    class _ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [
+            ('cb', wintypes.DWORD),
+            ('PageFaultCount', wintypes.DWORD),
+            ('PeakWorkingSetSize', ctypes.c_size_t),
+            ('WorkingSetSize', ctypes.c_size_t),
+            ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+            ('PagefileUsage', ctypes.c_size_t),
+            ('PeakPagefileUsage', ctypes.c_size_t),
+        ]
+
+    counters = _ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+    process = ctypes.windll.kernel32.GetCurrentProcess()
+    if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+        return None
+    return counters.PeakWorkingSetSize
+
+
+def peak_rss_mb():
+    """
+    프로세스 최대 상주 메모리(peak RSS, MB)를 반환합니다.
+    POSIX는 getrusage, Windows는 GetProcessMemoryInfo를 사용하며, 구할 수 없으면 None.
+    """
+    try:
+        if resource is not None:
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            # Linux는 KB, macOS는 바이트 단위
+            return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+        if sys.platform == 'win32':
+            peak = _windows_peak_rss()
+            return peak / (1024 * 1024) if peak is not None else None
+    except (OSError, AttributeError, ValueError):
+        return None
+    return None
@@ -18,6 +18,7 @@
 4. 폴리곤 모핑: morph_face_by_polygons 함수로 변형된 포인트를 사용하여 이미지 변형
 """
 from dataclasses import dataclass
+import hashlib
 import math
 from typing import List, Optional, Sequence, Tuple
 
@@ -46,7 +47,24 @@ except ImportError:
     RIGHT_EYE_INDICES = []
 
 
+from utils import facemesh_topology
+from utils.landmarks import Landmarks
+
 from .utils import _get_neighbor_points, _check_triangles_flipped
+from .barycentric_field import get_barycentric_field
+from .topology import build_topology
+from .tiling import render_row_tiles
+from . import kernels
+from .buffer_pool import get_buffer_pool, peak_rss_mb
+
+# 눈동자 포인트 인덱스 (윤곽 8개 + 중심 2개)
+_IRIS_ALL_INDICES = frozenset(facemesh_topology.IRIS_ALL_INDICES.tolist())
+
+# 픽셀 렌더링 방식
+# - forward: 원본 삼각형의 픽셀을 변형 위치에 이중선형 가중치로 더함 (빈 곳은 inpaint)
+# - remap: 변형 후 삼각형에서 원본 좌표를 역으로 구해 cv2.remap 한 번으로 샘플링 (빈 곳 없음)
+# - cached_remap: 원본 삼각형 무게중심 필드를 캐시해 두고 변위 필드의 역으로 remap (슬라이더 드래그용)
+RENDER_BACKENDS = ("forward", "remap", "cached_remap")
 
 # 공통 로거 헬퍼 (모듈 전역)
 try:
@@ -69,8 +87,8 @@ except ImportError:  # Fallback: IDE나 테스트 환경에서 logger 미존재
 class IrisTransformContext:
     """눈동자 및 랜드마크 준비 결과."""
 
-    original_landmarks_no_iris: List[Tuple[float, float]]
-    transformed_landmarks_no_iris: List[Tuple[float, float]]
+    original_landmarks_no_iris: Landmarks
+    transformed_landmarks_no_iris: Landmarks
     original_points_array: np.ndarray
     transformed_points_array: np.ndarray
     iris_indices: Sequence[int]
@@ -114,6 +132,9 @@ class MorphRenderContext:
     pixel_coords_orig_global: Optional[np.ndarray] = None
     simplex_indices_orig: Optional[np.ndarray] = None
     valid_simplex_indices: Optional[np.ndarray] = None
+    # 삼각형별 픽셀 목록 (CSR): simplex s의 픽셀 = pixel_order[simplex_offsets[s]:simplex_offsets[s + 1]]
+    pixel_order: Optional[np.ndarray] = None
+    simplex_offsets: Optional[np.ndarray] = None
 
 
 def _validate_and_prepare_inputs(image, original_landmarks, transformed_landmarks):
@@ -224,6 +245,17 @@ def clamp_iris_to_eye_region(iris_center_coord, eye_landmarks, img_width, img_he
     return (clamped_x, clamped_y)
 
 
+def _as_pixel_landmarks(landmarks, img_width, img_height):
+    """랜드마크를 픽셀 좌표 Landmarks로 변환 (MediaPipe 정규화 객체 지원, Landmarks는 복사 없음)"""
+    if landmarks is None:
+        return Landmarks()
+    if isinstance(landmarks, Landmarks):
+        return landmarks
+    if len(landmarks) > 0 and hasattr(landmarks[0], 'x') and hasattr(landmarks[0], 'y'):
+        return Landmarks.from_normalized(landmarks, img_width, img_height)
+    return Landmarks(landmarks, copy=False)
+
+
 def _prepare_iris_centers(original_landmarks, transformed_landmarks,
                          left_iris_center_coord, right_iris_center_coord,
                          left_iris_center_orig, right_iris_center_orig,
@@ -271,75 +303,46 @@ def _prepare_iris_centers(original_landmarks, transformed_landmarks,
     if original_len != transformed_len:
         print_warning("얼굴모핑", f"랜드마크 길이 불일치: original={original_len}, transformed={transformed_len}")
     
-    # 3. 눈동자 인덱스 가져오기
-    try:
-        from .region_extraction import get_iris_indices
-        left_iris_indices, right_iris_indices = get_iris_indices()
-        # contour 인덱스 (8개)
-        iris_contour_indices = set(left_iris_indices + right_iris_indices)
-        # 중심점 인덱스 (2개): 468(왼쪽), 473(오른쪽)
-        iris_center_indices = {468, 473}
-        # 모든 눈동자 포인트 인덱스 (10개)
-        iris_indices = iris_contour_indices | iris_center_indices
-    except ImportError:
-        # 폴백: 하드코딩된 인덱스 사용
-        # 실제 MediaPipe 정의: LEFT_IRIS=[474,475,476,477], RIGHT_IRIS=[469,470,471,472]
-        left_iris_indices = [474, 475, 476, 477]
-        right_iris_indices = [469, 470, 471, 472]
-        iris_contour_indices = set(left_iris_indices + right_iris_indices)
-        iris_center_indices = {468, 473}
-        iris_indices = iris_contour_indices | iris_center_indices
-    
-    # 4. 눈동자 포인트 제거 (길이에 따라 조건부 처리)
-    if original_len == 478:
-        # 478개인 경우: 인덱스로 눈동자 포인트 제거
-        original_landmarks_no_iris = [pt for i, pt in enumerate(original_landmarks) if i not in iris_indices]
-        print_info("얼굴모핑", f"original_landmarks(478개)에서 눈동자 포인트 제거: {len(original_landmarks_no_iris)}개로 변환")
-    elif original_len == 468:
-        # 468개인 경우: 이미 눈동자 포인트가 제거된 상태이므로 그대로 사용
-        original_landmarks_no_iris = list(original_landmarks)
-        print_info("얼굴모핑", f"original_landmarks(468개)는 이미 눈동자 포인트가 제거된 상태")
-    else:
-        # 예상치 못한 길이: 경고 후 그대로 사용
-        print_warning("얼굴모핑", f"original_landmarks의 예상치 못한 길이: {original_len} (예상: 468 또는 478)")
-        original_landmarks_no_iris = list(original_landmarks)
-    
-    if transformed_len == 478:
-        # 478개인 경우: 인덱스로 눈동자 포인트 제거
-        transformed_landmarks_no_iris = [pt for i, pt in enumerate(transformed_landmarks) if i not in iris_indices]
-        print_info("얼굴모핑", f"transformed_landmarks(478개)에서 눈동자 포인트 제거: {len(transformed_landmarks_no_iris)}개로 변환")
-    elif transformed_len == 468:
-        # 468개인 경우: 이미 눈동자 포인트가 제거된 상태이므로 그대로 사용
-        transformed_landmarks_no_iris = list(transformed_landmarks)
-        print_info("얼굴모핑", f"transformed_landmarks(468개)는 이미 눈동자 포인트가 제거된 상태")
-    else:
-        # 예상치 못한 길이: 경고 후 그대로 사용
-        print_warning("얼굴모핑", f"transformed_landmarks의 예상치 못한 길이: {transformed_len} (예상: 468 또는 478)")
-        transformed_landmarks_no_iris = list(transformed_landmarks)
+    # 3. 눈동자 인덱스 (토폴로지 상수)
+    # 실제 MediaPipe 정의: LEFT_IRIS=[474,475,476,477], RIGHT_IRIS=[469,470,471,472]
+    left_iris_indices = facemesh_topology.LEFT_IRIS_INDICES.tolist()
+    right_iris_indices = facemesh_topology.RIGHT_IRIS_INDICES.tolist()
+    # contour 인덱스 (8개)
+    iris_contour_indices = set(left_iris_indices + right_iris_indices)
+    # 중심점 인덱스 (2개): 468, 473
+    iris_center_indices = set(facemesh_topology.IRIS_CENTER_INDICES.tolist())
+    # 모든 눈동자 포인트 인덱스 (10개)
+    iris_indices = iris_contour_indices | iris_center_indices
+    
+    # 픽셀 좌표 Landmarks로 통일 (Landmarks 입력은 복사 없음)
+    original_landmarks_tuple = _as_pixel_landmarks(original_landmarks, img_width, img_height)
+    transformed_landmarks_tuple = _as_pixel_landmarks(transformed_landmarks, img_width, img_height)
+    
+    # 4. 눈동자 포인트 제거 (길이에 따라 조건부 처리, 인덱스 마스크로 한 번에 제거)
+    def _remove_iris_points(points, name):
+        if len(points) == 478:
+            keep = np.ones(len(points), dtype=bool)
+            keep[sorted(iris_indices)] = False
+            result = points.take(np.flatnonzero(keep))
+            print_info("얼굴모핑", f"{name}(478개)에서 눈동자 포인트 제거: {len(result)}개로 변환")
+            return result
+        if len(points) == 468:
+            # 468개인 경우: 이미 눈동자 포인트가 제거된 상태
+            print_info("얼굴모핑", f"{name}(468개)는 이미 눈동자 포인트가 제거된 상태")
+        else:
+            # 예상치 못한 길이: 경고 후 그대로 사용
+            print_warning("얼굴모핑", f"{name}의 예상치 못한 길이: {len(points)} (예상: 468 또는 478)")
+        # 중앙 포인트를 추가하므로 복사본 사용
+        return points.copy()
+    
+    original_landmarks_no_iris = _remove_iris_points(original_landmarks_tuple, "original_landmarks")
+    transformed_landmarks_no_iris = _remove_iris_points(transformed_landmarks_tuple, "transformed_landmarks")
     
     # 디버깅: 최종 길이 확인
     print_info("얼굴모핑", f"_prepare_iris_centers 결과: original_no_iris={len(original_landmarks_no_iris)}개, transformed_no_iris={len(transformed_landmarks_no_iris)}개")
     
     # 3. 중앙 포인트 계산 또는 전달된 좌표 사용
     # 전달된 좌표는 사용자 관점이므로 MediaPipe 관점으로 변환 필요
-    # 원본 랜드마크를 tuple 형태로 변환 (원본 중앙 포인트 계산용)
-    original_landmarks_tuple = []
-    for i, pt in enumerate(original_landmarks):
-        if isinstance(pt, tuple):
-            original_landmarks_tuple.append(pt)
-        elif hasattr(pt, 'x') and hasattr(pt, 'y'):
-            original_landmarks_tuple.append((pt.x * img_width, pt.y * img_height))
-        else:
-            original_landmarks_tuple.append(pt)
-    
-    transformed_landmarks_tuple = []
-    for i, pt in enumerate(transformed_landmarks):
-        if isinstance(pt, tuple):
-            transformed_landmarks_tuple.append(pt)
-        elif hasattr(pt, 'x') and hasattr(pt, 'y'):
-            transformed_landmarks_tuple.append((pt.x * img_width, pt.y * img_height))
-        else:
-            transformed_landmarks_tuple.append(pt)
     
     # 중앙 포인트 계산 함수 정의
     def _calculate_iris_centers_from_contour(landmarks_tuple, left_iris_indices, right_iris_indices, img_w, img_h):
@@ -654,10 +657,8 @@ def _prepare_iris_centers(original_landmarks, transformed_landmarks,
     if left_iris_center_orig is not None and right_iris_center_orig is not None:
         # landmarks[468] = LEFT_EYE_INDICES에서 계산된 중심
         # landmarks[469] = RIGHT_EYE_INDICES에서 계산된 중심
-        original_landmarks_no_iris.append(left_iris_center_orig)   # landmarks[468]
-        original_landmarks_no_iris.append(right_iris_center_orig)  # landmarks[469]
-        transformed_landmarks_no_iris.append(left_iris_center_trans)
-        transformed_landmarks_no_iris.append(right_iris_center_trans)
+        original_landmarks_no_iris.extend([left_iris_center_orig, right_iris_center_orig])   # landmarks[468], [469]
+        transformed_landmarks_no_iris.extend([left_iris_center_trans, right_iris_center_trans])
         
         # 중앙 포인트 이동 거리 계산 (중앙 포인트가 실제로 변경되었을 때만 로그 출력)
         left_displacement = np.sqrt((left_iris_center_trans[0] - left_iris_center_orig[0])**2 + 
@@ -669,63 +670,34 @@ def _prepare_iris_centers(original_landmarks, transformed_landmarks,
     # 경계 포인트: 4개 모서리
     # 경계 포인트는 바운딩 박스 경계 근처의 픽셀이 삼각형을 찾을 수 있도록 필요
     margin = 10
-    boundary_points = [
+    boundary_points = np.array([
         (-margin, -margin),  # 왼쪽 위
         (img_width + margin, -margin),  # 오른쪽 위
         (img_width + margin, img_height + margin),  # 오른쪽 아래
         (-margin, img_height + margin)  # 왼쪽 아래
-    ]
-    
-    # 모든 포인트 결합 (변환된 랜드마크 + 경계)
-    all_original_points = list(original_landmarks_no_iris) + boundary_points
-    all_transformed_points = list(transformed_landmarks_no_iris) + boundary_points
-    
-    # numpy 배열로 변환
-    original_points_array = np.array(all_original_points, dtype=np.float32)
-    transformed_points_array = np.array(all_transformed_points, dtype=np.float32)
-    
-    # 포인트 이동 거리 검증: 너무 많이 이동한 포인트가 있는지 확인
-    # 중앙 포인트를 포함한 전체 랜드마크 확인
-    max_displacement = 0.0
-    max_displacement_idx = -1
-    landmarks_count_for_check = len(original_landmarks_no_iris)  # 중앙 포인트 포함
-    
-    # 이동 거리 상세 로그 (중앙 포인트 포함)
-    displacement_details = []
-    for i in range(landmarks_count_for_check):
-        if i < len(original_landmarks_no_iris) and i < len(transformed_landmarks_no_iris):
-            orig_pt = original_landmarks_no_iris[i]
-            trans_pt = transformed_landmarks_no_iris[i]
-            displacement = np.sqrt((trans_pt[0] - orig_pt[0])**2 + (trans_pt[1] - orig_pt[1])**2)
-            if displacement > max_displacement:
-                max_displacement = displacement
-                max_displacement_idx = i
+    ], dtype=np.float32)
+    
+    # 모든 포인트 결합 (변환된 랜드마크 + 경계) -> float32 배열
+    original_points_array = np.concatenate([original_landmarks_no_iris.array, boundary_points], axis=0)
+    
+    # 포인트 이동 거리 검증: 너무 많이 이동한 포인트가 있는지 확인 (중앙 포인트 포함)
+    count = min(len(original_landmarks_no_iris), len(transformed_landmarks_no_iris))
+    orig_arr = original_landmarks_no_iris.array[:count]
+    trans_arr = transformed_landmarks_no_iris.array[:count]
+    displacements = np.sqrt(((trans_arr - orig_arr) ** 2).sum(axis=1)) if count else np.zeros(0, dtype=np.float32)
+    max_displacement = float(displacements.max()) if count else 0.0
     
     # 이미지 대각선 길이의 30%를 초과하면 경고
     image_diagonal = np.sqrt(img_width**2 + img_height**2)
     max_allowed_displacement = image_diagonal * 0.3
     
-    if max_displacement > max_allowed_displacement:
-        # 과도하게 이동한 포인트를 제한 (허용치의 1.2배까지만 허용)
-        # 중앙 포인트를 포함한 전체 랜드마크에 대해 제한 적용
-        if max_displacement > max_allowed_displacement * 1.2:
-            scale_factor_limit = max_allowed_displacement * 1.2 / max_displacement
-            for i in range(len(original_landmarks_no_iris)):
-                if i < len(original_landmarks_no_iris) and i < len(transformed_landmarks_no_iris):
-                    orig_pt = original_landmarks_no_iris[i]
-                    trans_pt = transformed_landmarks_no_iris[i]
-                    displacement = np.sqrt((trans_pt[0] - orig_pt[0])**2 + (trans_pt[1] - orig_pt[1])**2)
-                    if displacement > max_allowed_displacement * 1.2:
-                        # 이동 거리를 제한
-                        dx = trans_pt[0] - orig_pt[0]
-                        dy = trans_pt[1] - orig_pt[1]
-                        limited_dx = dx * scale_factor_limit
-                        limited_dy = dy * scale_factor_limit
-                        transformed_landmarks_no_iris[i] = (orig_pt[0] + limited_dx, orig_pt[1] + limited_dy)
-            
-            # 제한된 랜드마크로 배열 재생성 (중앙 포인트 포함)
-            all_transformed_points = list(transformed_landmarks_no_iris) + boundary_points
-            transformed_points_array = np.array(all_transformed_points, dtype=np.float32)
+    # 과도하게 이동한 포인트를 제한 (허용치의 1.2배까지만 허용)
+    if max_displacement > max_allowed_displacement * 1.2:
+        scale_factor_limit = max_allowed_displacement * 1.2 / max_displacement
+        over = np.flatnonzero(displacements > max_allowed_displacement * 1.2)
+        trans_arr[over] = orig_arr[over] + (trans_arr[over] - orig_arr[over]) * scale_factor_limit
+    
+    transformed_points_array = np.concatenate([transformed_landmarks_no_iris.array, boundary_points], axis=0)
     
     return IrisTransformContext(
         original_landmarks_no_iris=original_landmarks_no_iris,
@@ -742,32 +714,28 @@ def _prepare_iris_centers(original_landmarks, transformed_landmarks,
 
 
 def _create_delaunay_triangulation(original_points_array):
-    """Delaunay Triangulation 생성 및 캐싱
-    
+    """삼각분할 생성 및 캐싱
+
+    FaceMesh 고정 삼각형(겹치면 Delaunay 삼각형)에 래스터화 점 위치 맵을 붙인 토폴로지를 만들고,
+    원본 포인트가 같으면 캐시된 것을 그대로 씁니다 (슬라이더 드래그 동안 삼각형이 바뀌지 않음).
+
     Args:
         original_points_array: 원본 포인트 배열 (numpy array)
     
     Returns:
-        tri: Delaunay Triangulation 객체
+        tri: 삼각분할 객체 (simplices, transform, find_simplex 제공)
     """
-    # Delaunay Triangulation 캐싱 (성능 최적화)
-    # 랜드마크 포인트의 해시를 키로 사용
-    cache_key = hash(tuple(map(tuple, original_points_array)))
-    
-    if cache_key in _delaunay_cache:
-        tri = _delaunay_cache[cache_key]
-    else:
-        # scipy.spatial.Delaunay를 사용한 Delaunay Triangulation
-        tri = Delaunay(original_points_array)
-        
-        # 캐시 크기 제한 (LRU 방식)
-        if len(_delaunay_cache) >= _delaunay_cache_max_size:
-            # 가장 오래된 항목 제거 (간단하게 첫 번째 항목 제거)
-            oldest_key = next(iter(_delaunay_cache))
-            del _delaunay_cache[oldest_key]
-        
-        _delaunay_cache[cache_key] = tri
-    
+    points = np.ascontiguousarray(original_points_array, dtype=np.float64)
+    cache_key = (points.shape, hashlib.blake2b(points.tobytes(), digest_size=16).digest())
+
+    tri = _delaunay_cache.pop(cache_key, None)
+    if tri is None:
+        tri = build_topology(points)
+        # 캐시 크기 제한 (가장 오래 쓰이지 않은 항목 제거)
+        while _delaunay_cache and len(_delaunay_cache) >= _delaunay_cache_max_size:
+            del _delaunay_cache[next(iter(_delaunay_cache))]
+    # 다시 넣어 최근 사용 순서로 유지
+    _delaunay_cache[cache_key] = tri
     return tri
 
 
@@ -829,27 +797,21 @@ def _calculate_landmark_bounding_box(landmarks, img_width, img_height, padding_r
     if not landmarks:
         return None
     
-    # 랜드마크 좌표 추출 (복사본 생성 없이 인덱스로 직접 접근)
-    x_coords = []
-    y_coords = []
-    exclude_set = exclude_indices if exclude_indices is not None else set()
-    for i, pt in enumerate(landmarks):
-        if i in exclude_set:
-            continue
-        if isinstance(pt, tuple) and len(pt) >= 2:
-            x_coords.append(pt[0])
-            y_coords.append(pt[1])
-        elif hasattr(pt, 'x') and hasattr(pt, 'y'):
-            x_coords.append(pt.x * img_width)
-            y_coords.append(pt.y * img_height)
+    # 랜드마크 좌표 배열 (Landmarks는 복사 없음, 제외 인덱스는 마스크로 필터링)
+    points = _as_pixel_landmarks(landmarks, img_width, img_height).array
+    if exclude_indices:
+        keep = np.ones(len(points), dtype=bool)
+        excluded = [i for i in exclude_indices if 0 <= i < len(points)]
+        keep[excluded] = False
+        points = points[keep]
     
-    if not x_coords or not y_coords:
+    if len(points) == 0:
         return None
     
-    min_x = max(0, int(min(x_coords)))
-    min_y = max(0, int(min(y_coords)))
-    max_x = min(img_width, int(max(x_coords)))
-    max_y = min(img_height, int(max(y_coords)))
+    min_x = max(0, int(points[:, 0].min()))
+    min_y = max(0, int(points[:, 1].min()))
+    max_x = min(img_width, int(points[:, 0].max()))
+    max_y = min(img_height, int(points[:, 1].max()))
     
     # 패딩 추가 (변형 시 영역 확장 고려, 얼굴 전체 포함을 위해 30%로 증가)
     width = max_x - min_x
@@ -865,9 +827,20 @@ def _calculate_landmark_bounding_box(landmarks, img_width, img_height, padding_r
     return (min_x, min_y, max_x, max_y)    
 
 
+def _preview_scale(img_width, img_height, preview_size):
+    """미리보기 표시 크기에 맞춘 작업 해상도 배율 (확대하지 않음, 미리보기가 아니면 1.0)"""
+    if not preview_size:
+        return 1.0
+    preview_width, preview_height = preview_size
+    if preview_width <= 0 or preview_height <= 0:
+        return 1.0
+    return min(1.0, preview_width / img_width, preview_height / img_height)
+
+
 def _prepare_delaunay_context(*, img_array, img_width, img_height,
                               iris_ctx: IrisTransformContext,
-                              cached_original_bbox=None) -> DelaunayContext:
+                              cached_original_bbox=None,
+                              preview_size=None) -> DelaunayContext:
     """Create Delaunay triangulation and working image context."""
 
     ctx = DelaunayContext(
@@ -920,6 +893,9 @@ def _prepare_delaunay_context(*, img_array, img_width, img_height,
 
         if bbox_max_dimension > max_dimension:
             scale_factor = max_dimension / bbox_max_dimension
+        scale_factor = min(scale_factor, _preview_scale(img_width, img_height, preview_size))
+
+        if scale_factor < 1.0:
             working_width = int(img_width * scale_factor)
             working_height = int(img_height * scale_factor)
             if _cv2_cuda_available:
@@ -935,7 +911,7 @@ def _prepare_delaunay_context(*, img_array, img_width, img_height,
 
             original_points_array_scaled = ctx.original_points_array * scale_factor
             transformed_points_array_scaled = ctx.transformed_points_array * scale_factor
-            ctx.tri = Delaunay(original_points_array_scaled)
+            ctx.tri = _create_delaunay_triangulation(original_points_array_scaled)
             ctx.original_points_array = original_points_array_scaled
             ctx.transformed_points_array = transformed_points_array_scaled
 
@@ -969,6 +945,9 @@ def _prepare_delaunay_context(*, img_array, img_width, img_height,
 
         if max(img_width, img_height) > max_dimension:
             scale_factor = max_dimension / max(img_width, img_height)
+        scale_factor = min(scale_factor, _preview_scale(img_width, img_height, preview_size))
+
+        if scale_factor < 1.0:
             working_width = int(img_width * scale_factor)
             working_height = int(img_height * scale_factor)
             if _cv2_cuda_available:
@@ -984,7 +963,7 @@ def _prepare_delaunay_context(*, img_array, img_width, img_height,
 
             original_points_array_scaled = ctx.original_points_array * scale_factor
             transformed_points_array_scaled = ctx.transformed_points_array * scale_factor
-            ctx.tri = Delaunay(original_points_array_scaled)
+            ctx.tri = _create_delaunay_triangulation(original_points_array_scaled)
             ctx.original_points_array = original_points_array_scaled
             ctx.transformed_points_array = transformed_points_array_scaled
 
@@ -1013,232 +992,378 @@ def _build_pixel_coordinate_map(ctx: DelaunayContext) -> MorphRenderContext:
     bbox_total_pixels = bbox_width * bbox_height
     render_ctx.bbox_total_pixels = bbox_total_pixels
 
-    y_coords_orig, x_coords_orig = np.mgrid[ctx.min_y:ctx.max_y, ctx.min_x:ctx.max_x]
-    pixel_coords_orig_global = np.column_stack([x_coords_orig.ravel(), y_coords_orig.ravel()])
+    # 행 우선 (x, y) 좌표를 한 배열에 바로 채움 (mgrid 임시 배열 없음)
+    pixel_coords_orig_global = np.empty((bbox_total_pixels, 2), dtype=np.int64)
+    pixel_coords_grid = pixel_coords_orig_global.reshape(bbox_height, bbox_width, 2)
+    pixel_coords_grid[:, :, 0] = np.arange(ctx.min_x, ctx.max_x)
+    pixel_coords_grid[:, :, 1] = np.arange(ctx.min_y, ctx.max_y)[:, np.newaxis]
     render_ctx.pixel_coords_orig_global = pixel_coords_orig_global
 
-    chunk_size = 100000
-    if bbox_total_pixels > chunk_size:
-        simplex_indices_orig = np.full(bbox_total_pixels, -1, dtype=np.int32)
-        for chunk_start in range(0, bbox_total_pixels, chunk_size):
-            chunk_end = min(chunk_start + chunk_size, bbox_total_pixels)
-            chunk_coords = pixel_coords_orig_global[chunk_start:chunk_end]
-            simplex_indices_orig[chunk_start:chunk_end] = ctx.tri.find_simplex(chunk_coords)
-    else:
-        simplex_indices_orig = ctx.tri.find_simplex(pixel_coords_orig_global)
+    simplex_indices_orig = _find_simplex_chunked(ctx.tri, pixel_coords_orig_global)
 
     render_ctx.simplex_indices_orig = simplex_indices_orig
-    render_ctx.valid_simplex_indices = np.unique(simplex_indices_orig[simplex_indices_orig >= 0])
+    render_ctx.pixel_order, render_ctx.simplex_offsets = _group_pixels_by_simplex(
+        simplex_indices_orig, len(ctx.tri.simplices))
+    render_ctx.valid_simplex_indices = np.flatnonzero(np.diff(render_ctx.simplex_offsets)).astype(np.int32)
 
     return render_ctx
 
 
+def _find_simplex_chunked(tri, coords, chunk_size=100000):
+    """픽셀 좌표별 삼각형 인덱스 (큰 영역은 나눠서 계산, 삼각형 밖은 -1)"""
+    total = len(coords)
+    if total <= chunk_size:
+        return tri.find_simplex(coords)
+    simplex_indices = np.full(total, -1, dtype=np.int32)
+    for chunk_start in range(0, total, chunk_size):
+        chunk_end = min(chunk_start + chunk_size, total)
+        simplex_indices[chunk_start:chunk_end] = tri.find_simplex(coords[chunk_start:chunk_end])
+    return simplex_indices
+
+
+def _group_pixels_by_simplex(simplex_indices, num_simplices):
+    """
+    픽셀을 삼각형별로 한 번에 묶습니다 (CSR 형식).
+
+    삼각형마다 전체 바운딩 박스를 비교하는 대신 한 번 정렬해 두면
+    각 삼각형의 픽셀 목록을 슬라이스로 바로 꺼낼 수 있습니다.
+    안정 정렬이므로 삼각형 안의 픽셀 순서는 원래(행 우선) 순서 그대로입니다.
+
+    Returns:
+        (pixel_order, simplex_offsets): 바운딩 박스 픽셀 인덱스 배열, 길이 num_simplices + 1 오프셋 배열
+    """
+    valid_pixels = np.flatnonzero(simplex_indices >= 0)
+    valid_simplices = simplex_indices[valid_pixels]
+    pixel_order = valid_pixels[np.argsort(valid_simplices, kind='stable')]
+    counts = np.bincount(valid_simplices, minlength=num_simplices)
+    simplex_offsets = np.zeros(num_simplices + 1, dtype=np.int64)
+    np.cumsum(counts, out=simplex_offsets[1:])
+    return pixel_order, simplex_offsets
+
+
+def _compute_triangle_affines(original_points_array, transformed_points_array, simplices):
+    """
+    삼각형별 정변환 아핀 행렬을 한 번에 계산합니다.
+
+    뒤집히거나 너무 작아지는 삼각형은 원본 삼각형(항등 변환)으로 되돌리고,
+    나머지는 (S, 3, 3) 연립방정식 하나로 풉니다 (삼각형마다 cv2.getAffineTransform을 부르지 않음).
+
+    Args:
+        original_points_array: 원본 포인트 배열 (N, 2)
+        transformed_points_array: 변형된 포인트 배열 (N, 2)
+        simplices: 계산할 삼각형 꼭짓점 인덱스 (S, 3)
+
+    Returns:
+        (S, 2, 3) float64 아핀 행렬
+    """
+    simplices = np.asarray(simplices)
+    src = np.asarray(original_points_array)[simplices].astype(np.float32)
+    dst = np.asarray(transformed_points_array)[simplices].astype(np.float32)
+    if len(simplices) == 0:
+        return _solve_affines(src, dst)
+
+    def _cross(triangles):
+        v1 = triangles[:, 1] - triangles[:, 0]
+        v2 = triangles[:, 2] - triangles[:, 0]
+        return v1[:, 0] * v2[:, 1] - v1[:, 1] * v2[:, 0]
+
+    cross_product = _cross(dst)
+    cross_product_orig = _cross(src)
+    triangle_area = np.abs(cross_product) / 2.0
+    triangle_area_orig = np.abs(cross_product_orig) / 2.0
+
+    is_iris_triangle = np.isin(simplices, list(_IRIS_ALL_INDICES)).any(axis=1)
+    is_flipped = cross_product * cross_product_orig < 0
+
+    # 작아지는 삼각형 (눈동자 삼각형은 기준 없음)
+    area_threshold = np.where(is_iris_triangle, 0.0, np.where(triangle_area_orig < 10.0, 0.05, 0.02))
+    too_small = (area_threshold > 0) & ((triangle_area < triangle_area_orig * area_threshold) | (triangle_area < 1.0))
+    too_small &= ~(is_iris_triangle & (triangle_area_orig > 0.5) & (triangle_area > 0.5))
+
+    # 퇴화 삼각형
+    min_area_threshold = np.where(is_iris_triangle, 0.5, 0.1)
+    degenerate = (triangle_area_orig < min_area_threshold) | (triangle_area < min_area_threshold)
+    degenerate &= ~is_iris_triangle | (triangle_area_orig < 0.5)
+
+    dst = np.where((is_flipped | too_small | degenerate)[:, None, None], src, dst)
+
+    # 너무 짧은 변
+    side_lengths = np.stack([
+        np.linalg.norm(dst[:, 1] - dst[:, 0], axis=1),
+        np.linalg.norm(dst[:, 2] - dst[:, 0], axis=1),
+        np.linalg.norm(dst[:, 2] - dst[:, 1], axis=1),
+    ], axis=1)
+    dst = np.where((side_lengths.min(axis=1) < 0.5)[:, None, None], src, dst)
+
+    return _solve_affines(src, dst)
+
+
+def _solve_affines(src, dst):
+    """
+    삼각형 쌍 (S, 3, 2)에서 src -> dst 아핀 행렬 (S, 2, 3)을 한 번에 풉니다.
+    src 삼각형이 퇴화했거나 선형 부분이 특이하면 항등 변환을 돌려줍니다.
+    """
+    count = len(src)
+    identity = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+    affines = np.broadcast_to(identity, (count, 2, 3)).copy()
+    if count == 0:
+        return affines
+
+    # [x y 1] @ M.T = dst
+    src_system = np.concatenate([np.asarray(src, dtype=np.float64), np.ones((count, 3, 1))], axis=2)
+    solvable = np.abs(np.linalg.det(src_system)) > 1e-9
+    if np.any(solvable):
+        solution = np.linalg.solve(src_system[solvable], np.asarray(dst, dtype=np.float64)[solvable])
+        affines[solvable] = np.transpose(solution, (0, 2, 1))
+
+    det = affines[:, 0, 0] * affines[:, 1, 1] - affines[:, 0, 1] * affines[:, 1, 0]
+    affines[np.abs(det) < 1e-6] = identity
+    return affines
+
+
 def _apply_forward_transforms(*,
                               delaunay_ctx: DelaunayContext,
                               render_ctx: MorphRenderContext,
                               blend_ratio: float):
-    """Apply forward affine transforms over the bounding box pixels."""
+    """Apply forward affine transforms over the bounding box pixels.
 
-    if render_ctx.pixel_coords_orig_global is None or render_ctx.simplex_indices_orig is None:
-        return (
-            delaunay_ctx.working_img.copy().astype(np.float32),
-            np.ones((delaunay_ctx.working_height, delaunay_ctx.working_width), dtype=np.float32),
-            np.zeros((delaunay_ctx.working_height, delaunay_ctx.working_width), dtype=np.bool_),
-            0,
-            0,
-        )
+    누적 버퍼(result, result_count, transformed_mask)는 버퍼 풀에서 빌리므로,
+    다 쓴 뒤 호출한 쪽에서 get_buffer_pool().release()로 돌려줍니다.
+    """
 
     working_img = delaunay_ctx.working_img
     working_width = delaunay_ctx.working_width
     working_height = delaunay_ctx.working_height
+
+    pool = get_buffer_pool()
+    result = pool.acquire(working_img.shape, np.float32)
+    np.copyto(result, working_img)
+    result_count = pool.acquire((working_height, working_width), np.float32, fill=1.0)
+    transformed_mask = pool.acquire((working_height, working_width), np.bool_, fill=False)
+
+    if render_ctx.pixel_coords_orig_global is None or render_ctx.simplex_indices_orig is None:
+        return result, result_count, transformed_mask, 0, 0
+
     min_x = delaunay_ctx.min_x
     min_y = delaunay_ctx.min_y
     bbox_width = render_ctx.bbox_width
 
-    result = working_img.copy().astype(np.float32)
-    result_count = np.ones((working_height, working_width), dtype=np.float32)
-    transformed_mask = np.zeros((working_height, working_width), dtype=np.bool_)
-
     pixel_coords_orig_global = render_ctx.pixel_coords_orig_global
-    simplex_indices_orig = render_ctx.simplex_indices_orig
+    if render_ctx.pixel_order is None or render_ctx.simplex_offsets is None:
+        render_ctx.pixel_order, render_ctx.simplex_offsets = _group_pixels_by_simplex(
+            render_ctx.simplex_indices_orig, len(delaunay_ctx.tri.simplices))
+    pixel_order = render_ctx.pixel_order
+    simplex_offsets = render_ctx.simplex_offsets
     valid_simplex_indices = render_ctx.valid_simplex_indices
     if valid_simplex_indices is None:
-        valid_simplex_indices = []
+        valid_simplex_indices = np.flatnonzero(np.diff(simplex_offsets))
 
-    original_points_array = delaunay_ctx.original_points_array
-    transformed_points_array = delaunay_ctx.transformed_points_array
     tri = delaunay_ctx.tri
+    affines = _compute_triangle_affines(
+        delaunay_ctx.original_points_array,
+        delaunay_ctx.transformed_points_array,
+        tri.simplices[valid_simplex_indices],
+    )
 
-    total_pixels_processed = 0
-    pixels_out_of_bounds = 0
-
-    for simplex_idx in valid_simplex_indices:
-        simplex = tri.simplices[simplex_idx]
-        pixel_mask = (simplex_indices_orig == simplex_idx)
-        if not np.any(pixel_mask):
-            continue
-
-        pt1_orig = original_points_array[simplex[0]]
-        pt2_orig = original_points_array[simplex[1]]
-        pt3_orig = original_points_array[simplex[2]]
-        pt1_trans = transformed_points_array[simplex[0]]
-        pt2_trans = transformed_points_array[simplex[1]]
-        pt3_trans = transformed_points_array[simplex[2]]
-
-        src_triangle = np.array([pt1_orig, pt2_orig, pt3_orig], dtype=np.float32)
-        dst_triangle = np.array([pt1_trans, pt2_trans, pt3_trans], dtype=np.float32)
-
-        v1 = dst_triangle[1] - dst_triangle[0]
-        v2 = dst_triangle[2] - dst_triangle[0]
-        cross_product = v1[0] * v2[1] - v1[1] * v2[0]
-        triangle_area = abs(cross_product) / 2.0
-
-        v1_orig = src_triangle[1] - src_triangle[0]
-        v2_orig = src_triangle[2] - src_triangle[0]
-        cross_product_orig = v1_orig[0] * v2_orig[1] - v1_orig[1] * v2_orig[0]
-        triangle_area_orig = abs(cross_product_orig) / 2.0
-
-        iris_indices = {468, 469, 470, 471, 472, 473, 474, 475, 476, 477}
-        is_iris_triangle = any(idx in iris_indices for idx in simplex)
-        is_flipped = (cross_product * cross_product_orig < 0)
-
-        if is_iris_triangle:
-            area_threshold = 0.0
-        elif triangle_area_orig < 10.0:
-            area_threshold = 0.05
-        else:
-            area_threshold = 0.02
-
-        if is_flipped:
-            dst_triangle = src_triangle.copy()
-        elif area_threshold > 0 and (triangle_area < triangle_area_orig * area_threshold or triangle_area < 1.0):
-            if not (is_iris_triangle and triangle_area_orig > 0.5 and triangle_area > 0.5):
-                dst_triangle = src_triangle.copy()
-
-        min_area_threshold = 0.5 if is_iris_triangle else 0.1
-        if triangle_area_orig < min_area_threshold or triangle_area < min_area_threshold:
-            if not is_iris_triangle or triangle_area_orig < 0.5:
-                dst_triangle = src_triangle.copy()
-
-        dist12 = np.linalg.norm(dst_triangle[1] - dst_triangle[0])
-        dist13 = np.linalg.norm(dst_triangle[2] - dst_triangle[0])
-        dist23 = np.linalg.norm(dst_triangle[2] - dst_triangle[1])
-        min_side_length = min(dist12, dist13, dist23)
-        if min_side_length < 0.5:
-            dst_triangle = src_triangle.copy()
-
-        try:
-            M_forward = cv2.getAffineTransform(src_triangle, dst_triangle)
-            det = M_forward[0, 0] * M_forward[1, 1] - M_forward[0, 1] * M_forward[1, 0]
-            if abs(det) < 1e-6:
-                dst_triangle = src_triangle.copy()
-                M_forward = cv2.getAffineTransform(src_triangle, dst_triangle)
-        except Exception:
-            dst_triangle = src_triangle.copy()
-            M_forward = cv2.getAffineTransform(src_triangle, dst_triangle)
-
-        triangle_pixels_orig = pixel_coords_orig_global[pixel_mask]
-        ones = np.ones((len(triangle_pixels_orig), 1), dtype=np.float32)
-        triangle_pixels_orig_homogeneous = np.hstack([triangle_pixels_orig, ones])
-        transformed_coords = (M_forward @ triangle_pixels_orig_homogeneous.T).T
-
-        pixel_indices_bbox = np.where(pixel_mask)[0]
-        if len(pixel_indices_bbox) == 0:
-            continue
-
-        orig_y_coords_bbox = pixel_indices_bbox // bbox_width
-        orig_x_coords_bbox = pixel_indices_bbox % bbox_width
-        orig_y_coords = orig_y_coords_bbox + min_y
-        orig_x_coords = orig_x_coords_bbox + min_x
-
-        trans_x = transformed_coords[:, 0]
-        trans_y = transformed_coords[:, 1]
-        x0 = np.floor(trans_x).astype(np.int32)
-        y0 = np.floor(trans_y).astype(np.int32)
-        x1 = x0 + 1
-        y1 = y0 + 1
-        fx = trans_x - x0.astype(np.float32)
-        fy = trans_y - y0.astype(np.float32)
-        w00 = (1 - fx) * (1 - fy)
-        w01 = (1 - fx) * fy
-        w10 = fx * (1 - fy)
-        w11 = fx * fy
-        pixel_values = working_img[orig_y_coords, orig_x_coords].astype(np.float32)
-
-        valid_00 = (y0 >= 0) & (y0 < working_height) & (x0 >= 0) & (x0 < working_width)
-        valid_01 = (y1 >= 0) & (y1 < working_height) & (x0 >= 0) & (x0 < working_width)
-        valid_10 = (y0 >= 0) & (y0 < working_height) & (x1 >= 0) & (x1 < working_width)
-        valid_11 = (y1 >= 0) & (y1 < working_height) & (x1 >= 0) & (x1 < working_width)
-
-        def _accumulate(mask, xs, ys, weights):
-            if mask.size == 0:
-                return
-            y_valid = ys[mask]
-            x_valid = xs[mask]
-            weight_valid = weights[mask]
-            pixel_vals = pixel_values[mask]
-            weighted_vals = pixel_vals * weight_valid[:, np.newaxis]
-            np.add.at(result, (y_valid, x_valid), weighted_vals)
-            np.add.at(result_count, (y_valid, x_valid), weight_valid)
-            transformed_mask[y_valid, x_valid] = True
-
-        _accumulate(np.where(valid_00)[0], x0, y0, w00)
-        _accumulate(np.where(valid_01)[0], x0, y1, w01)
-        _accumulate(np.where(valid_10)[0], x1, y0, w10)
-        _accumulate(np.where(valid_11)[0], x1, y1, w11)
-
-        out_of_bounds_mask = (trans_x < 0) | (trans_x >= working_width) | (trans_y < 0) | (trans_y >= working_height)
-        out_of_bounds_indices = np.where(out_of_bounds_mask)[0]
-        if len(out_of_bounds_indices) > 0:
-            trans_x_clipped = np.clip(trans_x[out_of_bounds_indices], 0, working_width - 1).astype(np.int32)
-            trans_y_clipped = np.clip(trans_y[out_of_bounds_indices], 0, working_height - 1).astype(np.int32)
-            out_of_bounds_weight = 0.3
-            pixel_values_oob = pixel_values[out_of_bounds_indices]
-            weighted_values_oob = pixel_values_oob * out_of_bounds_weight
-            np.add.at(result, (trans_y_clipped, trans_x_clipped), weighted_values_oob)
-            np.add.at(result_count, (trans_y_clipped, trans_x_clipped), out_of_bounds_weight)
-            pixels_out_of_bounds += len(out_of_bounds_indices)
-
-        total_pixels_processed += len(pixel_indices_bbox)
+    # 픽셀마다 자기 삼각형의 아핀을 붙여 한 번에 변환 (pixel_order는 삼각형 순서로 묶여 있음)
+    pixel_indices_bbox = pixel_order[:simplex_offsets[-1]]
+    pixel_affines = np.repeat(affines, np.diff(simplex_offsets)[valid_simplex_indices], axis=0)
+    total_pixels_processed = len(pixel_indices_bbox)
+    if total_pixels_processed == 0:
+        return result, result_count, transformed_mask, 0, 0
+
+    orig_coords = pixel_coords_orig_global[pixel_indices_bbox].astype(np.float64)
+    trans_x = (pixel_affines[:, 0, 0] * orig_coords[:, 0] + pixel_affines[:, 0, 1] * orig_coords[:, 1]
+               + pixel_affines[:, 0, 2])
+    trans_y = (pixel_affines[:, 1, 0] * orig_coords[:, 0] + pixel_affines[:, 1, 1] * orig_coords[:, 1]
+               + pixel_affines[:, 1, 2])
+    del pixel_affines
+
+    orig_y_coords = pixel_indices_bbox // bbox_width + min_y
+    orig_x_coords = pixel_indices_bbox % bbox_width + min_x
+    pixel_values = working_img[orig_y_coords, orig_x_coords].astype(np.float32)
+
+    x0 = np.floor(trans_x).astype(np.int64)
+    y0 = np.floor(trans_y).astype(np.int64)
+    fx = trans_x - x0
+    fy = trans_y - y0
+
+    # 목적지 픽셀 4곳에 이중선형 가중치로 누적 (np.add.at 대신 공용 누적 커널)
+    flat_result = result.reshape(-1, result.shape[2])
+    flat_count = result_count.reshape(-1)
+    flat_mask = transformed_mask.reshape(-1)
+    for dx, dy, weights in ((0, 0, (1 - fx) * (1 - fy)), (0, 1, (1 - fx) * fy),
+                            (1, 0, fx * (1 - fy)), (1, 1, fx * fy)):
+        xs = x0 + dx
+        ys = y0 + dy
+        valid = np.flatnonzero((ys >= 0) & (ys < working_height) & (xs >= 0) & (xs < working_width))
+        kernels.accumulate(ys[valid] * working_width + xs[valid], weights[valid], pixel_values[valid],
+                           flat_result, flat_count, flat_mask)
+
+    # 이미지 밖으로 나간 픽셀은 가장자리에 약한 가중치로 누적
+    out_of_bounds_indices = np.flatnonzero(
+        (trans_x < 0) | (trans_x >= working_width) | (trans_y < 0) | (trans_y >= working_height))
+    pixels_out_of_bounds = len(out_of_bounds_indices)
+    if pixels_out_of_bounds > 0:
+        trans_x_clipped = np.clip(trans_x[out_of_bounds_indices], 0, working_width - 1).astype(np.int64)
+        trans_y_clipped = np.clip(trans_y[out_of_bounds_indices], 0, working_height - 1).astype(np.int64)
+        out_of_bounds_weight = np.full(pixels_out_of_bounds, 0.3, dtype=np.float32)
+        kernels.accumulate(trans_y_clipped * working_width + trans_x_clipped, out_of_bounds_weight,
+                           pixel_values[out_of_bounds_indices], flat_result, flat_count)
 
     return result, result_count, transformed_mask, total_pixels_processed, pixels_out_of_bounds
 
 
+def _apply_inverse_remap(*, delaunay_ctx: DelaunayContext, region=None, tile_count=None) -> np.ndarray:
+    """
+    역매핑(gather) 렌더링: 변형된 포인트 위치의 삼각형에서 목적지 픽셀마다 원본 좌표를 구해
+    cv2.remap 한 번으로 샘플링합니다. 모든 목적지 픽셀이 값을 받으므로 inpaint가 필요 없습니다.
+    목적지 픽셀마다 독립적으로 계산하므로 region만 렌더링해도 전체 렌더링의 같은 영역과 같고,
+    행 띠로 나눠 여러 스레드에서 렌더링해도 결과가 같습니다.
+
+    Args:
+        delaunay_ctx: Delaunay 컨텍스트
+        region: 렌더링할 영역 (min_x, min_y, max_x, max_y, 작업 해상도), None이면 바운딩 박스 전체
+        tile_count: 행 띠 수 (None이면 렌더링 스레드 수, 1이면 호출한 스레드에서만 렌더링)
+
+    Returns:
+        작업 해상도 결과 이미지 (uint8, 렌더링 영역 밖은 작업 이미지 그대로)
+        버퍼 풀에서 빌린 배열이므로 다 쓰면 돌려줍니다 (_finalize_result_image(borrowed=True) 등).
+    """
+    working_img = delaunay_ctx.working_img
+    min_x, min_y = delaunay_ctx.min_x, delaunay_ctx.min_y
+    max_x, max_y = delaunay_ctx.max_x, delaunay_ctx.max_y
+    if region is not None:
+        min_x, min_y = max(min_x, region[0]), max(min_y, region[1])
+        max_x, max_y = min(max_x, region[2]), min(max_y, region[3])
+    pool = get_buffer_pool()
+    result = pool.acquire(working_img.shape, working_img.dtype)
+    np.copyto(result, working_img)
+    if max_x <= min_x or max_y <= min_y:
+        return result
+
+    original_points_array = np.asarray(delaunay_ctx.original_points_array, dtype=np.float64)
+    transformed_points_array = np.asarray(delaunay_ctx.transformed_points_array, dtype=np.float64)
+    if hasattr(delaunay_ctx.tri, 'relocated'):
+        # 고정 토폴로지: 같은 삼각형을 변형된 포인트 위치로 래스터화
+        dst_tri = delaunay_ctx.tri.relocated(transformed_points_array)
+    else:
+        dst_tri = Delaunay(transformed_points_array)
+
+    # 변형 후 삼각형 -> 원본 삼각형 아핀 (같은 꼭짓점 인덱스)
+    inverse_affines = _solve_affines(transformed_points_array[dst_tri.simplices],
+                                     original_points_array[dst_tri.simplices])
+
+    def _render_tile(row_start, row_stop):
+        # 좌표 격자/매핑 배열은 풀에서 빌려 채움 (드래그 중 같은 크기 띠가 반복됨)
+        tile_shape = (row_stop - row_start, max_x - min_x)
+        map_x = pool.acquire(tile_shape, np.float32)
+        map_y = pool.acquire(tile_shape, np.float32)
+        dst_coords = pool.acquire((map_x.size, 2), np.float64)
+        map_x[:] = np.arange(min_x, max_x, dtype=np.float32)
+        map_y[:] = np.arange(row_start, row_stop, dtype=np.float32)[:, np.newaxis]
+        flat_x = map_x.reshape(-1)
+        flat_y = map_y.reshape(-1)
+        dst_coords[:, 0] = flat_x
+        dst_coords[:, 1] = flat_y
+        simplex_indices = _find_simplex_chunked(dst_tri, dst_coords)
+
+        # 삼각형 밖 픽셀은 제자리 (항등 매핑)
+        inside = np.flatnonzero(simplex_indices >= 0)
+        affine = inverse_affines[simplex_indices[inside]]
+        px = dst_coords[inside, 0]
+        py = dst_coords[inside, 1]
+        flat_x[inside] = affine[:, 0, 0] * px + affine[:, 0, 1] * py + affine[:, 0, 2]
+        flat_y[inside] = affine[:, 1, 0] * px + affine[:, 1, 1] * py + affine[:, 1, 2]
+
+        result[row_start:row_stop, min_x:max_x] = cv2.remap(
+            working_img, map_x, map_y,
+            interpolation=cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE,
+        )
+        pool.release(map_x, map_y, dst_coords)
+
+    render_row_tiles(min_y, max_y, _render_tile, tile_count)
+    return result
+
+
+def _apply_cached_remap(*, delaunay_ctx: DelaunayContext, tile_count=None) -> np.ndarray:
+    """
+    캐시된 무게중심 필드로 remap 렌더링합니다.
+    원본 포인트와 바운딩 박스가 같으면 필드를 다시 계산하지 않으므로,
+    프레임마다 꼭짓점 이동량 가중합과 cv2.remap만 수행합니다.
+    변위 필드는 한 번만 만들고, 역매핑 좌표와 샘플링은 행 띠별로 나눠 렌더링합니다.
+
+    Returns:
+        작업 해상도 결과 이미지 (uint8, 바운딩 박스 밖은 작업 이미지 그대로)
+        버퍼 풀에서 빌린 배열이므로 다 쓰면 돌려줍니다 (_finalize_result_image(borrowed=True) 등).
+    """
+    working_img = delaunay_ctx.working_img
+    min_x, min_y = delaunay_ctx.min_x, delaunay_ctx.min_y
+    max_x, max_y = delaunay_ctx.max_x, delaunay_ctx.max_y
+    pool = get_buffer_pool()
+    result = pool.acquire(working_img.shape, working_img.dtype)
+    np.copyto(result, working_img)
+    if max_x <= min_x or max_y <= min_y:
+        return result
+
+    field = get_barycentric_field(delaunay_ctx.tri, delaunay_ctx.original_points_array,
+                                  (min_x, min_y, max_x, max_y))
+    displacement = field.displacement(delaunay_ctx.original_points_array,
+                                      delaunay_ctx.transformed_points_array)
+
+    def _render_tile(row_start, row_stop):
+        map_x, map_y = field.inverse_map(displacement, row_start - min_y, row_stop - min_y)
+        result[row_start:row_stop, min_x:max_x] = cv2.remap(
+            working_img, map_x, map_y,
+            interpolation=cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE,
+        )
+        pool.release(map_x, map_y)
+
+    render_row_tiles(min_y, max_y, _render_tile, tile_count)
+    pool.release(displacement)
+    return result
+
+
 def _compose_result_image(*,
                           delaunay_ctx: DelaunayContext,
                           result: np.ndarray,
                           result_count: np.ndarray,
                           transformed_mask: np.ndarray,
                           blend_ratio: float) -> Image.Image:
-    """Normalize, fill, upsample and blend to create the final PIL image."""
+    """Normalize, fill, upsample and blend to create the final PIL image.
+
+    result는 제자리에서 정규화되며, 중간 float 배열은 버퍼 풀에서 빌려 쓰고 돌려줍니다.
+    """
 
-    img_array = delaunay_ctx.img_array
     working_img = delaunay_ctx.working_img
-    scale_factor = delaunay_ctx.scale_factor
-    min_x = delaunay_ctx.min_x
-    min_y = delaunay_ctx.min_y
-    max_x = delaunay_ctx.max_x
-    max_y = delaunay_ctx.max_y
-    min_x_orig_bbox = delaunay_ctx.min_x_orig_bbox
-    min_y_orig_bbox = delaunay_ctx.min_y_orig_bbox
-    max_x_orig_bbox = delaunay_ctx.max_x_orig_bbox
-    max_y_orig_bbox = delaunay_ctx.max_y_orig_bbox
+    pool = get_buffer_pool()
 
     blend_ratio = max(0.0, min(1.0, blend_ratio))
-    result_count_safe = np.maximum(result_count, 1e-6)
-    result_normalized = result / result_count_safe[:, :, np.newaxis]
+    result_count_safe = pool.acquire(result_count.shape, np.float32)
+    np.maximum(result_count, 1e-6, out=result_count_safe)
+    result_normalized = np.divide(result, result_count_safe[:, :, np.newaxis], out=result)
 
+    working_img_float = None
+    transformed_only = None
     if blend_ratio == 1.0:
         transformed_pixel_mask = (result_count > 1.0 + 1e-6)
         if np.any(transformed_pixel_mask):
-            mask_3d = transformed_pixel_mask[:, :, np.newaxis]
-            working_img_float = working_img.astype(np.float32)
+            working_img_float = pool.acquire(working_img.shape, np.float32)
+            np.copyto(working_img_float, working_img)
             result_count_float = result_count[:, :, np.newaxis]
-            result_count_minus_one = np.maximum(result_count_float - 1.0, 1e-6)
-            transformed_only = (result_normalized * result_count_float - working_img_float) / result_count_minus_one
-            result_normalized = np.where(mask_3d, transformed_only, working_img_float)
+            result_count_minus_one = np.subtract(result_count, 1.0, out=result_count_safe)
+            np.maximum(result_count_minus_one, 1e-6, out=result_count_minus_one)
+            # (정규화 값 * 가중치 합 - 원본) / (가중치 합 - 1): 원본 기여분을 뺀 변형 픽셀 값
+            transformed_only = pool.acquire(result.shape, np.float32)
+            np.multiply(result_normalized, result_count_float, out=transformed_only)
+            np.subtract(transformed_only, working_img_float, out=transformed_only)
+            np.divide(transformed_only, result_count_minus_one[:, :, np.newaxis], out=transformed_only)
+            # 변형된 픽셀만 바꾸고 나머지는 원본 (np.where와 같음)
+            np.copyto(working_img_float, transformed_only, where=transformed_pixel_mask[:, :, np.newaxis])
+            result_normalized = working_img_float
 
     result_final = result_normalized.astype(np.uint8)
+    pool.release(result_count_safe, working_img_float, transformed_only)
     empty_mask = (result_count < 1e-6)
     if np.any(empty_mask):
         empty_ratio = np.sum(empty_mask) / (result_count.size)
@@ -1248,8 +1373,34 @@ def _compose_result_image(*,
         else:
             result_final[empty_mask] = working_img[empty_mask]
 
+    return _finalize_result_image(delaunay_ctx=delaunay_ctx, result_final=result_final, blend_ratio=blend_ratio)
+
+
+def _finalize_result_image(*,
+                           delaunay_ctx: DelaunayContext,
+                           result_final: np.ndarray,
+                           blend_ratio: float,
+                           borrowed: bool = False) -> Image.Image:
+    """Upsample the working-resolution result and blend with the original image.
+
+    borrowed=True면 result_final은 버퍼 풀에서 빌린 배열(remap 결과)로 보고, 이미지를 만든 뒤 풀에 돌려줍니다.
+    """
+
+    borrowed_array = result_final if borrowed else None
+    img_array = delaunay_ctx.img_array
+    scale_factor = delaunay_ctx.scale_factor
+    min_x = delaunay_ctx.min_x
+    min_y = delaunay_ctx.min_y
+    max_x = delaunay_ctx.max_x
+    max_y = delaunay_ctx.max_y
+    min_x_orig_bbox = delaunay_ctx.min_x_orig_bbox
+    min_y_orig_bbox = delaunay_ctx.min_y_orig_bbox
+    max_x_orig_bbox = delaunay_ctx.max_x_orig_bbox
+    max_y_orig_bbox = delaunay_ctx.max_y_orig_bbox
+    blend_ratio = max(0.0, min(1.0, blend_ratio))
+
     if scale_factor < 1.0 and min_x_orig_bbox is not None:
-        result_full = img_array.copy().astype(np.float32)
+        result_full = img_array.copy()
         bbox_result = result_final[min_y:max_y, min_x:max_x].copy()
         bbox_result_height, bbox_result_width = bbox_result.shape[:2]
         min_x_orig = max(0, min_x_orig_bbox)
@@ -1264,22 +1415,35 @@ def _compose_result_image(*,
                 (bbox_width_orig, bbox_height_orig),
                 interpolation=cv2.INTER_LINEAR,
             )
-            result_full[min_y_orig:max_y_orig, min_x_orig:max_x_orig] = bbox_result_upscaled.astype(np.float32)
-        result_final = result_full.astype(np.uint8)
+            result_full[min_y_orig:max_y_orig, min_x_orig:max_x_orig] = bbox_result_upscaled
+        result_final = result_full
 
     if blend_ratio == 0.0:
         result_final = img_array.copy()
     elif 0.0 < blend_ratio < 1.0:
         if result_final.shape[:2] != img_array.shape[:2]:
             result_final = cv2.resize(result_final, (img_array.shape[1], img_array.shape[0]), interpolation=cv2.INTER_LINEAR)
-        result_float = result_final.astype(np.float32)
-        img_array_float = img_array.astype(np.float32)
-        result_final = (img_array_float * (1.0 - blend_ratio) + result_float * blend_ratio).astype(np.uint8)
+        pool = get_buffer_pool()
+        result_float = pool.acquire(result_final.shape, np.float32)
+        img_array_float = pool.acquire(img_array.shape, np.float32)
+        np.copyto(result_float, result_final)
+        np.copyto(img_array_float, img_array)
+        np.multiply(img_array_float, 1.0 - blend_ratio, out=img_array_float)
+        np.multiply(result_float, blend_ratio, out=result_float)
+        result_final = np.add(img_array_float, result_float, out=img_array_float).astype(np.uint8)
+        pool.release(result_float, img_array_float)
     else:
         if result_final.shape[:2] != img_array.shape[:2]:
             result_final = cv2.resize(result_final, (img_array.shape[1], img_array.shape[0]), interpolation=cv2.INTER_LINEAR)
 
-    return Image.fromarray(result_final)
+    if borrowed_array is None:
+        return Image.fromarray(result_final)
+    if result_final is borrowed_array and not (result_final.ndim == 3 and result_final.shape[2] == 3):
+        # RGB가 아닌 배열(RGBA/L)은 PIL 이미지가 배열 메모리를 그대로 쓰므로 복사한 뒤 돌려줌
+        result_final = result_final.copy()
+    final_image = Image.fromarray(result_final)
+    get_buffer_pool().release(borrowed_array)
+    return final_image
 
 def morph_face_by_polygons(image, original_landmarks, transformed_landmarks, selected_point_indices=None,
                            left_iris_center_coord=None, right_iris_center_coord=None,
@@ -1288,7 +1452,9 @@ def morph_face_by_polygons(image, original_landmarks, transformed_landmarks, sel
                            clamping_enabled=True, margin_ratio=0.3, iris_center_only=False,
                            iris_mapping_method="iris_outline",
                            skip_pixel_warp=False,
-                           return_contexts=False):
+                           return_contexts=False,
+                           render_backend="forward",
+                           preview_size=None):
     """
     Delaunay Triangulation을 사용하여 폴리곤(랜드마크 포인트) 기반 얼굴 변형을 수행합니다.
     뒤집힌 삼각형이 발생하면 변형을 점진적으로 줄여서 재시도합니다.
@@ -1310,6 +1476,10 @@ def morph_face_by_polygons(image, original_landmarks, transformed_landmarks, sel
         iris_mapping_method: 눈동자 맵핑 방법 (iris_outline/eye_landmarks, 기본값: "iris_outline")
         skip_pixel_warp: True일 경우 픽셀 변형 단계 없이 컨텍스트만 준비하고 입력 이미지를 반환
         return_contexts: True일 경우 (결과 이미지, 컨텍스트 dict)를 반환
+        render_backend: 픽셀 렌더링 방식 ("forward": 정변환 스플랫, "remap": cv2.remap 역매핑,
+            "cached_remap": 캐시된 무게중심 필드로 역매핑, 기본값: "forward")
+        preview_size: 드래그 중 미리보기 표시 크기 (width, height), 주면 작업 해상도를 이 크기 이하로
+            낮춰 렌더링한 뒤 원본 크기로 되돌림 (None이면 원본 해상도, 큰 이미지만 축소)
     
     Returns:
         PIL.Image: 변형된 이미지
@@ -1362,16 +1532,29 @@ def morph_face_by_polygons(image, original_landmarks, transformed_landmarks, sel
             img_height=img_height,
             iris_ctx=iris_ctx,
             cached_original_bbox=cached_original_bbox,
+            preview_size=preview_size,
         )
+        # 고정 토폴로지는 접힌 삼각형을 래스터화에서 처리하므로 뒤집힘 검사는 Delaunay 삼각형으로 함
         transformed_points_array = _check_and_fix_flipped_triangles(
             delaunay_ctx.original_points_array,
             delaunay_ctx.transformed_points_array,
-            delaunay_ctx.tri,
+            getattr(delaunay_ctx.tri, 'delaunay', None) or delaunay_ctx.tri,
             original_landmarks_no_iris,
         )
         delaunay_ctx.transformed_points_array = transformed_points_array
 
-        render_ctx = _build_pixel_coordinate_map(delaunay_ctx)
+        if render_backend not in RENDER_BACKENDS:
+            print_warning("얼굴모핑", f"알 수 없는 렌더링 방식 '{render_backend}', forward 사용")
+            render_backend = "forward"
+        elif render_backend != "forward" and not _cv2_available:
+            print_warning("얼굴모핑", f"OpenCV가 없어 {render_backend} 렌더링 대신 forward 사용")
+            render_backend = "forward"
+
+        # remap 계열은 따로 좌표를 계산하므로 정변환 픽셀 맵이 필요 없음
+        if render_backend == "forward":
+            render_ctx = _build_pixel_coordinate_map(delaunay_ctx)
+        else:
+            render_ctx = MorphRenderContext()
         contexts = {
             "iris": iris_ctx,
             "delaunay": delaunay_ctx,
@@ -1410,6 +1593,19 @@ def morph_face_by_polygons(image, original_landmarks, transformed_landmarks, sel
         except NameError:
             print(f"[얼굴모핑] selected: {len(selected_point_indices)}개, (max_diff={max_diff:.3f}, changed_count={changed_count})")
 
+        if render_backend != "forward":
+            if render_backend == "cached_remap":
+                result_final = _apply_cached_remap(delaunay_ctx=delaunay_ctx)
+            else:
+                result_final = _apply_inverse_remap(delaunay_ctx=delaunay_ctx)
+            final_image = _finalize_result_image(
+                delaunay_ctx=delaunay_ctx,
+                result_final=result_final,
+                blend_ratio=blend_ratio,
+                borrowed=True,
+            )
+            return _finalize_return(final_image)
+
         result, result_count, transformed_mask, total_pixels_processed, pixels_out_of_bounds = _apply_forward_transforms(
             delaunay_ctx=delaunay_ctx,
             render_ctx=render_ctx,
@@ -1430,6 +1626,12 @@ def morph_face_by_polygons(image, original_landmarks, transformed_landmarks, sel
             transformed_mask=transformed_mask,
             blend_ratio=blend_ratio,
         )
+        pool = get_buffer_pool()
+        pool.release(result, result_count, transformed_mask)
+
+        peak_rss = peak_rss_mb()
+        if peak_rss is not None:
+            print_debug("얼굴모핑", f"최대 RSS: {peak_rss:.1f}MB, 버퍼 풀: {pool.describe()}")
 
         return _finalize_return(final_image)
 
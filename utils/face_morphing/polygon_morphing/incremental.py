@@ -0,0 +1,143 @@
+"""
+점 드래그용 부분 재렌더링
+
+점 하나를 옮겼을 때 바뀌는 픽셀은 그 점에 붙은 삼각형(이전 위치와 새 위치)이 덮는 영역뿐입니다.
+직전 렌더링 결과를 보관해 두고, 원본 이미지/원본 포인트/바운딩 박스/옵션이 같으면
+옮긴 점에 붙은 삼각형의 합집합 영역만 remap으로 다시 계산해 직전 결과에 덮어씁니다.
+
+remap 렌더링은 목적지 픽셀마다 독립적이므로 부분 렌더링 결과는 전체 렌더링과 같습니다.
+단, 목적지 삼각형이 원본과 같은 삼각형(고정 토폴로지를 변형된 위치로 옮긴 것)이어야 하므로,
+변형된 포인트로 다시 삼각분할하는 scipy Delaunay 객체일 때는 매번 전체를 렌더링합니다
+(재삼각분할하면 이전 편집으로 옮겨진 점 주변 삼각형이 바뀌어 바뀐 영역을 삼각형 인덱스로 알 수 없음).
+작업 이미지를 축소하는 큰 이미지나, 바뀐 영역이 너무 넓으면 전체를 다시 렌더링합니다.
+"""
+import numpy as np
+from PIL import Image
+
+from . import core
+from .buffer_pool import get_buffer_pool
+
+# 바뀐 영역이 바운딩 박스 넓이의 이 비율을 넘으면 전체 렌더링
+MAX_DIRTY_RATIO = 0.35
+
+# 바뀐 영역 여백 (픽셀, 이중선형 보간 이웃)
+_DIRTY_PADDING = 2
+
+# 이동으로 보지 않는 좌표 차이
+_MOVE_EPSILON = 1e-6
+
+
+class IncrementalMorphRenderer:
+    """
+    직전 결과를 재사용하는 폴리곤 모핑 렌더러 (remap 렌더링)
+
+    사용 예:
+        renderer = IncrementalMorphRenderer()
+        result = renderer.render(image, original_landmarks, transformed_landmarks, blend_ratio=1.0, ...)
+    """
+
+    def __init__(self, max_dirty_ratio=MAX_DIRTY_RATIO):
+        self.max_dirty_ratio = max_dirty_ratio
+        self.last_region = None
+        self.last_full = False
+        self._state = None
+
+    def reset(self):
+        """보관한 직전 결과 버리기"""
+        self._state = None
+
+    def render(self, image, original_landmarks, transformed_landmarks, **morph_kwargs):
+        """
+        morph_face_by_polygons와 같은 인자로 렌더링 (render_backend는 항상 remap)
+
+        Returns:
+            PIL.Image: 변형된 이미지
+        """
+        morph_kwargs = {key: value for key, value in morph_kwargs.items()
+                        if key not in ('render_backend', 'skip_pixel_warp', 'return_contexts')}
+        _, contexts = core.morph_face_by_polygons(
+            image, original_landmarks, transformed_landmarks,
+            skip_pixel_warp=True, return_contexts=True, render_backend="remap", **morph_kwargs,
+        )
+        if contexts is None:
+            self._state = None
+            return core.morph_face_by_polygons(image, original_landmarks, transformed_landmarks,
+                                               render_backend="remap", **morph_kwargs)
+
+        delaunay_ctx = contexts["delaunay"]
+        blend_ratio = morph_kwargs.get('blend_ratio', 1.0)
+        key = (
+            id(image), image.size, blend_ratio,
+            delaunay_ctx.min_x, delaunay_ctx.min_y, delaunay_ctx.max_x, delaunay_ctx.max_y,
+        )
+        original_points = np.asarray(delaunay_ctx.original_points_array, dtype=np.float64)
+        transformed_points = np.asarray(delaunay_ctx.transformed_points_array, dtype=np.float64)
+
+        region = self._dirty_region(key, delaunay_ctx, original_points, transformed_points)
+        if region is None:
+            result_array = np.asarray(core._finalize_result_image(
+                delaunay_ctx=delaunay_ctx,
+                result_final=core._apply_inverse_remap(delaunay_ctx=delaunay_ctx),
+                blend_ratio=blend_ratio,
+                borrowed=True,
+            ))
+            self.last_full = True
+        else:
+            result_array = self._state['result'].copy()
+            if region[2] > region[0] and region[3] > region[1]:
+                x0, y0, x1, y1 = region
+                rendered = core._apply_inverse_remap(delaunay_ctx=delaunay_ctx, region=region)
+                result_array[y0:y1, x0:x1] = self._blend(delaunay_ctx.img_array[y0:y1, x0:x1],
+                                                         rendered[y0:y1, x0:x1], blend_ratio)
+                get_buffer_pool().release(rendered)
+            self.last_full = False
+        self.last_region = region
+
+        self._state = {
+            'key': key,
+            'image': image,
+            'original': original_points,
+            'transformed': transformed_points,
+            'result': result_array,
+        }
+        return Image.fromarray(result_array)
+
+    @staticmethod
+    def _blend(original, rendered, blend_ratio):
+        """_finalize_result_image와 같은 블렌딩 (축소하지 않은 작업 이미지 기준)"""
+        blend_ratio = max(0.0, min(1.0, blend_ratio))
+        if blend_ratio == 0.0:
+            return original
+        if blend_ratio == 1.0:
+            return rendered
+        return (original.astype(np.float32) * (1.0 - blend_ratio)
+                + rendered.astype(np.float32) * blend_ratio).astype(np.uint8)
+
+    def _dirty_region(self, key, delaunay_ctx, original_points, transformed_points):
+        """부분 렌더링할 영역 (min_x, min_y, max_x, max_y), 전체를 다시 렌더링해야 하면 None"""
+        state = self._state
+        if (state is None or state['key'] != key or delaunay_ctx.scale_factor != 1.0
+                or not hasattr(delaunay_ctx.tri, 'relocated')
+                or state['original'].shape != original_points.shape
+                or not np.array_equal(state['original'], original_points)
+                or state['transformed'].shape != transformed_points.shape):
+            return None
+
+        moved = np.flatnonzero(np.any(np.abs(transformed_points - state['transformed']) > _MOVE_EPSILON, axis=1))
+        if len(moved) == 0:
+            return (0, 0, 0, 0)
+
+        simplices = delaunay_ctx.tri.simplices
+        incident = simplices[np.isin(simplices, moved).any(axis=1)]
+        corners = np.concatenate([state['transformed'][incident].reshape(-1, 2),
+                                  transformed_points[incident].reshape(-1, 2)])
+        x0 = max(delaunay_ctx.min_x, int(np.floor(corners[:, 0].min())) - _DIRTY_PADDING)
+        y0 = max(delaunay_ctx.min_y, int(np.floor(corners[:, 1].min())) - _DIRTY_PADDING)
+        x1 = min(delaunay_ctx.max_x, int(np.ceil(corners[:, 0].max())) + 1 + _DIRTY_PADDING)
+        y1 = min(delaunay_ctx.max_y, int(np.ceil(corners[:, 1].max())) + 1 + _DIRTY_PADDING)
+
+        bbox_area = (delaunay_ctx.max_x - delaunay_ctx.min_x) * (delaunay_ctx.max_y - delaunay_ctx.min_y)
+        dirty_area = max(0, x1 - x0) * max(0, y1 - y0)
+        if bbox_area <= 0 or dirty_area > bbox_area * self.max_dirty_ratio:
+            return None
+        return (x0, y0, x1, y1)
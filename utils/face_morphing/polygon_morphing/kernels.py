@@ -0,0 +1,184 @@
+"""
+정변환(forward) 스플랫 누적 커널
+
+정변환 렌더링은 원본 픽셀마다 변형 위치 주변 목적지 픽셀에 이중선형 가중치로 색과 가중치를 더합니다.
+np.add.at은 항목마다 느린 경로를 거치므로, 한 프레임의 항목을 모아 한 번에 누적합니다.
+- numba가 설치되어 있으면: 컴파일된 루프 (항목이 많으면 스레드별 버퍼에 나눠 더한 뒤 픽셀별로 합침)
+- 없으면: np.bincount (평탄화된 목적지 인덱스별 합을 float64로 한 번에 계산)
+
+numba 커널은 첫 호출 때 컴파일되므로, warm_up()으로 편집 창을 열 때 미리 컴파일해 둡니다
+(cache=True라 두 번째 실행부터는 디스크 캐시를 읽습니다).
+컴파일이나 실행에 실패하면 경고를 남기고 bincount 누적으로 바꿉니다.
+"""
+import threading
+
+import numpy as np
+
+try:
+    import numba
+    from numba import njit, prange
+    _numba_available = True
+except ImportError:
+    numba = None
+    _numba_available = False
+
+try:
+    from utils.logger import print_debug, print_warning
+except ImportError:
+    def print_debug(module, msg):
+        print(f"[{module}] DEBUG: {msg}")
+
+    def print_warning(module, msg):
+        print(f"[{module}] WARNING: {msg}")
+
+# 이 항목 수 이상이면 스레드별 버퍼 병렬 누적 (적으면 버퍼를 합치는 비용이 더 큼)
+PARALLEL_MIN_ENTRIES = 200000
+
+# 스레드별 누적 버퍼 전체 크기 상한 (바이트)
+PARALLEL_BUFFER_BUDGET = 64 * 1024 * 1024
+
+_warm_up_lock = threading.Lock()
+_warmed_up = False
+
+
+if _numba_available:
+    @njit(cache=True)
+    def _accumulate_serial(dest_idx, weights, values, result, count, mask, use_mask):
+        channels = values.shape[1]
+        for i in range(dest_idx.shape[0]):
+            idx = dest_idx[i]
+            w = weights[i]
+            count[idx] += w
+            if use_mask:
+                mask[idx] = True
+            for c in range(channels):
+                result[idx, c] += values[i, c] * w
+
+    @njit(cache=True, parallel=True)
+    def _accumulate_parallel(dest_idx, weights, values, result, count, mask, use_mask, num_buffers):
+        size = count.shape[0]
+        channels = values.shape[1]
+        total = dest_idx.shape[0]
+        buffer_result = np.zeros((num_buffers, size, channels), dtype=np.float32)
+        buffer_count = np.zeros((num_buffers, size), dtype=np.float32)
+        # 항목을 연속 구간으로 나눠 버퍼마다 따로 누적
+        for k in prange(num_buffers):
+            start = total * k // num_buffers
+            stop = total * (k + 1) // num_buffers
+            for i in range(start, stop):
+                idx = dest_idx[i]
+                w = weights[i]
+                buffer_count[k, idx] += w
+                if use_mask:
+                    mask[idx] = True
+                for c in range(channels):
+                    buffer_result[k, idx, c] += values[i, c] * w
+        # 픽셀별로 버퍼 순서대로 합침 (버퍼 수가 같으면 결과도 같음)
+        for p in prange(size):
+            for k in range(num_buffers):
+                count[p] += buffer_count[k, p]
+                for c in range(channels):
+                    result[p, c] += buffer_result[k, p, c]
+
+
+def is_numba_available():
+    """numba 누적 커널 사용 가능 여부"""
+    return _numba_available
+
+
+def _disable_numba(error):
+    global _numba_available
+    _numba_available = False
+    print_warning("얼굴모핑", f"numba 누적 커널 사용 실패, bincount 누적 사용: {error}")
+
+
+def _accumulate_bincount(dest_idx, weights, values, result, count, mask=None):
+    """np.bincount로 목적지 픽셀별 합을 한 번에 계산해 더합니다."""
+    size = count.shape[0]
+    weights = np.asarray(weights, dtype=np.float64)
+    count += np.bincount(dest_idx, weights=weights, minlength=size)
+    for c in range(result.shape[1]):
+        result[:, c] += np.bincount(dest_idx, weights=values[:, c] * weights, minlength=size)
+    if mask is not None:
+        mask[dest_idx] = True
+
+
+def _parallel_buffer_count(entries, size, channels):
+    """스레드별 버퍼 수 (항목이 적거나 버퍼가 예산을 넘으면 1)"""
+    if entries < PARALLEL_MIN_ENTRIES:
+        return 1
+    buffer_bytes = size * (channels + 1) * 4
+    return max(1, min(numba.get_num_threads(), PARALLEL_BUFFER_BUDGET // max(buffer_bytes, 1)))
+
+
+def accumulate(dest_idx, weights, values, result, count, mask=None):
+    """
+    목적지 픽셀에 가중치를 곱한 색과 가중치를 더합니다 (제자리 갱신).
+
+    Args:
+        dest_idx: 평탄화된 목적지 픽셀 인덱스 (N,)
+        weights: 항목별 가중치 (N,)
+        values: 항목별 원본 색 (N, C), 가중치를 곱하기 전 값
+        result: 평탄화된 색 누적 버퍼 (P, C) float32
+        count: 평탄화된 가중치 누적 버퍼 (P,) float32
+        mask: 값을 받은 픽셀 표시 (P,) bool, None이면 표시하지 않음
+    """
+    if len(dest_idx) == 0:
+        return
+    if _numba_available:
+        dest_idx = np.ascontiguousarray(dest_idx, dtype=np.int64)
+        weights = np.ascontiguousarray(weights, dtype=np.float32)
+        values = np.ascontiguousarray(values, dtype=np.float32)
+        use_mask = mask is not None
+        mask_buffer = mask if use_mask else np.zeros(1, dtype=np.bool_)
+        try:
+            num_buffers = _parallel_buffer_count(len(dest_idx), count.shape[0], values.shape[1])
+            if num_buffers > 1:
+                _accumulate_parallel(dest_idx, weights, values, result, count, mask_buffer, use_mask, num_buffers)
+            else:
+                _accumulate_serial(dest_idx, weights, values, result, count, mask_buffer, use_mask)
+            return
+        except Exception as e:
+            _disable_numba(e)
+    _accumulate_bincount(dest_idx, weights, values, result, count, mask)
+
+
+def _compile_kernels():
+    global _warmed_up
+    with _warm_up_lock:
+        if _warmed_up or not _numba_available:
+            return
+        dest_idx = np.array([0, 1, 1], dtype=np.int64)
+        weights = np.ones(3, dtype=np.float32)
+        values = np.ones((3, 3), dtype=np.float32)
+        for use_mask in (True, False):
+            try:
+                _accumulate_serial(dest_idx, weights, values, np.zeros((2, 3), dtype=np.float32),
+                                   np.zeros(2, dtype=np.float32), np.zeros(2, dtype=np.bool_), use_mask)
+                _accumulate_parallel(dest_idx, weights, values, np.zeros((2, 3), dtype=np.float32),
+                                     np.zeros(2, dtype=np.float32), np.zeros(2, dtype=np.bool_), use_mask, 2)
+            except Exception as e:
+                _disable_numba(e)
+                return
+        _warmed_up = True
+        print_debug("얼굴모핑", "numba 누적 커널 컴파일 완료")
+
+
+def warm_up(background=True):
+    """
+    numba 커널을 작은 입력으로 미리 컴파일합니다 (numba가 없으면 아무것도 하지 않음).
+
+    Args:
+        background: True면 데몬 스레드에서 컴파일하고 스레드를 반환
+
+    Returns:
+        threading.Thread 또는 None
+    """
+    if not _numba_available or _warmed_up:
+        return None
+    if not background:
+        _compile_kernels()
+        return None
+    thread = threading.Thread(target=_compile_kernels, name='morph_kernel_warmup', daemon=True)
+    thread.start()
+    return thread
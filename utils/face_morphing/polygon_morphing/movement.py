@@ -20,6 +20,8 @@
 import numpy as np
 from PIL import Image
 
+from utils.landmarks import Landmarks, as_landmarks, as_point_array
+
 from ..constants import _cv2_available, _cv2_cuda_available, _scipy_available, _landmarks_available, _delaunay_cache, _delaunay_cache_max_size
 
 # 외부 모듈 import
@@ -52,9 +54,10 @@ def move_point_group(landmarks, group_name, offset_x=0.0, offset_y=0.0, maintain
         offset_x: 수평 이동 (픽셀)
         offset_y: 수직 이동 (픽셀)
         maintain_relative_positions: 그룹 내부 랜드마크 간 상대적 위치 유지 여부 (기본값: True)
+            중심 기준 이동도 결과적으로 모든 포인트를 같은 오프셋만큼 평행 이동하므로 결과는 동일합니다.
     
     Returns:
-        transformed_landmarks: 변형된 랜드마크 포인트 리스트
+        transformed_landmarks: 변형된 랜드마크 (Landmarks)
     """
     if landmarks is None or len(landmarks) == 0:
         return landmarks
@@ -63,9 +66,7 @@ def move_point_group(landmarks, group_name, offset_x=0.0, offset_y=0.0, maintain
         return landmarks
     
     try:
-        from utils.face_landmarks import LEFT_EYE_INDICES, RIGHT_EYE_INDICES, NOSE_TIP_INDEX, MOUTH_INDICES
-        
-        transformed_landmarks = list(landmarks)
+        from utils.face_landmarks import LEFT_EYE_INDICES, RIGHT_EYE_INDICES
         
         # 그룹별 인덱스 결정
         if group_name == 'left_eye':
@@ -89,32 +90,7 @@ def move_point_group(landmarks, group_name, offset_x=0.0, offset_y=0.0, maintain
         else:
             return landmarks
         
-        if maintain_relative_positions:
-            # 그룹 내부 랜드마크 간 상대적 위치 유지 (모든 포인트를 동일한 오프셋으로 이동)
-            for idx in group_indices:
-                if idx < len(landmarks):
-                    x, y = landmarks[idx]
-                    transformed_landmarks[idx] = (
-                        x + offset_x,
-                        y + offset_y
-                    )
-        else:
-            # 그룹 중심 기준으로 이동 (중심점 계산 후 상대적 위치 유지하며 이동)
-            group_points = [landmarks[i] for i in group_indices if i < len(landmarks)]
-            if group_points:
-                center_x = sum(p[0] for p in group_points) / len(group_points)
-                center_y = sum(p[1] for p in group_points) / len(group_points)
-                
-                for idx in group_indices:
-                    if idx < len(landmarks):
-                        x, y = landmarks[idx]
-                        # 중심점 기준 상대 위치 유지하며 이동
-                        transformed_landmarks[idx] = (
-                            (x - center_x) + center_x + offset_x,
-                            (y - center_y) + center_y + offset_y
-                        )
-        
-        return transformed_landmarks
+        return as_landmarks(landmarks).translate(offset_x, offset_y, group_indices)
         
     except Exception as e:
         import traceback
@@ -135,7 +111,7 @@ def move_points(landmarks, point_indices, offsets, influence_radius=50.0):
         influence_radius: 주변 포인트에 영향을 주는 반경 (픽셀, 기본값: 50.0)
     
     Returns:
-        transformed_landmarks: 변형된 랜드마크 포인트 리스트
+        transformed_landmarks: 변형된 랜드마크 (Landmarks)
     """
     if landmarks is None or len(landmarks) == 0:
         return landmarks
@@ -144,59 +120,41 @@ def move_points(landmarks, point_indices, offsets, influence_radius=50.0):
         return landmarks
     
     try:
-        transformed_landmarks = list(landmarks)
+        points = as_point_array(landmarks)
+        n = len(points)
         
-        # 직접 이동할 포인트들
+        # 직접 이동할 포인트들 (같은 인덱스가 여러 번 오면 마지막 오프셋 사용)
         direct_moves = {}
         for idx, offset in zip(point_indices, offsets):
-            if 0 <= idx < len(landmarks):
+            if 0 <= idx < n:
                 direct_moves[idx] = offset
+        if not direct_moves:
+            return Landmarks(points)
+        
+        move_idx = np.fromiter(direct_moves.keys(), dtype=np.intp, count=len(direct_moves))
+        move_offsets = np.array(list(direct_moves.values()), dtype=np.float64).reshape(-1, 2)
+        
+        # 모든 포인트와 이동 포인트 사이의 거리 (N, M)
+        source = points.astype(np.float64)
+        dist = np.sqrt(((source[:, None, :] - source[None, move_idx, :]) ** 2).sum(axis=2))
         
-        # 각 포인트에 대해 변형 계산
-        for i in range(len(landmarks)):
-            if i in direct_moves:
-                # 직접 이동
-                dx, dy = direct_moves[i]
-                transformed_landmarks[i] = (landmarks[i][0] + dx, landmarks[i][1] + dy)
-            else:
-                # 주변 영향 계산 (가우시안 가중치)
-                total_dx = 0.0
-                total_dy = 0.0
-                total_weight = 0.0
-                
-                for move_idx, (dx, dy) in direct_moves.items():
-                    # 거리 계산
-                    dist = ((landmarks[i][0] - landmarks[move_idx][0])**2 + 
-                           (landmarks[i][1] - landmarks[move_idx][1])**2)**0.5
-                    
-                    if dist < influence_radius:
-                        # 가우시안 가중치 (거리가 가까울수록 영향이 큼)
-                        weight = np.exp(-(dist**2) / (2 * (influence_radius / 3)**2))
-                        total_dx += dx * weight
-                        total_dy += dy * weight
-                        total_weight += weight
-                
-                if total_weight > 0:
-                    # 가중 평균으로 이동
-                    avg_dx = total_dx / total_weight
-                    avg_dy = total_dy / total_weight
-                    # 영향 감쇠 (거리에 따라)
-                    influence_factor = min(1.0, total_weight)
-                    transformed_landmarks[i] = (
-                        landmarks[i][0] + avg_dx * influence_factor,
-                        landmarks[i][1] + avg_dy * influence_factor
-                    )
-                else:
-                    # 영향 없음
-                    transformed_landmarks[i] = landmarks[i]
+        # 가우시안 가중치 (거리가 가까울수록 영향이 큼), 반경 밖은 0
+        sigma = influence_radius / 3
+        weights = np.where(dist < influence_radius, np.exp(-(dist ** 2) / (2 * sigma ** 2)), 0.0)
+        total_weight = weights.sum(axis=1)
         
-        return transformed_landmarks
+        # 가중 평균 이동량에 영향 감쇠(min(1, 총 가중치)) 적용
+        displacement = np.zeros_like(source)
+        affected = total_weight > 0
+        avg = (weights[affected] @ move_offsets) / total_weight[affected, None]
+        displacement[affected] = avg * np.minimum(1.0, total_weight[affected])[:, None]
+        
+        # 직접 이동 포인트는 오프셋을 그대로 적용
+        displacement[move_idx] = move_offsets
+        
+        return Landmarks(source + displacement)
         
     except Exception as e:
         import traceback
         traceback.print_exc()
         return landmarks
-
-
-
-
@@ -0,0 +1,191 @@
+"""
+모핑 애니메이션(전/후 전환 프레임) 렌더링
+
+morph_face_by_polygons를 프레임마다 호출하면 삼각분할, 바운딩 박스, 픽셀별 삼각형 찾기를 매번 다시 합니다.
+여기서는 원본 -> 변형 포인트로 한 번만 준비(토폴로지, 바운딩 박스, 무게중심 필드)하고,
+프레임마다 변형 포인트만 보간해 캐시된 필드로 remap 렌더링합니다.
+
+두 이미지(예: 원본과 다른 얼굴) 사이의 전환은 각 이미지를 중간 메시로 변형한 뒤 교차 페이드합니다.
+프레임은 생성기로 하나씩 내보내며, write_morph_sequence는 별도 스레드에서 디스크에 씁니다.
+"""
+import dataclasses
+import os
+import queue
+import threading
+
+import numpy as np
+from PIL import Image
+
+from . import core
+
+try:
+    from utils.logger import print_info, print_warning
+except ImportError:
+    def print_info(module, msg):
+        print(f"[{module}] {msg}")
+
+    def print_warning(module, msg):
+        print(f"[{module}] WARNING: {msg}")
+
+# 디스크 쓰기 스레드가 밀릴 때 메모리에 쌓아 둘 최대 프레임 수
+WRITER_QUEUE_SIZE = 4
+
+# 프레임 보간 중 함께 보간할 눈동자 중심 인자 (원본 인자, 변형 인자)
+_IRIS_CENTER_ARGS = (
+    ('left_iris_center_orig', 'left_iris_center_coord'),
+    ('right_iris_center_orig', 'right_iris_center_coord'),
+)
+
+
+def _frame_times(n_frames):
+    """프레임별 보간 비율 (첫 프레임 0.0, 마지막 프레임 1.0)"""
+    if n_frames <= 0:
+        return []
+    if n_frames == 1:
+        return [1.0]
+    return [i / (n_frames - 1) for i in range(n_frames)]
+
+
+def _interpolate(start, end, t):
+    """start -> end 보간 (t=0, t=1에서 양 끝과 정확히 같음)"""
+    return start * (1.0 - t) + end * t
+
+
+def _prepare_sequence_context(image, original_landmarks, transformed_landmarks, morph_kwargs):
+    """한 번만 수행하는 준비 단계 (픽셀 변형 없이 Delaunay 컨텍스트만 생성)"""
+    _, contexts = core.morph_face_by_polygons(
+        image, original_landmarks, transformed_landmarks,
+        skip_pixel_warp=True, return_contexts=True, render_backend="cached_remap", **morph_kwargs,
+    )
+    if contexts is None:
+        raise ValueError("모핑 애니메이션 준비 실패 (랜드마크를 확인하세요)")
+    return contexts["delaunay"]
+
+
+def _render_frame(delaunay_ctx, original_points, transformed_points, t, blend_ratio):
+    """보간 비율 t의 프레임 (캐시된 무게중심 필드로 remap)"""
+    frame_ctx = dataclasses.replace(
+        delaunay_ctx, transformed_points_array=_interpolate(original_points, transformed_points, t))
+    return core._finalize_result_image(
+        delaunay_ctx=frame_ctx,
+        result_final=core._apply_cached_remap(delaunay_ctx=frame_ctx),
+        blend_ratio=blend_ratio,
+        borrowed=True,
+    )
+
+
+def _interpolated_landmarks(original_landmarks, transformed_landmarks, morph_kwargs, t):
+    """OpenCV가 없을 때 쓰는 랜드마크/눈동자 중심 보간 (프레임마다 morph_face_by_polygons 호출)"""
+    landmarks = _interpolate(np.asarray(original_landmarks, dtype=np.float64),
+                             np.asarray(transformed_landmarks, dtype=np.float64), t)
+    frame_kwargs = dict(morph_kwargs)
+    for orig_arg, coord_arg in _IRIS_CENTER_ARGS:
+        orig_center = morph_kwargs.get(orig_arg)
+        new_center = morph_kwargs.get(coord_arg)
+        if orig_center is not None and new_center is not None:
+            frame_kwargs[coord_arg] = tuple(_interpolate(np.asarray(orig_center, dtype=np.float64),
+                                                         np.asarray(new_center, dtype=np.float64), t))
+    return [tuple(point) for point in landmarks], frame_kwargs
+
+
+def render_morph_sequence(image, original_landmarks, transformed_landmarks, n_frames,
+                          target_image=None, **morph_kwargs):
+    """
+    원본 -> 변형 랜드마크로 바뀌는 프레임을 차례로 생성합니다.
+
+    Args:
+        image: PIL.Image 원본 이미지
+        original_landmarks: 원본 랜드마크 [(x, y), ...]
+        transformed_landmarks: 변형된 랜드마크 [(x, y), ...] (target_image가 있으면 그 이미지의 랜드마크)
+        n_frames: 프레임 수 (첫 프레임은 원본, 마지막 프레임은 변형 결과)
+        target_image: 교차 페이드할 두 번째 이미지 (image와 같은 크기, None이면 한 이미지만 변형)
+        **morph_kwargs: morph_face_by_polygons 인자 (blend_ratio, 눈동자 중심 등)
+
+    Yields:
+        PIL.Image: 프레임 (image와 같은 크기)
+    """
+    if target_image is not None and target_image.size != image.size:
+        raise ValueError(f"교차 페이드 이미지 크기가 다릅니다: {image.size} != {target_image.size}")
+    morph_kwargs = {key: value for key, value in morph_kwargs.items()
+                    if key not in ('render_backend', 'skip_pixel_warp', 'return_contexts', 'preview_size')}
+    blend_ratio = morph_kwargs.get('blend_ratio', 1.0)
+    times = _frame_times(n_frames)
+
+    if not core._cv2_available:
+        # 캐시 필드 remap에는 OpenCV가 필요: 프레임마다 전체 모핑 (교차 페이드 없음)
+        print_warning("얼굴모핑", "OpenCV가 없어 모핑 애니메이션을 프레임마다 전체 렌더링합니다")
+        for t in times:
+            landmarks, frame_kwargs = _interpolated_landmarks(original_landmarks, transformed_landmarks,
+                                                              morph_kwargs, t)
+            yield core.morph_face_by_polygons(image, original_landmarks, landmarks, **frame_kwargs)
+        return
+
+    source_ctx = _prepare_sequence_context(image, original_landmarks, transformed_landmarks, morph_kwargs)
+    source_points = np.asarray(source_ctx.original_points_array, dtype=np.float64)
+    source_target_points = np.asarray(source_ctx.transformed_points_array, dtype=np.float64)
+
+    target_ctx = None
+    if target_image is not None:
+        # 두 번째 이미지는 반대 방향(변형 -> 원본 메시)으로 준비해 두고 1-t만큼 변형
+        target_kwargs = dict(morph_kwargs)
+        for orig_arg, coord_arg in _IRIS_CENTER_ARGS:
+            target_kwargs[orig_arg], target_kwargs[coord_arg] = morph_kwargs.get(coord_arg), morph_kwargs.get(orig_arg)
+        target_ctx = _prepare_sequence_context(target_image, transformed_landmarks, original_landmarks, target_kwargs)
+        target_points = np.asarray(target_ctx.original_points_array, dtype=np.float64)
+        target_source_points = np.asarray(target_ctx.transformed_points_array, dtype=np.float64)
+
+    print_info("얼굴모핑", f"모핑 애니메이션 렌더링: {len(times)}프레임" + (" (교차 페이드)" if target_ctx else ""))
+    for t in times:
+        frame = _render_frame(source_ctx, source_points, source_target_points, t, blend_ratio)
+        if target_ctx is not None:
+            target_frame = _render_frame(target_ctx, target_points, target_source_points, 1.0 - t, blend_ratio)
+            frame = Image.blend(frame.convert('RGB'), target_frame.convert('RGB'), t)
+        yield frame
+
+
+def write_morph_sequence(frames, output_dir, prefix="frame", image_format="png"):
+    """
+    프레임 생성기를 디스크 쓰기 스레드로 흘려보내 파일로 저장합니다.
+    렌더링과 인코딩/쓰기가 겹쳐서 진행되며, 쓰기가 밀리면 WRITER_QUEUE_SIZE 프레임에서 렌더링이 기다립니다.
+
+    Args:
+        frames: PIL.Image 반복 가능 객체 (render_morph_sequence 결과 등)
+        output_dir: 저장 디렉토리 (없으면 생성)
+        prefix: 파일 이름 접두사 ({prefix}_0000.png)
+        image_format: 저장 형식 확장자
+
+    Returns:
+        저장한 파일 경로 리스트 (프레임 순서)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    frame_queue = queue.Queue(maxsize=WRITER_QUEUE_SIZE)
+    written = []
+    errors = []
+
+    def _writer():
+        while True:
+            item = frame_queue.get()
+            if item is None:
+                return
+            path, frame = item
+            if errors:
+                continue
+            try:
+                frame.save(path)
+                written.append(path)
+            except (OSError, ValueError) as e:
+                errors.append(e)
+
+    writer = threading.Thread(target=_writer, name='morph_sequence_writer', daemon=True)
+    writer.start()
+    try:
+        for index, frame in enumerate(frames):
+            if errors:
+                break
+            frame_queue.put((os.path.join(output_dir, f"{prefix}_{index:04d}.{image_format}"), frame))
+    finally:
+        frame_queue.put(None)
+        writer.join()
+    if errors:
+        raise errors[0]
+    return written
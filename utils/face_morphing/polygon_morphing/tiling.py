@@ -0,0 +1,95 @@
+"""
+바운딩 박스 행 타일 병렬 렌더링
+
+역매핑(gather) 렌더링은 목적지 픽셀마다 독립적으로 계산하므로, 바운딩 박스를 가로 띠(행 범위)로
+나눠 스레드마다 한 띠씩 맡겨도 결과가 한 스레드로 렌더링한 것과 비트 단위로 같습니다.
+띠마다 결과 배열의 서로 겹치지 않는 행 범위에만 쓰므로 스레드 간 쓰기 경합이 없습니다.
+NumPy/OpenCV의 무거운 연산은 GIL을 풀고 실행되므로 스레드 수만큼 나눠 처리됩니다.
+
+정변환(forward) 렌더링은 여러 원본 픽셀이 같은 목적지 픽셀에 더해지는 누적 순서에 따라
+부동소수점 결과가 달라지므로 타일로 나누지 않습니다.
+
+스레드 수: globals._morph_render_threads (config.json의 morph_render_threads), 0 이하면 CPU 코어 수
+모든 호출이 프로세스 공용 스레드 풀 하나(RENDER_POOL_WORKERS개)를 함께 쓰며, 풀은 만든 뒤 교체하거나 종료하지 않습니다.
+호출 하나의 띠 수는 풀 크기를 넘지 않게 제한합니다.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# 띠 하나의 최소 행 수 (너무 잘게 나누면 스레드 전환 비용이 계산량보다 큼)
+MIN_TILE_ROWS = 32
+
+# 공용 렌더링 스레드 풀 크기 (CPU 코어 수, 단일 코어에서도 띠 나누기를 쓸 수 있게 최소 2)
+RENDER_POOL_WORKERS = max(2, os.cpu_count() or 1)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_render_thread_count():
+    """
+    모핑 렌더링 스레드 수를 반환합니다.
+    설정(globals._morph_render_threads)이 0 이하이거나 없으면 CPU 코어 수를 사용합니다.
+    """
+    try:
+        import globals as gl
+        threads = int(getattr(gl, '_morph_render_threads', 0))
+    except (ImportError, TypeError, ValueError):
+        threads = 0
+    if threads <= 0:
+        threads = os.cpu_count() or 1
+    return max(1, threads)
+
+
+def split_rows(start, stop, tile_count):
+    """
+    행 범위 [start, stop)을 최대 tile_count개의 연속된 띠로 나눕니다 (띠마다 최소 MIN_TILE_ROWS행).
+
+    Returns:
+        [(row_start, row_stop), ...] 위에서 아래 순서
+    """
+    rows = stop - start
+    if rows <= 0:
+        return []
+    tile_count = max(1, min(int(tile_count), rows // MIN_TILE_ROWS))
+    bounds = [start + rows * i // tile_count for i in range(tile_count + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _get_executor():
+    """공용 렌더링 스레드 풀 (처음 쓸 때 한 번만 생성, 다른 스레드가 쓰는 중일 수 있으므로 종료하지 않음)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=RENDER_POOL_WORKERS, thread_name_prefix='morph_render')
+        return _executor
+
+
+def render_row_tiles(start, stop, render_tile, tile_count=None):
+    """
+    행 범위를 띠로 나눠 render_tile(row_start, row_stop)을 스레드 풀에서 실행합니다.
+    render_tile은 자기 띠의 행만 써야 하며, 띠가 하나뿐이면 호출한 스레드에서 바로 실행합니다.
+
+    Args:
+        start, stop: 행 범위 [start, stop)
+        render_tile: 띠 하나를 렌더링하는 함수
+        tile_count: 띠 수 (None이면 get_render_thread_count(), 최대 RENDER_POOL_WORKERS)
+
+    Returns:
+        띠 수
+    """
+    if tile_count is None:
+        tile_count = get_render_thread_count()
+    tiles = split_rows(start, stop, min(tile_count, RENDER_POOL_WORKERS))
+    if len(tiles) <= 1:
+        for row_start, row_stop in tiles:
+            render_tile(row_start, row_stop)
+        return len(tiles)
+
+    executor = _get_executor()
+    futures = [executor.submit(render_tile, row_start, row_stop) for row_start, row_stop in tiles]
+    # 예외는 호출한 스레드로 다시 올림
+    for future in futures:
+        future.result()
+    return len(tiles)
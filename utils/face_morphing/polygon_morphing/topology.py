@@ -0,0 +1,342 @@
+"""
+고정 삼각형 토폴로지와 래스터화 점 위치 찾기
+
+MediaPipe FaceMesh 테셀레이션에 눈/입 구멍과 얼굴 윤곽 바깥(경계 포인트까지의 띠)을
+인덱스만으로 정한 삼각형으로 채워, 같은 랜드마크 구성이면 프레임/이미지가 달라도 같은 삼각형을 씁니다.
+2D로 투영한 메시는 옆을 향한 얼굴(게임 초상화 대부분)에서 코/뺨/턱 주변이 접혀 삼각형이 겹칩니다.
+경계 사각형이 고정된 원판 메시가 접히면 뒤집힌 삼각형이 덮는 곳은 항상 바로 선 삼각형이 두 겹 이상 덮으므로,
+뒤집힌 삼각형만 빼고 래스터화하면 빈틈 없이 덮입니다 (겹친 곳은 나중에 그린 삼각형, 즉 테셀레이션이 우선).
+랜드마크가 경계 사각형 밖으로 나가 빈틈이 생기면 원본 포인트의 Delaunay 삼각형을 대신 씁니다.
+
+어느 쪽이든 점 위치 찾기는 삼각형 인덱스를 래스터화한 맵 조회로 합니다 (find_simplex).
+래스터화는 삼각형마다 cv2.fillPoly로 인덱스를 채우며, OpenCV가 없으면 무게중심 좌표 판정으로 대신합니다.
+모핑 코드가 쓰는 scipy Delaunay 속성(simplices, transform, find_simplex)을 같은 형식으로 제공합니다.
+
+포인트 구성 (polygon_morphing.core 순서):
+- 0~467: FaceMesh 랜드마크 (눈동자 제외)
+- 468, 469: 눈동자 중심 (있는 경우)
+- 마지막 4개: 경계 포인트 (왼쪽 위, 오른쪽 위, 오른쪽 아래, 왼쪽 아래)
+"""
+from collections import defaultdict
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from scipy.spatial import Delaunay
+except ImportError:
+    Delaunay = None
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+from utils import facemesh_topology
+
+# 경계 포인트 수 (모서리 4개)
+BOUNDARY_POINT_COUNT = 4
+
+# 변 위 픽셀 판정 허용 오차 (무게중심 좌표)
+_EDGE_EPSILON = 1e-9
+
+# cv2.fillPoly 좌표 소수부 비트 수 (1/16 픽셀 정밀도)
+_FILL_SHIFT = 4
+
+# 얼굴 윤곽을 모서리별 구간으로 나누는 기준 랜드마크 (위, 이미지 왼쪽, 아래, 이미지 오른쪽)
+_OVAL_TOP, _OVAL_LEFT, _OVAL_BOTTOM, _OVAL_RIGHT = 10, 234, 152, 454
+
+# 구멍을 띠 모양으로 채울 때의 양 끝 (눈꼬리, 입꼬리)
+_MOUTH_CORNERS = (78, 308)
+_EYE_CORNERS = ((33, 133), (362, 263))
+
+
+def _boundary_loops(triangles):
+    """테셀레이션의 경계 간선을 이어 만든 닫힌 고리 목록"""
+    edge_count = defaultdict(int)
+    for a, b, c in triangles.tolist():
+        for edge in ((a, b), (b, c), (a, c)):
+            edge_count[tuple(sorted(edge))] += 1
+    adjacency = defaultdict(list)
+    for (a, b), count in edge_count.items():
+        if count == 1:
+            adjacency[a].append(b)
+            adjacency[b].append(a)
+
+    loops, seen = [], set()
+    for start in sorted(adjacency):
+        if start in seen:
+            continue
+        loop, previous, current = [start], None, start
+        seen.add(start)
+        while True:
+            following = next(v for v in adjacency[current] if v != previous)
+            if following == start:
+                break
+            loop.append(following)
+            seen.add(following)
+            previous, current = current, following
+        loops.append(loop)
+    return loops
+
+
+def _find_loop(loops, vertex):
+    return next(loop for loop in loops if vertex in loop)
+
+
+def _chain(loop, start, end):
+    """고리를 따라 start에서 end까지 (양 끝 포함)"""
+    i = loop.index(start)
+    rotated = loop[i:] + loop[:i]
+    return rotated[:rotated.index(end) + 1]
+
+
+def _strip_triangles(loop, corner_a, corner_b):
+    """두 꼭짓점 사이의 위/아래 사슬을 지그재그로 잇는 삼각형 (입, 눈동자 중심이 없는 눈)"""
+    upper = _chain(loop, corner_a, corner_b)
+    lower = _chain(loop[::-1], corner_a, corner_b)
+    triangles = []
+    i = j = 0
+    while i < len(upper) - 1 or j < len(lower) - 1:
+        # 남은 비율이 큰 쪽을 먼저 전진 (길이가 달라도 고르게)
+        advance_upper = j >= len(lower) - 1 or (
+            i < len(upper) - 1 and (i + 1) / (len(upper) - 1) <= (j + 1) / (len(lower) - 1))
+        if advance_upper:
+            triangles.append((upper[i], upper[i + 1], lower[j]))
+            i += 1
+        else:
+            triangles.append((upper[i], lower[j + 1], lower[j]))
+            j += 1
+    return [t for t in triangles if len(set(t)) == 3]
+
+
+def _fan_triangles(loop, center):
+    return [(center, loop[k], loop[(k + 1) % len(loop)]) for k in range(len(loop))]
+
+
+def _orient_consistently(triangles):
+    """
+    이웃 삼각형끼리 감는 방향을 맞춤 (공유 변을 서로 반대 방향으로 지나도록)
+    테셀레이션 원본은 삼각형마다 감는 방향이 제각각이라, 넓이 부호로 접힘을 판정하려면 먼저 맞춰야 합니다.
+    """
+    triangles = [list(t) for t in triangles]
+    edge_owners = defaultdict(list)
+    for index, (a, b, c) in enumerate(triangles):
+        for edge in ((a, b), (b, c), (c, a)):
+            edge_owners[frozenset(edge)].append(index)
+
+    oriented = [False] * len(triangles)
+    for seed in range(len(triangles)):
+        if oriented[seed]:
+            continue
+        oriented[seed] = True
+        pending = [seed]
+        while pending:
+            a, b, c = triangles[pending.pop()]
+            for u, v in ((a, b), (b, c), (c, a)):
+                for neighbor in edge_owners[frozenset((u, v))]:
+                    if oriented[neighbor]:
+                        continue
+                    # 이웃은 같은 변을 v -> u 방향으로 지나야 함
+                    x, y, z = triangles[neighbor]
+                    if (u, v) in ((x, y), (y, z), (z, x)):
+                        triangles[neighbor] = [x, z, y]
+                    oriented[neighbor] = True
+                    pending.append(neighbor)
+    return [tuple(t) for t in triangles]
+
+
+@lru_cache(maxsize=4)
+def face_mesh_triangles(num_landmarks, iris_center_order=None):
+    """
+    랜드마크 구성에 대한 고정 삼각형 목록 (T, 3) int32
+
+    Args:
+        num_landmarks: 경계 포인트 앞의 포인트 수 (468 또는 눈동자 중심 포함 470)
+        iris_center_order: 눈동자 중심이 있을 때 (첫 눈 고리에 붙일 중심, 둘째 눈 고리에 붙일 중심)
+    """
+    tesselation = facemesh_topology.TESSELATION_TRIANGLES
+    loops = _boundary_loops(tesselation)
+    triangles = [tuple(t) for t in tesselation.tolist()]
+
+    # 입
+    triangles += _strip_triangles(_find_loop(loops, _MOUTH_CORNERS[0]), *_MOUTH_CORNERS)
+
+    # 눈: 눈동자 중심이 있으면 부채꼴, 없으면 띠
+    for eye, corners in enumerate(_EYE_CORNERS):
+        loop = _find_loop(loops, corners[0])
+        if iris_center_order is not None:
+            triangles += _fan_triangles(loop, iris_center_order[eye])
+        else:
+            triangles += _strip_triangles(loop, *corners)
+
+    # 얼굴 윤곽 ~ 경계 포인트: 윤곽 구간마다 가장 가까운 모서리에 부채꼴, 구간 사이는 모서리 두 개로 연결
+    top_left, top_right, bottom_right, bottom_left = range(num_landmarks, num_landmarks + BOUNDARY_POINT_COUNT)
+    oval = _find_loop(loops, _OVAL_TOP)
+    arcs = (
+        (_OVAL_TOP, _OVAL_LEFT, top_left, bottom_left),
+        (_OVAL_LEFT, _OVAL_BOTTOM, bottom_left, bottom_right),
+        (_OVAL_BOTTOM, _OVAL_RIGHT, bottom_right, top_right),
+        (_OVAL_RIGHT, _OVAL_TOP, top_right, top_left),
+    )
+    direction = oval if _OVAL_LEFT in _chain(oval, _OVAL_TOP, _OVAL_BOTTOM) else oval[::-1]
+    for start, end, corner, next_corner in arcs:
+        arc = _chain(direction, start, end)
+        triangles += [(arc[k], arc[k + 1], corner) for k in range(len(arc) - 1)]
+        triangles.append((end, corner, next_corner))
+
+    array = np.array(_orient_consistently(triangles), dtype=np.int32)
+    array.flags.writeable = False
+    return array
+
+
+class RasterTopology:
+    """
+    고정 삼각형 + 래스터화 점 위치 맵 (scipy Delaunay와 같은 속성 제공)
+
+    Attributes:
+        points: 포인트 배열 (N, 2) float64
+        simplices: 삼각형 꼭짓점 인덱스 (T, 3) int32
+        transform: 무게중심 변환 (T, 3, 2), scipy Delaunay.transform과 같은 형식
+        folded: 접혀서 뒤집혔거나 넓이가 0이라 래스터화하지 않은 삼각형 (T,) bool
+    """
+
+    def __init__(self, points, simplices):
+        self.points = np.asarray(points, dtype=np.float64)
+        self.simplices = simplices
+        self.transform = self._barycentric_transform()
+        self.folded = self._folded_mask()
+        self._id_map = self._rasterize()
+        self._delaunay = None
+
+    def _barycentric_transform(self):
+        corners = self.points[self.simplices]
+        last = corners[:, 2]
+        matrix = np.stack([corners[:, 0] - last, corners[:, 1] - last], axis=2)
+        transform = np.zeros((len(self.simplices), 3, 2), dtype=np.float64)
+        det = matrix[:, 0, 0] * matrix[:, 1, 1] - matrix[:, 0, 1] * matrix[:, 1, 0]
+        valid = np.abs(det) > 1e-12
+        transform[valid, :2] = np.linalg.inv(matrix[valid])
+        transform[~valid, :2] = np.nan
+        transform[:, 2] = last
+        return transform
+
+    def _folded_mask(self):
+        """전체 감는 방향과 반대로 뒤집힌 삼각형과 넓이 0인 삼각형"""
+        areas = _signed_areas(self.points, self.simplices)
+        orientation = 1.0 if areas.sum() >= 0 else -1.0
+        with np.errstate(invalid='ignore'):
+            return ~(areas * orientation > 0)
+
+    def _rasterize(self):
+        """삼각형 인덱스 맵 (정수 좌표 픽셀이 들어 있는 삼각형, 삼각형 밖은 -1)"""
+        width = max(1, int(np.ceil(self.points[:, 0].max())) + 1)
+        height = max(1, int(np.ceil(self.points[:, 1].max())) + 1)
+        id_map = np.full((height, width), -1, dtype=np.int32)
+        # 인덱스 역순으로 그려 겹친 곳은 앞쪽 삼각형(테셀레이션)이 윤곽 띠/구멍 채움보다 우선
+        order = np.flatnonzero(~self.folded)[::-1]
+        if cv2 is not None:
+            fixed = np.rint(self.points[self.simplices] * (1 << _FILL_SHIFT)).astype(np.int32)
+            for simplex_id in order.tolist():
+                cv2.fillPoly(id_map, [fixed[simplex_id]], simplex_id, lineType=cv2.LINE_8, shift=_FILL_SHIFT)
+            return id_map
+
+        corners = self.points[self.simplices]
+        lows = np.clip(np.floor(corners.min(axis=1)).astype(np.int64), 0, None)
+        highs = np.minimum(np.ceil(corners.max(axis=1)).astype(np.int64), (width - 1, height - 1))
+        for simplex_id in order.tolist():
+            (x0, y0), (x1, y1) = lows[simplex_id], highs[simplex_id]
+            transform = self.transform[simplex_id]
+            if x1 < x0 or y1 < y0 or not np.isfinite(transform).all():
+                continue
+            dx = np.arange(x0, x1 + 1, dtype=np.float64)[None, :] - transform[2, 0]
+            dy = np.arange(y0, y1 + 1, dtype=np.float64)[:, None] - transform[2, 1]
+            b0 = transform[0, 0] * dx + transform[0, 1] * dy
+            b1 = transform[1, 0] * dx + transform[1, 1] * dy
+            inside = (b0 >= -_EDGE_EPSILON) & (b1 >= -_EDGE_EPSILON) & (b0 + b1 <= 1.0 + _EDGE_EPSILON)
+            id_map[y0:y1 + 1, x0:x1 + 1][inside] = simplex_id
+        return id_map
+
+    def find_simplex(self, coords):
+        """좌표별 삼각형 인덱스 (가장 가까운 픽셀의 맵 값, 맵 밖은 -1)"""
+        coords = np.asarray(coords)
+        x = np.rint(coords[:, 0]).astype(np.int64)
+        y = np.rint(coords[:, 1]).astype(np.int64)
+        height, width = self._id_map.shape
+        inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+        result = np.full(len(coords), -1, dtype=np.int32)
+        result[inside] = self._id_map[y[inside], x[inside]]
+        return result
+
+    def covers(self, corners):
+        """corners의 바운딩 사각형 안 픽셀(맵 범위)이 모두 삼각형에 들어가는지"""
+        height, width = self._id_map.shape
+        x0, y0 = np.clip(np.ceil(corners.min(axis=0)).astype(np.int64), 0, None)
+        x1 = min(int(np.floor(corners[:, 0].max())), width - 1)
+        y1 = min(int(np.floor(corners[:, 1].max())), height - 1)
+        return bool(np.all(self._id_map[y0:y1 + 1, x0:x1 + 1] >= 0))
+
+    @property
+    def delaunay(self):
+        """
+        같은 포인트의 Delaunay 삼각분할 (뒤집힘 검사용, 처음 쓸 때 생성)
+        고정 메시의 접힌 부분 옆 가는 삼각형은 조금만 움직여도 뒤집히므로,
+        점끼리 교차했는지는 포인트 배치에 맞는 Delaunay 삼각형으로 판정합니다.
+        """
+        if self._delaunay is None and Delaunay is not None:
+            self._delaunay = Delaunay(self.points)
+        return self._delaunay
+
+    def relocated(self, points):
+        """같은 삼각형으로 포인트만 바꾼 토폴로지 (변형 후 좌표에서 점 위치 찾기용)"""
+        return RasterTopology(points, self.simplices)
+
+
+def _signed_areas(points, simplices):
+    corners = points[simplices]
+    v1 = corners[:, 1] - corners[:, 0]
+    v2 = corners[:, 2] - corners[:, 0]
+    return (v1[:, 0] * v2[:, 1] - v1[:, 1] * v2[:, 0]) / 2.0
+
+
+def face_mesh_simplices(points):
+    """
+    포인트 구성이 FaceMesh(+눈동자 중심)+경계 포인트이면 고정 삼각형 배열, 아니면 None
+    (접혀서 뒤집힌 삼각형은 RasterTopology가 래스터화할 때 뺍니다)
+    """
+    points = np.asarray(points, dtype=np.float64)
+    num_landmarks = len(points) - BOUNDARY_POINT_COUNT
+    if num_landmarks == facemesh_topology.FACEMESH_NUM_LANDMARKS:
+        iris_center_order = None
+    elif num_landmarks == facemesh_topology.FACEMESH_NUM_LANDMARKS + 2:
+        # 눈동자 중심 468/469를 더 가까운 눈 고리에 붙임
+        first_eye = np.mean(points[list(_EYE_CORNERS[0])], axis=0)
+        center_a, center_b = num_landmarks - 2, num_landmarks - 1
+        if np.linalg.norm(points[center_a] - first_eye) <= np.linalg.norm(points[center_b] - first_eye):
+            iris_center_order = (center_a, center_b)
+        else:
+            iris_center_order = (center_b, center_a)
+    else:
+        return None
+
+    return face_mesh_triangles(num_landmarks, iris_center_order)
+
+
+def build_topology(points):
+    """
+    포인트에 대한 삼각형 토폴로지 (FaceMesh 고정 삼각형, 경계 사각형 안에 빈틈이 생기면 Delaunay 삼각형)
+
+    Returns:
+        RasterTopology, 포인트가 유효하지 않으면 scipy Delaunay (scipy가 없으면 None)
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if not np.all(np.isfinite(points)):
+        return Delaunay(points) if Delaunay is not None else None
+    simplices = face_mesh_simplices(points)
+    if simplices is not None:
+        topology = RasterTopology(points, simplices)
+        if topology.covers(points[-BOUNDARY_POINT_COUNT:]):
+            return topology
+    if Delaunay is None:
+        return None
+    return RasterTopology(points, Delaunay(points).simplices.astype(np.int32))
@@ -24,6 +24,9 @@ from PIL import Image
 # 디버그 출력 제어
 DEBUG_GUIDE_SCALING = True
 
+from utils import facemesh_topology
+from utils.landmarks import Landmarks, as_landmarks, as_point_array
+
 from ..constants import _cv2_available, _cv2_cuda_available, _scipy_available, _landmarks_available, _delaunay_cache, _delaunay_cache_max_size
 
 # 외부 모듈 import
@@ -46,6 +49,10 @@ except ImportError:
     RIGHT_EYE_INDICES = []
 
 
+# MediaPipe 눈 연결 정보에 포함된 포인트 인덱스 (토폴로지 모듈에서 한 번만 구성)
+_LEFT_EYE_CONNECTED_INDICES = frozenset(facemesh_topology.LEFT_EYE_INDICES.tolist())
+_RIGHT_EYE_CONNECTED_INDICES = frozenset(facemesh_topology.RIGHT_EYE_INDICES.tolist())
+
 # 전역 플래그 변수
 _GUIDE_SCALING_ENABLED = False
 
@@ -71,7 +78,11 @@ def transform_points_for_eye_size_centered(landmarks, left_eye_center=None, righ
         guide_line_angle: 지시선 각도 (라디안)
     
     Returns:
-        transformed_landmarks: 변형된 랜드마크 포인트 리스트
+        transformed_landmarks: 변형된 랜드마크 (Landmarks)
+    
+    Note:
+        지시선 각도로 회전 -> 균일 스케일 -> 역회전은 중심점 기준 균일 스케일과 같으므로
+        각도와 무관하게 하나의 벡터 연산으로 처리합니다.
     """
     if DEBUG_GUIDE_SCALING:
         print(f"[지시선 스케일링] 함수 호출됨! left_center={left_eye_center}, right_center={right_eye_center}, angle={guide_line_angle}")
@@ -83,7 +94,7 @@ def transform_points_for_eye_size_centered(landmarks, left_eye_center=None, righ
     try:
         from utils.face_landmarks import LEFT_EYE_INDICES, RIGHT_EYE_INDICES
         
-        transformed_landmarks = list(landmarks)
+        transformed_landmarks = as_landmarks(landmarks)
         
         # 눈 중심점이 제공되지 않은 경우, 기존 방식으로 계산
         if left_eye_center is None or right_eye_center is None:
@@ -96,94 +107,20 @@ def transform_points_for_eye_size_centered(landmarks, left_eye_center=None, righ
         
         # 왼쪽 눈 스케일링
         if left_eye_center is not None and abs(left_eye_size_ratio - 1.0) >= 0.01:
-            # 지시선 각도를 고려한 회전 행렬 계산
-            if guide_line_angle is not None:
-                cos_angle = math.cos(guide_line_angle)
-                sin_angle = math.sin(guide_line_angle)
-                if DEBUG_GUIDE_SCALING:
-                    print(f"[지시선 스케일링] 왼쪽 눈 회전: angle={math.degrees(guide_line_angle):.1f}°, cos={cos_angle:.3f}, sin={sin_angle:.3f}")
-            else:
-                cos_angle, sin_angle = 1.0, 0.0  # 기본값 (수평)
-                if DEBUG_GUIDE_SCALING:
-                    print(f"[지시선 스케일링] 왼쪽 눈: 수평 스케일링 적용")
-            
-            # 왼쪽 눈 영역 변형
-            transformed_count = 0
-            for idx in LEFT_EYE_INDICES:
-                if idx < len(landmarks):
-                    x, y = landmarks[idx]
-                    
-                    # 눈 중심을 기준으로 상대 좌표 계산
-                    dx = x - left_eye_center[0]
-                    dy = y - left_eye_center[1]
-                    
-                    # 지시선 각도를 고려한 회전 좌표로 변환
-                    rotated_x = dx * cos_angle + dy * sin_angle
-                    rotated_y = -dx * sin_angle + dy * cos_angle
-                    
-                    # 스케일링 적용 (중심점 기준)
-                    scaled_x = rotated_x * left_eye_size_ratio
-                    scaled_y = rotated_y * left_eye_size_ratio
-                    
-                    # 다시 원래 각도로 회전
-                    final_dx = scaled_x * cos_angle - scaled_y * sin_angle
-                    final_dy = scaled_x * sin_angle + scaled_y * cos_angle
-                    
-                    # 최종 좌표 계산
-                    final_x = left_eye_center[0] + final_dx
-                    final_y = left_eye_center[1] + final_dy
-                    
-                    # 디버그 출력 (처음 3개 포인트만)
-                    if transformed_count < 3 and DEBUG_GUIDE_SCALING:
-                        print(f"[DEBUG Y값] 포인트{idx}: ({x:.1f},{y:.1f}) -> ({final_x:.1f},{final_y:.1f})")
-                        print(f"  dx={dx:.1f}, dy={dy:.1f}")
-                        print(f"  rotated=({rotated_x:.1f},{rotated_y:.1f})")
-                        print(f"  scaled=({scaled_x:.1f},{scaled_y:.1f})")
-                        print(f"  final=({final_dx:.1f},{final_dy:.1f})")
-                        print(f"  y변화: {y:.1f} -> {final_y:.1f} (차이={final_y-y:.1f})")
-                    
-                    transformed_landmarks[idx] = (final_x, final_y)
-                    transformed_count += 1
-            
+            transformed_landmarks = transformed_landmarks.scale(
+                left_eye_size_ratio, left_eye_size_ratio, left_eye_center, LEFT_EYE_INDICES
+            )
             if DEBUG_GUIDE_SCALING:
-                print(f"[지시선 스케일링] 왼쪽 눈 변형 완료: {transformed_count}개 포인트")
+                print(f"[지시선 스케일링] 왼쪽 눈 변형 완료: {len(LEFT_EYE_INDICES)}개 포인트")
         
         # 오른쪽 눈 스케일링
         if right_eye_center is not None and abs(right_eye_size_ratio - 1.0) >= 0.01:
-            # 지시선 각도를 고려한 회전 행렬 계산
-            if guide_line_angle is not None:
-                cos_angle = math.cos(guide_line_angle)
-                sin_angle = math.sin(guide_line_angle)
-            else:
-                cos_angle, sin_angle = 1.0, 0.0  # 기본값 (수평)
-            
-            # 오른쪽 눈 영역 변형
-            for idx in RIGHT_EYE_INDICES:
-                if idx < len(landmarks):
-                    x, y = landmarks[idx]
-                    
-                    # 눈 중심을 기준으로 상대 좌표 계산
-                    dx = x - right_eye_center[0]
-                    dy = y - right_eye_center[1]
-                    
-                    # 지시선 각도를 고려한 회전 좌표로 변환
-                    rotated_x = dx * cos_angle + dy * sin_angle
-                    rotated_y = -dx * sin_angle + dy * cos_angle
-                    
-                    # 스케일링 적용 (중심점 기준)
-                    scaled_x = rotated_x * right_eye_size_ratio
-                    scaled_y = rotated_y * right_eye_size_ratio
-                    
-                    # 다시 원래 각도로 회전
-                    final_dx = scaled_x * cos_angle - scaled_y * sin_angle
-                    final_dy = scaled_x * sin_angle + scaled_y * cos_angle
-                    
-                    # 최종 좌표 계산
-                    transformed_landmarks[idx] = (
-                        right_eye_center[0] + final_dx,
-                        right_eye_center[1] + final_dy
-                    )
+            transformed_landmarks = transformed_landmarks.scale(
+                right_eye_size_ratio, right_eye_size_ratio, right_eye_center, RIGHT_EYE_INDICES
+            )
         
+        if transformed_landmarks is landmarks:
+            transformed_landmarks = transformed_landmarks.copy()
         return transformed_landmarks
         
     except Exception as e:
@@ -203,7 +140,7 @@ def transform_points_for_eye_size(landmarks, eye_size_ratio=1.0, left_eye_size_r
         right_eye_size_ratio: 오른쪽 눈 크기 비율
     
     Returns:
-        transformed_landmarks: 변형된 랜드마크 포인트 리스트
+        transformed_landmarks: 변형된 랜드마크 (Landmarks)
     """
     if DEBUG_GUIDE_SCALING:
         print(f"[일반 스케일링] 함수 호출됨! eye_size_ratio={eye_size_ratio}, left={left_eye_size_ratio}, right={right_eye_size_ratio}")
@@ -267,7 +204,7 @@ def transform_points_for_eye_size(landmarks, eye_size_ratio=1.0, left_eye_size_r
         if key_landmarks is None:
             return landmarks
         
-        transformed_landmarks = list(landmarks)
+        transformed_landmarks = Landmarks(landmarks)
         
         # 두 눈 사이의 거리 계산 (영향 반경 제한용)
         left_eye_center = key_landmarks.get('left_eye')
@@ -342,17 +279,7 @@ def transform_points_for_eye_size(landmarks, eye_size_ratio=1.0, left_eye_size_r
                     
                     # 2. 눈 영역 경계 내의 모든 랜드마크를 눈 크기 변화에 비례하여 변형
                     # MediaPipe 연결 정보를 사용하여 눈과 연결된 모든 포인트 찾기
-                    try:
-                        import mediapipe as mp
-                        mp_face_mesh = mp.solutions.face_mesh
-                        LEFT_EYE_CONNECTIONS = mp_face_mesh.FACEMESH_LEFT_EYE
-                        # 연결된 모든 포인트 인덱스 수집
-                        left_eye_connected_indices = set()
-                        for connection in LEFT_EYE_CONNECTIONS:
-                            left_eye_connected_indices.add(connection[0])
-                            left_eye_connected_indices.add(connection[1])
-                    except Exception as e:
-                        left_eye_connected_indices = set(LEFT_EYE_SURROUNDING_INDICES)
+                    left_eye_connected_indices = _LEFT_EYE_CONNECTED_INDICES
                     
                     # 디버깅: 변형되지 않은 포인트 추적
                     skipped_points = []
@@ -509,17 +436,7 @@ def transform_points_for_eye_size(landmarks, eye_size_ratio=1.0, left_eye_size_r
                     
                     # 2. 눈 영역 경계 내의 모든 랜드마크를 눈 크기 변화에 비례하여 변형
                     # MediaPipe 연결 정보를 사용하여 눈과 연결된 모든 포인트 찾기
-                    try:
-                        import mediapipe as mp
-                        mp_face_mesh = mp.solutions.face_mesh
-                        RIGHT_EYE_CONNECTIONS = mp_face_mesh.FACEMESH_RIGHT_EYE
-                        # 연결된 모든 포인트 인덱스 수집
-                        right_eye_connected_indices = set()
-                        for connection in RIGHT_EYE_CONNECTIONS:
-                            right_eye_connected_indices.add(connection[0])
-                            right_eye_connected_indices.add(connection[1])
-                    except Exception as e:
-                        right_eye_connected_indices = set(RIGHT_EYE_SURROUNDING_INDICES)
+                    right_eye_connected_indices = _RIGHT_EYE_CONNECTED_INDICES
                     
                     # 디버깅: 변형되지 않은 포인트 추적
                     skipped_points = []
@@ -630,7 +547,7 @@ def transform_points_for_nose_size(landmarks, nose_size_ratio=1.0):
         nose_size_ratio: 코 크기 비율
     
     Returns:
-        transformed_landmarks: 변형된 랜드마크 포인트 리스트
+        transformed_landmarks: 변형된 랜드마크 (Landmarks)
     """
     if landmarks is None or len(landmarks) == 0:
         return landmarks
@@ -639,7 +556,6 @@ def transform_points_for_nose_size(landmarks, nose_size_ratio=1.0):
         return landmarks
     
     try:
-        from utils.face_landmarks import NOSE_TIP_INDEX
         from utils.face_landmarks import get_key_landmarks
         
         key_landmarks = get_key_landmarks(landmarks)
@@ -655,33 +571,13 @@ def transform_points_for_nose_size(landmarks, nose_size_ratio=1.0):
         all_nose_indices = list(set(nose_indices + nose_side_indices))
         
         # 코 중심점 계산: 코 영역의 모든 포인트의 중심 사용 (더 정확함)
-        nose_points = [landmarks[i] for i in all_nose_indices if i < len(landmarks)]
-        if nose_points:
-            nose_center = (
-                sum(p[0] for p in nose_points) / len(nose_points),
-                sum(p[1] for p in nose_points) / len(nose_points)
-            )
-        else:
+        points = as_landmarks(landmarks)
+        nose_center = points.centroid(all_nose_indices)
+        if nose_center is None:
             # 포인트가 없으면 기본 코 끝점 사용
             nose_center = key_landmarks['nose']
         
-        transformed_landmarks = list(landmarks)
-        
-        # 변형된 포인트 개수 추적
-        transformed_count = 0
-        for idx in all_nose_indices:
-            if idx < len(landmarks):
-                x, y = landmarks[idx]
-                dx = x - nose_center[0]
-                dy = y - nose_center[1]
-                transformed_landmarks[idx] = (
-                    nose_center[0] + dx * nose_size_ratio,
-                    nose_center[1] + dy * nose_size_ratio
-                )
-                transformed_count += 1
-        
-        
-        return transformed_landmarks
+        return points.scale(nose_size_ratio, nose_size_ratio, nose_center, all_nose_indices)
         
     except Exception as e:
         return landmarks
@@ -698,7 +594,7 @@ def transform_points_for_jaw(landmarks, jaw_adjustment=0.0):
         jaw_adjustment: 턱선 조정 값 (-50 ~ +50, 음수=작게, 양수=크게)
     
     Returns:
-        transformed_landmarks: 변형된 랜드마크 포인트 리스트
+        transformed_landmarks: 변형된 랜드마크 (Landmarks)
     """
     if landmarks is None or len(landmarks) == 0:
         return landmarks
@@ -724,24 +620,10 @@ def transform_points_for_jaw(landmarks, jaw_adjustment=0.0):
             return landmarks
         
         # 얼굴 윤곽 랜드마크 인덱스 (MediaPipe Face Mesh: 인덱스 0-16이 턱선)
-        # 턱선: 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16
         jaw_indices = list(range(17))  # 0-16
         
-        transformed_landmarks = list(landmarks)
-        
-        # 턱선 랜드마크 변형 (얼굴 중심을 기준으로 수평 확장/축소)
-        for idx in jaw_indices:
-            if idx < len(landmarks):
-                x, y = landmarks[idx]
-                # 얼굴 중심점 기준으로 수평 거리만 조정
-                dx = x - face_center[0]
-                transformed_landmarks[idx] = (
-                    face_center[0] + dx * jaw_ratio,
-                    y  # 수직 위치는 유지
-                )
-        
-        
-        return transformed_landmarks
+        # 턱선 랜드마크 변형 (얼굴 중심을 기준으로 수평 확장/축소, 수직 위치는 유지)
+        return as_landmarks(landmarks).scale(jaw_ratio, 1.0, face_center, jaw_indices)
         
     except Exception as e:
         import traceback
@@ -761,7 +643,7 @@ def transform_points_for_face_size(landmarks, face_width_ratio=1.0, face_height_
         face_height_ratio: 얼굴 높이 비율
     
     Returns:
-        transformed_landmarks: 변형된 랜드마크 포인트 리스트
+        transformed_landmarks: 변형된 랜드마크 (Landmarks)
     """
     if landmarks is None or len(landmarks) == 0:
         return landmarks
@@ -781,20 +663,8 @@ def transform_points_for_face_size(landmarks, face_width_ratio=1.0, face_height_
         if face_center is None:
             return landmarks
         
-        transformed_landmarks = list(landmarks)
-        
         # 모든 랜드마크 포인트에 대해 얼굴 중심 기준으로 크기 조정
-        for idx in range(len(landmarks)):
-            x, y = landmarks[idx]
-            dx = x - face_center[0]
-            dy = y - face_center[1]
-            transformed_landmarks[idx] = (
-                face_center[0] + dx * face_width_ratio,
-                face_center[1] + dy * face_height_ratio
-            )
-        
-        
-        return transformed_landmarks
+        return as_landmarks(landmarks).scale(face_width_ratio, face_height_ratio, face_center)
         
     except Exception as e:
         import traceback
@@ -814,7 +684,7 @@ def transform_points_for_mouth_size(landmarks, mouth_size_ratio=1.0, mouth_width
         mouth_width_ratio: 입 너비 비율 (수평)
     
     Returns:
-        transformed_landmarks: 변형된 랜드마크 포인트 리스트
+        transformed_landmarks: 변형된 랜드마크 (Landmarks)
     """
     if landmarks is None or len(landmarks) == 0:
         return landmarks
@@ -830,21 +700,9 @@ def transform_points_for_mouth_size(landmarks, mouth_size_ratio=1.0, mouth_width
         if key_landmarks is None or key_landmarks.get('mouth') is None:
             return landmarks
         
+        # 너비는 x축만, 크기는 y축만 조정
         mouth_center = key_landmarks['mouth']
-        transformed_landmarks = list(landmarks)
-        
-        for idx in MOUTH_INDICES:
-            if idx < len(landmarks):
-                x, y = landmarks[idx]
-                dx = x - mouth_center[0]
-                dy = y - mouth_center[1]
-                # 너비는 x축만, 크기는 y축만 조정
-                transformed_landmarks[idx] = (
-                    mouth_center[0] + dx * mouth_width_ratio,
-                    mouth_center[1] + dy * mouth_size_ratio
-                )
-        
-        return transformed_landmarks
+        return as_landmarks(landmarks).scale(mouth_width_ratio, mouth_size_ratio, mouth_center, MOUTH_INDICES)
         
     except Exception as e:
         return landmarks
@@ -865,7 +723,7 @@ def transform_points_for_eye_position(landmarks, left_eye_position_x=0.0, left_e
         right_eye_position_y: 오른쪽 눈 수직 이동 (픽셀)
     
     Returns:
-        transformed_landmarks: 변형된 랜드마크 포인트 리스트
+        transformed_landmarks: 변형된 랜드마크 (Landmarks)
     """
     if landmarks is None or len(landmarks) == 0:
         return landmarks
@@ -877,27 +735,19 @@ def transform_points_for_eye_position(landmarks, left_eye_position_x=0.0, left_e
     try:
         from utils.face_landmarks import LEFT_EYE_INDICES, RIGHT_EYE_INDICES
         
-        transformed_landmarks = list(landmarks)
+        transformed_landmarks = as_landmarks(landmarks)
         
         # 왼쪽 눈 이동
         if abs(left_eye_position_x) >= 0.1 or abs(left_eye_position_y) >= 0.1:
-            for idx in LEFT_EYE_INDICES:
-                if idx < len(landmarks):
-                    x, y = landmarks[idx]
-                    transformed_landmarks[idx] = (
-                        x + left_eye_position_x,
-                        y + left_eye_position_y
-                    )
+            transformed_landmarks = transformed_landmarks.translate(
+                left_eye_position_x, left_eye_position_y, LEFT_EYE_INDICES
+            )
         
         # 오른쪽 눈 이동
         if abs(right_eye_position_x) >= 0.1 or abs(right_eye_position_y) >= 0.1:
-            for idx in RIGHT_EYE_INDICES:
-                if idx < len(landmarks):
-                    x, y = landmarks[idx]
-                    transformed_landmarks[idx] = (
-                        x + right_eye_position_x,
-                        y + right_eye_position_y
-                    )
+            transformed_landmarks = transformed_landmarks.translate(
+                right_eye_position_x, right_eye_position_y, RIGHT_EYE_INDICES
+            )
         
         return transformed_landmarks
         
@@ -907,6 +757,38 @@ def transform_points_for_eye_position(landmarks, left_eye_position_x=0.0, left_e
 
 
 
+# 입술 인덱스 (preview.py에서 참조)
+# 윗입술 외곽
+_UPPER_LIP_INDICES = np.array([61, 185, 40, 39, 37, 0, 267, 269, 270, 409, 291, 375, 321, 405, 314, 17, 84])
+# 아래입술 외곽
+_LOWER_LIP_INDICES = np.array([181, 91, 146, 78, 95, 88, 178, 87, 14, 317, 402, 318, 324])
+# 입 안쪽 (윗입술과 아래입술 모두 포함): 앞 절반은 윗입술 쪽, 뒤 절반은 아래입술 쪽
+_INNER_LIP_INDICES = np.array([78, 191, 80, 81, 82, 13, 312, 311, 310, 415, 308, 324, 318, 402, 317, 14, 87, 178, 88, 95])
+_INNER_UPPER_LIP_INDICES = _INNER_LIP_INDICES[:len(_INNER_LIP_INDICES) // 2]
+_INNER_LOWER_LIP_INDICES = _INNER_LIP_INDICES[len(_INNER_LIP_INDICES) // 2:]
+
+
+def _lip_group_indices(source, outer_indices, inner_indices, mouth_center_y, upper):
+    """
+    입술 그룹 인덱스 반환 (바깥 입술 + 입 안쪽 중 해당 쪽에 있는 포인트)
+    
+    Args:
+        source: 원본 포인트 배열 (N, 2)
+        outer_indices: 바깥 입술 인덱스 배열
+        inner_indices: 입 안쪽 후보 인덱스 배열
+        mouth_center_y: 입 중심 y 좌표
+        upper: True면 입 중심보다 위, False면 입 중심 이상(아래)인 안쪽 포인트만 포함
+    """
+    n = len(source)
+    outer = outer_indices[outer_indices < n]
+    inner = inner_indices[inner_indices < n]
+    if upper:
+        inner = inner[source[inner, 1] < mouth_center_y]
+    else:
+        inner = inner[source[inner, 1] >= mouth_center_y]
+    return outer, inner
+
+
 def transform_points_for_lip_shape(landmarks, upper_lip_shape=1.0, lower_lip_shape=1.0):
     """
     입술 모양(두께) 조정을 랜드마크 변형으로 변환합니다.
@@ -917,7 +799,7 @@ def transform_points_for_lip_shape(landmarks, upper_lip_shape=1.0, lower_lip_sha
         lower_lip_shape: 아랫입술 모양/두께 비율 (0.5 ~ 2.0)
     
     Returns:
-        transformed_landmarks: 변형된 랜드마크 포인트 리스트
+        transformed_landmarks: 변형된 랜드마크 (Landmarks)
     """
     if landmarks is None or len(landmarks) == 0:
         return landmarks
@@ -933,73 +815,25 @@ def transform_points_for_lip_shape(landmarks, upper_lip_shape=1.0, lower_lip_sha
             return landmarks
         
         mouth_center = key_landmarks['mouth']
-        transformed_landmarks = list(landmarks)
-        
-        # 입술 인덱스 (preview.py에서 참조)
-        # 윗입술 외곽
-        UPPER_LIP_INDICES = [61, 185, 40, 39, 37, 0, 267, 269, 270, 409, 291, 375, 321, 405, 314, 17, 84]
-        # 아래입술 외곽
-        LOWER_LIP_INDICES = [181, 91, 146, 78, 95, 88, 178, 87, 14, 317, 402, 318, 324]
-        # 입 안쪽 (윗입술과 아래입술 모두 포함)
-        INNER_LIP_INDICES = [78, 191, 80, 81, 82, 13, 312, 311, 310, 415, 308, 324, 318, 402, 317, 14, 87, 178, 88, 95]
-        
-        # 윗입술 모양 조정 (수직 방향으로 확대/축소)
-        if abs(upper_lip_shape - 1.0) >= 0.01:
-            # 윗입술 중심 계산
-            upper_lip_points = [landmarks[i] for i in UPPER_LIP_INDICES if i < len(landmarks)]
-            if upper_lip_points:
-                upper_lip_center_y = sum(p[1] for p in upper_lip_points) / len(upper_lip_points)
-                
-                for idx in UPPER_LIP_INDICES:
-                    if idx < len(landmarks):
-                        x, y = landmarks[idx]
-                        # 입술 중심 기준으로 수직 방향만 조정
-                        dy = y - upper_lip_center_y
-                        transformed_landmarks[idx] = (
-                            x,
-                            upper_lip_center_y + dy * upper_lip_shape
-                        )
-                
-                # 입 안쪽 윗입술 부분도 조정
-                for idx in INNER_LIP_INDICES[:len(INNER_LIP_INDICES)//2]:
-                    if idx < len(landmarks):
-                        x, y = landmarks[idx]
-                        if y < mouth_center[1]:  # 윗입술 영역
-                            dy = y - upper_lip_center_y
-                            transformed_landmarks[idx] = (
-                                x,
-                                upper_lip_center_y + dy * upper_lip_shape
-                            )
-        
-        # 아래입술 모양 조정 (수직 방향으로 확대/축소)
-        if abs(lower_lip_shape - 1.0) >= 0.01:
-            # 아래입술 중심 계산
-            lower_lip_points = [landmarks[i] for i in LOWER_LIP_INDICES if i < len(landmarks)]
-            if lower_lip_points:
-                lower_lip_center_y = sum(p[1] for p in lower_lip_points) / len(lower_lip_points)
-                
-                for idx in LOWER_LIP_INDICES:
-                    if idx < len(landmarks):
-                        x, y = landmarks[idx]
-                        # 입술 중심 기준으로 수직 방향만 조정
-                        dy = y - lower_lip_center_y
-                        transformed_landmarks[idx] = (
-                            x,
-                            lower_lip_center_y + dy * lower_lip_shape
-                        )
-                
-                # 입 안쪽 아래입술 부분도 조정
-                for idx in INNER_LIP_INDICES[len(INNER_LIP_INDICES)//2:]:
-                    if idx < len(landmarks):
-                        x, y = landmarks[idx]
-                        if y >= mouth_center[1]:  # 아래입술 영역
-                            dy = y - lower_lip_center_y
-                            transformed_landmarks[idx] = (
-                                x,
-                                lower_lip_center_y + dy * lower_lip_shape
-                            )
-        
-        return transformed_landmarks
+        source = as_point_array(landmarks)
+        result = source.copy()
+        
+        # 입술 중심 기준으로 수직 방향만 확대/축소 (모든 계산은 원본 좌표 기준)
+        for shape, outer_indices, inner_indices, upper in (
+            (upper_lip_shape, _UPPER_LIP_INDICES, _INNER_UPPER_LIP_INDICES, True),
+            (lower_lip_shape, _LOWER_LIP_INDICES, _INNER_LOWER_LIP_INDICES, False),
+        ):
+            if abs(shape - 1.0) < 0.01:
+                continue
+            outer, inner = _lip_group_indices(source, outer_indices, inner_indices, mouth_center[1], upper)
+            if len(outer) == 0:
+                continue
+            center_y = source[outer, 1].mean(dtype=np.float64)
+            for idx in (outer, inner):
+                result[idx, 0] = source[idx, 0]
+                result[idx, 1] = center_y + (source[idx, 1] - center_y) * shape
+        
+        return Landmarks(result, copy=False)
         
     except Exception as e:
         return landmarks
@@ -1017,7 +851,7 @@ def transform_points_for_lip_width(landmarks, upper_lip_width=1.0, lower_lip_wid
         lower_lip_width: 아랫입술 너비 비율 (0.5 ~ 2.0)
     
     Returns:
-        transformed_landmarks: 변형된 랜드마크 포인트 리스트
+        transformed_landmarks: 변형된 랜드마크 (Landmarks)
     """
     if landmarks is None or len(landmarks) == 0:
         return landmarks
@@ -1033,58 +867,22 @@ def transform_points_for_lip_width(landmarks, upper_lip_width=1.0, lower_lip_wid
             return landmarks
         
         mouth_center = key_landmarks['mouth']
-        transformed_landmarks = list(landmarks)
-        
-        # 입술 인덱스
-        UPPER_LIP_INDICES = [61, 185, 40, 39, 37, 0, 267, 269, 270, 409, 291, 375, 321, 405, 314, 17, 84]
-        LOWER_LIP_INDICES = [181, 91, 146, 78, 95, 88, 178, 87, 14, 317, 402, 318, 324]
-        INNER_LIP_INDICES = [78, 191, 80, 81, 82, 13, 312, 311, 310, 415, 308, 324, 318, 402, 317, 14, 87, 178, 88, 95]
-        
-        # 윗입술 너비 조정 (수평 방향으로 확대/축소)
-        if abs(upper_lip_width - 1.0) >= 0.01:
-            for idx in UPPER_LIP_INDICES:
-                if idx < len(landmarks):
-                    x, y = landmarks[idx]
-                    dx = x - mouth_center[0]
-                    transformed_landmarks[idx] = (
-                        mouth_center[0] + dx * upper_lip_width,
-                        y
-                    )
-            
-            # 입 안쪽 윗입술 부분도 조정
-            for idx in INNER_LIP_INDICES[:len(INNER_LIP_INDICES)//2]:
-                if idx < len(landmarks):
-                    x, y = landmarks[idx]
-                    if y < mouth_center[1]:  # 윗입술 영역
-                        dx = x - mouth_center[0]
-                        transformed_landmarks[idx] = (
-                            mouth_center[0] + dx * upper_lip_width,
-                            y
-                        )
-        
-        # 아래입술 너비 조정 (수평 방향으로 확대/축소)
-        if abs(lower_lip_width - 1.0) >= 0.01:
-            for idx in LOWER_LIP_INDICES:
-                if idx < len(landmarks):
-                    x, y = landmarks[idx]
-                    dx = x - mouth_center[0]
-                    transformed_landmarks[idx] = (
-                        mouth_center[0] + dx * lower_lip_width,
-                        y
-                    )
-            
-            # 입 안쪽 아래입술 부분도 조정
-            for idx in INNER_LIP_INDICES[len(INNER_LIP_INDICES)//2:]:
-                if idx < len(landmarks):
-                    x, y = landmarks[idx]
-                    if y >= mouth_center[1]:  # 아래입술 영역
-                        dx = x - mouth_center[0]
-                        transformed_landmarks[idx] = (
-                            mouth_center[0] + dx * lower_lip_width,
-                            y
-                        )
-        
-        return transformed_landmarks
+        source = as_point_array(landmarks)
+        result = source.copy()
+        
+        # 입 중심 기준으로 수평 방향만 확대/축소 (모든 계산은 원본 좌표 기준)
+        for width, outer_indices, inner_indices, upper in (
+            (upper_lip_width, _UPPER_LIP_INDICES, _INNER_UPPER_LIP_INDICES, True),
+            (lower_lip_width, _LOWER_LIP_INDICES, _INNER_LOWER_LIP_INDICES, False),
+        ):
+            if abs(width - 1.0) < 0.01:
+                continue
+            outer, inner = _lip_group_indices(source, outer_indices, inner_indices, mouth_center[1], upper)
+            for idx in (outer, inner):
+                result[idx, 0] = mouth_center[0] + (source[idx, 0] - mouth_center[0]) * width
+                result[idx, 1] = source[idx, 1]
+        
+        return Landmarks(result, copy=False)
         
     except Exception as e:
         return landmarks
@@ -1102,7 +900,7 @@ def transform_points_for_lip_vertical_move(landmarks, upper_lip_vertical_move=0.
         lower_lip_vertical_move: 아랫입술 수직 이동 (픽셀, 양수=아래로, 음수=위로)
     
     Returns:
-        transformed_landmarks: 변형된 랜드마크 포인트 리스트
+        transformed_landmarks: 변형된 랜드마크 (Landmarks)
     """
     if landmarks is None or len(landmarks) == 0:
         return landmarks
@@ -1118,48 +916,22 @@ def transform_points_for_lip_vertical_move(landmarks, upper_lip_vertical_move=0.
             return landmarks
         
         mouth_center = key_landmarks['mouth']
-        transformed_landmarks = list(landmarks)
-        
-        # 입술 인덱스
-        UPPER_LIP_INDICES = [61, 185, 40, 39, 37, 0, 267, 269, 270, 409, 291, 375, 321, 405, 314, 17, 84]
-        LOWER_LIP_INDICES = [181, 91, 146, 78, 95, 88, 178, 87, 14, 317, 402, 318, 324]
-        INNER_LIP_INDICES = [78, 191, 80, 81, 82, 13, 312, 311, 310, 415, 308, 324, 318, 402, 317, 14, 87, 178, 88, 95]
-        
-        # 윗입술 수직 이동
-        if abs(upper_lip_vertical_move) >= 0.1:
-            # 양수=위로, 음수=아래로 이동
-            move_y = -upper_lip_vertical_move  # UI에서는 양수=위로이므로 y축은 반대
-            
-            for idx in UPPER_LIP_INDICES:
-                if idx < len(landmarks):
-                    x, y = landmarks[idx]
-                    transformed_landmarks[idx] = (x, y + move_y)
-            
-            # 입 안쪽 윗입술 부분도 이동
-            for idx in INNER_LIP_INDICES[:len(INNER_LIP_INDICES)//2]:
-                if idx < len(landmarks):
-                    x, y = landmarks[idx]
-                    if y < mouth_center[1]:  # 윗입술 영역
-                        transformed_landmarks[idx] = (x, y + move_y)
-        
-        # 아래입술 수직 이동
-        if abs(lower_lip_vertical_move) >= 0.1:
-            # 양수=아래로, 음수=위로 이동
-            move_y = lower_lip_vertical_move
-            
-            for idx in LOWER_LIP_INDICES:
-                if idx < len(landmarks):
-                    x, y = landmarks[idx]
-                    transformed_landmarks[idx] = (x, y + move_y)
-            
-            # 입 안쪽 아래입술 부분도 이동
-            for idx in INNER_LIP_INDICES[len(INNER_LIP_INDICES)//2:]:
-                if idx < len(landmarks):
-                    x, y = landmarks[idx]
-                    if y >= mouth_center[1]:  # 아래입술 영역
-                        transformed_landmarks[idx] = (x, y + move_y)
-        
-        return transformed_landmarks
+        source = as_point_array(landmarks)
+        result = source.copy()
+        
+        # 윗입술: UI에서는 양수=위로이므로 y축은 반대, 아랫입술: 양수=아래로
+        for move, outer_indices, inner_indices, upper in (
+            (-upper_lip_vertical_move, _UPPER_LIP_INDICES, _INNER_UPPER_LIP_INDICES, True),
+            (lower_lip_vertical_move, _LOWER_LIP_INDICES, _INNER_LOWER_LIP_INDICES, False),
+        ):
+            if abs(move) < 0.1:
+                continue
+            outer, inner = _lip_group_indices(source, outer_indices, inner_indices, mouth_center[1], upper)
+            for idx in (outer, inner):
+                result[idx, 0] = source[idx, 0]
+                result[idx, 1] = source[idx, 1] + move
+        
+        return Landmarks(result, copy=False)
         
     except Exception as e:
         return landmarks
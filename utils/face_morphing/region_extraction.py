@@ -2,6 +2,10 @@
 영역 추출 함수 모듈
 얼굴 특징 영역(눈, 입, 코)을 추출하는 함수들
 """
+import numpy as np
+
+from utils import facemesh_topology
+from utils.landmarks import as_point_array
 from .constants import _landmarks_available
 
 
@@ -11,28 +15,48 @@ def get_iris_indices():
     Returns:
         (left_iris_indices, right_iris_indices): 왼쪽/오른쪽 눈동자 인덱스 리스트 튜플
     """
-    try:
-        import mediapipe as mp
-        mp_face_mesh = mp.solutions.face_mesh
-        LEFT_IRIS = list(mp_face_mesh.FACEMESH_LEFT_IRIS)
-        RIGHT_IRIS = list(mp_face_mesh.FACEMESH_RIGHT_IRIS)
-        
-        # MediaPipe에서 실제 인덱스 추출
-        left_iris_indices_set = set()
-        for idx1, idx2 in LEFT_IRIS:
-            left_iris_indices_set.add(idx1)
-            left_iris_indices_set.add(idx2)
-        
-        right_iris_indices_set = set()
-        for idx1, idx2 in RIGHT_IRIS:
-            right_iris_indices_set.add(idx1)
-            right_iris_indices_set.add(idx2)
-        
-        return list(left_iris_indices_set), list(right_iris_indices_set)
-    except (ImportError, AttributeError):
-        # MediaPipe가 없거나 FACEMESH_LEFT_IRIS/FACEMESH_RIGHT_IRIS가 없으면 기본값 사용
-        # 실제 MediaPipe 정의: LEFT_IRIS=[474,475,476,477], RIGHT_IRIS=[469,470,471,472]
-        return [474, 475, 476, 477], [469, 470, 471, 472]
+    # 실제 MediaPipe 정의: LEFT_IRIS=[474,475,476,477], RIGHT_IRIS=[469,470,471,472]
+    return facemesh_topology.LEFT_IRIS_INDICES.tolist(), facemesh_topology.RIGHT_IRIS_INDICES.tolist()
+
+
+# 부위 이름별 랜드마크 인덱스 배열 (토폴로지 모듈에서 한 번만 구성)
+_UPPER_LIPS_INDICES = np.array([61, 185, 40, 39, 37, 0, 267, 269, 270, 409, 291, 375, 321, 405, 314, 17, 84], dtype=np.int32)
+_LOWER_LIPS_INDICES = np.array([181, 91, 146, 78, 95, 88, 178, 87, 14, 317, 402, 318, 324], dtype=np.int32)
+
+_REGION_INDICES = {
+    'face_oval': facemesh_topology.FACE_OVAL_INDICES,
+    'left_eye': facemesh_topology.LEFT_EYE_INDICES,
+    'right_eye': facemesh_topology.RIGHT_EYE_INDICES,
+    'left_eyebrow': facemesh_topology.LEFT_EYEBROW_INDICES,
+    'right_eyebrow': facemesh_topology.RIGHT_EYEBROW_INDICES,
+    'nose': facemesh_topology.NOSE_INDICES,
+    'lips': facemesh_topology.LIPS_INDICES,
+    # 하위 호환성 유지 (기존 코드 지원)
+    'upper_lips': _UPPER_LIPS_INDICES,
+    'lower_lips': _LOWER_LIPS_INDICES,
+    'left_iris': facemesh_topology.LEFT_IRIS_INDICES,
+    'right_iris': facemesh_topology.RIGHT_IRIS_INDICES,
+    'contours': facemesh_topology.CONTOURS_INDICES,
+    # Tesselation 선택 시 눈동자도 포함
+    'tesselation': np.union1d(facemesh_topology.TESSELATION_INDICES, facemesh_topology.IRISES_INDICES),
+}
+
+
+def get_region_indices(region_name):
+    """부위 이름에 해당하는 랜드마크 인덱스 배열 반환 (알 수 없는 부위면 None)"""
+    return _REGION_INDICES.get(region_name)
+
+
+def _get_region_points(region_name, landmarks):
+    """부위의 유효한 랜드마크 좌표 배열 (N, 2) 반환 (없으면 None)"""
+    indices = _REGION_INDICES.get(region_name)
+    if indices is None:
+        return None
+    points = as_point_array(landmarks)
+    indices = indices[indices < len(points)]
+    if len(indices) == 0:
+        return None
+    return points[indices].astype(np.float64)
 
 
 def _get_eye_region(key_landmarks, img_width, img_height, eye='left', landmarks=None, padding_ratio=None, offset_x=None, offset_y=None):
@@ -395,149 +419,14 @@ def _get_region_center(region_name, landmarks, center_offset_x=0.0, center_offse
         return None
     
     try:
-        import mediapipe as mp
-        mp_face_mesh = mp.solutions.face_mesh
-        
-        indices = []
-        
-        if region_name == 'face_oval':
-            FACE_OVAL = list(mp_face_mesh.FACEMESH_FACE_OVAL)
-            for conn in FACE_OVAL:
-                indices.append(conn[0])
-                indices.append(conn[1])
-        elif region_name == 'left_eye':
-            LEFT_EYE = list(mp_face_mesh.FACEMESH_LEFT_EYE)
-            for conn in LEFT_EYE:
-                indices.append(conn[0])
-                indices.append(conn[1])
-        elif region_name == 'right_eye':
-            RIGHT_EYE = list(mp_face_mesh.FACEMESH_RIGHT_EYE)
-            for conn in RIGHT_EYE:
-                indices.append(conn[0])
-                indices.append(conn[1])
-        elif region_name == 'left_eyebrow':
-            LEFT_EYEBROW = list(mp_face_mesh.FACEMESH_LEFT_EYEBROW)
-            for conn in LEFT_EYEBROW:
-                indices.append(conn[0])
-                indices.append(conn[1])
-        elif region_name == 'right_eyebrow':
-            RIGHT_EYEBROW = list(mp_face_mesh.FACEMESH_RIGHT_EYEBROW)
-            for conn in RIGHT_EYEBROW:
-                indices.append(conn[0])
-                indices.append(conn[1])
-        elif region_name == 'nose':
-            NOSE = list(mp_face_mesh.FACEMESH_NOSE)
-            for conn in NOSE:
-                indices.append(conn[0])
-                indices.append(conn[1])
-        elif region_name == 'lips':
-            # Lips 전체 인덱스 (FACEMESH_LIPS 사용)
-            LIPS = list(mp_face_mesh.FACEMESH_LIPS)
-            for conn in LIPS:
-                indices.append(conn[0])
-                indices.append(conn[1])
-        elif region_name == 'upper_lips':
-            # 하위 호환성 유지 (기존 코드 지원)
-            UPPER_LIP_INDICES = [61, 185, 40, 39, 37, 0, 267, 269, 270, 409, 291, 375, 321, 405, 314, 17, 84]
-            indices = UPPER_LIP_INDICES
-        elif region_name == 'lower_lips':
-            # 하위 호환성 유지 (기존 코드 지원)
-            LOWER_LIP_INDICES = [181, 91, 146, 78, 95, 88, 178, 87, 14, 317, 402, 318, 324]
-            indices = LOWER_LIP_INDICES
-        elif region_name == 'left_iris':
-            try:
-                LEFT_IRIS = list(mp_face_mesh.FACEMESH_LEFT_IRIS)
-                for conn in LEFT_IRIS:
-                    indices.append(conn[0])
-                    indices.append(conn[1])
-            except AttributeError:
-                # refine_landmarks=False인 경우 (MediaPipe 정의 사용)
-                try:
-                    left_iris_indices, _ = get_iris_indices()
-                    indices = left_iris_indices
-                except (ImportError, AttributeError):
-                    # 폴백: 하드코딩된 인덱스 사용 (실제 MediaPipe 정의: LEFT_IRIS=[474,475,476,477])
-                    indices = [474, 475, 476, 477]
-        elif region_name == 'right_iris':
-            try:
-                RIGHT_IRIS = list(mp_face_mesh.FACEMESH_RIGHT_IRIS)
-                for conn in RIGHT_IRIS:
-                    indices.append(conn[0])
-                    indices.append(conn[1])
-            except AttributeError:
-                # refine_landmarks=False인 경우 (MediaPipe 정의 사용)
-                try:
-                    _, right_iris_indices = get_iris_indices()
-                    indices = right_iris_indices
-                except (ImportError, AttributeError):
-                    # 폴백: 하드코딩된 인덱스 사용 (실제 MediaPipe 정의: RIGHT_IRIS=[469,470,471,472])
-                    indices = [469, 470, 471, 472]
-        elif region_name == 'contours':
-            CONTOURS = list(mp_face_mesh.FACEMESH_CONTOURS)
-            for conn in CONTOURS:
-                indices.append(conn[0])
-                indices.append(conn[1])
-        elif region_name == 'tesselation':
-            TESSELATION = list(mp_face_mesh.FACEMESH_TESSELATION)
-            for conn in TESSELATION:
-                indices.append(conn[0])
-                indices.append(conn[1])
-            # Tesselation 선택 시 눈동자도 포함
-            try:
-                LEFT_IRIS = list(mp_face_mesh.FACEMESH_LEFT_IRIS)
-                for conn in LEFT_IRIS:
-                    indices.append(conn[0])
-                    indices.append(conn[1])
-            except AttributeError:
-                # 구버전 MediaPipe에서는 눈동자 인덱스 직접 추가 (MediaPipe 정의 사용)
-                try:
-                    left_iris_indices, _ = get_iris_indices()
-                    indices.extend(left_iris_indices)
-                except (ImportError, AttributeError):
-                    # 폴백: 하드코딩된 인덱스 사용 (실제 MediaPipe 정의: LEFT_IRIS=[474,475,476,477])
-                    indices.extend([474, 475, 476, 477])
-            try:
-                RIGHT_IRIS = list(mp_face_mesh.FACEMESH_RIGHT_IRIS)
-                for conn in RIGHT_IRIS:
-                    indices.append(conn[0])
-                    indices.append(conn[1])
-            except AttributeError:
-                # 구버전 MediaPipe에서는 눈동자 인덱스 직접 추가 (MediaPipe 정의 사용)
-                try:
-                    _, right_iris_indices = get_iris_indices()
-                    indices.extend(right_iris_indices)
-                except (ImportError, AttributeError):
-                    # 폴백: 하드코딩된 인덱스 사용 (실제 MediaPipe 정의: RIGHT_IRIS=[469,470,471,472])
-                    indices.extend([469, 470, 471, 472])
-        else:
-            return None
-        
-        # 중복 제거
-        indices = list(set(indices))
-        
-        # 유효한 인덱스만 필터링
-        valid_indices = [i for i in indices if i < len(landmarks)]
-        
-        if not valid_indices:
-            return None
-        
-        # 포인트들의 평균 좌표 계산 (기본 중심점)
-        x_coords = []
-        y_coords = []
-        for idx in valid_indices:
-            point = landmarks[idx]
-            x_coords.append(point[0])
-            y_coords.append(point[1])
-        
-        if not x_coords or not y_coords:
+        points = _get_region_points(region_name, landmarks)
+        if points is None:
             return None
         
-        center_x = sum(x_coords) / len(x_coords)
-        center_y = sum(y_coords) / len(y_coords)
-        
-        # 오프셋 적용
-        center_x += center_offset_x
-        center_y += center_offset_y
+        # 포인트들의 평균 좌표 계산 (기본 중심점) 후 오프셋 적용
+        center_x, center_y = points.mean(axis=0)
+        center_x = float(center_x) + center_offset_x
+        center_y = float(center_y) + center_offset_y
         
         return (center_x, center_y)
         
@@ -566,137 +455,13 @@ def _get_region_bbox(region_name, landmarks, img_width, img_height, padding_rati
         return None
     
     try:
-        import mediapipe as mp
-        mp_face_mesh = mp.solutions.face_mesh
-        
-        indices = []
-        
-        if region_name == 'face_oval':
-            FACE_OVAL = list(mp_face_mesh.FACEMESH_FACE_OVAL)
-            for conn in FACE_OVAL:
-                indices.append(conn[0])
-                indices.append(conn[1])
-        elif region_name == 'left_eye':
-            LEFT_EYE = list(mp_face_mesh.FACEMESH_LEFT_EYE)
-            for conn in LEFT_EYE:
-                indices.append(conn[0])
-                indices.append(conn[1])
-        elif region_name == 'right_eye':
-            RIGHT_EYE = list(mp_face_mesh.FACEMESH_RIGHT_EYE)
-            for conn in RIGHT_EYE:
-                indices.append(conn[0])
-                indices.append(conn[1])
-        elif region_name == 'left_eyebrow':
-            LEFT_EYEBROW = list(mp_face_mesh.FACEMESH_LEFT_EYEBROW)
-            for conn in LEFT_EYEBROW:
-                indices.append(conn[0])
-                indices.append(conn[1])
-        elif region_name == 'right_eyebrow':
-            RIGHT_EYEBROW = list(mp_face_mesh.FACEMESH_RIGHT_EYEBROW)
-            for conn in RIGHT_EYEBROW:
-                indices.append(conn[0])
-                indices.append(conn[1])
-        elif region_name == 'nose':
-            NOSE = list(mp_face_mesh.FACEMESH_NOSE)
-            for conn in NOSE:
-                indices.append(conn[0])
-                indices.append(conn[1])
-        elif region_name == 'lips':
-            LIPS = list(mp_face_mesh.FACEMESH_LIPS)
-            for conn in LIPS:
-                indices.append(conn[0])
-                indices.append(conn[1])
-        elif region_name == 'upper_lips':
-            UPPER_LIP_INDICES = [61, 185, 40, 39, 37, 0, 267, 269, 270, 409, 291, 375, 321, 405, 314, 17, 84]
-            indices = UPPER_LIP_INDICES
-        elif region_name == 'lower_lips':
-            LOWER_LIP_INDICES = [181, 91, 146, 78, 95, 88, 178, 87, 14, 317, 402, 318, 324]
-            indices = LOWER_LIP_INDICES
-        elif region_name == 'left_iris':
-            try:
-                LEFT_IRIS = list(mp_face_mesh.FACEMESH_LEFT_IRIS)
-                for conn in LEFT_IRIS:
-                    indices.append(conn[0])
-                    indices.append(conn[1])
-            except AttributeError:
-                try:
-                    left_iris_indices, _ = get_iris_indices()
-                    indices = left_iris_indices
-                except (ImportError, AttributeError):
-                    indices = [474, 475, 476, 477]
-        elif region_name == 'right_iris':
-            try:
-                RIGHT_IRIS = list(mp_face_mesh.FACEMESH_RIGHT_IRIS)
-                for conn in RIGHT_IRIS:
-                    indices.append(conn[0])
-                    indices.append(conn[1])
-            except AttributeError:
-                try:
-                    _, right_iris_indices = get_iris_indices()
-                    indices = right_iris_indices
-                except (ImportError, AttributeError):
-                    indices = [469, 470, 471, 472]
-        elif region_name == 'contours':
-            CONTOURS = list(mp_face_mesh.FACEMESH_CONTOURS)
-            for conn in CONTOURS:
-                indices.append(conn[0])
-                indices.append(conn[1])
-        elif region_name == 'tesselation':
-            TESSELATION = list(mp_face_mesh.FACEMESH_TESSELATION)
-            for conn in TESSELATION:
-                indices.append(conn[0])
-                indices.append(conn[1])
-            # Tesselation 선택 시 눈동자도 포함
-            try:
-                LEFT_IRIS = list(mp_face_mesh.FACEMESH_LEFT_IRIS)
-                for conn in LEFT_IRIS:
-                    indices.append(conn[0])
-                    indices.append(conn[1])
-            except AttributeError:
-                try:
-                    left_iris_indices, _ = get_iris_indices()
-                    indices.extend(left_iris_indices)
-                except (ImportError, AttributeError):
-                    indices.extend([474, 475, 476, 477])
-            try:
-                RIGHT_IRIS = list(mp_face_mesh.FACEMESH_RIGHT_IRIS)
-                for conn in RIGHT_IRIS:
-                    indices.append(conn[0])
-                    indices.append(conn[1])
-            except AttributeError:
-                try:
-                    _, right_iris_indices = get_iris_indices()
-                    indices.extend(right_iris_indices)
-                except (ImportError, AttributeError):
-                    indices.extend([469, 470, 471, 472])
-        else:
-            return None
-        
-        # 중복 제거
-        indices = list(set(indices))
-        
-        # 유효한 인덱스만 필터링
-        valid_indices = [i for i in indices if i < len(landmarks)]
-        
-        if not valid_indices:
-            return None
-        
-        # 랜드마크 좌표 추출
-        x_coords = []
-        y_coords = []
-        for idx in valid_indices:
-            point = landmarks[idx]
-            x_coords.append(point[0])
-            y_coords.append(point[1])
-        
-        if not x_coords or not y_coords:
+        points = _get_region_points(region_name, landmarks)
+        if points is None:
             return None
         
         # 바운딩 박스 계산
-        min_x = min(x_coords)
-        max_x = max(x_coords)
-        min_y = min(y_coords)
-        max_y = max(y_coords)
+        min_x, min_y = (float(v) for v in points.min(axis=0))
+        max_x, max_y = (float(v) for v in points.max(axis=0))
         
         # 중심점 계산
         center_x = (min_x + max_x) / 2
@@ -0,0 +1,638 @@
+"""
+MediaPipe FaceMesh 토폴로지 상수 (자동 생성 파일 - 직접 수정하지 마세요)
+생성: debug/generate_facemesh_topology.py (mediapipe 0.10.14)
+
+MediaPipe 없이 로드되며, mp.solutions.face_mesh 대신 그대로 사용할 수 있습니다.
+- FACEMESH_*: 기존과 같은 frozenset[(a, b)] 연결 집합
+- *_EDGES: (E, 2) int32 간선 배열, *_INDICES: 정렬된 고유 정점 인덱스 배열
+- TESSELATION_TRIANGLES: (T, 3) int32 테셀레이션 삼각형
+"""
+import numpy as np
+
+FACEMESH_NUM_LANDMARKS = 468
+FACEMESH_NUM_LANDMARKS_WITH_IRISES = 478
+
+
+def _edges(flat):
+    """평탄화된 간선 튜플을 (E, 2) 읽기 전용 배열로 변환"""
+    array = np.array(flat, dtype=np.int32).reshape(-1, 2)
+    array.flags.writeable = False
+    return array
+
+
+def _indices(edges):
+    """간선 배열의 고유 정점 인덱스 (정렬, 읽기 전용)"""
+    array = np.unique(edges).astype(np.int32)
+    array.flags.writeable = False
+    return array
+
+
+def _connections(edges):
+    """간선 배열을 mp.solutions.face_mesh와 같은 frozenset 형식으로 변환"""
+    return frozenset(tuple(edge) for edge in edges.tolist())
+
+
+LIPS_EDGES = _edges((
+    0, 267, 13, 312, 14, 317, 17, 314, 37, 0, 39, 37, 40, 39, 61, 146,
+    61, 185, 78, 95, 78, 191, 80, 81, 81, 82, 82, 13, 84, 17, 87, 14,
+    88, 178, 91, 181, 95, 88, 146, 91, 178, 87, 181, 84, 185, 40, 191, 80,
+    267, 269, 269, 270, 270, 409, 310, 415, 311, 310, 312, 311, 314, 405, 317, 402,
+    318, 324, 321, 375, 324, 308, 375, 291, 402, 318, 405, 321, 409, 291, 415, 308,
+))
+LIPS_INDICES = _indices(LIPS_EDGES)
+FACEMESH_LIPS = _connections(LIPS_EDGES)
+
+LEFT_EYE_EDGES = _edges((
+    249, 390, 263, 249, 263, 466, 373, 374, 374, 380, 380, 381, 381, 382, 382, 362,
+    384, 398, 385, 384, 386, 385, 387, 386, 388, 387, 390, 373, 398, 362, 466, 388,
+))
+LEFT_EYE_INDICES = _indices(LEFT_EYE_EDGES)
+FACEMESH_LEFT_EYE = _connections(LEFT_EYE_EDGES)
+
+LEFT_IRIS_EDGES = _edges((
+    474, 475, 475, 476, 476, 477, 477, 474,
+))
+LEFT_IRIS_INDICES = _indices(LEFT_IRIS_EDGES)
+FACEMESH_LEFT_IRIS = _connections(LEFT_IRIS_EDGES)
+
+LEFT_EYEBROW_EDGES = _edges((
+    276, 283, 282, 295, 283, 282, 293, 334, 295, 285, 296, 336, 300, 293, 334, 296,
+))
+LEFT_EYEBROW_INDICES = _indices(LEFT_EYEBROW_EDGES)
+FACEMESH_LEFT_EYEBROW = _connections(LEFT_EYEBROW_EDGES)
+
+RIGHT_EYE_EDGES = _edges((
+    7, 163, 33, 7, 33, 246, 144, 145, 145, 153, 153, 154, 154, 155, 155, 133,
+    157, 173, 158, 157, 159, 158, 160, 159, 161, 160, 163, 144, 173, 133, 246, 161,
+))
+RIGHT_EYE_INDICES = _indices(RIGHT_EYE_EDGES)
+FACEMESH_RIGHT_EYE = _connections(RIGHT_EYE_EDGES)
+
+RIGHT_IRIS_EDGES = _edges((
+    469, 470, 470, 471, 471, 472, 472, 469,
+))
+RIGHT_IRIS_INDICES = _indices(RIGHT_IRIS_EDGES)
+FACEMESH_RIGHT_IRIS = _connections(RIGHT_IRIS_EDGES)
+
+RIGHT_EYEBROW_EDGES = _edges((
+    46, 53, 52, 65, 53, 52, 63, 105, 65, 55, 66, 107, 70, 63, 105, 66,
+))
+RIGHT_EYEBROW_INDICES = _indices(RIGHT_EYEBROW_EDGES)
+FACEMESH_RIGHT_EYEBROW = _connections(RIGHT_EYEBROW_EDGES)
+
+FACE_OVAL_EDGES = _edges((
+    10, 338, 21, 54, 54, 103, 58, 132, 67, 109, 93, 234, 103, 67, 109, 10,
+    127, 162, 132, 93, 136, 172, 148, 176, 149, 150, 150, 136, 152, 148, 162, 21,
+    172, 58, 176, 149, 234, 127, 251, 389, 284, 251, 288, 397, 297, 332, 323, 361,
+    332, 284, 338, 297, 356, 454, 361, 288, 365, 379, 377, 152, 378, 400, 379, 378,
+    389, 356, 397, 365, 400, 377, 454, 323,
+))
+FACE_OVAL_INDICES = _indices(FACE_OVAL_EDGES)
+FACEMESH_FACE_OVAL = _connections(FACE_OVAL_EDGES)
+
+NOSE_EDGES = _edges((
+    1, 19, 2, 326, 4, 1, 4, 45, 5, 4, 6, 197, 19, 94, 45, 220,
+    48, 64, 64, 98, 94, 2, 97, 2, 98, 97, 115, 48, 168, 6, 195, 5,
+    197, 195, 220, 115, 275, 4, 278, 344, 294, 278, 326, 327, 327, 294, 344, 440,
+    440, 275,
+))
+NOSE_INDICES = _indices(NOSE_EDGES)
+FACEMESH_NOSE = _connections(NOSE_EDGES)
+
+CONTOURS_EDGES = _edges((
+    0, 267, 7, 163, 10, 338, 13, 312, 14, 317, 17, 314, 21, 54, 33, 7,
+    33, 246, 37, 0, 39, 37, 40, 39, 46, 53, 52, 65, 53, 52, 54, 103,
+    58, 132, 61, 146, 61, 185, 63, 105, 65, 55, 66, 107, 67, 109, 70, 63,
+    78, 95, 78, 191, 80, 81, 81, 82, 82, 13, 84, 17, 87, 14, 88, 178,
+    91, 181, 93, 234, 95, 88, 103, 67, 105, 66, 109, 10, 127, 162, 132, 93,
+    136, 172, 144, 145, 145, 153, 146, 91, 148, 176, 149, 150, 150, 136, 152, 148,
+    153, 154, 154, 155, 155, 133, 157, 173, 158, 157, 159, 158, 160, 159, 161, 160,
+    162, 21, 163, 144, 172, 58, 173, 133, 176, 149, 178, 87, 181, 84, 185, 40,
+    191, 80, 234, 127, 246, 161, 249, 390, 251, 389, 263, 249, 263, 466, 267, 269,
+    269, 270, 270, 409, 276, 283, 282, 295, 283, 282, 284, 251, 288, 397, 293, 334,
+    295, 285, 296, 336, 297, 332, 300, 293, 310, 415, 311, 310, 312, 311, 314, 405,
+    317, 402, 318, 324, 321, 375, 323, 361, 324, 308, 332, 284, 334, 296, 338, 297,
+    356, 454, 361, 288, 365, 379, 373, 374, 374, 380, 375, 291, 377, 152, 378, 400,
+    379, 378, 380, 381, 381, 382, 382, 362, 384, 398, 385, 384, 386, 385, 387, 386,
+    388, 387, 389, 356, 390, 373, 397, 365, 398, 362, 400, 377, 402, 318, 405, 321,
+    409, 291, 415, 308, 454, 323, 466, 388,
+))
+CONTOURS_INDICES = _indices(CONTOURS_EDGES)
+FACEMESH_CONTOURS = _connections(CONTOURS_EDGES)
+
+IRISES_EDGES = _edges((
+    469, 470, 470, 471, 471, 472, 472, 469, 474, 475, 475, 476, 476, 477, 477, 474,
+))
+IRISES_INDICES = _indices(IRISES_EDGES)
+FACEMESH_IRISES = _connections(IRISES_EDGES)
+
+TESSELATION_EDGES = _edges((
+    0, 11, 0, 37, 0, 164, 0, 267, 1, 4, 1, 19, 1, 44, 1, 274,
+    2, 94, 2, 97, 2, 141, 2, 164, 2, 167, 2, 326, 2, 370, 2, 393,
+    3, 51, 3, 195, 3, 196, 3, 197, 3, 236, 4, 1, 4, 5, 4, 44,
+    4, 45, 4, 51, 4, 274, 4, 275, 4, 281, 5, 4, 5, 51, 5, 195,
+    5, 281, 6, 122, 6, 168, 6, 196, 6, 197, 6, 351, 6, 419, 7, 25,
+    7, 33, 7, 110, 8, 9, 8, 55, 8, 168, 8, 193, 8, 285, 8, 417,
+    9, 8, 9, 55, 9, 107, 9, 108, 9, 151, 9, 285, 9, 336, 9, 337,
+    10, 109, 10, 151, 11, 0, 11, 12, 11, 37, 11, 72, 11, 267, 11, 302,
+    12, 11, 12, 13, 12, 38, 12, 72, 12, 268, 12, 302, 13, 12, 13, 38,
+    13, 268, 13, 312, 14, 15, 14, 86, 14, 87, 14, 316, 15, 14, 15, 16,
+    15, 85, 15, 86, 15, 315, 15, 316, 16, 15, 16, 17, 16, 85, 16, 315,
+    17, 16, 17, 18, 17, 83, 17, 84, 17, 85, 17, 313, 17, 314, 17, 315,
+    18, 17, 18, 83, 18, 200, 18, 201, 18, 313, 18, 421, 19, 1, 19, 44,
+    19, 94, 19, 125, 19, 141, 19, 274, 19, 354, 19, 370, 20, 60, 20, 79,
+    20, 99, 20, 166, 20, 238, 20, 242, 21, 68, 21, 71, 21, 162, 22, 23,
+    22, 26, 22, 145, 22, 153, 22, 154, 22, 230, 22, 231, 23, 22, 23, 24,
+    23, 144, 23, 145, 23, 229, 23, 230, 24, 23, 24, 110, 24, 144, 24, 228,
+    24, 229, 25, 7, 25, 31, 25, 33, 25, 110, 25, 130, 25, 226, 25, 228,
+    26, 22, 26, 112, 26, 154, 26, 155, 26, 231, 26, 232, 27, 28, 27, 29,
+    27, 159, 27, 160, 27, 222, 27, 223, 28, 27, 28, 56, 28, 157, 28, 158,
+    28, 159, 28, 221, 28, 222, 29, 27, 29, 30, 29, 160, 29, 223, 29, 224,
+    30, 29, 30, 160, 30, 161, 30, 224, 30, 225, 30, 247, 31, 25, 31, 111,
+    31, 117, 31, 226, 31, 228, 32, 140, 32, 171, 32, 194, 32, 201, 32, 208,
+    32, 211, 33, 25, 33, 130, 33, 246, 33, 247, 34, 127, 34, 139, 34, 143,
+    34, 156, 34, 227, 34, 234, 35, 111, 35, 113, 35, 124, 35, 143, 35, 226,
+    36, 100, 36, 101, 36, 142, 36, 203, 36, 205, 36, 206, 37, 0, 37, 11,
+    37, 39, 37, 72, 37, 164, 37, 167, 38, 12, 38, 13, 38, 41, 38, 72,
+    38, 81, 38, 82, 39, 37, 39, 40, 39, 72, 39, 73, 39, 92, 39, 165,
+    39, 167, 40, 39, 40, 73, 40, 74, 40, 92, 40, 185, 40, 186, 41, 38,
+    41, 42, 41, 72, 41, 73, 41, 74, 41, 81, 42, 41, 42, 74, 42, 80,
+    42, 81, 42, 183, 42, 184, 43, 57, 43, 61, 43, 91, 43, 106, 43, 146,
+    43, 202, 43, 204, 44, 1, 44, 4, 44, 19, 44, 45, 44, 125, 44, 220,
+    44, 237, 45, 4, 45, 44, 45, 51, 45, 134, 45, 220, 46, 53, 46, 63,
+    46, 70, 46, 113, 46, 124, 46, 156, 46, 225, 47, 100, 47, 114, 47, 121,
+    47, 126, 47, 128, 47, 217, 48, 49, 48, 64, 48, 115, 48, 131, 48, 219,
+    48, 235, 49, 48, 49, 64, 49, 102, 49, 129, 49, 131, 49, 209, 50, 101,
+    50, 117, 50, 118, 50, 123, 50, 187, 50, 205, 51, 3, 51, 4, 51, 5,
+    51, 45, 51, 134, 51, 195, 51, 236, 52, 53, 52, 63, 52, 65, 52, 66,
+    52, 105, 52, 222, 52, 223, 53, 46, 53, 52, 53, 63, 53, 223, 53, 224,
+    53, 225, 54, 21, 54, 68, 54, 104, 55, 8, 55, 9, 55, 65, 55, 107,
+    55, 189, 55, 193, 55, 221, 56, 28, 56, 157, 56, 173, 56, 190, 56, 221,
+    57, 43, 57, 61, 57, 185, 57, 186, 57, 202, 57, 212, 58, 172, 58, 177,
+    58, 215, 59, 75, 59, 166, 59, 219, 59, 235, 60, 20, 60, 75, 60, 99,
+    60, 166, 60, 240, 61, 43, 61, 57, 61, 76, 61, 146, 61, 184, 61, 185,
+    62, 76, 62, 77, 62, 78, 62, 96, 62, 183, 62, 191, 63, 46, 63, 52,
+    63, 53, 63, 68, 63, 70, 63, 71, 63, 104, 63, 105, 64, 48, 64, 49,
+    64, 98, 64, 102, 64, 129, 64, 235, 64, 240, 65, 52, 65, 55, 65, 66,
+    65, 107, 65, 221, 65, 222, 66, 52, 66, 65, 66, 69, 66, 105, 66, 107,
+    67, 69, 67, 103, 67, 104, 67, 108, 68, 21, 68, 54, 68, 63, 68, 71,
+    68, 104, 69, 66, 69, 67, 69, 104, 69, 105, 69, 107, 69, 108, 70, 46,
+    70, 63, 70, 71, 70, 139, 70, 156, 71, 21, 71, 63, 71, 68, 71, 70,
+    71, 139, 71, 162, 72, 11, 72, 12, 72, 37, 72, 38, 72, 39, 72, 41,
+    72, 73, 73, 39, 73, 40, 73, 41, 73, 72, 73, 74, 74, 40, 74, 41,
+    74, 42, 74, 73, 74, 184, 74, 185, 75, 59, 75, 60, 75, 166, 75, 235,
+    75, 240, 76, 61, 76, 62, 76, 77, 76, 146, 76, 183, 76, 184, 77, 62,
+    77, 76, 77, 90, 77, 91, 77, 96, 77, 146, 78, 62, 78, 96, 78, 191,
+    79, 20, 79, 166, 79, 218, 79, 237, 79, 238, 79, 239, 80, 42, 80, 81,
+    80, 183, 81, 38, 81, 41, 81, 42, 81, 82, 82, 13, 82, 38, 83, 17,
+    83, 18, 83, 84, 83, 181, 83, 182, 83, 201, 84, 17, 84, 83, 84, 85,
+    84, 180, 84, 181, 85, 15, 85, 16, 85, 17, 85, 84, 85, 86, 85, 179,
+    85, 180, 86, 14, 86, 15, 86, 85, 86, 87, 86, 178, 86, 179, 87, 86,
+    87, 178, 88, 89, 88, 95, 88, 96, 88, 179, 89, 88, 89, 90, 89, 96,
+    89, 179, 89, 180, 90, 77, 90, 89, 90, 91, 90, 96, 90, 180, 90, 181,
+    91, 43, 91, 77, 91, 90, 91, 106, 91, 146, 91, 181, 91, 182, 92, 39,
+    92, 40, 92, 165, 92, 186, 92, 206, 92, 216, 93, 132, 93, 137, 93, 227,
+    94, 2, 94, 19, 94, 141, 94, 370, 95, 78, 95, 96, 96, 62, 96, 77,
+    96, 78, 96, 88, 96, 89, 96, 90, 96, 95, 97, 2, 97, 98, 97, 99,
+    97, 141, 97, 165, 97, 167, 97, 242, 98, 64, 98, 97, 98, 99, 98, 129,
+    98, 165, 98, 203, 98, 240, 99, 20, 99, 60, 99, 97, 99, 98, 99, 240,
+    99, 242, 100, 36, 100, 47, 100, 101, 100, 120, 100, 121, 100, 126, 100, 142,
+    101, 36, 101, 50, 101, 100, 101, 118, 101, 119, 101, 120, 101, 205, 102, 49,
+    102, 64, 102, 129, 103, 54, 103, 104, 104, 54, 104, 63, 104, 67, 104, 68,
+    104, 69, 104, 103, 104, 105, 105, 52, 105, 63, 105, 66, 105, 69, 105, 104,
+    106, 43, 106, 91, 106, 182, 106, 194, 106, 204, 107, 9, 107, 55, 107, 65,
+    107, 66, 107, 69, 107, 108, 108, 9, 108, 67, 108, 69, 108, 107, 108, 109,
+    108, 151, 109, 67, 109, 108, 109, 151, 110, 7, 110, 24, 110, 25, 110, 144,
+    110, 163, 110, 228, 111, 31, 111, 35, 111, 116, 111, 117, 111, 123, 111, 143,
+    111, 226, 112, 26, 112, 133, 112, 155, 112, 232, 112, 233, 112, 243, 112, 244,
+    113, 35, 113, 46, 113, 124, 113, 225, 113, 226, 113, 247, 114, 47, 114, 128,
+    114, 174, 114, 188, 114, 217, 115, 48, 115, 131, 115, 218, 115, 219, 115, 220,
+    116, 111, 116, 123, 116, 137, 116, 143, 116, 227, 117, 31, 117, 50, 117, 111,
+    117, 118, 117, 123, 117, 228, 117, 229, 118, 50, 118, 101, 118, 117, 118, 119,
+    118, 229, 118, 230, 119, 101, 119, 118, 119, 120, 119, 230, 120, 100, 120, 101,
+    120, 119, 120, 121, 120, 230, 120, 231, 120, 232, 121, 47, 121, 100, 121, 120,
+    121, 128, 121, 232, 122, 6, 122, 168, 122, 188, 122, 193, 122, 196, 122, 245,
+    123, 50, 123, 111, 123, 116, 123, 117, 123, 137, 123, 147, 123, 177, 123, 187,
+    124, 35, 124, 46, 124, 113, 124, 143, 124, 156, 125, 19, 125, 44, 125, 141,
+    125, 237, 125, 241, 126, 47, 126, 100, 126, 129, 126, 142, 126, 209, 126, 217,
+    127, 34, 127, 139, 127, 234, 128, 47, 128, 114, 128, 121, 128, 188, 128, 232,
+    128, 233, 128, 245, 129, 49, 129, 64, 129, 98, 129, 102, 129, 126, 129, 142,
+    129, 203, 129, 209, 130, 25, 130, 33, 130, 226, 130, 247, 131, 48, 131, 49,
+    131, 115, 131, 134, 131, 198, 131, 209, 131, 220, 132, 58, 132, 137, 132, 177,
+    133, 112, 133, 155, 133, 190, 133, 243, 134, 45, 134, 51, 134, 131, 134, 198,
+    134, 220, 134, 236, 135, 136, 135, 138, 135, 150, 135, 169, 135, 192, 135, 214,
+    136, 135, 136, 138, 136, 150, 137, 93, 137, 116, 137, 123, 137, 132, 137, 177,
+    137, 227, 138, 135, 138, 136, 138, 172, 138, 192, 138, 213, 138, 215, 139, 34,
+    139, 70, 139, 71, 139, 127, 139, 156, 139, 162, 140, 32, 140, 148, 140, 170,
+    140, 171, 140, 176, 140, 211, 141, 2, 141, 19, 141, 94, 141, 97, 141, 125,
+    141, 241, 141, 242, 142, 36, 142, 100, 142, 126, 142, 129, 142, 203, 143, 34,
+    143, 35, 143, 111, 143, 116, 143, 124, 143, 156, 143, 227, 144, 23, 144, 24,
+    144, 110, 144, 163, 145, 22, 145, 23, 145, 144, 146, 43, 146, 61, 146, 76,
+    146, 77, 146, 91, 147, 123, 147, 177, 147, 187, 147, 213, 147, 215, 148, 140,
+    148, 152, 148, 171, 148, 175, 149, 170, 149, 176, 150, 135, 150, 149, 150, 169,
+    150, 170, 151, 9, 151, 10, 151, 108, 151, 109, 151, 337, 151, 338, 152, 175,
+    152, 377, 153, 22, 153, 145, 154, 22, 154, 26, 154, 153, 155, 26, 155, 112,
+    155, 154, 156, 34, 156, 46, 156, 70, 156, 124, 156, 139, 156, 143, 157, 28,
+    157, 56, 157, 173, 158, 28, 158, 157, 159, 27, 159, 28, 159, 158, 160, 27,
+    160, 29, 160, 30, 160, 159, 161, 30, 161, 160, 161, 247, 162, 71, 162, 127,
+    162, 139, 163, 7, 163, 110, 164, 0, 164, 2, 164, 37, 164, 167, 164, 267,
+    164, 393, 165, 39, 165, 92, 165, 97, 165, 98, 165, 167, 165, 203, 165, 206,
+    166, 20, 166, 59, 166, 60, 166, 75, 166, 79, 166, 218, 166, 219, 167, 2,
+    167, 37, 167, 39, 167, 97, 167, 164, 167, 165, 168, 6, 168, 8, 168, 122,
+    168, 193, 168, 351, 168, 417, 169, 135, 169, 150, 169, 170, 169, 210, 169, 211,
+    169, 214, 170, 140, 170, 149, 170, 150, 170, 169, 170, 176, 170, 211, 171, 32,
+    171, 140, 171, 148, 171, 175, 171, 199, 171, 208, 172, 136, 172, 138, 172, 215,
+    173, 56, 173, 133, 173, 190, 174, 114, 174, 188, 174, 196, 174, 217, 174, 236,
+    175, 148, 175, 152, 175, 171, 175, 199, 175, 377, 175, 396, 176, 140, 176, 148,
+    176, 170, 177, 58, 177, 123, 177, 132, 177, 137, 177, 147, 177, 215, 178, 86,
+    178, 88, 178, 179, 179, 85, 179, 86, 179, 88, 179, 89, 179, 178, 179, 180,
+    180, 84, 180, 85, 180, 89, 180, 90, 180, 179, 180, 181, 181, 83, 181, 84,
+    181, 90, 181, 91, 181, 180, 181, 182, 182, 83, 182, 91, 182, 106, 182, 181,
+    182, 194, 182, 201, 183, 42, 183, 62, 183, 76, 183, 80, 183, 184, 183, 191,
+    184, 42, 184, 61, 184, 74, 184, 76, 184, 183, 184, 185, 185, 40, 185, 57,
+    185, 61, 185, 74, 185, 184, 185, 186, 186, 40, 186, 57, 186, 92, 186, 185,
+    186, 212, 186, 216, 187, 50, 187, 123, 187, 147, 187, 192, 187, 205, 187, 207,
+    187, 213, 187, 214, 188, 114, 188, 122, 188, 128, 188, 174, 188, 196, 188, 245,
+    189, 55, 189, 190, 189, 193, 189, 221, 189, 243, 189, 244, 190, 56, 190, 133,
+    190, 173, 190, 189, 190, 221, 190, 243, 191, 62, 191, 80, 191, 183, 192, 135,
+    192, 138, 192, 187, 192, 213, 192, 214, 193, 8, 193, 55, 193, 122, 193, 168,
+    193, 189, 193, 244, 193, 245, 194, 32, 194, 106, 194, 182, 194, 201, 194, 204,
+    194, 211, 195, 3, 195, 5, 195, 51, 195, 197, 195, 248, 195, 281, 196, 3,
+    196, 6, 196, 122, 196, 174, 196, 188, 196, 197, 196, 236, 197, 3, 197, 6,
+    197, 195, 197, 196, 197, 248, 197, 419, 198, 131, 198, 134, 198, 209, 198, 217,
+    198, 236, 199, 171, 199, 175, 199, 200, 199, 208, 199, 396, 199, 428, 200, 18,
+    200, 199, 200, 201, 200, 208, 200, 421, 200, 428, 201, 18, 201, 32, 201, 83,
+    201, 182, 201, 194, 201, 200, 201, 208, 202, 43, 202, 57, 202, 204, 202, 210,
+    202, 212, 202, 214, 203, 36, 203, 98, 203, 129, 203, 142, 203, 165, 203, 206,
+    204, 43, 204, 106, 204, 194, 204, 202, 204, 210, 204, 211, 205, 36, 205, 50,
+    205, 101, 205, 187, 205, 206, 205, 207, 205, 216, 206, 36, 206, 92, 206, 165,
+    206, 203, 206, 205, 206, 216, 207, 187, 207, 205, 207, 212, 207, 214, 207, 216,
+    208, 32, 208, 171, 208, 199, 208, 200, 208, 201, 209, 49, 209, 126, 209, 129,
+    209, 131, 209, 198, 209, 217, 210, 169, 210, 202, 210, 204, 210, 211, 210, 214,
+    211, 32, 211, 140, 211, 169, 211, 170, 211, 194, 211, 204, 211, 210, 212, 57,
+    212, 186, 212, 202, 212, 207, 212, 214, 212, 216, 213, 138, 213, 147, 213, 187,
+    213, 192, 213, 215, 214, 135, 214, 169, 214, 187, 214, 192, 214, 202, 214, 207,
+    214, 210, 214, 212, 215, 58, 215, 138, 215, 147, 215, 172, 215, 177, 215, 213,
+    216, 92, 216, 186, 216, 205, 216, 206, 216, 207, 216, 212, 217, 47, 217, 114,
+    217, 126, 217, 174, 217, 198, 217, 209, 217, 236, 218, 79, 218, 115, 218, 166,
+    218, 219, 218, 220, 218, 237, 219, 48, 219, 59, 219, 115, 219, 166, 219, 218,
+    219, 235, 220, 44, 220, 45, 220, 115, 220, 131, 220, 134, 220, 218, 220, 237,
+    221, 28, 221, 55, 221, 56, 221, 65, 221, 189, 221, 190, 221, 222, 222, 27,
+    222, 28, 222, 52, 222, 65, 222, 221, 222, 223, 223, 27, 223, 29, 223, 52,
+    223, 53, 223, 222, 223, 224, 224, 29, 224, 30, 224, 53, 224, 223, 224, 225,
+    225, 30, 225, 46, 225, 53, 225, 113, 225, 224, 225, 247, 226, 25, 226, 31,
+    226, 35, 226, 111, 226, 113, 226, 130, 226, 247, 227, 34, 227, 93, 227, 116,
+    227, 137, 227, 143, 227, 234, 228, 24, 228, 25, 228, 31, 228, 110, 228, 117,
+    228, 229, 229, 23, 229, 24, 229, 117, 229, 118, 229, 228, 229, 230, 230, 22,
+    230, 23, 230, 118, 230, 119, 230, 120, 230, 229, 230, 231, 231, 22, 231, 26,
+    231, 120, 231, 230, 231, 232, 232, 26, 232, 112, 232, 120, 232, 121, 232, 128,
+    232, 231, 232, 233, 233, 112, 233, 128, 233, 232, 233, 244, 233, 245, 234, 34,
+    234, 93, 234, 227, 235, 48, 235, 59, 235, 64, 235, 75, 235, 219, 235, 240,
+    236, 3, 236, 51, 236, 134, 236, 174, 236, 196, 236, 198, 236, 217, 237, 44,
+    237, 79, 237, 125, 237, 218, 237, 220, 237, 239, 237, 241, 238, 20, 238, 79,
+    238, 239, 238, 241, 238, 242, 239, 79, 239, 237, 239, 238, 239, 241, 240, 60,
+    240, 64, 240, 75, 240, 98, 240, 99, 240, 235, 241, 125, 241, 141, 241, 237,
+    241, 238, 241, 239, 241, 242, 242, 20, 242, 97, 242, 99, 242, 141, 242, 238,
+    242, 241, 243, 112, 243, 133, 243, 189, 243, 190, 243, 244, 244, 112, 244, 189,
+    244, 193, 244, 233, 244, 243, 244, 245, 245, 122, 245, 128, 245, 188, 245, 193,
+    245, 233, 245, 244, 246, 161, 246, 247, 247, 30, 247, 33, 247, 113, 247, 130,
+    247, 161, 247, 225, 247, 226, 247, 246, 248, 195, 248, 197, 248, 281, 248, 419,
+    248, 456, 249, 255, 249, 339, 249, 390, 250, 290, 250, 309, 250, 328, 250, 392,
+    250, 458, 250, 459, 250, 462, 251, 284, 251, 298, 251, 301, 252, 253, 252, 256,
+    252, 374, 252, 380, 252, 381, 252, 450, 252, 451, 253, 252, 253, 254, 253, 373,
+    253, 374, 253, 449, 253, 450, 254, 253, 254, 339, 254, 373, 254, 448, 254, 449,
+    255, 249, 255, 261, 255, 263, 255, 339, 255, 359, 255, 446, 255, 448, 256, 252,
+    256, 341, 256, 381, 256, 382, 256, 451, 256, 452, 257, 258, 257, 259, 257, 386,
+    257, 387, 257, 442, 257, 443, 258, 257, 258, 286, 258, 384, 258, 385, 258, 386,
+    258, 441, 258, 442, 259, 257, 259, 260, 259, 387, 259, 443, 259, 444, 260, 259,
+    260, 387, 260, 388, 260, 444, 260, 445, 260, 466, 260, 467, 261, 255, 261, 340,
+    261, 346, 261, 446, 261, 448, 262, 369, 262, 396, 262, 418, 262, 421, 262, 428,
+    262, 431, 263, 249, 263, 255, 263, 359, 263, 467, 264, 356, 264, 368, 264, 372,
+    264, 383, 264, 447, 264, 454, 265, 340, 265, 342, 265, 353, 265, 372, 265, 446,
+    266, 329, 266, 330, 266, 371, 266, 423, 266, 425, 266, 426, 267, 0, 267, 11,
+    267, 164, 267, 269, 267, 302, 267, 393, 268, 12, 268, 13, 268, 271, 268, 302,
+    268, 311, 268, 312, 269, 267, 269, 270, 269, 302, 269, 303, 269, 322, 269, 391,
+    269, 393, 270, 269, 270, 303, 270, 304, 270, 322, 270, 409, 270, 410, 271, 268,
+    271, 272, 271, 302, 271, 303, 271, 304, 271, 311, 272, 271, 272, 304, 272, 310,
+    272, 311, 272, 407, 272, 408, 273, 287, 273, 291, 273, 321, 273, 335, 273, 375,
+    273, 422, 273, 424, 274, 1, 274, 4, 274, 19, 274, 275, 274, 354, 274, 440,
+    274, 457, 275, 4, 275, 274, 275, 281, 275, 363, 275, 440, 276, 283, 276, 293,
+    276, 300, 276, 342, 276, 353, 276, 383, 276, 445, 277, 329, 277, 343, 277, 350,
+    277, 355, 277, 357, 277, 437, 278, 279, 278, 294, 278, 344, 278, 360, 278, 439,
+    278, 455, 279, 278, 279, 294, 279, 331, 279, 358, 279, 360, 279, 429, 280, 330,
+    280, 346, 280, 347, 280, 352, 280, 411, 280, 425, 281, 4, 281, 5, 281, 195,
+    281, 248, 281, 275, 281, 363, 281, 456, 282, 283, 282, 293, 282, 295, 282, 296,
+    282, 334, 282, 442, 282, 443, 283, 276, 283, 282, 283, 293, 283, 443, 283, 444,
+    283, 445, 284, 298, 284, 332, 284, 333, 285, 8, 285, 9, 285, 295, 285, 336,
+    285, 413, 285, 417, 285, 441, 286, 258, 286, 384, 286, 398, 286, 414, 286, 441,
+    287, 273, 287, 291, 287, 409, 287, 410, 287, 422, 287, 432, 288, 361, 288, 401,
+    288, 435, 289, 290, 289, 305, 289, 392, 289, 439, 289, 455, 290, 250, 290, 289,
+    290, 305, 290, 328, 290, 392, 290, 460, 291, 273, 291, 287, 291, 306, 291, 375,
+    291, 408, 291, 409, 292, 306, 292, 307, 292, 308, 292, 325, 292, 407, 292, 415,
+    293, 276, 293, 282, 293, 283, 293, 298, 293, 300, 293, 301, 293, 333, 293, 334,
+    294, 278, 294, 279, 294, 327, 294, 331, 294, 358, 294, 455, 294, 460, 295, 282,
+    295, 285, 295, 296, 295, 336, 295, 441, 295, 442, 296, 282, 296, 295, 296, 299,
+    296, 334, 296, 336, 297, 299, 297, 333, 297, 337, 297, 338, 298, 251, 298, 284,
+    298, 293, 298, 301, 298, 333, 299, 296, 299, 297, 299, 333, 299, 334, 299, 336,
+    299, 337, 300, 276, 300, 293, 300, 301, 300, 368, 300, 383, 301, 251, 301, 293,
+    301, 298, 301, 300, 301, 368, 301, 389, 302, 11, 302, 12, 302, 267, 302, 268,
+    302, 269, 302, 271, 302, 303, 303, 269, 303, 270, 303, 271, 303, 302, 303, 304,
+    304, 270, 304, 271, 304, 272, 304, 303, 304, 408, 304, 409, 305, 289, 305, 290,
+    305, 455, 305, 460, 306, 291, 306, 292, 306, 307, 306, 375, 306, 407, 306, 408,
+    307, 292, 307, 306, 307, 320, 307, 321, 307, 325, 307, 375, 308, 292, 308, 324,
+    308, 325, 309, 250, 309, 392, 309, 438, 309, 457, 309, 459, 310, 272, 310, 407,
+    310, 415, 311, 268, 311, 271, 311, 272, 311, 310, 312, 268, 312, 311, 313, 17,
+    313, 18, 313, 314, 313, 405, 313, 406, 313, 421, 314, 17, 314, 313, 314, 315,
+    314, 404, 314, 405, 315, 15, 315, 16, 315, 17, 315, 314, 315, 316, 315, 403,
+    315, 404, 316, 14, 316, 15, 316, 315, 316, 317, 316, 402, 316, 403, 317, 14,
+    317, 316, 318, 319, 318, 325, 318, 402, 318, 403, 319, 318, 319, 320, 319, 325,
+    319, 403, 319, 404, 320, 307, 320, 319, 320, 321, 320, 325, 320, 404, 320, 405,
+    321, 273, 321, 307, 321, 320, 321, 335, 321, 375, 321, 405, 321, 406, 322, 269,
+    322, 270, 322, 391, 322, 410, 322, 426, 322, 436, 323, 366, 323, 447, 323, 454,
+    324, 318, 324, 325, 325, 292, 325, 307, 325, 308, 325, 318, 325, 319, 325, 320,
+    325, 324, 326, 2, 326, 327, 326, 328, 326, 370, 326, 391, 326, 393, 326, 462,
+    327, 294, 327, 326, 327, 328, 327, 358, 327, 391, 327, 423, 327, 460, 328, 250,
+    328, 290, 328, 326, 328, 327, 328, 460, 328, 462, 329, 266, 329, 277, 329, 330,
+    329, 349, 329, 350, 329, 355, 329, 371, 330, 266, 330, 280, 330, 329, 330, 347,
+    330, 348, 330, 349, 330, 425, 331, 279, 331, 294, 331, 358, 332, 297, 332, 333,
+    333, 284, 333, 293, 333, 297, 333, 298, 333, 299, 333, 332, 333, 334, 334, 282,
+    334, 293, 334, 296, 334, 299, 334, 333, 335, 273, 335, 321, 335, 406, 335, 418,
+    335, 424, 336, 9, 336, 285, 336, 295, 336, 296, 336, 299, 336, 337, 337, 9,
+    337, 151, 337, 297, 337, 299, 337, 336, 337, 338, 338, 10, 338, 151, 338, 337,
+    339, 249, 339, 254, 339, 255, 339, 373, 339, 390, 339, 448, 340, 261, 340, 265,
+    340, 345, 340, 346, 340, 352, 340, 372, 340, 446, 341, 256, 341, 362, 341, 382,
+    341, 452, 341, 453, 341, 463, 341, 464, 342, 265, 342, 276, 342, 353, 342, 445,
+    342, 446, 342, 467, 343, 277, 343, 357, 343, 399, 343, 412, 343, 437, 344, 278,
+    344, 360, 344, 438, 344, 439, 344, 440, 345, 340, 345, 352, 345, 366, 345, 372,
+    345, 447, 346, 261, 346, 280, 346, 340, 346, 347, 346, 352, 346, 448, 346, 449,
+    347, 280, 347, 330, 347, 346, 347, 348, 347, 449, 347, 450, 348, 330, 348, 347,
+    348, 349, 348, 450, 349, 329, 349, 330, 349, 348, 349, 350, 349, 450, 349, 451,
+    349, 452, 350, 277, 350, 329, 350, 349, 350, 357, 350, 452, 351, 6, 351, 168,
+    351, 412, 351, 417, 351, 419, 351, 465, 352, 280, 352, 340, 352, 345, 352, 346,
+    352, 366, 352, 376, 352, 401, 352, 411, 353, 265, 353, 276, 353, 342, 353, 372,
+    353, 383, 354, 19, 354, 274, 354, 370, 354, 457, 354, 461, 355, 277, 355, 329,
+    355, 358, 355, 371, 355, 429, 355, 437, 356, 264, 356, 368, 356, 389, 357, 277,
+    357, 343, 357, 350, 357, 412, 357, 452, 357, 453, 357, 465, 358, 279, 358, 294,
+    358, 327, 358, 331, 358, 355, 358, 371, 358, 423, 358, 429, 359, 255, 359, 263,
+    359, 446, 359, 467, 360, 278, 360, 279, 360, 344, 360, 363, 360, 420, 360, 429,
+    360, 440, 361, 323, 361, 366, 361, 401, 362, 341, 362, 398, 362, 414, 362, 463,
+    363, 275, 363, 281, 363, 360, 363, 420, 363, 440, 363, 456, 364, 365, 364, 367,
+    364, 379, 364, 394, 364, 416, 364, 434, 365, 364, 365, 367, 365, 397, 366, 323,
+    366, 345, 366, 352, 366, 361, 366, 401, 366, 447, 367, 364, 367, 365, 367, 397,
+    367, 416, 367, 433, 367, 435, 368, 264, 368, 300, 368, 301, 368, 356, 368, 383,
+    368, 389, 369, 262, 369, 377, 369, 395, 369, 396, 369, 400, 369, 431, 370, 2,
+    370, 19, 370, 94, 370, 326, 370, 354, 370, 461, 370, 462, 371, 266, 371, 329,
+    371, 355, 371, 358, 371, 423, 372, 264, 372, 265, 372, 340, 372, 345, 372, 353,
+    372, 383, 372, 447, 373, 253, 373, 254, 373, 339, 373, 374, 374, 252, 374, 253,
+    374, 380, 375, 273, 375, 291, 375, 306, 375, 307, 375, 321, 376, 352, 376, 401,
+    376, 411, 376, 433, 376, 435, 377, 175, 377, 369, 377, 396, 377, 400, 378, 379,
+    378, 395, 379, 364, 379, 365, 379, 394, 379, 395, 380, 252, 380, 381, 381, 252,
+    381, 256, 381, 382, 382, 256, 382, 341, 382, 362, 383, 264, 383, 276, 383, 300,
+    383, 353, 383, 368, 383, 372, 384, 258, 384, 286, 384, 385, 385, 258, 385, 386,
+    386, 257, 386, 258, 386, 387, 387, 257, 387, 259, 387, 260, 387, 388, 388, 260,
+    388, 466, 389, 251, 389, 301, 389, 368, 390, 339, 390, 373, 391, 269, 391, 322,
+    391, 326, 391, 327, 391, 393, 391, 423, 391, 426, 392, 250, 392, 289, 392, 290,
+    392, 309, 392, 438, 392, 439, 393, 2, 393, 164, 393, 267, 393, 269, 393, 326,
+    393, 391, 394, 364, 394, 379, 394, 395, 394, 430, 394, 431, 394, 434, 395, 369,
+    395, 378, 395, 379, 395, 394, 395, 400, 395, 431, 396, 175, 396, 199, 396, 262,
+    396, 369, 396, 377, 396, 428, 397, 288, 397, 367, 397, 435, 398, 286, 398, 384,
+    398, 414, 399, 343, 399, 412, 399, 419, 399, 437, 399, 456, 400, 369, 400, 378,
+    400, 395, 401, 288, 401, 352, 401, 361, 401, 366, 401, 376, 401, 435, 402, 316,
+    402, 317, 402, 403, 403, 315, 403, 316, 403, 318, 403, 319, 403, 402, 403, 404,
+    404, 314, 404, 315, 404, 319, 404, 320, 404, 403, 404, 405, 405, 313, 405, 314,
+    405, 320, 405, 321, 405, 404, 405, 406, 406, 313, 406, 321, 406, 335, 406, 405,
+    406, 418, 406, 421, 407, 272, 407, 292, 407, 306, 407, 310, 407, 408, 407, 415,
+    408, 272, 408, 291, 408, 304, 408, 306, 408, 407, 408, 409, 409, 270, 409, 287,
+    409, 291, 409, 304, 409, 408, 409, 410, 410, 270, 410, 287, 410, 322, 410, 409,
+    410, 432, 410, 436, 411, 280, 411, 352, 411, 376, 411, 416, 411, 425, 411, 427,
+    411, 433, 411, 434, 412, 343, 412, 351, 412, 357, 412, 399, 412, 419, 412, 465,
+    413, 285, 413, 414, 413, 417, 413, 441, 413, 463, 413, 464, 414, 286, 414, 362,
+    414, 398, 414, 413, 414, 441, 414, 463, 415, 292, 415, 308, 415, 407, 416, 364,
+    416, 367, 416, 411, 416, 433, 416, 434, 417, 8, 417, 168, 417, 285, 417, 351,
+    417, 413, 417, 464, 417, 465, 418, 262, 418, 335, 418, 406, 418, 421, 418, 424,
+    418, 431, 419, 6, 419, 197, 419, 248, 419, 351, 419, 399, 419, 412, 419, 456,
+    420, 360, 420, 363, 420, 429, 420, 437, 420, 456, 421, 18, 421, 200, 421, 262,
+    421, 313, 421, 406, 421, 418, 421, 428, 422, 273, 422, 287, 422, 424, 422, 430,
+    422, 432, 422, 434, 423, 266, 423, 327, 423, 358, 423, 371, 423, 391, 423, 426,
+    424, 273, 424, 335, 424, 418, 424, 422, 424, 430, 424, 431, 425, 266, 425, 280,
+    425, 330, 425, 411, 425, 426, 425, 427, 425, 436, 426, 266, 426, 322, 426, 391,
+    426, 423, 426, 425, 426, 436, 427, 411, 427, 425, 427, 432, 427, 434, 427, 436,
+    428, 199, 428, 200, 428, 262, 428, 396, 428, 421, 429, 279, 429, 355, 429, 358,
+    429, 360, 429, 420, 429, 437, 430, 394, 430, 422, 430, 424, 430, 431, 430, 434,
+    431, 262, 431, 369, 431, 394, 431, 395, 431, 418, 431, 424, 431, 430, 432, 287,
+    432, 410, 432, 422, 432, 427, 432, 434, 432, 436, 433, 367, 433, 376, 433, 411,
+    433, 416, 433, 435, 434, 364, 434, 394, 434, 411, 434, 416, 434, 422, 434, 427,
+    434, 430, 434, 432, 435, 288, 435, 367, 435, 376, 435, 397, 435, 401, 435, 433,
+    436, 322, 436, 410, 436, 425, 436, 426, 436, 427, 436, 432, 437, 277, 437, 343,
+    437, 355, 437, 399, 437, 420, 437, 429, 437, 456, 438, 309, 438, 344, 438, 392,
+    438, 439, 438, 440, 438, 457, 439, 278, 439, 289, 439, 344, 439, 392, 439, 438,
+    439, 455, 440, 274, 440, 275, 440, 344, 440, 360, 440, 363, 440, 438, 440, 457,
+    441, 258, 441, 285, 441, 286, 441, 295, 441, 413, 441, 414, 441, 442, 442, 257,
+    442, 258, 442, 282, 442, 295, 442, 441, 442, 443, 443, 257, 443, 259, 443, 282,
+    443, 283, 443, 442, 443, 444, 444, 259, 444, 260, 444, 283, 444, 443, 444, 445,
+    445, 260, 445, 276, 445, 283, 445, 342, 445, 444, 445, 467, 446, 255, 446, 261,
+    446, 265, 446, 340, 446, 342, 446, 359, 446, 467, 447, 264, 447, 323, 447, 345,
+    447, 366, 447, 372, 447, 454, 448, 254, 448, 255, 448, 261, 448, 339, 448, 346,
+    448, 449, 449, 253, 449, 254, 449, 346, 449, 347, 449, 448, 449, 450, 450, 252,
+    450, 253, 450, 347, 450, 348, 450, 349, 450, 449, 450, 451, 451, 252, 451, 256,
+    451, 349, 451, 450, 451, 452, 452, 256, 452, 341, 452, 349, 452, 350, 452, 357,
+    452, 451, 452, 453, 453, 341, 453, 357, 453, 452, 453, 464, 453, 465, 454, 264,
+    454, 356, 454, 447, 455, 278, 455, 289, 455, 294, 455, 305, 455, 439, 455, 460,
+    456, 248, 456, 281, 456, 363, 456, 399, 456, 419, 456, 420, 456, 437, 457, 274,
+    457, 309, 457, 354, 457, 438, 457, 440, 457, 459, 457, 461, 458, 250, 458, 459,
+    458, 461, 458, 462, 459, 250, 459, 309, 459, 457, 459, 458, 459, 461, 460, 290,
+    460, 294, 460, 305, 460, 327, 460, 328, 460, 455, 461, 354, 461, 370, 461, 457,
+    461, 458, 461, 459, 461, 462, 462, 250, 462, 326, 462, 328, 462, 370, 462, 458,
+    462, 461, 463, 341, 463, 362, 463, 413, 463, 414, 463, 464, 464, 341, 464, 413,
+    464, 417, 464, 453, 464, 463, 464, 465, 465, 351, 465, 357, 465, 412, 465, 417,
+    465, 453, 465, 464, 466, 260, 466, 263, 466, 467, 467, 260, 467, 263, 467, 342,
+    467, 359, 467, 445, 467, 446, 467, 466,
+))
+TESSELATION_INDICES = _indices(TESSELATION_EDGES)
+FACEMESH_TESSELATION = _connections(TESSELATION_EDGES)
+
+# 테셀레이션 간선의 3-클리크에서 복원한 삼각형 면
+TESSELATION_TRIANGLES = np.array((
+    0, 11, 37, 0, 11, 267, 0, 37, 164, 0, 164, 267, 1, 4, 44,
+    1, 4, 274, 1, 19, 44, 1, 19, 274, 2, 94, 141, 2, 94, 370,
+    2, 97, 141, 2, 97, 167, 2, 164, 167, 2, 164, 393, 2, 326, 370,
+    2, 326, 393, 3, 51, 195, 3, 51, 236, 3, 195, 197, 3, 196, 197,
+    3, 196, 236, 4, 5, 51, 4, 5, 281, 4, 44, 45, 4, 45, 51,
+    4, 274, 275, 4, 275, 281, 5, 51, 195, 5, 195, 281, 6, 122, 168,
+    6, 122, 196, 6, 168, 351, 6, 196, 197, 6, 197, 419, 6, 351, 419,
+    7, 25, 33, 7, 25, 110, 7, 110, 163, 8, 9, 55, 8, 9, 285,
+    8, 55, 193, 8, 168, 193, 8, 168, 417, 8, 285, 417, 9, 55, 107,
+    9, 107, 108, 9, 108, 151, 9, 151, 337, 9, 285, 336, 9, 336, 337,
+    10, 109, 151, 10, 151, 338, 11, 12, 72, 11, 12, 302, 11, 37, 72,
+    11, 267, 302, 12, 13, 38, 12, 13, 268, 12, 38, 72, 12, 268, 302,
+    13, 38, 82, 13, 268, 312, 14, 15, 86, 14, 15, 316, 14, 86, 87,
+    14, 316, 317, 15, 16, 85, 15, 16, 315, 15, 85, 86, 15, 315, 316,
+    16, 17, 85, 16, 17, 315, 17, 18, 83, 17, 18, 313, 17, 83, 84,
+    17, 84, 85, 17, 313, 314, 17, 314, 315, 18, 83, 201, 18, 200, 201,
+    18, 200, 421, 18, 313, 421, 19, 44, 125, 19, 94, 141, 19, 94, 370,
+    19, 125, 141, 19, 274, 354, 19, 354, 370, 20, 60, 99, 20, 60, 166,
+    20, 79, 166, 20, 79, 238, 20, 99, 242, 20, 238, 242, 21, 54, 68,
+    21, 68, 71, 21, 71, 162, 22, 23, 145, 22, 23, 230, 22, 26, 154,
+    22, 26, 231, 22, 145, 153, 22, 153, 154, 22, 230, 231, 23, 24, 144,
+    23, 24, 229, 23, 144, 145, 23, 229, 230, 24, 110, 144, 24, 110, 228,
+    24, 228, 229, 25, 31, 226, 25, 31, 228, 25, 33, 130, 25, 110, 228,
+    25, 130, 226, 26, 112, 155, 26, 112, 232, 26, 154, 155, 26, 231, 232,
+    27, 28, 159, 27, 28, 222, 27, 29, 160, 27, 29, 223, 27, 159, 160,
+    27, 222, 223, 28, 56, 157, 28, 56, 221, 28, 157, 158, 28, 158, 159,
+    28, 221, 222, 29, 30, 160, 29, 30, 224, 29, 223, 224, 30, 160, 161,
+    30, 161, 247, 30, 224, 225, 30, 225, 247, 31, 111, 117, 31, 111, 226,
+    31, 117, 228, 32, 140, 171, 32, 140, 211, 32, 171, 208, 32, 194, 201,
+    32, 194, 211, 32, 201, 208, 33, 130, 247, 33, 246, 247, 34, 127, 139,
+    34, 127, 234, 34, 139, 156, 34, 143, 156, 34, 143, 227, 34, 227, 234,
+    35, 111, 143, 35, 111, 226, 35, 113, 124, 35, 113, 226, 35, 124, 143,
+    36, 100, 101, 36, 100, 142, 36, 101, 205, 36, 142, 203, 36, 203, 206,
+    36, 205, 206, 37, 39, 72, 37, 39, 167, 37, 164, 167, 38, 41, 72,
+    38, 41, 81, 38, 81, 82, 39, 40, 73, 39, 40, 92, 39, 72, 73,
+    39, 92, 165, 39, 165, 167, 40, 73, 74, 40, 74, 185, 40, 92, 186,
+    40, 185, 186, 41, 42, 74, 41, 42, 81, 41, 72, 73, 41, 73, 74,
+    42, 74, 184, 42, 80, 81, 42, 80, 183, 42, 183, 184, 43, 57, 61,
+    43, 57, 202, 43, 61, 146, 43, 91, 106, 43, 91, 146, 43, 106, 204,
+    43, 202, 204, 44, 45, 220, 44, 125, 237, 44, 220, 237, 45, 51, 134,
+    45, 134, 220, 46, 53, 63, 46, 53, 225, 46, 63, 70, 46, 70, 156,
+    46, 113, 124, 46, 113, 225, 46, 124, 156, 47, 100, 121, 47, 100, 126,
+    47, 114, 128, 47, 114, 217, 47, 121, 128, 47, 126, 217, 48, 49, 64,
+    48, 49, 131, 48, 64, 235, 48, 115, 131, 48, 115, 219, 48, 219, 235,
+    49, 64, 102, 49, 102, 129, 49, 129, 209, 49, 131, 209, 50, 101, 118,
+    50, 101, 205, 50, 117, 118, 50, 117, 123, 50, 123, 187, 50, 187, 205,
+    51, 134, 236, 52, 53, 63, 52, 53, 223, 52, 63, 105, 52, 65, 66,
+    52, 65, 222, 52, 66, 105, 52, 222, 223, 53, 223, 224, 53, 224, 225,
+    54, 68, 104, 54, 103, 104, 55, 65, 107, 55, 65, 221, 55, 189, 193,
+    55, 189, 221, 56, 157, 173, 56, 173, 190, 56, 190, 221, 57, 61, 185,
+    57, 185, 186, 57, 186, 212, 57, 202, 212, 58, 132, 177, 58, 172, 215,
+    58, 177, 215, 59, 75, 166, 59, 75, 235, 59, 166, 219, 59, 219, 235,
+    60, 75, 166, 60, 75, 240, 60, 99, 240, 61, 76, 146, 61, 76, 184,
+    61, 184, 185, 62, 76, 77, 62, 76, 183, 62, 77, 96, 62, 78, 96,
+    62, 78, 191, 62, 183, 191, 63, 68, 71, 63, 68, 104, 63, 70, 71,
+    63, 104, 105, 64, 98, 129, 64, 98, 240, 64, 102, 129, 64, 235, 240,
+    65, 66, 107, 65, 221, 222, 66, 69, 105, 66, 69, 107, 67, 69, 104,
+    67, 69, 108, 67, 103, 104, 67, 108, 109, 69, 104, 105, 69, 107, 108,
+    70, 71, 139, 70, 139, 156, 71, 139, 162, 74, 184, 185, 75, 235, 240,
+    76, 77, 146, 76, 183, 184, 77, 90, 91, 77, 90, 96, 77, 91, 146,
+    78, 95, 96, 79, 166, 218, 79, 218, 237, 79, 237, 239, 79, 238, 239,
+    80, 183, 191, 83, 84, 181, 83, 181, 182, 83, 182, 201, 84, 85, 180,
+    84, 180, 181, 85, 86, 179, 85, 179, 180, 86, 87, 178, 86, 178, 179,
+    88, 89, 96, 88, 89, 179, 88, 95, 96, 88, 178, 179, 89, 90, 96,
+    89, 90, 180, 89, 179, 180, 90, 91, 181, 90, 180, 181, 91, 106, 182,
+    91, 181, 182, 92, 165, 206, 92, 186, 216, 92, 206, 216, 93, 132, 137,
+    93, 137, 227, 93, 227, 234, 97, 98, 99, 97, 98, 165, 97, 99, 242,
+    97, 141, 242, 97, 165, 167, 98, 99, 240, 98, 129, 203, 98, 165, 203,
+    100, 101, 120, 100, 120, 121, 100, 126, 142, 101, 118, 119, 101, 119, 120,
+    106, 182, 194, 106, 194, 204, 108, 109, 151, 110, 144, 163, 111, 116, 123,
+    111, 116, 143, 111, 117, 123, 112, 133, 155, 112, 133, 243, 112, 232, 233,
+    112, 233, 244, 112, 243, 244, 113, 225, 247, 113, 226, 247, 114, 128, 188,
+    114, 174, 188, 114, 174, 217, 115, 131, 220, 115, 218, 219, 115, 218, 220,
+    116, 123, 137, 116, 137, 227, 116, 143, 227, 117, 118, 229, 117, 228, 229,
+    118, 119, 230, 118, 229, 230, 119, 120, 230, 120, 121, 232, 120, 230, 231,
+    120, 231, 232, 121, 128, 232, 122, 168, 193, 122, 188, 196, 122, 188, 245,
+    122, 193, 245, 123, 137, 177, 123, 147, 177, 123, 147, 187, 124, 143, 156,
+    125, 141, 241, 125, 237, 241, 126, 129, 142, 126, 129, 209, 126, 209, 217,
+    127, 139, 162, 128, 188, 245, 128, 232, 233, 128, 233, 245, 129, 142, 203,
+    130, 226, 247, 131, 134, 198, 131, 134, 220, 131, 198, 209, 132, 137, 177,
+    133, 173, 190, 133, 190, 243, 134, 198, 236, 135, 136, 138, 135, 136, 150,
+    135, 138, 192, 135, 150, 169, 135, 169, 214, 135, 192, 214, 136, 138, 172,
+    138, 172, 215, 138, 192, 213, 138, 213, 215, 140, 148, 171, 140, 148, 176,
+    140, 170, 176, 140, 170, 211, 141, 241, 242, 147, 177, 215, 147, 187, 213,
+    147, 213, 215, 148, 152, 175, 148, 171, 175, 149, 150, 170, 149, 170, 176,
+    150, 169, 170, 151, 337, 338, 152, 175, 377, 161, 246, 247, 164, 267, 393,
+    165, 203, 206, 166, 218, 219, 168, 351, 417, 169, 170, 211, 169, 210, 211,
+    169, 210, 214, 171, 175, 199, 171, 199, 208, 174, 188, 196, 174, 196, 236,
+    174, 217, 236, 175, 199, 396, 175, 377, 396, 182, 194, 201, 186, 212, 216,
+    187, 192, 213, 187, 192, 214, 187, 205, 207, 187, 207, 214, 189, 190, 221,
+    189, 190, 243, 189, 193, 244, 189, 243, 244, 193, 244, 245, 194, 204, 211,
+    195, 197, 248, 195, 248, 281, 197, 248, 419, 198, 209, 217, 198, 217, 236,
+    199, 200, 208, 199, 200, 428, 199, 396, 428, 200, 201, 208, 200, 421, 428,
+    202, 204, 210, 202, 210, 214, 202, 212, 214, 204, 210, 211, 205, 206, 216,
+    205, 207, 216, 207, 212, 214, 207, 212, 216, 218, 220, 237, 233, 244, 245,
+    237, 239, 241, 238, 239, 241, 238, 241, 242, 248, 281, 456, 248, 419, 456,
+    249, 255, 263, 249, 255, 339, 249, 339, 390, 250, 290, 328, 250, 290, 392,
+    250, 309, 392, 250, 309, 459, 250, 328, 462, 250, 458, 459, 250, 458, 462,
+    251, 284, 298, 251, 298, 301, 251, 301, 389, 252, 253, 374, 252, 253, 450,
+    252, 256, 381, 252, 256, 451, 252, 374, 380, 252, 380, 381, 252, 450, 451,
+    253, 254, 373, 253, 254, 449, 253, 373, 374, 253, 449, 450, 254, 339, 373,
+    254, 339, 448, 254, 448, 449, 255, 261, 446, 255, 261, 448, 255, 263, 359,
+    255, 339, 448, 255, 359, 446, 256, 341, 382, 256, 341, 452, 256, 381, 382,
+    256, 451, 452, 257, 258, 386, 257, 258, 442, 257, 259, 387, 257, 259, 443,
+    257, 386, 387, 257, 442, 443, 258, 286, 384, 258, 286, 441, 258, 384, 385,
+    258, 385, 386, 258, 441, 442, 259, 260, 387, 259, 260, 444, 259, 443, 444,
+    260, 387, 388, 260, 388, 466, 260, 444, 445, 260, 445, 467, 260, 466, 467,
+    261, 340, 346, 261, 340, 446, 261, 346, 448, 262, 369, 396, 262, 369, 431,
+    262, 396, 428, 262, 418, 421, 262, 418, 431, 262, 421, 428, 263, 359, 467,
+    263, 466, 467, 264, 356, 368, 264, 356, 454, 264, 368, 383, 264, 372, 383,
+    264, 372, 447, 264, 447, 454, 265, 340, 372, 265, 340, 446, 265, 342, 353,
+    265, 342, 446, 265, 353, 372, 266, 329, 330, 266, 329, 371, 266, 330, 425,
+    266, 371, 423, 266, 423, 426, 266, 425, 426, 267, 269, 302, 267, 269, 393,
+    268, 271, 302, 268, 271, 311, 268, 311, 312, 269, 270, 303, 269, 270, 322,
+    269, 302, 303, 269, 322, 391, 269, 391, 393, 270, 303, 304, 270, 304, 409,
+    270, 322, 410, 270, 409, 410, 271, 272, 304, 271, 272, 311, 271, 302, 303,
+    271, 303, 304, 272, 304, 408, 272, 310, 311, 272, 310, 407, 272, 407, 408,
+    273, 287, 291, 273, 287, 422, 273, 291, 375, 273, 321, 335, 273, 321, 375,
+    273, 335, 424, 273, 422, 424, 274, 275, 440, 274, 354, 457, 274, 440, 457,
+    275, 281, 363, 275, 363, 440, 276, 283, 293, 276, 283, 445, 276, 293, 300,
+    276, 300, 383, 276, 342, 353, 276, 342, 445, 276, 353, 383, 277, 329, 350,
+    277, 329, 355, 277, 343, 357, 277, 343, 437, 277, 350, 357, 277, 355, 437,
+    278, 279, 294, 278, 279, 360, 278, 294, 455, 278, 344, 360, 278, 344, 439,
+    278, 439, 455, 279, 294, 331, 279, 331, 358, 279, 358, 429, 279, 360, 429,
+    280, 330, 347, 280, 330, 425, 280, 346, 347, 280, 346, 352, 280, 352, 411,
+    280, 411, 425, 281, 363, 456, 282, 283, 293, 282, 283, 443, 282, 293, 334,
+    282, 295, 296, 282, 295, 442, 282, 296, 334, 282, 442, 443, 283, 443, 444,
+    283, 444, 445, 284, 298, 333, 284, 332, 333, 285, 295, 336, 285, 295, 441,
+    285, 413, 417, 285, 413, 441, 286, 384, 398, 286, 398, 414, 286, 414, 441,
+    287, 291, 409, 287, 409, 410, 287, 410, 432, 287, 422, 432, 288, 361, 401,
+    288, 397, 435, 288, 401, 435, 289, 290, 305, 289, 290, 392, 289, 305, 455,
+    289, 392, 439, 289, 439, 455, 290, 305, 460, 290, 328, 460, 291, 306, 375,
+    291, 306, 408, 291, 408, 409, 292, 306, 307, 292, 306, 407, 292, 307, 325,
+    292, 308, 325, 292, 308, 415, 292, 407, 415, 293, 298, 301, 293, 298, 333,
+    293, 300, 301, 293, 333, 334, 294, 327, 358, 294, 327, 460, 294, 331, 358,
+    294, 455, 460, 295, 296, 336, 295, 441, 442, 296, 299, 334, 296, 299, 336,
+    297, 299, 333, 297, 299, 337, 297, 332, 333, 297, 337, 338, 299, 333, 334,
+    299, 336, 337, 300, 301, 368, 300, 368, 383, 301, 368, 389, 304, 408, 409,
+    305, 455, 460, 306, 307, 375, 306, 407, 408, 307, 320, 321, 307, 320, 325,
+    307, 321, 375, 308, 324, 325, 309, 392, 438, 309, 438, 457, 309, 457, 459,
+    310, 407, 415, 313, 314, 405, 313, 405, 406, 313, 406, 421, 314, 315, 404,
+    314, 404, 405, 315, 316, 403, 315, 403, 404, 316, 317, 402, 316, 402, 403,
+    318, 319, 325, 318, 319, 403, 318, 324, 325, 318, 402, 403, 319, 320, 325,
+    319, 320, 404, 319, 403, 404, 320, 321, 405, 320, 404, 405, 321, 335, 406,
+    321, 405, 406, 322, 391, 426, 322, 410, 436, 322, 426, 436, 323, 361, 366,
+    323, 366, 447, 323, 447, 454, 326, 327, 328, 326, 327, 391, 326, 328, 462,
+    326, 370, 462, 326, 391, 393, 327, 328, 460, 327, 358, 423, 327, 391, 423,
+    329, 330, 349, 329, 349, 350, 329, 355, 371, 330, 347, 348, 330, 348, 349,
+    335, 406, 418, 335, 418, 424, 339, 373, 390, 340, 345, 352, 340, 345, 372,
+    340, 346, 352, 341, 362, 382, 341, 362, 463, 341, 452, 453, 341, 453, 464,
+    341, 463, 464, 342, 445, 467, 342, 446, 467, 343, 357, 412, 343, 399, 412,
+    343, 399, 437, 344, 360, 440, 344, 438, 439, 344, 438, 440, 345, 352, 366,
+    345, 366, 447, 345, 372, 447, 346, 347, 449, 346, 448, 449, 347, 348, 450,
+    347, 449, 450, 348, 349, 450, 349, 350, 452, 349, 450, 451, 349, 451, 452,
+    350, 357, 452, 351, 412, 419, 351, 412, 465, 351, 417, 465, 352, 366, 401,
+    352, 376, 401, 352, 376, 411, 353, 372, 383, 354, 370, 461, 354, 457, 461,
+    355, 358, 371, 355, 358, 429, 355, 429, 437, 356, 368, 389, 357, 412, 465,
+    357, 452, 453, 357, 453, 465, 358, 371, 423, 359, 446, 467, 360, 363, 420,
+    360, 363, 440, 360, 420, 429, 361, 366, 401, 362, 398, 414, 362, 414, 463,
+    363, 420, 456, 364, 365, 367, 364, 365, 379, 364, 367, 416, 364, 379, 394,
+    364, 394, 434, 364, 416, 434, 365, 367, 397, 367, 397, 435, 367, 416, 433,
+    367, 433, 435, 369, 377, 396, 369, 377, 400, 369, 395, 400, 369, 395, 431,
+    370, 461, 462, 376, 401, 435, 376, 411, 433, 376, 433, 435, 378, 379, 395,
+    378, 395, 400, 379, 394, 395, 391, 423, 426, 392, 438, 439, 394, 395, 431,
+    394, 430, 431, 394, 430, 434, 399, 412, 419, 399, 419, 456, 399, 437, 456,
+    406, 418, 421, 410, 432, 436, 411, 416, 433, 411, 416, 434, 411, 425, 427,
+    411, 427, 434, 413, 414, 441, 413, 414, 463, 413, 417, 464, 413, 463, 464,
+    417, 464, 465, 418, 424, 431, 420, 429, 437, 420, 437, 456, 422, 424, 430,
+    422, 430, 434, 422, 432, 434, 424, 430, 431, 425, 426, 436, 425, 427, 436,
+    427, 432, 434, 427, 432, 436, 438, 440, 457, 453, 464, 465, 457, 459, 461,
+    458, 459, 461, 458, 461, 462,
+), dtype=np.int32).reshape(-1, 3)
+TESSELATION_TRIANGLES.flags.writeable = False
+
+# 눈동자 중심 인덱스 (refine_landmarks=True일 때만 존재, 각각 LEFT_IRIS/RIGHT_IRIS 윤곽의 중심)
+LEFT_IRIS_CENTER_INDEX = 473
+RIGHT_IRIS_CENTER_INDEX = 468
+IRIS_CENTER_INDICES = np.array((RIGHT_IRIS_CENTER_INDEX, LEFT_IRIS_CENTER_INDEX), dtype=np.int32)
+IRIS_CENTER_INDICES.flags.writeable = False
+
+# 눈동자 전체 인덱스 (윤곽 8개 + 중심 2개, 468~477)
+IRIS_ALL_INDICES = np.union1d(IRISES_INDICES, IRIS_CENTER_INDICES).astype(np.int32)
+IRIS_ALL_INDICES.flags.writeable = False
@@ -0,0 +1,580 @@
+"""
+특징 벡터 저장소
+디렉토리별로 특징 벡터를 하나의 연속된 행렬 파일에 모아 저장합니다.
+이미지마다 JSON 캐시 파일을 열지 않고, 검색 시 행렬 전체를 한 번의 mmap으로 읽습니다.
+
+파일 구성 (이미지 디렉토리의 features 폴더 내, 종류별):
+- s7ed.features.{kind}.f32 / .f16: (행 수, 차원) 행렬 (헤더 없는 원시 배열, 추가 전용)
+  메시/임베딩처럼 차원이 크거나 많은 종류는 float16으로 저장하고, 읽을 때는 항상 float32로 돌려줍니다.
+- s7ed.features.{kind}.json: 이미지 파일명 -> 행 번호/수정 시간/크기 색인과 삭제 표시(tombstone)
+
+이미지가 바뀌거나 삭제되면 기존 행은 삭제 표시만 하고, 삭제 표시 비율이 높아지면 압축(compaction)합니다.
+"""
+import os
+import json
+import threading
+from collections import namedtuple
+
+import numpy as np
+
+# 로거 (지연 로딩)
+_logger = None
+
+def _get_logger():
+    """로거 가져오기 (지연 로딩)"""
+    global _logger
+    if _logger is None:
+        from utils.logger import get_logger
+        _logger = get_logger('특징저장소')
+    return _logger
+
+
+# 특징 종류
+KIND_FACE = 'face'
+KIND_CLOTHING = 'clothing'
+KIND_MESH = 'mesh'              # 정렬된 전체 메시 좌표 (face_embedding)
+KIND_EMBEDDING = 'embedding'    # 메시 PCA 임베딩 (face_embedding)
+FEATURE_KINDS = (KIND_FACE, KIND_CLOTHING, KIND_MESH, KIND_EMBEDDING)
+
+# 종류별 저장 자료형 (없으면 float32)
+_KIND_DTYPES = {
+    KIND_MESH: np.float16,
+    KIND_EMBEDDING: np.float16,
+}
+
+# 색인 형식 버전 (형식이 바뀌면 기존 저장소를 버리고 다시 만듦)
+STORE_VERSION = 1
+
+# 종류별 특징 계산 버전 (없으면 1, 같은 이미지의 벡터 값이 바뀌면 올려서 기존 행을 다시 계산하게 함)
+# - clothing 2: BOX 축소 + bincount 히스토그램으로 바뀜 (이전 벡터와 값이 달라 비교 불가)
+_KIND_FEATURE_VERSIONS = {
+    KIND_CLOTHING: 2,
+}
+
+# 색인을 디스크에 쓰기 전까지 모아 둘 최대 변경 수
+_FLUSH_INTERVAL = 64
+
+# 압축 조건: 삭제 표시된 행이 최소 개수 이상이고 전체 행 대비 비율을 넘을 때
+_COMPACT_MIN_TOMBSTONES = 32
+_COMPACT_TOMBSTONE_RATIO = 0.25
+
+# 특징이 없는 이미지 (얼굴/옷 영역 없음)의 행 번호
+_EMPTY_ROW = -1
+
+# load_features(with_sources=True)가 돌려주는 디렉토리별 출처
+# rows: paths 순서의 행 번호, layout: 읽을 때의 행 배치 세대 (압축/초기화 후에는 행 번호가 달라짐)
+FeatureSource = namedtuple("FeatureSource", ["store", "rows", "layout", "paths"])
+
+
+def get_features_dir(image_path):
+    """이미지 파일이 있는 디렉토리의 features 폴더 경로 반환"""
+    return os.path.join(os.path.dirname(os.path.abspath(image_path)), 'features')
+
+
+def _image_signature(image_path):
+    """캐시 유효성 확인용 (수정 시간, 크기)"""
+    stat = os.stat(image_path)
+    return stat.st_mtime, stat.st_size
+
+
+class FeatureStore:
+    """디렉토리 하나의 한 종류 특징 벡터 저장소 (스레드 안전)"""
+
+    def __init__(self, features_dir, kind):
+        self.features_dir = features_dir
+        self.kind = kind
+        self.dtype = np.dtype(_KIND_DTYPES.get(kind, np.float32))
+        self.feature_version = _KIND_FEATURE_VERSIONS.get(kind, 1)
+        self.matrix_path = os.path.join(features_dir, f"s7ed.features.{kind}.f{self.dtype.itemsize * 8}")
+        self.index_path = os.path.join(features_dir, f"s7ed.features.{kind}.json")
+        self._lock = threading.RLock()
+        self._index = None
+        self._matrix = None
+        self._dirty = 0
+        # 변경 세대: 항목이 바뀔 때마다 증가 (ANN 인덱스 등이 변경분만 반영하는 데 사용)
+        self.generation = 0
+        self.layout_generation = 0
+        self._changes = {}
+        self._reset_generation = 0
+
+    def _record_change(self, name=None):
+        """변경 세대 증가 (name이 None이면 저장소 전체가 바뀜)"""
+        self.generation += 1
+        if name is None:
+            self._changes.clear()
+            self._reset_generation = self.generation
+            self.layout_generation += 1
+        else:
+            self._changes[name] = self.generation
+
+    def changes_since(self, generation):
+        """
+        주어진 세대 이후 바뀐 항목
+
+        Returns:
+            (generation, names): 현재 세대와 바뀐 파일명 리스트
+                                 (그 사이 저장소 전체가 바뀌었으면 names는 None)
+        """
+        with self._lock:
+            if generation < self._reset_generation:
+                return self.generation, None
+            return self.generation, [name for name, changed in self._changes.items() if changed > generation]
+
+    # ---- 색인 ----
+
+    def _empty_index(self):
+        return {'version': STORE_VERSION, 'feature_version': self.feature_version,
+                'dim': None, 'rows': 0, 'entries': {}, 'tombstones': []}
+
+    def _ensure_loaded(self):
+        """색인을 처음 사용할 때 로드"""
+        if self._index is not None:
+            return
+        index = None
+        if os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+                if index.get('version') != STORE_VERSION:
+                    _get_logger().info(f"특징 저장소 형식이 달라 다시 만듭니다: {self.index_path}")
+                    index = None
+                elif index.get('feature_version', 1) != self.feature_version:
+                    _get_logger().info(
+                        f"특징 계산 방식이 바뀌어 저장소를 다시 만듭니다 ({self.kind}: "
+                        f"{index.get('feature_version', 1)} -> {self.feature_version}): {self.index_path}"
+                    )
+                    index = None
+            except Exception as e:
+                _get_logger().error(f"특징 저장소 색인 로드 실패 ({self.index_path}): {e}")
+                index = None
+
+        if index is not None and index['dim'] is not None:
+            # 색인보다 행렬 파일이 짧으면 (쓰기 도중 중단) 저장소를 버림
+            expected = index['rows'] * index['dim'] * self.dtype.itemsize
+            actual = os.path.getsize(self.matrix_path) if os.path.exists(self.matrix_path) else 0
+            if actual < expected:
+                _get_logger().warning(f"특징 행렬 파일이 색인보다 짧아 다시 만듭니다: {self.matrix_path}")
+                index = None
+
+        self._index = index if index is not None else self._empty_index()
+
+    def _save_index(self):
+        """색인을 임시 파일에 쓴 뒤 교체 (중단되어도 이전 색인 유지)"""
+        os.makedirs(self.features_dir, exist_ok=True)
+        temp_path = self.index_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f)
+        os.replace(temp_path, self.index_path)
+        self._dirty = 0
+
+    def _mark_dirty(self):
+        self._dirty += 1
+        if self._dirty >= _FLUSH_INTERVAL:
+            self.flush()
+
+    # ---- 행렬 ----
+
+    def _open_matrix(self):
+        """현재 행 수만큼 행렬 파일을 읽기 전용 mmap으로 열기"""
+        if self._matrix is None:
+            rows, dim = self._index['rows'], self._index['dim']
+            if rows == 0 or dim is None:
+                self._matrix = np.empty((0, dim or 0), dtype=self.dtype)
+            else:
+                self._matrix = np.memmap(self.matrix_path, dtype=self.dtype, mode='r', shape=(rows, dim))
+        return self._matrix
+
+    def _append_row(self, vector):
+        """행렬 끝(색인 기준)에 한 행을 쓰고 행 번호 반환"""
+        row = self._index['rows']
+        # 파일 크기가 바뀌므로 기존 mmap은 닫고 다음 읽기 때 다시 엶
+        self._matrix = None
+        os.makedirs(self.features_dir, exist_ok=True)
+        mode = 'r+b' if os.path.exists(self.matrix_path) else 'w+b'
+        with open(self.matrix_path, mode) as f:
+            # 색인에 반영되지 않은 꼬리 데이터는 덮어씀
+            f.seek(row * self._index['dim'] * self.dtype.itemsize)
+            f.write(vector.tobytes())
+            f.truncate()
+        self._index['rows'] = row + 1
+        return row
+
+    def matrix(self):
+        """
+        저장된 전체 행렬 (읽기 전용 mmap, 삭제 표시된 행 포함)
+
+        Returns:
+            (rows, dim) 배열 (저장 자료형 그대로)
+        """
+        with self._lock:
+            self._ensure_loaded()
+            return self._open_matrix()
+
+    # ---- 조회/저장 ----
+
+    def _lookup(self, image_path, signature=None):
+        """
+        유효한 색인 항목 반환 (없거나 이미지가 바뀌었으면 None)
+        signature (수정 시간, 크기)를 주면 파일 상태를 다시 확인하지 않음
+        """
+        entry = self._index['entries'].get(os.path.basename(image_path))
+        if entry is None:
+            return None
+        try:
+            mtime, size = signature if signature is not None else _image_signature(image_path)
+        except OSError:
+            return None
+        if entry['mtime'] != mtime or entry['size'] != size:
+            return None
+        return entry
+
+    def get(self, image_path):
+        """
+        이미지의 특징 벡터를 조회합니다.
+
+        Returns:
+            (vector, cached): vector는 float32 벡터 또는 None(특징 없음),
+                              cached는 유효한 항목이 있었는지 여부
+        """
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._lookup(image_path)
+            if entry is None:
+                return None, False
+            if entry['row'] == _EMPTY_ROW:
+                return None, True
+            return np.array(self._open_matrix()[entry['row']], dtype=np.float32), True
+
+    def get_many(self, image_paths, signatures=None, with_rows=False):
+        """
+        여러 이미지의 특징 벡터를 한 번에 조회합니다.
+
+        Args:
+            image_paths: 이미지 경로 리스트
+            signatures: {경로: (수정 시간, 크기)} (디렉토리 매니페스트 등에서 이미 알고 있으면 stat 생략)
+            with_rows: True면 found_paths의 행 번호와 행 배치 세대도 반환
+
+        Returns:
+            (matrix, found_paths, missing_paths):
+                matrix는 found_paths 순서의 (k, dim) float32 행렬,
+                missing_paths는 유효한 항목이 없어 새로 추출해야 하는 경로
+                (특징 없음으로 기록된 이미지는 어느 쪽에도 포함되지 않음)
+            with_rows=True면 (matrix, found_paths, missing_paths, FeatureSource)
+        """
+        with self._lock:
+            self._ensure_loaded()
+            rows, found, missing = [], [], []
+            for image_path in image_paths:
+                signature = signatures.get(image_path) if signatures else None
+                entry = self._lookup(image_path, signature)
+                if entry is None:
+                    missing.append(image_path)
+                elif entry['row'] != _EMPTY_ROW:
+                    rows.append(entry['row'])
+                    found.append(image_path)
+            rows = np.asarray(rows, dtype=np.int64)
+            matrix = self._open_matrix()
+            if len(rows):
+                vectors = np.asarray(matrix[rows], dtype=np.float32)
+            else:
+                vectors = np.empty((0, matrix.shape[1]), dtype=np.float32)
+            if with_rows:
+                return vectors, found, missing, FeatureSource(self, rows, self.layout_generation, found)
+            return vectors, found, missing
+
+    def put(self, image_path, vector):
+        """
+        이미지의 특징 벡터를 저장합니다 (추가 전용, 기존 행은 삭제 표시).
+
+        Args:
+            image_path: 원본 이미지 경로
+            vector: 1차원 특징 벡터 또는 None(특징 없음으로 기록)
+        """
+        with self._lock:
+            self._ensure_loaded()
+            try:
+                mtime, size = _image_signature(image_path)
+            except OSError as e:
+                _get_logger().error(f"특징 저장 실패 ({image_path}): {e}")
+                return
+
+            if vector is not None:
+                vector = np.ascontiguousarray(vector, dtype=self.dtype).ravel()
+                if self._index['dim'] is None:
+                    self._index['dim'] = int(vector.shape[0])
+                elif self._index['dim'] != vector.shape[0]:
+                    # 특징 정의가 바뀐 경우: 이전 벡터와 비교할 수 없으므로 저장소를 비움
+                    _get_logger().warning(
+                        f"특징 차원이 바뀌어 저장소를 초기화합니다 ({self.kind}: "
+                        f"{self._index['dim']} -> {vector.shape[0]})"
+                    )
+                    self._matrix = None
+                    self._index = self._empty_index()
+                    self._index['dim'] = int(vector.shape[0])
+                    self._record_change()
+
+            name = os.path.basename(image_path)
+            self._tombstone(name)
+            try:
+                row = self._append_row(vector) if vector is not None else _EMPTY_ROW
+            except OSError as e:
+                _get_logger().error(f"특징 행렬 쓰기 실패 ({self.matrix_path}): {e}")
+                return
+            self._index['entries'][name] = {'row': row, 'mtime': mtime, 'size': size}
+            self._record_change(name)
+            self._mark_dirty()
+
+    def _tombstone(self, name):
+        """항목을 제거하고 사용하던 행을 삭제 표시"""
+        entry = self._index['entries'].pop(name, None)
+        if entry is None:
+            return False
+        if entry['row'] != _EMPTY_ROW:
+            self._index['tombstones'].append(entry['row'])
+        return True
+
+    def remove(self, image_path):
+        """이미지의 특징 항목을 삭제 표시 (이미지 삭제 시)"""
+        with self._lock:
+            self._ensure_loaded()
+            name = os.path.basename(image_path)
+            if self._tombstone(name):
+                self._record_change(name)
+                self._mark_dirty()
+                return True
+            return False
+
+    def __contains__(self, image_path):
+        with self._lock:
+            self._ensure_loaded()
+            return self._lookup(image_path) is not None
+
+    def live_entries(self):
+        """
+        특징 벡터가 있는 항목 전체 (이미지 수정 여부는 확인하지 않음)
+
+        Returns:
+            (names, signatures, vectors): 파일명 리스트, (N, 2) float64 (수정 시간, 크기),
+                                          (N, dim) float32 벡터 (복사본)
+        """
+        with self._lock:
+            self._ensure_loaded()
+            return self._entry_arrays(self._index['entries'].items())
+
+    def entries(self, names):
+        """
+        주어진 파일명 중 특징 벡터가 있는 항목 (live_entries와 같은 형식, 없는 이름은 제외)
+        """
+        with self._lock:
+            self._ensure_loaded()
+            entries = self._index['entries']
+            return self._entry_arrays((name, entries[name]) for name in names if name in entries)
+
+    def _entry_arrays(self, items):
+        """(파일명, 색인 항목)들을 (names, signatures, vectors)로 (특징 없음 항목 제외)"""
+        live = [(name, entry) for name, entry in items if entry['row'] != _EMPTY_ROW]
+        names = [name for name, _ in live]
+        signatures = np.array([(entry['mtime'], entry['size']) for _, entry in live], dtype=np.float64).reshape(-1, 2)
+        rows = np.asarray([entry['row'] for _, entry in live], dtype=np.int64)
+        matrix = self._open_matrix()
+        if len(rows):
+            vectors = np.asarray(matrix[rows], dtype=np.float32)
+        else:
+            vectors = np.empty((0, matrix.shape[1]), dtype=np.float32)
+        return names, signatures, vectors
+
+    def rows_for(self, names):
+        """
+        파일명들의 현재 행 번호 (특징이 없거나 없는 이름은 제외)
+
+        Returns:
+            (rows, layout): 행 번호 배열과 행 배치 세대
+        """
+        with self._lock:
+            self._ensure_loaded()
+            entries = self._index['entries']
+            rows = [entries[name]['row'] for name in names if name in entries]
+            return np.asarray([row for row in rows if row != _EMPTY_ROW], dtype=np.int64), self.layout_generation
+
+    def replace_all(self, names, signatures, vectors):
+        """
+        저장소 전체를 주어진 항목으로 교체합니다 (기저가 바뀐 임베딩을 다시 계산한 경우 등).
+
+        Args:
+            names: 이미지 파일명 리스트
+            signatures: (N, 2) (수정 시간, 크기)
+            vectors: (N, dim) 벡터
+        """
+        with self._lock:
+            self._ensure_loaded()
+            vectors = np.ascontiguousarray(vectors, dtype=self.dtype).reshape(len(names), -1)
+            temp_path = self.matrix_path + '.tmp'
+            try:
+                os.makedirs(self.features_dir, exist_ok=True)
+                with open(temp_path, 'wb') as f:
+                    f.write(vectors.tobytes())
+                self._matrix = None
+                os.replace(temp_path, self.matrix_path)
+            except OSError as e:
+                _get_logger().error(f"특징 저장소 교체 실패 ({self.matrix_path}): {e}")
+                return False
+
+            index = self._empty_index()
+            index['dim'] = int(vectors.shape[1]) if len(names) else self._index['dim']
+            index['rows'] = len(names)
+            for row, (name, (mtime, size)) in enumerate(zip(names, signatures)):
+                index['entries'][name] = {'row': row, 'mtime': float(mtime), 'size': int(size)}
+            self._index = index
+            self._record_change()
+            try:
+                self._save_index()
+            except OSError as e:
+                _get_logger().error(f"특징 저장소 색인 저장 실패 ({self.index_path}): {e}")
+            return True
+
+    # ---- 저장/압축 ----
+
+    def needs_compaction(self):
+        """삭제 표시된 행이 많아 압축이 필요한지 여부"""
+        tombstones = len(self._index['tombstones']) if self._index is not None else 0
+        if tombstones < _COMPACT_MIN_TOMBSTONES:
+            return False
+        return tombstones > self._index['rows'] * _COMPACT_TOMBSTONE_RATIO
+
+    def flush(self):
+        """변경된 색인을 디스크에 쓰고, 필요하면 압축"""
+        with self._lock:
+            if self._index is None:
+                return
+            if self.needs_compaction():
+                self.compact()
+            elif self._dirty:
+                try:
+                    self._save_index()
+                except OSError as e:
+                    _get_logger().error(f"특징 저장소 색인 저장 실패 ({self.index_path}): {e}")
+
+    def compact(self):
+        """살아 있는 행만 새 행렬 파일로 복사하고 행 번호를 다시 매김"""
+        with self._lock:
+            self._ensure_loaded()
+            entries = self._index['entries']
+            live = [(name, entry) for name, entry in entries.items() if entry['row'] != _EMPTY_ROW]
+            old_rows = np.asarray([entry['row'] for _, entry in live], dtype=np.int64)
+            old_count = self._index['rows']
+
+            temp_path = self.matrix_path + '.tmp'
+            try:
+                if len(old_rows):
+                    vectors = np.asarray(self._open_matrix()[old_rows])
+                else:
+                    vectors = np.empty((0, self._index['dim'] or 0), dtype=self.dtype)
+                with open(temp_path, 'wb') as f:
+                    f.write(np.ascontiguousarray(vectors, dtype=self.dtype).tobytes())
+                # Windows에서는 mmap이 열려 있으면 교체할 수 없으므로 먼저 닫음
+                self._matrix = None
+                del vectors
+                os.replace(temp_path, self.matrix_path)
+            except OSError as e:
+                _get_logger().warning(f"특징 저장소 압축 실패, 다음에 다시 시도합니다 ({self.matrix_path}): {e}")
+                if os.path.exists(temp_path):
+                    try:
+                        os.remove(temp_path)
+                    except OSError as remove_error:
+                        _get_logger().error(f"임시 파일 삭제 실패 ({temp_path}): {remove_error}")
+                return False
+
+            for new_row, (_, entry) in enumerate(live):
+                entry['row'] = new_row
+            self._index['rows'] = len(live)
+            self._index['tombstones'] = []
+            # 항목 내용은 그대로이고 행 번호만 바뀜
+            self.layout_generation += 1
+            try:
+                self._save_index()
+            except OSError as e:
+                _get_logger().error(f"특징 저장소 색인 저장 실패 ({self.index_path}): {e}")
+            _get_logger().info(f"특징 저장소 압축 ({self.kind}): {old_count}행 -> {len(live)}행")
+            return True
+
+
+# 열린 저장소 (정규화된 features 폴더 경로, 종류) -> FeatureStore
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_feature_store(image_path, kind):
+    """
+    이미지가 속한 디렉토리의 특징 저장소를 반환합니다 (프로세스 내에서 공유).
+
+    Args:
+        image_path: 이미지 파일 경로
+        kind: 특징 종류 (KIND_FACE, KIND_CLOTHING, KIND_MESH, KIND_EMBEDDING)
+    """
+    features_dir = os.path.normcase(os.path.normpath(get_features_dir(image_path)))
+    key = (features_dir, kind)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = FeatureStore(features_dir, kind)
+        return store
+
+
+def remove_image_features(image_path, flush=True):
+    """모든 종류의 저장소에서 이미지 항목을 삭제 표시하고 색인을 저장 (flush=False면 flush_all에 맡김)"""
+    removed = False
+    for kind in FEATURE_KINDS:
+        store = get_feature_store(image_path, kind)
+        if store.remove(image_path):
+            removed = True
+            if flush:
+                store.flush()
+    return removed
+
+
+def flush_all():
+    """열린 모든 저장소의 변경 사항을 저장"""
+    with _stores_lock:
+        stores = list(_stores.values())
+    for store in stores:
+        store.flush()
+
+
+def load_features(image_paths, kind, signatures=None, with_sources=False):
+    """
+    여러 이미지의 특징 벡터를 디렉토리별 저장소에서 한 번에 읽습니다.
+
+    Args:
+        image_paths: 이미지 경로 리스트 (여러 디렉토리 가능)
+        kind: 특징 종류
+        signatures: {경로: (수정 시간, 크기)} (있으면 파일 상태 확인 생략)
+        with_sources: True면 found_paths 순서의 디렉토리별 FeatureSource 리스트도 반환
+
+    Returns:
+        (matrix, found_paths, missing_paths): FeatureStore.get_many와 같음
+        (found_paths는 디렉토리별로 묶인 순서)
+        with_sources=True면 (matrix, found_paths, missing_paths, sources)
+    """
+    groups = {}
+    for image_path in image_paths:
+        groups.setdefault(os.path.dirname(os.path.abspath(image_path)), []).append(image_path)
+
+    matrices, found, missing, sources = [], [], [], []
+    for paths in groups.values():
+        matrix, group_found, group_missing, source = get_feature_store(paths[0], kind).get_many(
+            paths, signatures, with_rows=True)
+        if group_found:
+            matrices.append(matrix)
+            found.extend(group_found)
+            sources.append(source)
+        missing.extend(group_missing)
+
+    if not matrices:
+        matrix = np.empty((0, 0), dtype=np.float32)
+    elif len(matrices) == 1:
+        matrix = matrices[0]
+    else:
+        matrix = np.concatenate(matrices)
+    if with_sources:
+        return matrix, found, missing, sources
+    return matrix, found, missing
@@ -47,6 +47,9 @@ except ImportError:
     _mediapipe_available = False
     mp = None
 
+# 얼굴 감지기 레지스트리 (MediaPipe 없이도 사용 가능)
+import utils.face_detectors as face_detectors
+
 # globals 모듈 import
 import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -63,6 +66,9 @@ DEFAULT_KAODATA_PATH = 'saves/Kaodata.s7'
 # 헤더 크기 (추정)
 HEADER_SIZE = 10372
 
+# 일괄 가져오기에서 한 번에 읽어 얼굴 영역을 감지할 PNG 수 (메모리에 올려 두는 이미지 수 상한)
+IMPORT_DETECT_BATCH_SIZE = 16
+
 # 전역 변수: 파일 핸들 캐싱
 _kaodata_file = None
 _kaodata_file_path = None
@@ -302,6 +308,10 @@ def save_face_image(faceno, image):
     except Exception as e:
         raise IOError(f"얼굴 이미지 저장 실패 (faceno: {faceno}): {e}")
 
+    # 7. 게임 얼굴 유사도 인덱스에서 이 슬롯 무효화 (다음 갱신 때 이 슬롯만 다시 계산)
+    import utils.kaodata_index as kaodata_index
+    kaodata_index.invalidate_slot(file_path, faceno)
+
 def convert_to_palette_colors(image, palette=FACE_PALETTE, method='quantize', dither=False, smooth=True):
     """
     RGB/RGBA 이미지를 팔레트 색상에 맞춰 변환합니다.
@@ -493,7 +503,7 @@ def _resize_with_aspect_ratio(image, target_size):
     
     return result
 
-def extract_face_region(image, crop_scale=2.0, center_offset_x=0, center_offset_y=0, manual_region=None, return_face_region=False, use_mediapipe=False):
+def extract_face_region(image, crop_scale=2.0, center_offset_x=0, center_offset_y=0, manual_region=None, return_face_region=False, use_mediapipe=False, face_region=None):
     """
     이미지에서 얼굴 영역을 추출합니다. (OpenCV 또는 MediaPipe 사용)
     
@@ -507,6 +517,7 @@ def extract_face_region(image, crop_scale=2.0, center_offset_x=0, center_offset_
         manual_region: 수동 영역 지정 (x, y, width, height) 튜플 또는 None
         return_face_region: True일 경우 (이미지, 얼굴영역) 튜플 반환, False일 경우 이미지만 반환
         use_mediapipe: True일 경우 MediaPipe를 사용하여 얼굴 감지 (기본값: False, OpenCV 사용)
+        face_region: 미리 감지한 얼굴 영역 (x, y, w, h) (face_detectors.detect_faces 결과, 지정 시 감지 생략)
     
     Returns:
         PIL.Image 또는 (PIL.Image, (x, y, w, h)): 얼굴 영역이 크롭된 이미지 (얼굴을 찾지 못하면 에러 발생)
@@ -612,236 +623,15 @@ def extract_face_region(image, crop_scale=2.0, center_offset_x=0, center_offset_
             else:
                 return face_image
         
-        # MediaPipe를 사용하는 경우
-        if use_mediapipe and _mediapipe_available:
-            try:
-                # PIL Image로 변환 (MediaPipe는 PIL Image를 받음)
-                img_pil = Image.fromarray(img_rgb)
-                
-                # 랜드마크 감지
-                landmarks, detected = detect_face_landmarks(img_pil)
-                
-                if detected and landmarks:
-                    # 주요 랜드마크 추출
-                    key_landmarks = get_key_landmarks(landmarks)
-                    
-                    if key_landmarks and key_landmarks.get('left_eye') and key_landmarks.get('right_eye'):
-                        # 랜드마크 포인트들의 실제 min/max 값을 사용하여 얼굴 영역 계산
-                        # 모든 랜드마크 포인트의 X, Y 좌표 추출
-                        all_x = [point[0] for point in landmarks]
-                        all_y = [point[1] for point in landmarks]
-                        
-                        # 얼굴 윤곽선(FACE_OVAL) 포인트만 사용하여 더 정확한 영역 계산
-                        try:
-                            if mp is not None:
-                                mp_face_mesh = mp.solutions.face_mesh
-                                face_oval_indices = [idx for connection in mp_face_mesh.FACEMESH_FACE_OVAL for idx in connection]
-                                face_oval_x = [landmarks[idx][0] for idx in face_oval_indices if idx < len(landmarks)]
-                                face_oval_y = [landmarks[idx][1] for idx in face_oval_indices if idx < len(landmarks)]
-                                
-                                if face_oval_x and face_oval_y:
-                                    # 얼굴 윤곽선 포인트의 min/max 사용
-                                    min_x = min(face_oval_x)
-                                    max_x = max(face_oval_x)
-                                    min_y = min(face_oval_y)
-                                    max_y = max(face_oval_y)
-                                else:
-                                    # 얼굴 윤곽선 포인트가 없으면 모든 랜드마크 사용
-                                    min_x = min(all_x)
-                                    max_x = max(all_x)
-                                    min_y = min(all_y)
-                                    max_y = max(all_y)
-                            else:
-                                # MediaPipe가 없으면 모든 랜드마크 사용
-                                min_x = min(all_x)
-                                max_x = max(all_x)
-                                min_y = min(all_y)
-                                max_y = max(all_y)
-                        except Exception as e:
-                            # MediaPipe 상수를 가져올 수 없으면 모든 랜드마크 사용
-                            print(f"[얼굴이미지] 얼굴 윤곽선 계산 실패, 모든 랜드마크 사용: {e}")
-                            min_x = min(all_x)
-                            max_x = max(all_x)
-                            min_y = min(all_y)
-                            max_y = max(all_y)
-                        
-                        # 얼굴 영역 계산 (실제 랜드마크 범위 사용)
-                        x = max(0, int(min_x))
-                        y = max(0, int(min_y))
-                        w = min(img_width - x, int(max_x - min_x))
-                        h = min(img_height - y, int(max_y - min_y))
-                        
-                        # 경계 조정
-                        if x + w > img_width:
-                            w = img_width - x
-                        if y + h > img_height:
-                            h = img_height - y
-                        
-                        if w > 0 and h > 0:
-                            detected_face_region = (x, y, w, h)
-                            
-                            # 감지된 얼굴 영역의 중심점 계산
-                            detected_face_center_x = x + w // 2
-                            detected_face_center_y = y + h // 2
-                            
-                            # 크롭 중심점 계산 (감지된 얼굴 영역의 중심 기준)
-                            crop_center_x = detected_face_center_x + center_offset_x
-                            crop_center_y = detected_face_center_y + center_offset_y
-                            
-                            # 목표 비율 (96:120 = 0.8)
-                            target_ratio = FACE_WIDTH / FACE_HEIGHT  # 96/120 = 0.8
-                            
-                            # 감지된 얼굴 영역의 크기를 기준으로 96:120 비율로 크롭할 크기 계산
-                            if w / h > target_ratio:
-                                crop_height = int(h * crop_scale)
-                                crop_width = int(crop_height * target_ratio)
-                            else:
-                                crop_width = int(w * crop_scale)
-                                crop_height = int(crop_width / target_ratio)
-                            
-                            # 96:120 비율 보장 (반올림 오차 보정)
-                            actual_ratio = crop_width / crop_height if crop_height > 0 else target_ratio
-                            if abs(actual_ratio - target_ratio) > 0.01:
-                                if w / h > target_ratio:
-                                    crop_width = int(crop_height * target_ratio)
-                                else:
-                                    crop_height = int(crop_width / target_ratio)
-                            
-                            # 감지된 얼굴 영역의 중심점을 기준으로 크롭 영역 계산 (오프셋 적용)
-                            crop_center_x = detected_face_center_x + center_offset_x
-                            crop_center_y = detected_face_center_y + center_offset_y
-                            
-                            # 크롭 영역 좌표 계산 (감지된 얼굴 중심 기준)
-                            x_start = crop_center_x - crop_width // 2
-                            y_start = crop_center_y - crop_height // 2
-                            
-                            # 경계 조정
-                            if crop_width > img_width:
-                                crop_width = img_width
-                                crop_height = int(crop_width / target_ratio)
-                            if crop_height > img_height:
-                                crop_height = img_height
-                                crop_width = int(crop_height * target_ratio)
-                            
-                            # 좌표 재계산
-                            x_start = crop_center_x - crop_width // 2
-                            y_start = crop_center_y - crop_height // 2
-                            
-                            # 경계를 벗어난 경우 중심점을 조정
-                            if x_start < 0:
-                                x_start = 0
-                            elif x_start + crop_width > img_width:
-                                x_start = img_width - crop_width
-                            
-                            if y_start < 0:
-                                y_start = 0
-                            elif y_start + crop_height > img_height:
-                                y_start = img_height - crop_height
-                            
-                            # 최종 크롭 영역
-                            x_end = x_start + crop_width
-                            y_end = y_start + crop_height
-                            
-                            # 얼굴 영역 크롭
-                            face_region = img_rgb[y_start:y_end, x_start:x_end]
-                            
-                            if face_region.size == 0:
-                                raise ValueError(f"크롭된 영역이 비어있습니다. 크롭 영역: ({x_start}, {y_start}) ~ ({x_end}, {y_end})")
-                            
-                            # numpy 배열을 PIL Image로 변환
-                            face_image = Image.fromarray(face_region)
-                            
-                            # 얼굴 영역 좌표 반환 여부 확인
-                            if return_face_region:
-                                return face_image, detected_face_region
-                            else:
-                                return face_image
-                
-                # MediaPipe로 얼굴을 찾지 못한 경우 OpenCV로 폴백
-                print("[얼굴이미지] MediaPipe로 얼굴을 찾지 못했습니다. OpenCV 방식으로 폴백합니다.")
-            except Exception as e:
-                # MediaPipe 실패 시 OpenCV로 폴백
-                print(f"[얼굴이미지] MediaPipe 얼굴 감지 실패: {e}, OpenCV 방식으로 폴백합니다.")
-        
-        # OpenCV 방식 (기본 또는 MediaPipe 실패 시)
-        # 그레이스케일로 변환 (얼굴 인식용)
-        gray = cv2.cvtColor(img_rgb, cv2.COLOR_RGB2GRAY)
-        
-        # 감지된 얼굴 영역 저장용 변수
-        detected_face_region = None
-        
-        # 얼굴 감지 (먼저 시도)
-        face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
-        faces = []
-        face_detected = False
-        x, y, w, h = None, None, None, None
-        eye_center_y = None
-        face_center_x = None
-        
-        if not face_cascade.empty():
-            # 얼굴 감지 (더 민감하게 설정)
-            faces = face_cascade.detectMultiScale(
-                gray,
-                scaleFactor=1.1,
-                minNeighbors=3,  # 5 -> 3으로 낮춰서 더 많이 감지
-                minSize=(20, 20)  # 30 -> 20으로 낮춰서 작은 얼굴도 감지
-            )
-        
-        # 눈 감지 분류기 로드
-        eye_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_eye.xml')
-        eyes_detected = False
-        
-                # 얼굴을 찾은 경우
-        if len(faces) > 0:
-            
-            # 가장 큰 얼굴 선택 (여러 얼굴이 있는 경우)
-            largest_face = max(faces, key=lambda f: f[2] * f[3])
-            x, y, w, h = largest_face
-            detected_face_region = (x, y, w, h)  # 감지된 얼굴 영역 저장
-        
-        # 얼굴을 못 찾은 경우 - 전체 이미지에서 눈 감지 시도 (fallback)
-        elif not eye_cascade.empty():
-            eyes = eye_cascade.detectMultiScale(
-                gray,
-                scaleFactor=1.1,
-                minNeighbors=3,
-                minSize=(10, 10)
-            )
-            
-            if len(eyes) >= 2:
-                eyes_detected = True
-                # 두 눈의 중심점 계산
-                eye_centers = []
-                for (ex, ey, ew, eh) in eyes:
-                    eye_center_x = ex + ew // 2
-                    eye_center_y = ey + eh // 2
-                    eye_centers.append((eye_center_x, eye_center_y))
-                
-                # 두 눈의 Y 좌표 중 더 작은 값 (Y 좌표가 작을수록 위쪽)
-                eye_centers_y = [ec[1] for ec in eye_centers]
-                eye_center_y = min(eye_centers_y)
-                
-                # 두 눈의 X 좌표 평균 (얼굴 중심 X 추정)
-                eye_centers_x = [ec[0] for ec in eye_centers]
-                face_center_x = sum(eye_centers_x) // len(eye_centers_x)
-                
-                # 눈 간격을 기반으로 얼굴 크기 추정 (일반적으로 눈 간격의 2.5~3배가 얼굴 너비)
-                eye_distance = abs(eye_centers[0][0] - eye_centers[1][0])
-                estimated_face_width = int(eye_distance * 2.5)
-                estimated_face_height = int(estimated_face_width * 1.25)  # 얼굴은 보통 세로가 더 김
-                
-                # 얼굴 영역 추정
-                x = max(0, face_center_x - estimated_face_width // 2)
-                y = max(0, eye_center_y - estimated_face_height // 3)  # 눈은 얼굴 상단 1/3 지점
-                w = min(img_width - x, estimated_face_width)
-                h = min(img_height - y, estimated_face_height)
-                detected_face_region = (x, y, w, h)  # 감지된 얼굴 영역 저장
-            else:
-                # 얼굴도 눈도 못 찾은 경우
-                raise ValueError("얼굴과 눈을 모두 찾을 수 없습니다. 얼굴 인식 체크박스를 해제하거나 다른 이미지를 사용하세요.")
+        # 얼굴 영역 감지 (MediaPipe 우선 시 실패하면 OpenCV로 폴백, 분류기/모델은 레지스트리에서 재사용)
+        if face_region is not None:
+            detected_face_region = tuple(face_region)
         else:
+            detected_face_region = face_detectors.detect_faces([img_rgb], use_mediapipe=use_mediapipe)[0]
+        if detected_face_region is None:
             # 얼굴도 눈도 못 찾은 경우
             raise ValueError("얼굴과 눈을 모두 찾을 수 없습니다. 얼굴 인식 체크박스를 해제하거나 다른 이미지를 사용하세요.")
+        x, y, w, h = detected_face_region
         
         # 목표 비율 (96:120 = 0.8)
         target_ratio = FACE_WIDTH / FACE_HEIGHT  # 96/120 = 0.8
@@ -985,7 +775,7 @@ def save_face_from_png(png_path, faceno, use_face_detection=False):
     except Exception as e:
         raise IOError(f"PNG 파일 저장 실패 ({png_path} -> faceno: {faceno}): {e}")
 
-def import_faces_from_png(png_dir=None, pattern='face*.png', verbose=True):
+def import_faces_from_png(png_dir=None, pattern='face*.png', verbose=True, use_face_detection=False):
     """
     편집한 PNG 파일들을 Kaodata.s7 파일에 반영합니다.
     
@@ -993,6 +783,7 @@ def import_faces_from_png(png_dir=None, pattern='face*.png', verbose=True):
         png_dir: PNG 파일이 있는 디렉토리 경로 (None이면 저장된 경로 또는 기본값 'gui/png' 사용)
         pattern: 파일명 패턴 (기본값: 'face*.png')
         verbose: 진행 상황 출력 여부
+        use_face_detection: 얼굴 인식 사용 여부 (True면 얼굴 영역을 일괄 감지한 뒤 크롭해서 저장)
     
     Returns:
         dict: {'success': 성공 개수, 'failed': 실패 개수, 'errors': 에러 리스트}
@@ -1025,46 +816,76 @@ def import_faces_from_png(png_dir=None, pattern='face*.png', verbose=True):
     
     results = {'success': 0, 'failed': 0, 'errors': []}
     
+    # 파일명 검사 후 저장할 대상 목록 구성
+    targets = []
     for png_file in sorted(png_files):
-        try:
-            # 파일명에서 얼굴 번호 추출
+        # 파일명에서 얼굴 번호 추출
+        filename = os.path.basename(png_file)
+        match = face_pattern.match(filename)
+        
+        if not match:
+            error_msg = f"파일명 형식이 올바르지 않습니다: {filename}"
+            results['errors'].append(error_msg)
+            results['failed'] += 1
+            if verbose:
+                print(f"  [실패] {filename}: {error_msg}")
+            continue
+        
+        faceno = int(match.group(1))
+        
+        if faceno < 0 or faceno >= 648:
+            error_msg = f"얼굴 번호가 범위를 벗어났습니다: {faceno}"
+            results['errors'].append(f"{filename}: {error_msg}")
+            results['failed'] += 1
+            if verbose:
+                print(f"  [실패] {filename}: {error_msg}")
+            continue
+        
+        targets.append((png_file, faceno))
+    
+    # 얼굴 인식 사용 시 IMPORT_DETECT_BATCH_SIZE개씩 읽어 같은 감지기 인스턴스로 일괄 감지 (PNG는 한 번만 읽음)
+    batch_size = IMPORT_DETECT_BATCH_SIZE if use_face_detection else 1
+    for batch_start in range(0, len(targets), batch_size):
+        # PNG 이미지 읽기 (실패하면 예외를 저장해 두고 아래에서 실패로 기록)
+        batch = []
+        for png_file, faceno in targets[batch_start:batch_start + batch_size]:
+            try:
+                batch.append((png_file, faceno, Image.open(png_file), None))
+            except Exception as e:
+                batch.append((png_file, faceno, None, e))
+        
+        face_regions = [None] * len(batch)
+        if use_face_detection:
+            readable = [index for index, (_, _, _, error) in enumerate(batch) if error is None]
+            regions = face_detectors.detect_faces(batch[index][2].convert('RGB') for index in readable)
+            for index, region in zip(readable, regions):
+                face_regions[index] = region
+        
+        for (png_file, faceno, img, error), face_region in zip(batch, face_regions):
             filename = os.path.basename(png_file)
-            match = face_pattern.match(filename)
-            
-            if not match:
-                error_msg = f"파일명 형식이 올바르지 않습니다: {filename}"
-                results['errors'].append(error_msg)
-                results['failed'] += 1
+            try:
+                if error is not None:
+                    raise error
+                
+                # 얼굴 인식 사용 시 감지한 얼굴 영역으로 크롭
+                if use_face_detection:
+                    if face_region is None:
+                        raise ValueError("얼굴과 눈을 모두 찾을 수 없습니다.")
+                    img = extract_face_region(img, face_region=face_region)
+                
+                # Kaodata.s7에 저장
+                save_face_image(faceno, img)
+                
+                results['success'] += 1
                 if verbose:
-                    print(f"  [실패] {filename}: {error_msg}")
-                continue
-            
-            faceno = int(match.group(1))
-            
-            if faceno < 0 or faceno >= 648:
-                error_msg = f"얼굴 번호가 범위를 벗어났습니다: {faceno}"
-                results['errors'].append(f"{filename}: {error_msg}")
+                    print(f"  [성공] {filename} -> 얼굴 번호 {faceno}")
+                    
+            except Exception as e:
+                error_msg = f"{filename}: {str(e)}"
+                results['errors'].append(error_msg)
                 results['failed'] += 1
                 if verbose:
-                    print(f"  [실패] {filename}: {error_msg}")
-                continue
-            
-            # PNG 이미지 읽기
-            img = Image.open(png_file)
-            
-            # Kaodata.s7에 저장
-            save_face_image(faceno, img)
-            
-            results['success'] += 1
-            if verbose:
-                print(f"  [성공] {filename} -> 얼굴 번호 {faceno}")
-                
-        except Exception as e:
-            error_msg = f"{os.path.basename(png_file)}: {str(e)}"
-            results['errors'].append(error_msg)
-            results['failed'] += 1
-            if verbose:
-                print(f"  [실패] {os.path.basename(png_file)}: {e}")
+                    print(f"  [실패] {filename}: {e}")
     
     if verbose:
         print(f"\n[얼굴이미지] 완료: 성공 {results['success']}개, 실패 {results['failed']}개")
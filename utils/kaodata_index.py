@@ -0,0 +1,312 @@
+"""
+Kaodata.s7 게임 얼굴 유사도 인덱스
+게임에 들어 있는 얼굴 648개 전체의 랜드마크와 얼굴 특징 벡터를 미리 계산해 두고,
+"이 사진과 가장 비슷한 게임 얼굴 번호"를 행렬곱 한 번으로 찾습니다 (덮어쓸 슬롯 고르기).
+
+- 96x120 얼굴은 FaceMesh에 너무 작으므로 UPSCALE배 확대한 뒤 감지합니다.
+- 슬롯마다 원본 바이트의 해시를 기록해 두고, 해시가 바뀐 슬롯만 다시 계산합니다.
+  save_face_image가 슬롯을 쓰면 invalidate_slot으로 해당 슬롯을 바로 무효화합니다.
+- 인덱스는 Kaodata 파일 옆 features 폴더의 <파일명>.s7ed.index.npz에 저장됩니다.
+"""
+import os
+import hashlib
+import threading
+
+import numpy as np
+from PIL import Image
+
+import utils.kaodata_image as kaodata_image
+import utils.feature_store as feature_store
+from utils.similarity_search import SimilarityIndex
+from utils.facemesh_topology import FACEMESH_NUM_LANDMARKS_WITH_IRISES
+
+# 로거 (지연 로딩)
+_logger = None
+
+def _get_logger():
+    """로거 가져오기 (지연 로딩)"""
+    global _logger
+    if _logger is None:
+        from utils.logger import get_logger
+        _logger = get_logger('게임얼굴인덱스')
+    return _logger
+
+
+# 인덱스 파일 형식 버전
+INDEX_VERSION = 1
+INDEX_SUFFIX = '.s7ed.index.npz'
+
+# Kaodata.s7 얼굴 수
+FACE_COUNT = 648
+
+# FaceMesh 감지용 확대 배율 (96x120 -> 384x480)
+UPSCALE = 4
+
+# 슬롯 해시 크기 (바이트, 비어 있으면 아직 계산하지 않은 슬롯)
+_HASH_SIZE = 16
+
+# 이만큼 계산할 때마다 중간 저장 (긴 계산이 취소되어도 진행분 유지)
+_SAVE_INTERVAL = 64
+
+
+def get_index_path(kaodata_path):
+    """Kaodata 파일의 인덱스 파일 경로"""
+    name = os.path.basename(kaodata_path) + INDEX_SUFFIX
+    return os.path.join(feature_store.get_features_dir(kaodata_path), name)
+
+
+def _file_signature(path):
+    """(수정 시간, 크기) 또는 None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def read_slots(kaodata_path):
+    """
+    모든 얼굴 슬롯의 원본 바이트를 한 번에 읽습니다.
+
+    Returns:
+        (FACE_COUNT, FACE_SIZE) uint8 배열
+    """
+    size = kaodata_image.FACE_SIZE
+    with open(kaodata_path, 'rb') as f:
+        f.seek(kaodata_image.HEADER_SIZE)
+        data = np.frombuffer(f.read(FACE_COUNT * size), dtype=np.uint8)
+    if len(data) != FACE_COUNT * size:
+        raise IOError(f"얼굴 데이터가 부족합니다. (요청: {FACE_COUNT * size}, 읽음: {len(data)})")
+    return data.reshape(FACE_COUNT, size)
+
+
+def slot_hashes(slots):
+    """슬롯별 내용 해시 ((FACE_COUNT,) 'S16' 배열)"""
+    return np.array([hashlib.blake2b(row.tobytes(), digest_size=_HASH_SIZE).digest() for row in slots],
+                    dtype=f'S{_HASH_SIZE}')
+
+
+def slot_image(slot):
+    """슬롯 바이트를 FaceMesh 감지용으로 확대한 RGB 이미지로 변환"""
+    image = Image.frombytes('P', (kaodata_image.FACE_WIDTH, kaodata_image.FACE_HEIGHT), slot.tobytes())
+    image.putpalette(kaodata_image.FACE_PALETTE)
+    image = image.convert('RGB')
+    return image.resize((kaodata_image.FACE_WIDTH * UPSCALE, kaodata_image.FACE_HEIGHT * UPSCALE), Image.LANCZOS)
+
+
+def extract_features(image):
+    """
+    이미지에서 (랜드마크, 얼굴 특징 벡터)를 추출합니다.
+
+    Returns:
+        (landmarks (N, 2) 배열 또는 None, features 벡터 또는 None)
+    """
+    import utils.face_landmarks as face_landmarks
+    if not face_landmarks.is_available():
+        return None, None
+    landmarks, detected = face_landmarks.detect_face_landmarks(image)
+    if not detected or landmarks is None:
+        return None, None
+    return np.asarray(landmarks, dtype=np.float32), face_landmarks.extract_face_features_vector(image, landmarks)
+
+
+class KaodataIndex:
+    """
+    Kaodata 파일 하나의 얼굴 슬롯 인덱스
+
+    Args:
+        kaodata_path: Kaodata.s7 경로
+        extract: extract(image) -> (landmarks, features) (None이면 extract_features)
+    """
+
+    def __init__(self, kaodata_path, extract=None):
+        self.kaodata_path = os.path.abspath(kaodata_path)
+        self.index_path = get_index_path(self.kaodata_path)
+        self.extract = extract or extract_features
+        self._lock = threading.Lock()
+        self.hashes = np.zeros(FACE_COUNT, dtype=f'S{_HASH_SIZE}')
+        self.vectors = None
+        self.landmarks = np.full((FACE_COUNT, FACEMESH_NUM_LANDMARKS_WITH_IRISES, 2), np.nan, dtype=np.float32)
+        self.file_signature = None
+        self._dirty = set()
+        self._load()
+
+    def _load(self):
+        """저장된 인덱스 로드 (없거나 형식이 다르면 빈 인덱스)"""
+        if not os.path.exists(self.index_path):
+            return
+        try:
+            with np.load(self.index_path) as data:
+                if int(data['version']) != INDEX_VERSION or data['hashes'].shape != (FACE_COUNT,):
+                    raise ValueError("인덱스 형식이 다릅니다")
+                self.hashes = data['hashes'].astype(f'S{_HASH_SIZE}')
+                self.landmarks = data['landmarks'].astype(np.float32)
+                vectors = data['vectors']
+                self.vectors = vectors.astype(np.float32) if vectors.size else None
+                signature = data['file_signature']
+                self.file_signature = tuple(int(v) for v in signature) if signature.size else None
+        except Exception as e:
+            _get_logger().warning(f"게임 얼굴 인덱스 로드 실패, 다시 계산합니다 ({self.index_path}): {e}")
+            self.hashes = np.zeros(FACE_COUNT, dtype=f'S{_HASH_SIZE}')
+            self.vectors = None
+            self.landmarks[:] = np.nan
+            self.file_signature = None
+
+    def save(self):
+        """npz 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+        with self._lock:
+            hashes = self.hashes.copy()
+            landmarks = self.landmarks.copy()
+            vectors = self.vectors.copy() if self.vectors is not None else np.empty((0, 0), dtype=np.float32)
+            signature = np.array(self.file_signature if self.file_signature else [], dtype=np.int64)
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        temp_path = self.index_path + '.tmp.npz'
+        np.savez(temp_path, version=INDEX_VERSION, hashes=hashes, landmarks=landmarks,
+                 vectors=vectors, file_signature=signature)
+        os.replace(temp_path, self.index_path)
+
+    def invalidate(self, faceno):
+        """슬롯 하나를 무효화 (다음 update에서 다시 계산)"""
+        with self._lock:
+            self.hashes[faceno] = b''
+            self._dirty.add(faceno)
+
+    def stale_slots(self):
+        """
+        다시 계산해야 하는 슬롯 번호 목록과 현재 슬롯 데이터
+        파일이 마지막 갱신 이후 바뀌지 않았고 무효화된 슬롯도 없으면 파일을 읽지 않습니다.
+
+        Returns:
+            (slots 리스트, (FACE_COUNT, FACE_SIZE) 배열 또는 None, 현재 해시 또는 None)
+        """
+        signature = _file_signature(self.kaodata_path)
+        with self._lock:
+            if signature is not None and signature == self.file_signature and not self._dirty \
+                    and all(self.hashes):
+                return [], None, None
+        data = read_slots(self.kaodata_path)
+        hashes = slot_hashes(data)
+        with self._lock:
+            stale = np.nonzero(hashes != self.hashes)[0].tolist()
+        return stale, data, hashes
+
+    def update(self, is_cancelled=None, on_progress=None):
+        """
+        내용이 바뀐 슬롯만 랜드마크/특징을 다시 계산하고 저장합니다.
+
+        Args:
+            is_cancelled: 취소 여부 함수 (True를 반환하면 중간 저장 후 중단)
+            on_progress: on_progress(done, total) 콜백
+
+        Returns:
+            다시 계산한 슬롯 번호 리스트
+        """
+        signature = _file_signature(self.kaodata_path)
+        stale, data, hashes = self.stale_slots()
+        if not stale:
+            if data is not None:
+                with self._lock:
+                    self.file_signature = signature
+            return []
+
+        with self._lock:
+            self._dirty.difference_update(stale)
+        _get_logger().info(f"게임 얼굴 인덱스 갱신: {len(stale)}개 슬롯")
+
+        done = []
+        for count, faceno in enumerate(stale, start=1):
+            if is_cancelled is not None and is_cancelled():
+                break
+            try:
+                landmarks, features = self.extract(slot_image(data[faceno]))
+            except Exception as e:
+                _get_logger().warning(f"게임 얼굴 특징 추출 실패 (faceno: {faceno}): {e}")
+                landmarks, features = None, None
+            self._store(faceno, hashes[faceno], landmarks, features)
+            done.append(faceno)
+            if on_progress is not None:
+                on_progress(count, len(stale))
+            if count % _SAVE_INTERVAL == 0:
+                self.save()
+
+        with self._lock:
+            if len(done) == len(stale):
+                self.file_signature = signature
+        self.save()
+        return done
+
+    def _store(self, faceno, slot_hash, landmarks, features):
+        """슬롯 계산 결과 기록 (계산 중 다시 무효화된 슬롯은 해시를 남기지 않음)"""
+        with self._lock:
+            if features is not None:
+                features = np.asarray(features, dtype=np.float32)
+                if self.vectors is None or self.vectors.shape[1] != len(features):
+                    self.vectors = np.full((FACE_COUNT, len(features)), np.nan, dtype=np.float32)
+                self.vectors[faceno] = features
+            elif self.vectors is not None:
+                self.vectors[faceno] = np.nan
+            if landmarks is not None and landmarks.shape == self.landmarks.shape[1:]:
+                self.landmarks[faceno] = landmarks / UPSCALE
+            else:
+                self.landmarks[faceno] = np.nan
+            if faceno not in self._dirty:
+                self.hashes[faceno] = slot_hash
+
+    def search_index(self):
+        """특징이 있는 슬롯만 담은 SimilarityIndex (키는 얼굴 번호, 없으면 None)"""
+        with self._lock:
+            if self.vectors is None:
+                return None
+            rows = np.nonzero(np.all(np.isfinite(self.vectors), axis=1))[0]
+            if len(rows) == 0:
+                return None
+            return SimilarityIndex(rows.tolist(), face_vectors=self.vectors[rows])
+
+    def query(self, features, top_k=10, exclude=None):
+        """
+        얼굴 특징 벡터와 가장 비슷한 게임 얼굴 번호
+
+        Returns:
+            [(score, faceno), ...] (점수 내림차순)
+        """
+        index = self.search_index()
+        if index is None or features is None:
+            return []
+        return index.search(index.face_scores([features])[0], top_n=top_k, exclude=exclude)
+
+    def query_image(self, image, top_k=10, exclude=None):
+        """사진(PIL.Image)과 가장 비슷한 게임 얼굴 번호 ([(score, faceno), ...])"""
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        _, features = self.extract(image)
+        return self.query(features, top_k=top_k, exclude=exclude)
+
+
+# Kaodata 경로별 인덱스 (프로세스 안에서 공유)
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_index(kaodata_path=None):
+    """Kaodata 파일의 인덱스 (None이면 현재 설정된 얼굴 파일)"""
+    if kaodata_path is None:
+        kaodata_path = kaodata_image.get_face_file_path()
+    key = os.path.normcase(os.path.abspath(kaodata_path))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = KaodataIndex(kaodata_path)
+            _indexes[key] = index
+        return index
+
+
+def invalidate_slot(kaodata_path, faceno):
+    """
+    슬롯이 다시 쓰였음을 알립니다 (save_face_image에서 호출).
+    메모리에 인덱스가 없으면 다음 로드 때 해시 비교로 찾아내므로 아무것도 하지 않습니다.
+    """
+    key = os.path.normcase(os.path.abspath(kaodata_path))
+    with _indexes_lock:
+        index = _indexes.get(key)
+    if index is not None:
+        index.invalidate(faceno)
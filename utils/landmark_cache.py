@@ -0,0 +1,118 @@
+"""
+랜드마크 캐시 유틸리티
+이미지별 얼굴 랜드마크 감지 결과를 landmarks 폴더에 저장/로드합니다.
+이미지 수정 시간이 바뀌면 캐시를 무효화합니다.
+"""
+import os
+import json
+
+from utils.landmarks import Landmarks
+
+# 로거 (지연 로딩)
+_logger = None
+
+def _get_logger():
+    """로거 가져오기 (지연 로딩)"""
+    global _logger
+    if _logger is None:
+        from utils.logger import get_logger
+        _logger = get_logger('랜드마크캐시')
+    return _logger
+
+
+def _get_landmarks_dir(image_path):
+    """이미지 파일이 있는 디렉토리의 landmarks 폴더 경로 반환"""
+    image_dir = os.path.dirname(image_path)
+    landmarks_dir = os.path.join(image_dir, 'landmarks')
+    # landmarks 폴더가 없으면 생성
+    if not os.path.exists(landmarks_dir):
+        try:
+            os.makedirs(landmarks_dir, exist_ok=True)
+        except Exception as e:
+            _get_logger().error(f"landmarks 폴더 생성 실패: {e}")
+    return landmarks_dir
+
+
+def _get_landmarks_filename(image_path):
+    """이미지 파일명을 기반으로 캐시 파일명 생성"""
+    # 캐시 파일명: {이미지파일명}.s7ed.landmarks
+    return f"{os.path.basename(image_path)}.s7ed.landmarks"
+
+
+def get_landmarks_cache_path(image_path):
+    """랜드마크 캐시 파일 경로 반환 (landmarks 폴더 내)"""
+    return os.path.join(_get_landmarks_dir(image_path), _get_landmarks_filename(image_path))
+
+
+def load_landmarks(image_path):
+    """
+    캐시된 랜드마크를 로드합니다.
+
+    Args:
+        image_path: 원본 이미지 파일 경로
+
+    Returns:
+        (landmarks, cached): landmarks는 Landmarks 또는 None(얼굴 없음),
+                             cached는 유효한 캐시가 있었는지 여부
+    """
+    cache_path = get_landmarks_cache_path(image_path)
+    if not os.path.exists(cache_path):
+        return None, False
+
+    try:
+        image_mtime = os.path.getmtime(image_path)
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache_data = json.load(f)
+
+        # 이미지 수정 시간이 다르면 캐시 무효화
+        if cache_data.get('image_mtime') != image_mtime:
+            return None, False
+
+        points = cache_data.get('landmarks')
+        if points is None:
+            # 얼굴이 없는 이미지도 캐시하여 재감지를 피함
+            return None, True
+        return Landmarks(points), True
+
+    except Exception as e:
+        _get_logger().error(f"랜드마크 캐시 로드 실패 ({cache_path}): {e}")
+        return None, False
+
+
+def save_landmarks(image_path, landmarks):
+    """
+    랜드마크를 캐시에 저장합니다.
+
+    Args:
+        image_path: 원본 이미지 파일 경로
+        landmarks: [(x, y), ...] 또는 None(얼굴을 찾지 못한 경우)
+    """
+    cache_path = get_landmarks_cache_path(image_path)
+    try:
+        cache_data = {
+            'image_mtime': os.path.getmtime(image_path),
+            'landmarks': Landmarks(landmarks, copy=False).array.tolist() if landmarks is not None else None
+        }
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cache_data, f)
+    except Exception as e:
+        _get_logger().error(f"랜드마크 캐시 저장 실패 ({cache_path}): {e}")
+
+
+def remove_landmarks(image_path):
+    """랜드마크 캐시 파일 삭제 (이미지가 삭제/변경된 경우)"""
+    cache_path = get_landmarks_cache_path(image_path)
+    if not os.path.exists(cache_path):
+        return False
+    try:
+        os.remove(cache_path)
+        return True
+    except OSError as e:
+        _get_logger().error(f"랜드마크 캐시 삭제 실패 ({cache_path}): {e}")
+        return False
+
+
+def is_cached(image_path):
+    """유효한 랜드마크 캐시가 있는지 확인"""
+    _, cached = load_landmarks(image_path)
+    return cached
@@ -0,0 +1,228 @@
+"""
+랜드마크 배열 타입
+float32 (N, 2) numpy 배열을 기반으로 하면서 기존 [(x, y), ...] 튜플 리스트처럼
+동작하는 Landmarks 클래스를 제공합니다.
+
+- 인덱싱은 (x, y) 튜플을 반환하므로 기존 코드와 호환됩니다.
+- 슬라이싱은 리스트처럼 독립된 복사본을 반환하고, np.asarray()/.array는 복사 없이
+  같은 배열을 공유합니다.
+- translate/scale 등의 변형은 벡터 연산으로 처리하며 서브픽셀 좌표를 유지합니다.
+"""
+from collections.abc import MutableSequence
+
+import numpy as np
+
+
+def as_point_array(points):
+    """
+    랜드마크를 float32 (N, 2) 배열로 변환합니다.
+    Landmarks나 float32 배열이면 복사하지 않고 그대로 반환합니다.
+
+    Args:
+        points: Landmarks, numpy 배열 또는 [(x, y), ...] 리스트
+
+    Returns:
+        numpy.ndarray: float32 (N, 2) 배열
+    """
+    if isinstance(points, Landmarks):
+        return points.array
+    array = np.asarray(points, dtype=np.float32)
+    if array.size == 0:
+        return array.reshape(0, 2)
+    if array.ndim != 2 or array.shape[1] < 2:
+        raise ValueError(f"랜드마크 배열 형태가 올바르지 않습니다: {array.shape}")
+    if array.shape[1] != 2:
+        array = array[:, :2]
+    return array
+
+
+def as_landmarks(points):
+    """
+    Landmarks로 변환합니다 (이미 Landmarks이거나 float32 배열이면 복사 없음).
+
+    Args:
+        points: Landmarks, numpy 배열, [(x, y), ...] 리스트 또는 None
+
+    Returns:
+        Landmarks 또는 None
+    """
+    if points is None or isinstance(points, Landmarks):
+        return points
+    return Landmarks(points, copy=False)
+
+
+def _normalize_indices(indices, length):
+    """인덱스 리스트에서 범위를 벗어난 인덱스를 제거한 int 배열 반환"""
+    if indices is None:
+        return None
+    idx = np.asarray(list(indices) if isinstance(indices, (set, frozenset)) else indices, dtype=np.intp)
+    return idx[(idx >= 0) & (idx < length)]
+
+
+class Landmarks(MutableSequence):
+    """float32 (N, 2) 배열 기반 랜드마크 (튜플 리스트 호환)"""
+
+    __slots__ = ('_array',)
+    __hash__ = None
+
+    def __init__(self, points=(), copy=True):
+        """
+        Args:
+            points: [(x, y), ...] 리스트, (N, 2) 배열 또는 Landmarks
+            copy: True면 항상 새 배열을 만들고, False면 가능한 경우 배열을 공유
+        """
+        array = as_point_array(points)
+        if copy:
+            array = array.copy()
+        self._array = array
+
+    @classmethod
+    def from_normalized(cls, normalized_landmarks, img_width, img_height):
+        """
+        MediaPipe 정규화 좌표(0~1)에서 픽셀 좌표 Landmarks를 생성합니다.
+
+        Args:
+            normalized_landmarks: .x, .y 속성을 가진 랜드마크 시퀀스
+            img_width: 이미지 너비
+            img_height: 이미지 높이
+        """
+        array = np.array([(lm.x, lm.y) for lm in normalized_landmarks], dtype=np.float32).reshape(-1, 2)
+        array *= np.array([img_width, img_height], dtype=np.float32)
+        return cls(array, copy=False)
+
+    # ========== 배열 접근 ==========
+
+    @property
+    def array(self):
+        """내부 float32 (N, 2) 배열 (복사본 아님)"""
+        return self._array
+
+    @property
+    def x(self):
+        """x 좌표 배열 (뷰)"""
+        return self._array[:, 0]
+
+    @property
+    def y(self):
+        """y 좌표 배열 (뷰)"""
+        return self._array[:, 1]
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None or np.dtype(dtype) == self._array.dtype:
+            return self._array.copy() if copy else self._array
+        return self._array.astype(dtype)
+
+    # ========== 시퀀스 프로토콜 (튜플 리스트 호환) ==========
+
+    def __len__(self):
+        return self._array.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            # 리스트 슬라이스와 같이 원본과 분리된 복사본 (뷰를 공유하면 수정이 원본에 번짐)
+            return Landmarks(self._array[index], copy=True)
+        x, y = self._array[index]
+        return (float(x), float(y))
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self._array[index] = as_point_array(value)
+        else:
+            self._array[index] = (value[0], value[1])
+
+    def __delitem__(self, index):
+        self._array = np.delete(self._array, index, axis=0)
+
+    def insert(self, index, value):
+        self._array = np.insert(self._array, index, (value[0], value[1]), axis=0)
+
+    def extend(self, values):
+        self._array = np.concatenate([self._array, as_point_array(values)], axis=0)
+
+    def __iter__(self):
+        return (tuple(p) for p in self._array.tolist())
+
+    def __add__(self, other):
+        return Landmarks(np.concatenate([self._array, as_point_array(other)], axis=0), copy=False)
+
+    def __radd__(self, other):
+        return Landmarks(np.concatenate([as_point_array(other), self._array], axis=0), copy=False)
+
+    def __eq__(self, other):
+        if isinstance(other, (Landmarks, list, tuple, np.ndarray)):
+            try:
+                return np.array_equal(self._array, as_point_array(other))
+            except ValueError:
+                return False
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Landmarks(n={len(self)})"
+
+    def copy(self):
+        """배열을 복사한 새 Landmarks 반환"""
+        return Landmarks(self._array, copy=True)
+
+    def tolist(self):
+        """[(x, y), ...] 튜플 리스트로 변환 (직렬화용)"""
+        return [tuple(p) for p in self._array.tolist()]
+
+    def to_int_tuples(self):
+        """반올림한 정수 좌표 튜플 리스트 (OpenCV 그리기용)"""
+        return [tuple(p) for p in np.rint(self._array).astype(np.int32).tolist()]
+
+    # ========== 벡터 연산 ==========
+
+    def take(self, indices):
+        """지정한 인덱스의 포인트만 모은 새 Landmarks 반환"""
+        return Landmarks(self._array[_normalize_indices(indices, len(self))], copy=False)
+
+    def centroid(self, indices=None):
+        """포인트 중심 (x, y) 반환 (인덱스 지정 시 해당 포인트만)"""
+        points = self._array if indices is None else self._array[_normalize_indices(indices, len(self))]
+        if len(points) == 0:
+            return None
+        cx, cy = points.mean(axis=0, dtype=np.float64)
+        return (float(cx), float(cy))
+
+    def bbox(self):
+        """(min_x, min_y, max_x, max_y) 반환"""
+        if len(self) == 0:
+            return None
+        min_x, min_y = self._array.min(axis=0)
+        max_x, max_y = self._array.max(axis=0)
+        return (float(min_x), float(min_y), float(max_x), float(max_y))
+
+    def translate(self, dx, dy, indices=None):
+        """
+        포인트를 이동한 새 Landmarks를 반환합니다.
+
+        Args:
+            dx, dy: 이동량 (픽셀)
+            indices: 이동할 인덱스 (None이면 전체)
+        """
+        result = self._array.copy()
+        if indices is None:
+            result += np.array([dx, dy], dtype=np.float32)
+        else:
+            result[_normalize_indices(indices, len(self))] += np.array([dx, dy], dtype=np.float32)
+        return Landmarks(result, copy=False)
+
+    def scale(self, sx, sy, center, indices=None):
+        """
+        중심점 기준으로 크기를 조정한 새 Landmarks를 반환합니다.
+
+        Args:
+            sx, sy: 수평/수직 배율
+            center: 기준점 (x, y)
+            indices: 조정할 인덱스 (None이면 전체)
+        """
+        result = self._array.copy()
+        factor = np.array([sx, sy], dtype=np.float32)
+        origin = np.array([center[0], center[1]], dtype=np.float32)
+        if indices is None:
+            result = origin + (result - origin) * factor
+        else:
+            idx = _normalize_indices(indices, len(self))
+            result[idx] = origin + (result[idx] - origin) * factor
+        return Landmarks(result, copy=False)
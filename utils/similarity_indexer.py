@@ -0,0 +1,388 @@
+"""
+백그라운드 유사도 색인/검색 작업
+특징 저장소에 이미 있는 후보는 시작하자마자 점수를 매기고, 없는 후보는 스레드 풀에서 추출하면서
+상위 N개 결과를 점진적으로 갱신합니다. UI에는 after() 콜백으로 진행률과 중간 결과를 전달합니다.
+"""
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import utils.ann_index as ann_index
+import utils.dir_manifest as dir_manifest
+import utils.feature_store as feature_store
+from utils.similarity_search import SimilarityIndex, top_k, DEFAULT_FACE_WEIGHT, DEFAULT_CLOTHING_WEIGHT
+
+# 로거 (지연 로딩)
+_logger = None
+
+def _get_logger():
+    """로거 가져오기 (지연 로딩)"""
+    global _logger
+    if _logger is None:
+        from utils.logger import get_logger
+        _logger = get_logger('유사도색인')
+    return _logger
+
+
+# 검색 방식
+MODE_FACE = 'face'            # 얼굴만
+MODE_COMBINED = 'combined'    # 얼굴 + 옷 (가중 결합)
+MODE_CLOTHING = 'clothing'    # 옷만
+MODE_MESH = 'mesh'            # 얼굴 전체 메시 임베딩 (face_embedding)
+
+# 작업 큐 메시지 종류
+_MSG_REFERENCE = 'reference'
+_MSG_FEATURES = 'features'
+
+
+def _mode_kinds(mode):
+    """검색 방식에 필요한 특징 저장소 종류"""
+    if mode == MODE_CLOTHING:
+        return [feature_store.KIND_CLOTHING]
+    if mode == MODE_COMBINED:
+        return [feature_store.KIND_FACE, feature_store.KIND_CLOTHING]
+    if mode == MODE_MESH:
+        return [feature_store.KIND_EMBEDDING]
+    return [feature_store.KIND_FACE]
+
+
+def _face_kind(mode):
+    """검색 방식의 얼굴 점수에 쓰는 특징 종류"""
+    return feature_store.KIND_EMBEDDING if mode == MODE_MESH else feature_store.KIND_FACE
+
+
+def index_from_features(features_list, mode=MODE_FACE):
+    """
+    [(features, key), ...]로 검색 인덱스 생성 (features는 _extract_face_features_for_image 반환 형식)
+    """
+    if mode != MODE_CLOTHING:
+        return SimilarityIndex.from_features(features_list)
+    keys, vectors = [], []
+    for features, key in features_list:
+        if features is not None:
+            keys.append(key)
+            vectors.append(features)
+    if not vectors:
+        return SimilarityIndex([])
+    return SimilarityIndex(keys, clothing_vectors=np.stack(vectors))
+
+
+def load_cached_index(image_paths, mode=MODE_FACE, with_sources=False):
+    """
+    특징 저장소에 있는 후보만으로 검색 인덱스를 만듭니다 (추출하지 않음).
+    디렉토리 매니페스트로 스캔한 파일은 매니페스트의 수정 시간/크기로 캐시 유효성을 확인합니다
+    (파일을 다시 stat하지 않으므로 호출 전에 디렉토리를 scan()해 두어야 함, dir_manifest.get_signatures 참고).
+
+    Args:
+        with_sources: True면 인덱스 키 순서의 디렉토리별 FeatureSource 리스트도 반환 (ANN 후보 축소용)
+
+    Returns:
+        (index, missing_paths): missing_paths는 저장소에 없어 추출이 필요한 경로 (입력 순서)
+        with_sources=True면 (index, missing_paths, sources)
+    """
+    signatures = dir_manifest.get_signatures(image_paths)
+    missing = set()
+    for kind in _mode_kinds(mode):
+        _, _, kind_missing = feature_store.load_features(image_paths, kind, signatures)
+        missing.update(kind_missing)
+    cached = [p for p in image_paths if p not in missing]
+    missing = [p for p in image_paths if p in missing]
+
+    if mode == MODE_CLOTHING:
+        matrix, keys, _, sources = feature_store.load_features(
+            cached, feature_store.KIND_CLOTHING, signatures, with_sources=True)
+        index = SimilarityIndex(keys, clothing_vectors=matrix)
+        return (index, missing, sources) if with_sources else (index, missing)
+
+    face_matrix, keys, _, sources = feature_store.load_features(
+        cached, _face_kind(mode), signatures, with_sources=True)
+    if mode in (MODE_FACE, MODE_MESH):
+        index = SimilarityIndex(keys, face_vectors=face_matrix)
+        return (index, missing, sources) if with_sources else (index, missing)
+
+    # 옷 특징은 얼굴 특징이 있는 후보의 행 번호에 연결
+    clothing_matrix, clothing_keys, _ = feature_store.load_features(keys, feature_store.KIND_CLOTHING, signatures)
+    positions = {key: i for i, key in enumerate(keys)}
+    clothing_rows = [positions[key] for key in clothing_keys]
+    index = SimilarityIndex(keys, face_vectors=face_matrix, clothing_vectors=clothing_matrix,
+                            clothing_rows=clothing_rows)
+    return (index, missing, sources) if with_sources else (index, missing)
+
+
+def score_index(index, reference, mode=MODE_FACE,
+                face_weight=DEFAULT_FACE_WEIGHT, clothing_weight=DEFAULT_CLOTHING_WEIGHT):
+    """기준 특징과 인덱스 전체 후보의 (N,) 점수 (옷 특징이 없는 후보는 NaN)"""
+    if len(index) == 0:
+        return np.empty(0, dtype=np.float32)
+    if mode == MODE_CLOTHING:
+        return index.clothing_scores([reference])[0]
+    if mode == MODE_COMBINED:
+        face_features, clothing_features = reference
+        return index.combined_scores([face_features], [clothing_features],
+                                     face_weight=face_weight, clothing_weight=clothing_weight)[0]
+    return index.face_scores([reference])[0]
+
+
+def get_default_worker_count():
+    """기본 스레드 수 (UI 스레드용으로 코어 하나를 남기고 최대 4개)"""
+    return max(1, min(4, (os.cpu_count() or 2) - 1))
+
+
+class SimilaritySearchJob:
+    """
+    스레드 풀 기반 유사도 검색 작업
+
+    사용 예:
+        job = SimilaritySearchJob(extract_features, mode=MODE_FACE, top_n=10)
+        job.start(reference_path, image_paths)
+        job.attach(widget, on_progress, on_complete)
+        ...
+        job.cancel()
+
+    Args:
+        extract_features: extract_features(image_path) -> 특징 (저장소에 기록까지 담당, 스레드 안전해야 함)
+        mode: MODE_FACE, MODE_COMBINED, MODE_CLOTHING, MODE_MESH
+        top_n: 결과 수 (None이면 min_score 이상 전체)
+        min_score: 이 점수 미만 결과 제외
+        ann_nprobe: 저장소 후보가 많을 때 ANN 인덱스로 후보를 줄임 (탐색 리스트 수, None이면 항상 정확한 검색)
+        maintenance: maintenance(image_paths, is_cancelled) 추출 작업 뒤에 같은 풀에서 실행할 유지보수 작업
+                     (임베딩 기저 갱신 등, 결과와 완료 판정에는 영향 없음)
+    """
+
+    def __init__(self, extract_features, mode=MODE_FACE, top_n=10, min_score=None, num_workers=None,
+                 face_weight=DEFAULT_FACE_WEIGHT, clothing_weight=DEFAULT_CLOTHING_WEIGHT, ann_nprobe=None,
+                 maintenance=None):
+        self.extract_features = extract_features
+        self.mode = mode
+        self.top_n = top_n
+        self.min_score = min_score
+        self.num_workers = num_workers or get_default_worker_count()
+        self.face_weight = face_weight
+        self.clothing_weight = clothing_weight
+        self.ann_nprobe = ann_nprobe
+        self.maintenance = maintenance
+
+        self._executor = None
+        self._messages = queue.Queue()
+        self._cancel_event = threading.Event()
+        self._lock = threading.Lock()
+        self._pending = 0
+
+        self.reference = None
+        self.reference_found = None   # None: 아직 모름, False: 기준 특징 없음
+        self.total = 0
+        self.done = 0
+        self.failed = 0
+        self.cancelled = False
+        self.results = []
+
+        # 지금까지 점수를 매긴 후보와 점수
+        self._keys = []
+        self._scores = np.empty(0, dtype=np.float32)
+
+    @property
+    def running(self):
+        """작업이 진행 중인지 여부"""
+        with self._lock:
+            return self._executor is not None and self._pending > 0
+
+    def start(self, reference_path, image_paths):
+        """
+        검색을 시작합니다. 기준 특징 추출과 저장소 로드도 작업 스레드에서 수행합니다.
+
+        Args:
+            reference_path: 기준 이미지 경로
+            image_paths: 후보 이미지 경로 리스트 (기준 이미지 제외)
+        """
+        if self._executor is not None:
+            raise RuntimeError("이미 실행 중인 유사도 검색이 있습니다")
+
+        self._executor = ThreadPoolExecutor(max_workers=self.num_workers, thread_name_prefix='similarity')
+        self._pending = 1
+        self.total = len(image_paths)
+        _get_logger().info(f"유사도 검색 시작 ({self.mode}): 후보 {len(image_paths)}개, 스레드 {self.num_workers}개")
+        future = self._executor.submit(self._prepare, reference_path, list(image_paths))
+        future.add_done_callback(self._on_future_done)
+
+    def _prepare(self, reference_path, image_paths):
+        """기준 특징을 추출하고, 저장소에 있는 후보를 한 번에 로드한 뒤 나머지를 추출 작업으로 제출"""
+        reference = self.extract_features(reference_path)
+        self._messages.put((_MSG_REFERENCE, reference, None))
+        if reference is None or self._cancel_event.is_set():
+            return
+
+        index, missing, sources = load_cached_index(image_paths, self.mode, with_sources=True)
+        if self._use_ann(index):
+            index = self._approximate_subset(index, sources, reference)
+        self._messages.put((_MSG_FEATURES, index, len(image_paths) - len(missing)))
+        _get_logger().debug(f"저장소 특징 {len(index)}개 로드, 추출 대상 {len(missing)}개")
+
+        with self._lock:
+            if self._executor is None:
+                return
+            self._pending += len(missing)
+            executor = self._executor
+        try:
+            for image_path in missing:
+                future = executor.submit(self._extract, image_path)
+                future.add_done_callback(self._on_future_done)
+            if self.maintenance is not None:
+                # 진행률/완료 판정에는 넣지 않음 (검색이 끝난 뒤에도 풀이 남은 작업을 마저 실행)
+                executor.submit(self._maintain, image_paths)
+        except RuntimeError:
+            # 취소로 풀이 이미 종료됨
+            with self._lock:
+                self._pending = 0
+
+    def _use_ann(self, index):
+        """ANN 후보 축소를 쓸지 여부 (상위 N개 검색이고 저장소 후보가 충분히 많을 때)"""
+        return (self.ann_nprobe is not None and self.top_n is not None
+                and len(index) >= ann_index.MIN_ROWS_FOR_ANN)
+
+    def _approximate_subset(self, index, sources, reference):
+        """ANN 인덱스로 고른 후보만 남김 (점수는 이후 정확한 식으로 계산)"""
+        # 출처는 인덱스 키의 특징 종류 (옷 모드는 옷, 나머지는 얼굴/메시 특징)
+        query = reference[0] if self.mode == MODE_COMBINED else reference
+        count = self.top_n * ann_index.CANDIDATE_OVERSAMPLE
+        positions = ann_index.approximate_candidates(sources, query, count, self.ann_nprobe)
+        _get_logger().debug(f"ANN 후보 축소: {len(index)} -> {len(positions)} (nprobe {self.ann_nprobe})")
+        return index.take(positions)
+
+    def _extract(self, image_path):
+        """후보 한 장의 특징 추출 (취소되었으면 건너뜀)"""
+        if self._cancel_event.is_set():
+            return
+        try:
+            features = self.extract_features(image_path)
+            self._messages.put((_MSG_FEATURES, [(features, image_path)], 1))
+        except Exception as e:
+            _get_logger().warning(f"특징 추출 실패 ({image_path}): {e}")
+            self._messages.put((_MSG_FEATURES, [], 1))
+
+    def _maintain(self, image_paths):
+        """유지보수 작업 실행 (실패해도 검색 결과에는 영향 없음)"""
+        if self._cancel_event.is_set():
+            return
+        try:
+            self.maintenance(image_paths, self._cancel_event.is_set)
+        except Exception as e:
+            _get_logger().warning(f"유사도 검색 유지보수 작업 실패: {e}")
+
+    def _on_future_done(self, future):
+        """작업 완료 처리 (작업 스레드에서 호출됨)"""
+        with self._lock:
+            self._pending = max(0, self._pending - 1)
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            _get_logger().error(f"유사도 검색 작업 실패: {error}")
+
+    def _merge(self, index):
+        """새로 준비된 후보 인덱스의 점수를 누적하고 상위 결과 갱신"""
+        if len(index) == 0:
+            return False
+        scores = score_index(index, self.reference, self.mode, self.face_weight, self.clothing_weight)
+        self._keys.extend(index.keys)
+        self._scores = np.concatenate([self._scores, scores.astype(np.float32)])
+
+        candidates = np.where(np.isnan(self._scores), -np.inf, self._scores)
+        k = len(candidates) if self.top_n is None else self.top_n
+        results = []
+        for i in top_k(candidates, k).tolist():
+            score = float(candidates[i])
+            if score == -np.inf or (self.min_score is not None and score < self.min_score):
+                continue
+            results.append((score, self._keys[i]))
+
+        changed = results != self.results
+        self.results = results
+        return changed
+
+    def poll(self):
+        """
+        도착한 특징을 모두 반영합니다 (논블로킹, UI 스레드에서 호출).
+
+        Returns:
+            bool: 상위 결과가 바뀌었는지 여부
+        """
+        changed = False
+        batch = []
+        while True:
+            try:
+                kind, payload, count = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            if kind == _MSG_REFERENCE:
+                self.reference = payload
+                self.reference_found = payload is not None
+                continue
+            self.done += count
+            if isinstance(payload, SimilarityIndex):
+                changed |= self._merge(payload)
+            else:
+                self.failed += sum(1 for features, _ in payload if features is None)
+                batch.extend(payload)
+
+        if batch and self.reference is not None:
+            changed |= self._merge(index_from_features(batch, self.mode))
+
+        if self._executor is not None and not self.running:
+            self._shutdown()
+        return changed
+
+    def is_finished(self):
+        """모든 작업과 결과 반영이 끝났는지 여부"""
+        return self._executor is None and self._messages.empty()
+
+    def cancel(self):
+        """남은 추출 작업을 취소합니다 (진행 중인 이미지는 완료까지 기다리지 않음)"""
+        if self._executor is None:
+            return
+        self.cancelled = True
+        self._cancel_event.set()
+        _get_logger().info(f"유사도 검색 취소: {self.done}/{self.total}")
+        self._shutdown(cancel_futures=True)
+
+    def _shutdown(self, cancel_futures=False):
+        """스레드 풀 종료 (기다리지 않음) 및 새로 추출한 특징 저장"""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+            if cancel_futures:
+                self._pending = 0
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=cancel_futures)
+        feature_store.flush_all()
+
+    def attach(self, widget, on_progress=None, on_complete=None, interval_ms=100):
+        """
+        Tk 위젯의 after() 루프로 결과를 주기적으로 수거합니다.
+
+        Args:
+            widget: after()를 제공하는 Tk 위젯
+            on_progress: on_progress(done, total, results, changed) 콜백
+            on_complete: on_complete(cancelled) 콜백
+            interval_ms: 폴링 간격 (밀리초)
+        """
+        def _tick():
+            try:
+                changed = self.poll()
+                if on_progress is not None:
+                    on_progress(self.done, self.total, self.results, changed)
+            except Exception as e:
+                _get_logger().error(f"유사도 검색 진행률 처리 실패: {e}", exc_info=True)
+
+            if self.is_finished():
+                _get_logger().info(
+                    f"유사도 검색 종료: {self.done}/{self.total} (특징 없음 {self.failed}, 취소 {self.cancelled})"
+                )
+                if on_complete is not None:
+                    on_complete(self.cancelled)
+                return
+            widget.after(interval_ms, _tick)
+
+        widget.after(interval_ms, _tick)
@@ -0,0 +1,331 @@
+"""
+벡터화된 유사도 검색 엔진
+모든 후보의 특징 벡터를 하나의 행렬로 들고, 여러 기준 이미지에 대한 점수를 행렬 연산으로 한 번에 계산합니다.
+점수 정의는 face_landmarks.calculate_face_similarity / calculate_clothing_similarity /
+calculate_combined_similarity와 같고, 상위 N개는 np.argpartition으로 선택합니다.
+"""
+import numpy as np
+
+# 얼굴 유사도: 0.7 * 코사인 + 0.3 * 1 / (1 + 유클리드 거리 / 10)
+FACE_COSINE_WEIGHT = 0.7
+FACE_DISTANCE_WEIGHT = 0.3
+FACE_MAX_DISTANCE = 10.0
+
+# 옷 유사도: 0.6 * 히스토그램 교차 + 0.4 * 1 / (1 + 통계 거리 / 1000)
+CLOTHING_STATS_DIMS = 6
+CLOTHING_HIST_WEIGHT = 0.6
+CLOTHING_STATS_WEIGHT = 0.4
+CLOTHING_MAX_STATS_DISTANCE = 1000.0
+
+# 결합 유사도 기본 가중치
+DEFAULT_FACE_WEIGHT = 0.7
+DEFAULT_CLOTHING_WEIGHT = 0.3
+
+# 히스토그램 교차 계산 시 한 번에 만드는 (기준 x 후보 x 차원) 임시 배열 최대 원소 수
+_HIST_BLOCK_ELEMENTS = 1 << 22
+
+
+def _as_matrix(vectors, dim=None):
+    """벡터 목록/행렬을 (N, D) float32 연속 배열로 변환"""
+    if vectors is None:
+        return None
+    if isinstance(vectors, np.ndarray):
+        matrix = vectors
+    elif len(vectors) == 0:
+        return np.empty((0, dim or 0), dtype=np.float32)
+    else:
+        matrix = np.stack([np.asarray(v, dtype=np.float32).ravel() for v in vectors])
+    matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix[np.newaxis, :]
+    return matrix
+
+
+def top_k(scores, k):
+    """
+    점수 배열에서 높은 순으로 상위 k개 인덱스를 선택합니다.
+
+    Args:
+        scores: (N,) 또는 (Q, N) 점수
+        k: 선택할 개수
+
+    Returns:
+        (N,) 입력이면 (k,), (Q, N) 입력이면 (Q, k) 인덱스 (점수 내림차순)
+    """
+    scores = np.asarray(scores)
+    n = scores.shape[-1]
+    k = max(0, min(int(k), n))
+    if k == 0:
+        return np.empty(scores.shape[:-1] + (0,), dtype=np.int64)
+    if k < n:
+        candidates = np.argpartition(-scores, k - 1, axis=-1)[..., :k]
+    else:
+        candidates = np.broadcast_to(np.arange(n), scores.shape).copy()
+    # 선택된 k개만 정렬 (같은 점수는 인덱스 순서 유지)
+    order = np.argsort(-np.take_along_axis(scores, candidates, axis=-1), axis=-1, kind='stable')
+    return np.take_along_axis(candidates, order, axis=-1)
+
+
+class FaceMatrix:
+    """얼굴 특징 행렬 (행 노름/정규화 행렬을 미리 계산)"""
+
+    def __init__(self, vectors):
+        self.vectors = _as_matrix(vectors)
+        # 같은 벡터끼리의 거리가 0이 되도록 (|a|^2 + |b|^2 - 2ab 상쇄 오차) 배정밀도로 계산
+        vectors64 = self.vectors.astype(np.float64)
+        self.norms = np.linalg.norm(vectors64, axis=1)
+        safe = np.where(self.norms > 0, self.norms, 1.0)
+        self.normalized = vectors64 / safe[:, np.newaxis]
+
+    def __len__(self):
+        return len(self.vectors)
+
+    def scores(self, queries):
+        """
+        기준 벡터들과 모든 행의 얼굴 유사도 (BLAS 행렬곱 한 번)
+
+        Args:
+            queries: (Q, D) 기준 특징 또는 FaceMatrix
+
+        Returns:
+            (Q, N) float32 유사도 (0~1)
+        """
+        if not isinstance(queries, FaceMatrix):
+            queries = FaceMatrix(queries)
+        cosine = queries.normalized @ self.normalized.T
+        similarity = _face_similarity(cosine, queries.norms[:, np.newaxis], self.norms[np.newaxis, :])
+        return similarity.astype(np.float32)
+
+    def scores_at_least(self, queries, threshold):
+        """
+        유사도가 threshold 이상인 (기준, 행) 쌍만 계산합니다.
+        거리 항은 최대 FACE_DISTANCE_WEIGHT이므로 코사인만으로 상한을 구해 먼저 걸러 냅니다.
+
+        Args:
+            queries: (Q, D) 기준 특징 또는 FaceMatrix
+            threshold: 최소 유사도
+
+        Returns:
+            (query_rows, rows, scores): int64, int64, float32 배열 (scores()와 같은 값)
+        """
+        if not isinstance(queries, FaceMatrix):
+            queries = FaceMatrix(queries)
+        cosine = queries.normalized @ self.normalized.T
+        query_rows, rows = np.nonzero(FACE_COSINE_WEIGHT * cosine + FACE_DISTANCE_WEIGHT >= threshold)
+        similarity = _face_similarity(cosine[query_rows, rows], queries.norms[query_rows], self.norms[rows])
+        similarity = similarity.astype(np.float32)
+        keep = similarity >= threshold
+        return query_rows[keep].astype(np.int64), rows[keep].astype(np.int64), similarity[keep]
+
+
+def _face_similarity(cosine, query_norms, row_norms):
+    """코사인과 두 벡터 노름으로 얼굴 유사도 계산 (배열 모양은 브로드캐스트)"""
+    # |a - b|^2 = |a|^2 + |b|^2 - 2|a||b|cos (행렬곱 결과 재사용)
+    cross = cosine * query_norms * row_norms
+    sq_distance = query_norms ** 2 + row_norms ** 2 - 2.0 * cross
+    distance = np.sqrt(np.maximum(sq_distance, 0.0))
+
+    similarity = (FACE_COSINE_WEIGHT * cosine
+                  + FACE_DISTANCE_WEIGHT / (1.0 + distance / FACE_MAX_DISTANCE))
+    # 노름이 0인 벡터는 유사도 0 (calculate_face_similarity와 같음)
+    similarity = np.where((query_norms == 0) | (row_norms == 0), 0.0, similarity)
+    return np.clip(similarity, 0.0, 1.0)
+
+
+class ClothingMatrix:
+    """옷 특징 행렬 (히스토그램 부분과 통계 부분을 분리해 보관)"""
+
+    def __init__(self, vectors):
+        self.vectors = _as_matrix(vectors)
+        dim = self.vectors.shape[1]
+        self.has_hist = dim > CLOTHING_STATS_DIMS
+        if self.has_hist:
+            self.hist = self.vectors[:, :-CLOTHING_STATS_DIMS]
+            self.stats = self.vectors[:, -CLOTHING_STATS_DIMS:]
+            self.hist_sums = self.hist.sum(axis=1, dtype=np.float64)
+        else:
+            self.hist = None
+            self.stats = self.vectors
+            self.hist_sums = None
+
+    def __len__(self):
+        return len(self.vectors)
+
+    def _hist_intersection(self, queries):
+        """sum(min(q, f)) 히스토그램 교차 (임시 배열 크기를 제한해 블록 단위로 계산)"""
+        num_queries, num_rows = len(queries), len(self)
+        dim = self.hist.shape[1]
+        result = np.empty((num_queries, num_rows), dtype=np.float64)
+        block = max(1, _HIST_BLOCK_ELEMENTS // max(1, dim * num_queries))
+        for start in range(0, num_rows, block):
+            rows = self.hist[start:start + block]
+            minimum = np.minimum(queries.hist[:, np.newaxis, :], rows[np.newaxis, :, :])
+            result[:, start:start + len(rows)] = minimum.sum(axis=2, dtype=np.float64)
+        return result
+
+    def scores(self, queries):
+        """
+        기준 벡터들과 모든 행의 옷 유사도
+
+        Args:
+            queries: (Q, D) 기준 특징 또는 ClothingMatrix
+
+        Returns:
+            (Q, N) float32 유사도 (0~1)
+        """
+        if not isinstance(queries, ClothingMatrix):
+            queries = ClothingMatrix(queries)
+
+        if self.has_hist and queries.has_hist:
+            intersection = self._hist_intersection(queries)
+            # sum(max(a, b)) = sum(a) + sum(b) - sum(min(a, b))
+            union = queries.hist_sums[:, np.newaxis] + self.hist_sums[np.newaxis, :] - intersection
+            hist_similarity = intersection / (union + 1e-10)
+        else:
+            hist_similarity = np.full((len(queries), len(self)), 0.5)
+
+        stats_distance = np.sqrt(np.maximum(
+            (queries.stats.astype(np.float64) ** 2).sum(axis=1)[:, np.newaxis]
+            + (self.stats.astype(np.float64) ** 2).sum(axis=1)[np.newaxis, :]
+            - 2.0 * (queries.stats.astype(np.float64) @ self.stats.T.astype(np.float64)),
+            0.0
+        ))
+        stats_similarity = 1.0 / (1.0 + stats_distance / CLOTHING_MAX_STATS_DISTANCE)
+
+        similarity = CLOTHING_HIST_WEIGHT * hist_similarity + CLOTHING_STATS_WEIGHT * stats_similarity
+        return np.clip(similarity, 0.0, 1.0).astype(np.float32)
+
+
+class SimilarityIndex:
+    """
+    후보 이미지 전체의 얼굴/옷 특징을 행렬로 보관하는 검색 인덱스
+
+    Args:
+        keys: 후보 식별자 리스트 (파일 경로 등)
+        face_vectors: (N, D) 얼굴 특징 (None이면 얼굴 검색 불가)
+        clothing_vectors: (M, C) 옷 특징 (None이면 옷 검색 불가)
+        clothing_rows: 옷 특징 각 행이 해당하는 후보 인덱스 (None이면 0..N-1)
+    """
+
+    def __init__(self, keys, face_vectors=None, clothing_vectors=None, clothing_rows=None):
+        self.keys = list(keys)
+        self.face = FaceMatrix(face_vectors) if face_vectors is not None else None
+        self.clothing = None
+        self.clothing_rows = None
+        if clothing_vectors is not None and len(clothing_vectors) > 0:
+            self.clothing = ClothingMatrix(clothing_vectors)
+            if clothing_rows is None:
+                clothing_rows = np.arange(len(self.clothing))
+            self.clothing_rows = np.asarray(clothing_rows, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.keys)
+
+    @classmethod
+    def from_features(cls, features_list):
+        """
+        [(features, key), ...] 목록에서 인덱스 생성
+        features는 얼굴 벡터 또는 (얼굴, 옷 또는 None) 튜플 (None인 항목은 제외)
+        """
+        keys, faces, clothing, clothing_rows = [], [], [], []
+        for features, key in features_list:
+            if features is None:
+                continue
+            if isinstance(features, tuple):
+                face_features, clothing_features = features
+                if face_features is None:
+                    continue
+                if clothing_features is not None:
+                    clothing_rows.append(len(keys))
+                    clothing.append(clothing_features)
+            else:
+                face_features = features
+            keys.append(key)
+            faces.append(face_features)
+        return cls(keys, _as_matrix(faces), _as_matrix(clothing) if clothing else None, clothing_rows)
+
+    def take(self, positions):
+        """지정한 후보만 남긴 새 인덱스 (positions: 후보 인덱스 리스트)"""
+        positions = np.asarray(positions, dtype=np.int64)
+        keys = [self.keys[i] for i in positions.tolist()]
+        face_vectors = self.face.vectors[positions] if self.face is not None else None
+        clothing_vectors, clothing_rows = None, None
+        if self.clothing is not None:
+            # 남는 후보의 새 위치로 옷 특징 행 번호를 다시 매김
+            new_positions = np.full(len(self), -1, dtype=np.int64)
+            new_positions[positions] = np.arange(len(positions))
+            mapped = new_positions[self.clothing_rows]
+            kept = mapped >= 0
+            clothing_vectors = self.clothing.vectors[kept]
+            clothing_rows = mapped[kept]
+        return SimilarityIndex(keys, face_vectors, clothing_vectors, clothing_rows)
+
+    def face_scores(self, queries):
+        """(Q, N) 얼굴 유사도"""
+        return self.face.scores(_as_matrix(queries))
+
+    def clothing_scores(self, queries):
+        """
+        (Q, N) 옷 유사도 (옷 특징이 없는 후보는 NaN)
+        """
+        queries = _as_matrix(queries)
+        scores = np.full((len(queries), len(self)), np.nan, dtype=np.float32)
+        if self.clothing is not None:
+            scores[:, self.clothing_rows] = self.clothing.scores(queries)
+        return scores
+
+    def combined_scores(self, face_queries, clothing_queries=None,
+                        face_weight=DEFAULT_FACE_WEIGHT, clothing_weight=DEFAULT_CLOTHING_WEIGHT):
+        """
+        (Q, N) 결합 유사도
+        기준 또는 후보 어느 한쪽이라도 옷 특징이 없으면 얼굴 유사도만 사용합니다.
+
+        Args:
+            face_queries: (Q, D) 기준 얼굴 특징
+            clothing_queries: 기준 옷 특징 목록 (길이 Q, 각 항목은 벡터 또는 None)
+        """
+        scores = self.face_scores(face_queries)
+        if clothing_queries is None or self.clothing is None:
+            return scores
+
+        with_clothing = [i for i, q in enumerate(clothing_queries) if q is not None]
+        if with_clothing:
+            clothing = self.clothing.scores(_as_matrix([clothing_queries[i] for i in with_clothing]))
+            rows = np.asarray(with_clothing)[:, np.newaxis]
+            cols = self.clothing_rows[np.newaxis, :]
+            scores[rows, cols] = face_weight * scores[rows, cols] + clothing_weight * clothing
+        return scores
+
+    def search(self, scores, top_n=10, min_score=None, exclude=None):
+        """
+        점수 행렬에서 기준별 상위 N개를 선택합니다.
+
+        Args:
+            scores: (N,) 또는 (Q, N) 점수 (NaN은 후보에서 제외)
+            top_n: 기준별 최대 결과 수 (None이면 전체)
+            min_score: 이 점수 미만은 제외
+            exclude: 제외할 키 집합 (기준 이미지 자신 등)
+
+        Returns:
+            (N,) 입력이면 [(score, key), ...], (Q, N) 입력이면 그 리스트의 리스트
+        """
+        scores = np.asarray(scores, dtype=np.float32)
+        single = scores.ndim == 1
+        scores = np.atleast_2d(scores).copy()
+        scores[np.isnan(scores)] = -np.inf
+        if exclude:
+            excluded = [i for i, key in enumerate(self.keys) if key in exclude]
+            scores[:, excluded] = -np.inf
+
+        k = len(self) if top_n is None else top_n
+        indices = top_k(scores, k)
+        results = []
+        for row, row_indices in zip(scores, indices):
+            row_results = []
+            for index in row_indices.tolist():
+                score = float(row[index])
+                if score == -np.inf or (min_score is not None and score < min_score):
+                    continue
+                row_results.append((score, self.keys[index]))
+            results.append(row_results)
+        return results[0] if single else results
@@ -0,0 +1,252 @@
+"""
+검색 결과 썸네일 캐시
+고정 크기 썸네일을 이미지 내용 해시로 디스크(features/thumbnails)에 저장해 두고,
+최근 사용한 썸네일은 메모리에도 보관합니다. 결과 목록은 캐시에 있는 썸네일을 바로 표시하고,
+없는 썸네일은 ThumbnailLoader가 작업 스레드에서 만들어 UI 스레드의 poll()로 전달합니다.
+
+- 디스크 키: 내용 해시 (디렉토리 매니페스트에 있으면 재사용) + 썸네일 크기
+- 메모리 키: 경로 + (수정 시간, 크기) (파일이 바뀌면 다시 읽음)
+- 형식: WebP (Pillow가 지원하지 않으면 PNG)
+"""
+import os
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, features
+
+import utils.feature_store as feature_store
+import utils.dir_manifest as dir_manifest
+
+# 로거 (지연 로딩)
+_logger = None
+
+def _get_logger():
+    """로거 가져오기 (지연 로딩)"""
+    global _logger
+    if _logger is None:
+        from utils.logger import get_logger
+        _logger = get_logger('썸네일캐시')
+    return _logger
+
+
+# 썸네일 최대 크기 (게임 얼굴 크기)
+THUMBNAIL_SIZE = (96, 120)
+
+# features 폴더 아래 썸네일 폴더 이름
+THUMBNAILS_DIRNAME = 'thumbnails'
+
+# 메모리에 보관할 썸네일 수
+MEMORY_LIMIT = 512
+
+# 디스크 형식
+if features.check('webp'):
+    _FORMAT, _EXTENSION, _SAVE_OPTIONS = 'WEBP', '.webp', {'quality': 90, 'method': 4}
+else:
+    _FORMAT, _EXTENSION, _SAVE_OPTIONS = 'PNG', '.png', {}
+
+
+def get_thumbnails_dir(image_path):
+    """이미지의 썸네일 캐시 폴더"""
+    return os.path.join(feature_store.get_features_dir(image_path), THUMBNAILS_DIRNAME)
+
+
+def _signature(image_path):
+    """(수정 시간, 크기) 또는 None"""
+    try:
+        stat = os.stat(image_path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def content_key(image_path):
+    """
+    이미지 내용 해시
+    매니페스트 항목이 파일과 같으면 매니페스트를 거쳐 계산/기록하므로 다음 조회부터는 다시 읽지 않습니다.
+    (매니페스트에 없거나 스캔 후 바뀐 파일만 직접 계산)
+    """
+    directory, name = os.path.split(os.path.abspath(image_path))
+    manifest = dir_manifest.get_manifest(directory)
+    entry = manifest.get(name)
+    if entry is not None:
+        stat = os.stat(image_path)
+        if (stat.st_mtime, stat.st_size) == (entry.mtime, entry.size):
+            content_hash = manifest.content_hash(name, defer_save=True)
+            if content_hash is not None:
+                return content_hash
+    return dir_manifest.compute_content_hash(image_path)
+
+
+def make_thumbnail(image_path, size=THUMBNAIL_SIZE):
+    """원본 이미지로 썸네일 생성 (비율 유지, RGB)"""
+    with Image.open(image_path) as image:
+        # JPEG는 디코딩 단계에서 줄여 읽음
+        image.draft('RGB', (size[0] * 2, size[1] * 2))
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        image.thumbnail(size, Image.LANCZOS, reducing_gap=3.0)
+        image.load()
+        return image
+
+
+class ThumbnailCache:
+    """디스크 + 메모리 썸네일 캐시 (스레드 안전)"""
+
+    def __init__(self, size=THUMBNAIL_SIZE, memory_limit=MEMORY_LIMIT):
+        self.size = tuple(size)
+        self.memory_limit = memory_limit
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _disk_path(self, image_path, key):
+        return os.path.join(get_thumbnails_dir(image_path),
+                            f"{key}_{self.size[0]}x{self.size[1]}{_EXTENSION}")
+
+    def peek(self, image_path):
+        """메모리에 있는 썸네일만 조회 (없거나 파일이 바뀌었으면 None)"""
+        signature = _signature(image_path)
+        with self._lock:
+            cached = self._memory.get(image_path)
+            if cached is None or cached[0] != signature:
+                return None
+            self._memory.move_to_end(image_path)
+            return cached[1]
+
+    def _remember(self, image_path, signature, image):
+        with self._lock:
+            self._memory[image_path] = (signature, image)
+            self._memory.move_to_end(image_path)
+            while len(self._memory) > self.memory_limit:
+                self._memory.popitem(last=False)
+
+    def get(self, image_path):
+        """
+        썸네일 조회 (메모리 -> 디스크 -> 새로 생성 후 디스크에 저장)
+
+        Returns:
+            PIL.Image (RGB) 또는 None (이미지를 읽을 수 없는 경우)
+        """
+        image = self.peek(image_path)
+        if image is not None:
+            return image
+
+        signature = _signature(image_path)
+        if signature is None:
+            return None
+        try:
+            disk_path = self._disk_path(image_path, content_key(image_path))
+        except OSError as e:
+            _get_logger().warning(f"썸네일 키 계산 실패 ({image_path}): {e}")
+            return None
+
+        if os.path.exists(disk_path):
+            try:
+                with Image.open(disk_path) as cached:
+                    image = cached.convert('RGB')
+            except Exception as e:
+                _get_logger().warning(f"썸네일 캐시 읽기 실패, 다시 만듭니다 ({disk_path}): {e}")
+                image = None
+
+        if image is None:
+            try:
+                image = make_thumbnail(image_path, self.size)
+            except Exception as e:
+                _get_logger().warning(f"썸네일 생성 실패 ({image_path}): {e}")
+                return None
+            self._save(disk_path, image)
+
+        self._remember(image_path, signature, image)
+        return image
+
+    def _save(self, disk_path, image):
+        """디스크에 저장 (임시 파일에 쓴 뒤 교체, 실패해도 메모리 캐시는 사용)"""
+        try:
+            os.makedirs(os.path.dirname(disk_path), exist_ok=True)
+            temp_path = f"{disk_path}.{threading.get_ident()}.tmp"
+            image.save(temp_path, _FORMAT, **_SAVE_OPTIONS)
+            os.replace(temp_path, disk_path)
+        except Exception as e:
+            _get_logger().warning(f"썸네일 캐시 저장 실패 ({disk_path}): {e}")
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_thumbnail_cache():
+    """프로세스 공용 썸네일 캐시"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ThumbnailCache()
+        return _cache
+
+
+class ThumbnailLoader:
+    """
+    작업 스레드에서 썸네일을 준비하는 로더
+
+    사용 예:
+        loader = ThumbnailLoader()
+        loader.request(paths)
+        ... (UI 스레드의 after 루프에서)
+        for path, image in loader.poll(): ...
+    """
+
+    def __init__(self, cache=None, num_workers=2):
+        self.cache = cache or get_thumbnail_cache()
+        self._executor = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix='thumbnail')
+        self._results = queue.Queue()
+        self._pending = set()
+        self._running = 0
+        self._lock = threading.Lock()
+
+    def request(self, image_paths):
+        """썸네일 준비 요청 (이미 요청 중인 경로는 건너뜀)"""
+        for image_path in image_paths:
+            with self._lock:
+                if image_path in self._pending:
+                    continue
+                self._pending.add(image_path)
+                self._running += 1
+            self._executor.submit(self._load, image_path)
+
+    def _load(self, image_path):
+        try:
+            image = self.cache.get(image_path)
+        except Exception as e:
+            _get_logger().error(f"썸네일 준비 실패 ({image_path}): {e}")
+            image = None
+        with self._lock:
+            self._running -= 1
+            idle = self._running == 0
+        if idle:
+            # 요청을 모두 처리하면 새로 계산한 내용 해시를 매니페스트에 저장
+            dir_manifest.flush_all()
+        self._results.put((image_path, image))
+
+    @property
+    def pending(self):
+        """아직 결과를 꺼내지 않은 요청 수"""
+        with self._lock:
+            return len(self._pending)
+
+    def poll(self):
+        """준비된 썸네일을 모두 꺼냅니다 (논블로킹, [(path, image 또는 None), ...])"""
+        results = []
+        while True:
+            try:
+                image_path, image = self._results.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._pending.discard(image_path)
+            results.append((image_path, image))
+        return results
+
+    def shutdown(self):
+        """남은 요청 취소 (모아 둔 내용 해시는 저장)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        dir_manifest.flush_all()